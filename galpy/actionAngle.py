@@ -3,12 +3,21 @@ from galpy.actionAngle_src import actionAngleFlat
 from galpy.actionAngle_src import actionAnglePower
 from galpy.actionAngle_src import actionAngleAxi
 from galpy.actionAngle_src import actionAngleAdiabatic
+from galpy.actionAngle_src import actionAngleStaeckel
+from galpy.actionAngle_src import actionAngleStaeckelGrid
+from galpy.actionAngle_src import actionAngleIsochrone
+from galpy.actionAngle_src import actionAngleNAFF
 
 #
 # Exceptions
 #
 UnboundError= actionAngle.UnboundError
 
+#
+# Functions
+#
+estimateDeltaStaeckel= actionAngleStaeckel.estimateDeltaStaeckel
+
 #
 # Classes
 #
@@ -17,3 +26,7 @@ actionAngleFlat= actionAngleFlat.actionAngleFlat
 actionAnglePower= actionAnglePower.actionAnglePower
 actionAngleAxi= actionAngleAxi.actionAngleAxi
 actionAngleAdiabatic= actionAngleAdiabatic.actionAngleAdiabatic
+actionAngleStaeckel= actionAngleStaeckel.actionAngleStaeckel
+actionAngleStaeckelGrid= actionAngleStaeckelGrid.actionAngleStaeckelGrid
+actionAngleIsochrone= actionAngleIsochrone.actionAngleIsochrone
+actionAngleNAFF= actionAngleNAFF.actionAngleNAFF
@@ -9,11 +9,23 @@
 #      methods:
 #             __call__: returns (jr,lz,jz)
 #
+#             arrays of (R,vR,vT,z,vz) are handled all at once, using
+#             vectorized root finding for the turning points and 
+#             fixed-order Gauss-Legendre quadrature for the actions, in C
+#             if possible
+#
 ###############################################################################
 import math as m
+import multiprocessing
 import numpy as nu
 from actionAngleAxi import actionAngleAxi
-from actionAngle import actionAngle
+from actionAngle import actionAngle, UnboundError
+from actionAngleAdiabatic_c import _check_c, actionAngleAdiabatic_c
+from galpy.potential_src.verticalPotential import RZToverticalPotential
+from galpy.potential_src.Potential import Phiinf
+from galpy.potential_src.interpRotcurve import _reshape
+from galpy.potential_src.interpVerticalPotential import _evaluatePotentials, \
+    _glTheta
 class actionAngleAdiabatic():
     """Action-angle formalism for axisymmetric potentials using the adiabatic approximation"""
     def __init__(self,*args,**kwargs):
@@ -25,17 +37,28 @@ class actionAngleAdiabatic():
         INPUT:
            pot= potential or list of potentials (planarPotentials)
            gamma= (default=1.) replace Lz by Lz+gamma Jz in effective potential
+           c= (default=True) if True, calculate the actions in C if 
+              possible (scipy.integrate.quadrature keywords are then 
+              ignored and the error estimates are zero)
         OUTPUT:
         HISTORY:
             2012-07-26 - Written - Bovy (IAS@MPIA)
+            2026-10-19 - Added c= - agent (local)
         """
         if not kwargs.has_key('pot'):
             raise IOError("Must specify pot= for actionAngleAxi")
         self._pot= kwargs['pot']
+        #The planar potential is the same for all stars
+        if isinstance(self._pot,list):
+            self._planarpot= [p.toPlanar() for p in self._pot]
+        else:
+            self._planarpot= self._pot.toPlanar()
         if kwargs.has_key('gamma'):
             self._gamma= kwargs['gamma']
         else:
             self._gamma= 1.
+        self._c= (not kwargs.has_key('c') or kwargs['c']) \
+            and _check_c(self._pot)
         return None
     
     def __call__(self,*args,**kwargs):
@@ -50,24 +73,27 @@ class actionAngleAdiabatic():
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            scipy.integrate.quadrature keywords
+           for array input:
+              order= order of the Gauss-Legendre quadrature (default: 20)
+              numcores= number of cpus to use to parallelize (default: 1)
         OUTPUT:
            (jr,lz,jz), where jr=[jr,jrerr], and jz=[jz,jzerr]
+           for array input: (jr,lz,jz) arrays (jr=inf for unbound orbits)
         HISTORY:
            2012-07-26 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Vectorized for array input - agent (local)
         """
+        if _isVector(args):
+            return self._evalVector(args,**kwargs)
+        if self._c and len(args) == 5:
+            jr,lz,jz= self._evalScalar(args)
+            return ([jr,0.],lz,[jz,0.])
         #Set up the actionAngleAxi object
         meta= actionAngle(*args)
-        if isinstance(self._pot,list):
-            thispot= [p.toPlanar() for p in self._pot]
-        else:
-            thispot= self._pot.toPlanar()
-        if isinstance(self._pot,list):
-            thisverticalpot= [p.toVertical(meta._R) for p in self._pot]
-        else:
-            thisverticalpot= self._pot.toVertical(meta._R)
-        aAAxi= actionAngleAxi(*args,pot=thispot,
+        thisverticalpot= RZToverticalPotential(self._pot,meta._R)
+        aAAxi= actionAngleAxi(*args,pot=self._planarpot,
                                verticalPot=thisverticalpot,
-                               gamma=self._gamma)
+                               gamma=self._gamma,c=self._c)
         return (aAAxi.JR(**kwargs),aAAxi._R*aAAxi._vT,aAAxi.Jz(**kwargs))
 
     def JR(self,*args,**kwargs):
@@ -82,19 +108,29 @@ class actionAngleAdiabatic():
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            scipy.integrate.quadrature keywords
+           for array input: order=, numcores= (see __call__)
         OUTPUT:
            Jr
         HISTORY:
            2012-07-30 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Vectorized for array input - agent (local)
+           2026-10-19 - Include gamma Jz in the effective potential, as 
+                        __call__ does - agent (local)
         """
+        if _isVector(args):
+            return self._evalVector(args,**kwargs)[0]
+        if self._c and len(args) == 5:
+            return [self._evalScalar(args)[0],0.]
         #Set up the actionAngleAxi object
         meta= actionAngle(*args)
-        if isinstance(self._pot,list):
-            thispot= [p.toPlanar() for p in self._pot]
+        if hasattr(meta,'_z'):
+            thisverticalpot= RZToverticalPotential(self._pot,meta._R)
+            aAAxi= actionAngleAxi(*args,pot=self._planarpot,
+                                   verticalPot=thisverticalpot,
+                                   gamma=self._gamma,c=self._c)
         else:
-            thispot= self._pot.toPlanar()
-        aAAxi= actionAngleAxi(*args,pot=thispot,
-                               gamma=self._gamma)
+            aAAxi= actionAngleAxi(*args,pot=self._planarpot,
+                                   gamma=self._gamma,c=self._c)
         return aAAxi.JR(**kwargs)
 
     def Jz(self,*args,**kwargs):
@@ -109,24 +145,249 @@ class actionAngleAdiabatic():
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
            scipy.integrate.quadrature keywords
+           for array input: order=, numcores= (see __call__)
         OUTPUT:
            jz,jzerr
         HISTORY:
            2012-07-27 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Vectorized for array input - agent (local)
         """
+        if _isVector(args):
+            kwargs['radial']= False
+            return self._evalVector(args,**kwargs)[2]
+        if self._c and len(args) == 5:
+            return [self._evalScalar(args,radial=False)[2],0.]
         #Set up the actionAngleAxi object
         meta= actionAngle(*args)
-        if isinstance(self._pot,list):
-            thispot= [p.toPlanar() for p in self._pot]
-        else:
-            thispot= self._pot.toPlanar()
-        if isinstance(self._pot,list):
-            thisverticalpot= [p.toVertical(meta._R) for p in self._pot]
-        else:
-            thisverticalpot= self._pot.toVertical(meta._R)
-        aAAxi= actionAngleAxi(*args,pot=thispot,
+        thisverticalpot= RZToverticalPotential(self._pot,meta._R)
+        aAAxi= actionAngleAxi(*args,pot=self._planarpot,
                                verticalPot=thisverticalpot,
-                               gamma=self._gamma)
+                               gamma=self._gamma,c=self._c)
         return aAAxi.Jz(**kwargs)
 
-        
+    def _evalVector(self,args,order=20,numcores=1,radial=True):
+        """Evaluate (jr,lz,jz) for arrays of (R,vR,vT,z,vz), in numcores
+        equal-sized chunks"""
+        R, vR, vT, z, vz= nu.broadcast_arrays(*[nu.array(a,dtype='float64')
+                                                for a in args])
+        shape= R.shape
+        xv= nu.array([R.flatten(),vR.flatten(),vT.flatten(),z.flatten(),
+                      vz.flatten()])
+        if not hasattr(self,'_Phiinf'):
+            self._Phiinf= Phiinf(self._pot)
+        ntot= xv.shape[1]
+        if numcores > 1 and ntot > numcores:
+            out= self._poolActions(xv,order,radial,numcores)
+        else:
+            out= self._actions(xv,order,radial)
+        return (_reshape(out[0],shape),_reshape(out[1],shape),
+                _reshape(out[2],shape))
+
+    def _poolActions(self,xv,order,radial,numcores):
+        """Calculate (jr,lz,jz) for the [5,N] array xv in a pool of numcores
+        processes, in numcores equal-sized chunks"""
+        ntot= xv.shape[1]
+        nchunk= int(m.ceil(float(ntot)/numcores))
+        out= multiprocessing.RawArray('d',3*ntot)
+        pool= multiprocessing.Pool(numcores,initializer=_initAdiabaticWorker,
+                                   initargs=(self._pot,self._gamma,self._c,
+                                             self._Phiinf,xv,nchunk,order,
+                                             radial,out))
+        try:
+            for chunk in pool.imap_unordered(_adiabaticWorker,
+                                             range(numcores)):
+                pass
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        return nu.reshape(nu.ctypeslib.as_array(out).copy(),(3,ntot))
+
+    def _evalScalar(self,args,radial=True):
+        """Evaluate (jr,lz,jz) for a single phase-space point in C"""
+        jr,lz,jz= self._evalVector([nu.array([a]) for a in args],
+                                   radial=radial)
+        if radial and nu.isinf(jr[0]):
+            raise UnboundError("Orbit is unbound")
+        return (jr[0],lz[0],jz[0])
+
+    def _actions(self,xv,order,radial):
+        """Calculate (jr,lz,jz) for a [5,N] array of (R,vR,vT,z,vz), in C 
+        if possible"""
+        if self._c:
+            rperi,rap,zmax,jr,jz,TR,Tphi,Tz= \
+                actionAngleAdiabatic_c(self._pot,self._gamma,self._Phiinf,
+                                       *xv,order=order)
+            return nu.array([jr,xv[0]*xv[2],jz])
+        return _actionsAdiabatic(xv,self._pot,self._gamma,self._Phiinf,
+                                 order,radial)
+
+#Worker processes for numcores > 1; everything the workers need is passed 
+#through the pool's initializer, such that this also works when the workers 
+#are spawned rather than forked
+_ADIABATICWORKER= {}
+def _initAdiabaticWorker(pot,gamma,c,phiinf,xv,nchunk,order,radial,out):
+    aA= actionAngleAdiabatic(pot=pot,gamma=gamma,c=c)
+    aA._Phiinf= phiinf
+    _ADIABATICWORKER['aA']= aA
+    _ADIABATICWORKER['xv']= xv
+    _ADIABATICWORKER['nchunk']= nchunk
+    _ADIABATICWORKER['order']= order
+    _ADIABATICWORKER['radial']= radial
+    _ADIABATICWORKER['out']= nu.reshape(nu.ctypeslib.as_array(out),
+                                        (3,xv.shape[1]))
+    return None
+
+def _adiabaticWorker(chunk):
+    """Calculate the actions for chunk number chunk and write them to the 
+    shared output array"""
+    w= _ADIABATICWORKER
+    lo, hi= chunk*w['nchunk'], min((chunk+1)*w['nchunk'],w['xv'].shape[1])
+    if lo >= hi: return None
+    w['out'][:,lo:hi]= w['aA']._actions(w['xv'][:,lo:hi],w['order'],
+                                        w['radial'])
+    return None
+
+def _isVector(args):
+    """Return True if the phase-space input (R,vR,vT,z,vz) contains arrays"""
+    return len(args) == 5 and nu.any([nu.ndim(a) > 0 for a in args])
+
+def _actionsAdiabatic(xv,pot,gamma,phiinf,order,radial=True):
+    """
+    NAME:
+       _actionsAdiabatic
+    PURPOSE:
+       calculate the actions in the adiabatic approximation for an array of
+       phase-space points
+    INPUT:
+       xv - [5,N] array of (R,vR,vT,z,vz)
+       pot - potential or list of potentials
+       gamma - replace Lz by Lz+gamma Jz in the effective potential
+       phiinf - Phi(infinity)
+       order - order of the Gauss-Legendre quadrature
+       radial= if False, only calculate Jz (jr is set to NaN)
+    OUTPUT:
+       [3,N] array of (jr,lz,jz)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    R, vR, vT, z, vz= xv
+    out= nu.empty((3,len(R)))
+    out[1]= R*vT
+    #Vertical action, z= zmax sin(theta)
+    Phi0= _evaluatePotentials(R,0.*R,pot)
+    phiz= lambda zz,indx: _evaluatePotentials(R[indx],zz,pot)-Phi0[indx]
+    Ez= phiz(nu.fabs(z),nu.arange(len(R)))+vz**2./2.
+    zmax= _turningPoint(lambda zz,indx: Ez[indx]-phiz(zz,indx),
+                        nu.fabs(z),vz**2./2.,2.)
+    sintheta, costheta, w= _glTheta(order)
+    zs= zmax[:,nu.newaxis]*sintheta
+    RR= nu.tile(R,(order,1)).T
+    integrand= nu.sqrt(nu.maximum(2.*(Ez[:,nu.newaxis]
+                                      -(_evaluatePotentials(RR.flatten(),
+                                                            zs.flatten(),pot)
+                                        .reshape(zs.shape)
+                                        -Phi0[:,nu.newaxis])),0.))*costheta
+    out[2]= 2./nu.pi*zmax*nu.sum(w*integrand,axis=1)
+    if not radial:
+        out[0]= nu.nan
+        return out
+    #Radial action in the effective potential, including gamma Jz
+    L= nu.fabs(out[1])+gamma*out[2]
+    E= Phi0+vR**2./2.+L**2./2./R**2.
+    unbound= (E >= phiinf)
+    out[0]= nu.inf
+    if nu.all(unbound): return out
+    bound= nu.arange(len(R))[~unbound]
+    R, vR, E, L, Phi0= R[bound], vR[bound], E[bound], L[bound], Phi0[bound]
+    feff= lambda rr,indx: E[indx]-_evaluatePotentials(rr,0.*rr,pot)\
+        -L[indx]**2./2./rr**2.
+    rap= _turningPoint(feff,R,vR**2./2.,2.)
+    rperi= _turningPoint(feff,R,vR**2./2.,0.5)
+    #r= (rap+rperi)/2-(rap-rperi)/2 cos(eta) removes the square-root 
+    #singularities at the turning points
+    x, w= nu.polynomial.legendre.leggauss(order)
+    eta= nu.pi/2.*(x+1.)
+    rm= (rap+rperi)/2.
+    dr= (rap-rperi)/2.
+    rs= rm[:,nu.newaxis]-dr[:,nu.newaxis]*nu.cos(eta)
+    rsf= rs.flatten()
+    f= E[:,nu.newaxis]-_evaluatePotentials(rsf,0.*rsf,pot).reshape(rs.shape)\
+        -(L**2.)[:,nu.newaxis]/2./rs**2.
+    integrand= nu.sqrt(nu.maximum(2.*f,0.))*nu.sin(eta)
+    out[0,bound]= dr*nu.sum(w*integrand,axis=1)/2.
+    return out
+
+def _turningPoint(func,x0,f0,fac,xtol=10.**-12.,maxiter=100):
+    """
+    NAME:
+       _turningPoint
+    PURPOSE:
+       vectorized search for the zero of func beyond x0, bracketing it by
+       stepping away from x0 by factors of fac and refining it using the
+       Illinois false-position method
+    INPUT:
+       func - function of (x,indx) that evaluates the function for the 
+              points indx; >= 0 at x0 and decreasing through the zero
+       x0 - starting points
+       f0 - func(x0)
+       fac - factor by which to step away from x0 to bracket the zero
+             (> 1 for outer, < 1 for inner turning points)
+       xtol= relative tolerance
+       maxiter= maximum number of iterations
+    OUTPUT:
+       turning points (0 for inner turning points below 10^-9, infinity 
+       for outer turning points that cannot be bracketed)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    out= x0.copy()
+    #Points with f0 == 0 are turning points if func decreases away from them
+    a= nu.where(f0 > 0.,x0,x0*(1.+(fac-1.)*10.**-8.))
+    fa= f0.copy()
+    indx= nu.arange(len(x0))[f0 <= 0.]
+    if len(indx) > 0:
+        fa[indx]= func(a[indx],indx)
+    indx= nu.arange(len(x0))[fa > 0.]
+    a, fa= a[indx], fa[indx]
+    #Bracket
+    b= x0[indx]*fac
+    b[b == 0.]= 10.**-2.
+    fb= func(b,indx)
+    step= (fb > 0.)
+    nbracket= 0
+    while nu.any(step) and nbracket < 200:
+        a[step]= b[step]
+        fa[step]= fb[step]
+        b[step]*= fac
+        fb[step]= func(b[step],indx[step])
+        step= (fb > 0.)
+        if fac < 1.: step*= (b > 10.**-9.)
+        nbracket+= 1
+    #Inner turning points that reach ~0 are at zero, outer ones that
+    #cannot be bracketed at infinity
+    atzero= (fb > 0.)
+    if fac < 1.: out[indx[atzero]]= 0.
+    else: out[indx[atzero]]= nu.inf
+    indx, a, b, fa, fb= indx[~atzero], a[~atzero], b[~atzero], \
+        fa[~atzero], fb[~atzero]
+    #Illinois false-position iteration on the bracket [a,b]
+    niter= 0
+    while len(indx) > 0 and niter < maxiter:
+        c= b-fb*(b-a)/(fb-fa)
+        fc= func(c,indx)
+        flip= (fc*fb < 0.)
+        a[flip]= b[flip]
+        fa[flip]= fb[flip]
+        fa[~flip]*= 0.5
+        b= c
+        fb= fc
+        done= (nu.fabs(b-a) <= xtol*nu.fabs(b))+(fc == 0.)
+        out[indx[done]]= b[done]
+        indx, a, b, fa, fb= indx[~done], a[~done], b[~done], fa[~done], \
+            fb[~done]
+        niter+= 1
+    out[indx]= b
+    return out
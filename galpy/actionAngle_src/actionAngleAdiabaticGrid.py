@@ -10,20 +10,25 @@
 #             __call__: returns (jr,lz,jz)
 #
 ###############################################################################
-import math
+import os
+import shutil
+import tempfile
+import hashlib
+import multiprocessing
 import numpy
 from scipy import interpolate
 from actionAngleAdiabatic import actionAngleAdiabatic
 from galpy.actionAngle import actionAngle, UnboundError
 import galpy.potential
-from galpy.util import multi
 from matplotlib import pyplot
 _PRINTOUTSIDEGRID= False
+_SAVEVERSION= 1.
+_CHUNKSPERCORE= 8
 class actionAngleAdiabaticGrid():
     """Action-angle formalism for axisymmetric potentials using the adiabatic approximation, grid-based interpolation"""
     def __init__(self,pot=None,zmax=3./8.,gamma=1.,Rmax=3.,
-                 nR=25,nEz=25,nEr=25,nLz=25,numcores=1,
-                 **kwargs):
+                 nR=25,nEz=25,nEr=25,nLz=25,numcores=1,c=True,
+                 savefilename=None,**kwargs):
         """
         NAME:
            __init__
@@ -35,11 +40,22 @@ class actionAngleAdiabaticGrid():
            Rmax = Rmax for building grids
            gamma= (default=1.) replace Lz by Lz+gamma Jz in effective potential
            nEz=, nEr=, nLz, nR= grid size
-           numcores= number of cpus to use to parallellize
-           +scipy.integrate.quad keywords
+           numcores= number of cpus to use to parallellize (if the actions 
+                     cannot be calculated in C)
+           c= (default=True) if True, calculate the actions in C if possible
+           savefilename= save the grids to or restore them from this file 
+                         (or from a file in this directory whose name is 
+                         derived from the potential's fingerprint, gamma, 
+                         zmax, Rmax, and the grid sizes); restored grids are 
+                         memory-mapped read-only, such that processes that 
+                         load the same file share one copy
+           +scipy.integrate.quad keywords (ignored when the actions are 
+           calculated in C)
         OUTPUT:
         HISTORY:
             2012-07-27 - Written - Bovy (IAS@MPIA)
+            2026-10-19 - Build the grids all at once in C if possible - agent (local)
+            2026-10-19 - Added savefilename= - agent (local)
         """
         if pot is None:
             raise IOError("Must specify pot= for actionAngleAxi")
@@ -48,106 +64,168 @@ class actionAngleAdiabaticGrid():
         self._zmax= zmax
         self._Rmax= Rmax
         self._Rmin= 0.01
+        self._Ramax= 99.
         #Set up the actionAngleAdiabatic object that we will use to interpolate
-        self._aA= actionAngleAdiabatic(pot=self._pot,gamma=self._gamma)
+        self._aA= actionAngleAdiabatic(pot=self._pot,gamma=self._gamma,c=c)
+        key= _gridKey(self._pot,self._gamma,self._zmax,self._Rmax,
+                      nR,nEz,nEr,nLz)
+        if not savefilename is None and os.path.isdir(savefilename):
+            savefilename= os.path.join(savefilename,'aAAGrid-%s.npy' % key)
+        if not savefilename is None and os.path.exists(savefilename):
+            self._restoreGrids(savefilename,key)
+        else:
+            self._buildGrids(nR,nEz,nEr,nLz,numcores,**kwargs)
+            if not savefilename is None:
+                self._saveGrids(savefilename,key)
+        self._setupInterp()
+        return None
+
+    def _buildGrids(self,nR,nEz,nEr,nLz,numcores,**kwargs):
+        """Calculate the Jz and JR grids"""
+        self._rotcurve= galpy.potential.rotcurveTable(self._pot)
         #Build grid for Ez, first calculate Ez(zmax;R) function
         self._Rs= numpy.linspace(self._Rmin,self._Rmax,nR)
         self._EzZmaxs= numpy.array([galpy.potential.evaluatePotentials(r,self._zmax,self._pot)-
                                         galpy.potential.evaluatePotentials(r,0.,self._pot) for r in self._Rs])
-        self._EzZmaxsInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._EzZmaxs),k=3)
         y= numpy.linspace(0.,1.,nEz)
-        jz= numpy.zeros((nR,nEz))
-        jzEzzmax= numpy.zeros(nR)
-        if numcores > 1:
-            thisRs= (numpy.tile(self._Rs,(nEz,1)).T).flatten()
-            thisEzZmaxs= (numpy.tile(self._EzZmaxs,(nEz,1)).T).flatten()
-            thisy= (numpy.tile(y,(nR,1))).flatten()
-            jz= multi.parallel_map((lambda x: self._aA.Jz(thisRs[x],0.,1.,#these two r dummies
-                                                          0.,math.sqrt(2.*thisy[x]*thisEzZmaxs[x]),
-                                                          **kwargs)[0]),
-                                   range(nR*nEz),numcores=numcores)
-            jz= numpy.reshape(jz,(nR,nEz))
-            jzEzzmax[0:nR]= jz[:,nEz-1]
-        else:
-            for ii in range(nR):
-                for jj in range(nEz):
-                    #Calculate Jz
-                    jz[ii,jj]= self._aA.Jz(self._Rs[ii],0.,1.,#these two r dummies
-                                           0.,math.sqrt(2.*y[jj]*self._EzZmaxs[ii]),
-                                           **kwargs)[0]
-                    if jj == nEz-1: 
-                        jzEzzmax[ii]= jz[ii,jj]
+        #Jz at (R,vz= sqrt(2 y Ez(zmax;R))) in the mid-plane
+        xv= numpy.array([numpy.tile(self._Rs,(nEz,1)).T.flatten(),
+                         numpy.zeros(nR*nEz),numpy.ones(nR*nEz),#these two r dummies
+                         numpy.zeros(nR*nEz),
+                         numpy.sqrt(2.*numpy.outer(self._EzZmaxs,y)).flatten()])
+        jz= numpy.reshape(self._gridActions('z',xv,numcores,**kwargs),
+                          (nR,nEz))
+        jzEzzmax= jz[:,nEz-1].copy()
         for ii in range(nR): jz[ii,:]/= jzEzzmax[ii]
-        #First interpolate Ez=Ezmax
-        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(jzEzzmax+10.**-5.),k=3)
         self._jz= jz
-        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
-                                                        y,
-                                                        jz,
-                                                        kx=3,ky=3,s=0.)
+        self._jzEzzmax= jzEzzmax
         #JR grid
         self._Lzmin= 0.01
         self._Lzs= numpy.linspace(self._Lzmin,
                                   self._Rmax\
-                                      *galpy.potential.vcirc(self._pot,
-                                                             self._Rmax),
+                                      *self._rotcurve.vcirc(self._Rmax),
                                   nLz)
-        self._Lzmax= self._Lzs[-1]
         #Calculate ER(vr=0,R=RL)
-        self._RL= numpy.array([galpy.potential.rl(self._pot,l) for l in self._Lzs])
+        self._RL= self._rotcurve.rl(self._Lzs)
+        self._ERRL= numpy.array([galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot) +self._Lzs[ii]**2./2./self._RL[ii]**2. for ii in range(nLz)])
+        self._ERRa= numpy.array([galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs[ii]**2./2./self._Ramax**2. for ii in range(nLz)])
+        y= numpy.linspace(0.,1.,nEr)
+        #JR at (RL,vR) with ER= ERRa+y(ERRL-ERRa); the last one is zero by 
+        #construction
+        thisRL= numpy.tile(self._RL,(nEr-1,1)).T.flatten()
+        thisLzs= numpy.tile(self._Lzs,(nEr-1,1)).T.flatten()
+        thisERRL= numpy.tile(self._ERRL,(nEr-1,1)).T.flatten()
+        thisERRa= numpy.tile(self._ERRa,(nEr-1,1)).T.flatten()
+        thisy= numpy.tile(y[0:-1],(nLz,1)).flatten()
+        thisPhiRL= numpy.tile([galpy.potential.evaluatePotentials(r,0.,self._pot) for r in self._RL],(nEr-1,1)).T.flatten()
+        xv= numpy.array([thisRL,
+                         numpy.sqrt(2.*(thisERRa+thisy*(thisERRL-thisERRa)-thisPhiRL)-thisLzs**2./thisRL**2.),
+                         thisLzs/thisRL,
+                         numpy.zeros(nLz*(nEr-1)),numpy.zeros(nLz*(nEr-1))])
+        jr= numpy.zeros((nLz,nEr))
+        jr[:,0:-1]= numpy.reshape(self._gridActions('R',xv,numcores,**kwargs),
+                                  (nLz,nEr-1))
+        if numpy.any(numpy.isinf(jr)):
+            raise UnboundError("Orbit is unbound")
+        jrERRa= jr[:,0].copy()
+        for ii in range(nLz): jr[ii,:]/= jrERRa[ii]
+        self._jr= jr
+        self._jrERRa= jrERRa
+        return None
+
+    def _gridActions(self,kind,xv,numcores,**kwargs):
+        """Calculate Jz (kind='z') or JR (kind='R') for the [5,N] array xv of 
+        (R,vR,vT,z,vz), all at once in C if possible, in a pool of numcores 
+        processes otherwise"""
+        if self._aA._c or numcores < 2:
+            return _gridActions(self._aA,kind,xv,**kwargs)
+        ntask= xv.shape[1]
+        out= multiprocessing.RawArray('d',ntask)
+        nchunk= min(ntask,_CHUNKSPERCORE*numcores)
+        pool= multiprocessing.Pool(numcores,initializer=_initGridWorker,
+                                   initargs=(self._pot,self._gamma,kind,xv,
+                                             nchunk,out,kwargs))
+        try:
+            for chunk in pool.imap_unordered(_gridWorker,range(nchunk)):
+                pass
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+        return numpy.ctypeslib.as_array(out).copy()
+
+    def _setupInterp(self):
+        """Set up the interpolations of the Jz and JR grids"""
+        nR, nEz= self._jz.shape
+        nLz, nEr= self._jr.shape
+        self._EzZmaxsInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._EzZmaxs),k=3)
+        #First interpolate Ez=Ezmax
+        self._jzEzmaxInterp= interpolate.InterpolatedUnivariateSpline(self._Rs,numpy.log(self._jzEzzmax+10.**-5.),k=3)
+        self._jzInterp= interpolate.RectBivariateSpline(self._Rs,
+                                                        numpy.linspace(0.,1.,nEz),
+                                                        self._jz,
+                                                        kx=3,ky=3,s=0.)
+        self._Lzmin= self._Lzs[0]
+        self._Lzmax= self._Lzs[-1]
         self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                  self._RL,k=3)
-        self._ERRL= numpy.array([galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot) +self._Lzs[ii]**2./2./self._RL[ii]**2. for ii in range(nLz)])
         self._ERRLmax= numpy.amax(self._ERRL)+1.
         self._ERRLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                    numpy.log(-(self._ERRL-self._ERRLmax)),k=3)
-        self._Ramax= 99.
-        self._ERRa= numpy.array([galpy.potential.evaluatePotentials(self._Ramax,0.,self._pot) +self._Lzs[ii]**2./2./self._Ramax**2. for ii in range(nLz)])
         self._ERRamax= numpy.amax(self._ERRa)+1.
         self._ERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
                                                                    numpy.log(-(self._ERRa-self._ERRamax)),k=3)
-        y= numpy.linspace(0.,1.,nEr)
-        jr= numpy.zeros((nLz,nEr))
-        jrERRa= numpy.zeros(nLz)
-        if numcores > 1:
-            thisRL= (numpy.tile(self._RL,(nEr-1,1)).T).flatten()
-            thisLzs= (numpy.tile(self._Lzs,(nEr-1,1)).T).flatten()
-            thisERRL= (numpy.tile(self._ERRL,(nEr-1,1)).T).flatten()
-            thisERRa= (numpy.tile(self._ERRa,(nEr-1,1)).T).flatten()
-            thisy= (numpy.tile(y[0:-1],(nLz,1))).flatten()
-            mjr= multi.parallel_map((lambda x: self._aA.JR(thisRL[x],
-                                                          numpy.sqrt(2.*(thisERRa[x]+thisy[x]*(thisERRL[x]-thisERRa[x])-galpy.potential.evaluatePotentials(thisRL[x],0.,self._pot))-thisLzs[x]**2./thisRL[x]**2.),
-                                                          thisLzs[x]/thisRL[x],
-                                                          0.,0.,
-                                                          **kwargs)[0]),
-                                   range((nEr-1)*nLz),
-                                   numcores=numcores)
-            jr[:,0:-1]= numpy.reshape(mjr,(nLz,nEr-1))
-            jrERRa[0:nLz]= jr[:,0]
-        else:
-            for ii in range(nLz):
-                for jj in range(nEr-1): #Last one is zero by construction
-                    try:
-                        jr[ii,jj]= self._aA.JR(self._RL[ii],
-                                               numpy.sqrt(2.*(self._ERRa[ii]+y[jj]*(self._ERRL[ii]-self._ERRa[ii])-galpy.potential.evaluatePotentials(self._RL[ii],0.,self._pot))-self._Lzs[ii]**2./self._RL[ii]**2.),
-                                               self._Lzs[ii]/self._RL[ii],
-                                               0.,0.,
-                                               **kwargs)[0]
-                    except UnboundError:
-                        raise
-                    if jj == 0: 
-                        jrERRa[ii]= jr[ii,jj]
-        for ii in range(nLz): jr[ii,:]/= jrERRa[ii]
-        #First interpolate Ez=Ezmax
-        self._jr= jr
+        #First interpolate ER=ERRa
         self._jrERRaInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
-                                                                     numpy.log(jrERRa+10.**-5.),k=3)
+                                                                     numpy.log(self._jrERRa+10.**-5.),k=3)
         self._jrInterp= interpolate.RectBivariateSpline(self._Lzs,
-                                                        y,
-                                                        jr,
+                                                        numpy.linspace(0.,1.,nEr),
+                                                        self._jr,
                                                         kx=3,ky=3,s=0.)
         return None
 
+    def _saveGrids(self,savefilename,key):
+        """Save the grids to a flat binary (.npy) file: a header 
+        [version,gamma,zmax,Rmax,nR,nEz,nEr,nLz,key (5 32-bit words)] followed 
+        by Rs, EzZmaxs, jz, jzEzzmax, Lzs, RL, ERRL, ERRa, jr, and jrERRa"""
+        nR, nEz= self._jz.shape
+        nLz, nEr= self._jr.shape
+        out= numpy.concatenate(([_SAVEVERSION,self._gamma,self._zmax,
+                                 self._Rmax,nR,nEz,nEr,nLz],
+                                _keyWords(key),
+                                self._Rs,self._EzZmaxs,self._jz.flatten(),
+                                self._jzEzzmax,
+                                self._Lzs,self._RL,self._ERRL,self._ERRa,
+                                self._jr.flatten(),self._jrERRa))
+        #Write to a temporary file first, such that other processes never 
+        #see a partially written file
+        fd, tmp_savefilename= tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(savefilename)))
+        savefile= os.fdopen(fd,'wb')
+        numpy.save(savefile,out)
+        savefile.close()
+        os.chmod(tmp_savefilename,0644)
+        shutil.move(tmp_savefilename,savefilename)
+        return None
+
+    def _restoreGrids(self,savefilename,key):
+        """Restore the grids from a file written by _saveGrids, memory-mapping 
+        it read-only"""
+        grids= numpy.load(savefilename,mmap_mode='r')
+        if grids[0] != _SAVEVERSION \
+                or numpy.any(grids[8:13] != _keyWords(key)):
+            raise IOError("Savefile %s does not match this potential, gamma, zmax, Rmax, and grid sizes" % savefilename)
+        nR, nEz, nEr, nLz= [int(x) for x in grids[4:8]]
+        sizes= [nR,nR,nR*nEz,nR,nLz,nLz,nLz,nLz,nLz*nEr,nLz]
+        offsets= 13+numpy.cumsum([0]+sizes)
+        self._Rs, self._EzZmaxs, jz, self._jzEzzmax, self._Lzs, self._RL, \
+            self._ERRL, self._ERRa, jr, self._jrERRa= \
+            [grids[offsets[ii]:offsets[ii+1]] for ii in range(len(sizes))]
+        self._jz= jz.reshape((nR,nEz))
+        self._jr= jr.reshape((nLz,nEr))
+        return None
+
     def __call__(self,*args,**kwargs):
         """
         NAME:
@@ -159,11 +237,16 @@ class actionAngleAdiabaticGrid():
               a) R,vR,vT,z,vz
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
-           scipy.integrate.quadrature keywords
+           order=, numcores= keywords for the stars outside of the grid 
+           (see actionAngleAdiabatic.__call__)
         OUTPUT:
-           (jr,lz,jz)
+           (jr,lz,jz) (jr and jz are NaN for unbound orbits outside of the 
+           grid)
         HISTORY:
            2012-07-27 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Calculate the actions of all stars outside of the
+                        grid at once - agent (local)
+           2026-10-19 - Evaluate scalar input as arrays - agent (local)
         NOTE:
            For a Miyamoto-Nagai potential, this seems accurate to 0.1% and takes ~0.13 ms
            For a MWPotential, this takes ~ 0.17 ms
@@ -179,100 +262,52 @@ class actionAngleAdiabaticGrid():
             vT= meta._vT
             z= meta._z
             vz= meta._vz
+        #Scalars are evaluated as arrays of length one, such that they are
+        #treated exactly like array input
+        scalar= not isinstance(R,numpy.ndarray)
+        R,vR,vT,z,vz= [numpy.array(x,dtype='float64').flatten()
+                       for x in numpy.broadcast_arrays(R,vR,vT,z,vz)]
         #First work on the vertical action
-        Phi= galpy.potential.evaluatePotentials(R,z,self._pot)
-        Phio= galpy.potential.evaluatePotentials(R,0.,self._pot)
-        Ez= Phi-Phio+vz**2./2.
-        #Bigger than Ezzmax?
-        thisEzZmax= numpy.exp(self._EzZmaxsInterp(R))
-        if isinstance(R,numpy.ndarray):
-            indx= (R > self._Rmax)
-            indx+= (R < self._Rmin)
-            indx+= (Ez != 0.)*(numpy.log(Ez) > thisEzZmax)
-            indxc= True-indx
-            jz= numpy.empty(R.shape)
-            if numpy.sum(indxc) > 0:
-                jz[indxc]= (self._jzInterp.ev(R[indxc],Ez[indxc]/thisEzZmax[indxc])\
-                                *(numpy.exp(self._jzEzmaxInterp(R[indxc]))-10.**-5.))
-            if numpy.sum(indx) > 0:
-                jzindiv= numpy.empty(numpy.sum(indx))
-                for ii in range(numpy.sum(indx)):
-                    try:
-                        jzindiv[ii]= self._aA.Jz(R[indx][ii],0.,1.,#these two r dummies
-                                                 0.,numpy.sqrt(2.*Ez[indx][ii]),
-                                                 **kwargs)[0]
-                    except UnboundError:
-                        jzindiv[ii]= numpy.nan
-                jz[indx]= jzindiv
-        else:
-            if R > self._Rmax or R < self._Rmin or (Ez != 0 and numpy.log(Ez) > thisEzZmax): #Outside of the grid
-                if _PRINTOUTSIDEGRID:
-                    print "Outside of grid in Ez", R > self._Rmax , R < self._Rmin , (Ez != 0 and numpy.log(Ez) > thisEzZmax)
-                jz= self._aA.Jz(R,0.,1.,#these two r dummies
-                                    0.,math.sqrt(2.*Ez),
-                                    **kwargs)[0]
-            else:
-                jz= (self._jzInterp(R,Ez/thisEzZmax)\
-                         *(numpy.exp(self._jzEzmaxInterp(R))-10.**-5.))[0][0]
+        jz, Phio= self._Jz(R,z,vz,**kwargs)
         #Radial action
         ERLz= numpy.fabs(R*vT)+self._gamma*jz
         ER= Phio+vR**2./2.+ERLz**2./2./R**2.
         thisRL= self._RLInterp(ERLz)
         thisERRL= -numpy.exp(self._ERRLInterp(ERLz))+self._ERRLmax
         thisERRa= -numpy.exp(self._ERRaInterp(ERLz))+self._ERRamax
-        if isinstance(R,numpy.ndarray):
-            indx= ((ER-thisERRa)/(thisERRL-thisERRa) > 1.)\
-                *(((ER-thisERRa)/(thisERRL-thisERRa)-1.) < 10.**-2.)
-            ER[indx]= thisERRL[indx]
-            indx= ((ER-thisERRa)/(thisERRL-thisERRa) < 0.)\
-                *((ER-thisERRa)/(thisERRL-thisERRa) > -10.**-2.)
-            ER[indx]= thisERRa[indx]
-            indx= (ERLz < self._Lzmin)
-            indx+= (ERLz > self._Lzmax)
-            indx+= ((ER-thisERRa)/(thisERRL-thisERRa) > 1.)
-            indx+= ((ER-thisERRa)/(thisERRL-thisERRa) < 0.)
-            indxc= True-indx
-            jr= numpy.empty(R.shape)
-            if numpy.sum(indxc) > 0:
-                jr[indxc]= (self._jrInterp.ev(ERLz[indxc],
-                                              (ER[indxc]-thisERRa[indxc])/(thisERRL[indxc]-thisERRa[indxc]))\
-                                *(numpy.exp(self._jrERRaInterp(ERLz[indxc]))-10.**-5.))
-            if numpy.sum(indx) > 0:
-                jrindiv= numpy.empty(numpy.sum(indx))
-                for ii in range(numpy.sum(indx)):
-                    try:
-                        jrindiv[ii]= self._aA.JR(thisRL[indx][ii],
-                                                 numpy.sqrt(2.*(ER[indx][ii]-galpy.potential.evaluatePotentials(thisRL[indx][ii],0.,self._pot))-ERLz[indx][ii]**2./thisRL[indx][ii]**2.),
-                                                 ERLz[indx][ii]/thisRL[indx][ii],
-                                                 0.,0.,
-                                                 **kwargs)[0]
-                    except (UnboundError,OverflowError):
-                        jrindiv[ii]= numpy.nan
-                jr[indx]= jrindiv
-        else:
-            if (ER-thisERRa)/(thisERRL-thisERRa) > 1. \
-                    and ((ER-thisERRa)/(thisERRL-thisERRa)-1.) < 10.**-2.:
-                ER= thisERRL
-            elif (ER-thisERRa)/(thisERRL-thisERRa) < 0. \
-                    and (ER-thisERRa)/(thisERRL-thisERRa) > -10.**-2.:
-                ER= thisERRa
-            #Outside of grid?
-            if ERLz < self._Lzmin or ERLz > self._Lzmax \
-                    or (ER-thisERRa)/(thisERRL-thisERRa) > 1. \
-                    or (ER-thisERRa)/(thisERRL-thisERRa) < 0.:
-                if _PRINTOUTSIDEGRID:
-                    print "Outside of grid in ER/Lz", ERLz < self._Lzmin , ERLz > self._Lzmax \
-                        , (ER-thisERRa)/(thisERRL-thisERRa) > 1. \
-                        , (ER-thisERRa)/(thisERRL-thisERRa) < 0., ER, thisERRL, thisERRa, (ER-thisERRa)/(thisERRL-thisERRa)
-                jr= self._aA.JR(thisRL,
-                                numpy.sqrt(2.*(ER-galpy.potential.evaluatePotentials(thisRL,0.,self._pot))-ERLz**2./thisRL**2.),
-                                ERLz/thisRL,
-                                0.,0.,
-                                **kwargs)[0]
-            else:
-                jr= (self._jrInterp(ERLz,
-                                    (ER-thisERRa)/(thisERRL-thisERRa))\
-                         *(numpy.exp(self._jrERRaInterp(ERLz))-10.**-5.))[0][0]
+        indx= ((ER-thisERRa)/(thisERRL-thisERRa) > 1.)\
+            *(((ER-thisERRa)/(thisERRL-thisERRa)-1.) < 10.**-2.)
+        ER[indx]= thisERRL[indx]
+        indx= ((ER-thisERRa)/(thisERRL-thisERRa) < 0.)\
+            *((ER-thisERRa)/(thisERRL-thisERRa) > -10.**-2.)
+        ER[indx]= thisERRa[indx]
+        indx= (ERLz < self._Lzmin)
+        indx+= (ERLz > self._Lzmax)
+        indx+= ((ER-thisERRa)/(thisERRL-thisERRa) > 1.)
+        indx+= ((ER-thisERRa)/(thisERRL-thisERRa) < 0.)
+        #Orbits that are vertically unbound are unbound
+        unbound= numpy.isnan(jz)
+        indx*= ~unbound
+        indxc= ~indx*~unbound
+        jr= numpy.empty(R.shape)
+        jr[unbound]= numpy.nan
+        if numpy.sum(indxc) > 0:
+            jr[indxc]= (self._jrInterp.ev(ERLz[indxc],
+                                          (ER[indxc]-thisERRa[indxc])/(thisERRL[indxc]-thisERRa[indxc]))\
+                            *(numpy.exp(self._jrERRaInterp(ERLz[indxc]))-10.**-5.))
+        if numpy.sum(indx) > 0:
+            if _PRINTOUTSIDEGRID:
+                print "Outside of grid in ER/Lz for %i stars" % numpy.sum(indx)
+            #Directly, all at once, at the star's own R, where 
+            #ER= Phi(R,0)+vR^2/2+ERLz^2/2/R^2 (z=vz=0 such that ERLz 
+            #is not adjusted again)
+            nindx= numpy.sum(indx)
+            jr[indx]= self._aA.JR(R[indx],vR[indx],ERLz[indx]/R[indx],
+                                  numpy.zeros(nindx),numpy.zeros(nindx),
+                                  **_vectorKwargs(kwargs))
+            jr[numpy.isinf(jr)]= numpy.nan
+        if scalar:
+            return (jr[0],R[0]*vT[0],jz[0])
         return (jr,R*vT,jz)
 
     def Jz(self,*args,**kwargs):
@@ -286,25 +321,107 @@ class actionAngleAdiabaticGrid():
               a) R,vR,vT,z,vz
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
-           scipy.integrate.quadrature keywords
+           order=, numcores= keywords for the stars outside of the grid 
+           (see actionAngleAdiabatic.__call__)
         OUTPUT:
-           jz
+           jz (NaN for unbound orbits outside of the grid)
         HISTORY:
            2012-07-30 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Evaluate scalar input as arrays - agent (local)
         """
         meta= actionAngle(*args)
-        Phi= galpy.potential.evaluatePotentials(meta._R,meta._z,self._pot)
-        Phio= galpy.potential.evaluatePotentials(meta._R,0.,self._pot)
-        Ez= Phi-Phio+meta._vz**2./2.
+        scalar= not isinstance(meta._R,numpy.ndarray)
+        R,z,vz= [numpy.array(x,dtype='float64').flatten()
+                 for x in numpy.broadcast_arrays(meta._R,meta._z,meta._vz)]
+        jz= self._Jz(R,z,vz,**kwargs)[0]
+        if scalar: return jz[0]
+        return jz
+
+    def _Jz(self,R,z,vz,**kwargs):
+        """Vertical actions for arrays R, z, vz, interpolated on the grid and 
+        calculated directly outside of it (NaN for unbound orbits); also 
+        returns Phi(R,0)"""
+        Phi= galpy.potential.evaluatePotentials(R,z,self._pot)
+        Phio= galpy.potential.evaluatePotentials(R,0.*R,self._pot)
+        Ez= Phi-Phio+vz**2./2.
         #Bigger than Ezzmax?
-        thisEzZmax= numpy.exp(self._EzZmaxsInterp(meta._R))
-        if meta._R > self._Rmax or meta._R < self._Rmin or (Ez != 0. and numpy.log(Ez) > thisEzZmax): #Outside of the grid
+        thisEzZmax= numpy.exp(self._EzZmaxsInterp(R))
+        indx= (R > self._Rmax)
+        indx+= (R < self._Rmin)
+        indx+= (Ez > thisEzZmax)
+        indxc= ~indx
+        jz= numpy.empty(R.shape)
+        if numpy.sum(indxc) > 0:
+            jz[indxc]= (self._jzInterp.ev(R[indxc],Ez[indxc]/thisEzZmax[indxc])\
+                            *(numpy.exp(self._jzEzmaxInterp(R[indxc]))-10.**-5.))
+        if numpy.sum(indx) > 0:
             if _PRINTOUTSIDEGRID:
-                print "Outside of grid in Ez"
-            jz= self._aA.Jz(meta._R,0.,1.,#these two r dummies
-                            0.,math.sqrt(2.*Ez),
-                            **kwargs)[0]
+                print "Outside of grid in Ez for %i stars" % numpy.sum(indx)
+            #Directly, all at once
+            nindx= numpy.sum(indx)
+            jz[indx]= self._aA.Jz(R[indx],numpy.zeros(nindx),
+                                  numpy.ones(nindx),#these two r dummies
+                                  numpy.zeros(nindx),
+                                  numpy.sqrt(2.*Ez[indx]),
+                                  **_vectorKwargs(kwargs))
+            jz[numpy.isinf(jz)]= numpy.nan
+        return (jz,Phio)
+
+def _gridKey(pot,gamma,zmax,Rmax,nR,nEz,nEr,nLz):
+    """Key (sha1 hex digest) identifying a grid"""
+    return hashlib.sha1(repr((galpy.potential.potentialFingerprint(pot),
+                              float(gamma),float(zmax),float(Rmax),
+                              nR,nEz,nEr,nLz))).hexdigest()
+
+def _keyWords(key):
+    """Split a sha1 hex digest into 5 32-bit words that are exactly 
+    representable as floats"""
+    return numpy.array([int(key[8*ii:8*(ii+1)],16) for ii in range(5)],
+                       dtype='float64')
+
+def _vectorKwargs(kwargs):
+    """Select the keywords of actionAngleAdiabatic's array input"""
+    return dict([(k,kwargs[k]) for k in ['order','numcores']
+                 if kwargs.has_key(k)])
+
+def _gridActions(aA,kind,xv,**kwargs):
+    """Calculate Jz (kind='z') or JR (kind='R') for the [5,N] array xv of 
+    (R,vR,vT,z,vz) using the actionAngleAdiabatic instance aA; JR is 
+    infinite for unbound orbits"""
+    if aA._c:
+        #All at once in C
+        if kind == 'z': return aA.Jz(*xv)
+        else: return aA.JR(*xv)
+    out= numpy.empty(xv.shape[1])
+    for ii in range(xv.shape[1]):
+        if kind == 'z':
+            out[ii]= aA.Jz(*xv[:,ii],**kwargs)[0]
         else:
-            jz= (self._jzInterp(meta._R,Ez/thisEzZmax)\
-                *(numpy.exp(self._jzEzmaxInterp(meta._R))-10.**-5.))[0][0]
-        return jz
+            try:
+                out[ii]= aA.JR(*xv[:,ii],**kwargs)[0]
+            except UnboundError:
+                out[ii]= numpy.inf
+    return out
+
+#Worker processes for the parallel construction of the grids; everything the
+#workers need is passed through the pool's initializer, such that this also
+#works when the workers are spawned rather than forked
+_GRIDWORKER= {}
+def _initGridWorker(pot,gamma,kind,xv,nchunk,out,kwargs):
+    _GRIDWORKER['aA']= actionAngleAdiabatic(pot=pot,gamma=gamma,c=False)
+    _GRIDWORKER['kind']= kind
+    _GRIDWORKER['xv']= xv
+    _GRIDWORKER['nchunk']= nchunk
+    _GRIDWORKER['out']= numpy.ctypeslib.as_array(out)
+    _GRIDWORKER['kwargs']= kwargs
+    return None
+
+def _gridWorker(chunk):
+    """Calculate chunk number chunk of the grid and write it to the shared 
+    output array; chunks take every nchunk-th grid point, such that 
+    expensive regions of the grid are spread over all chunks"""
+    w= _GRIDWORKER
+    indx= numpy.arange(chunk,w['xv'].shape[1],w['nchunk'])
+    w['out'][indx]= _gridActions(w['aA'],w['kind'],w['xv'][:,indx],
+                                 **w['kwargs'])
+    return None
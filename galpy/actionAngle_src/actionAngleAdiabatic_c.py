@@ -0,0 +1,142 @@
+###############################################################################
+#   actionAngleAdiabatic_c.py: wrapper around the C code that calculates the
+#                              turning points, actions, and periods in the
+#                              adiabatic approximation for arrays of
+#                              phase-space points
+###############################################################################
+import os
+import sys
+import ctypes
+import ctypes.util
+import numpy as nu
+from numpy.ctypeslib import ndpointer
+from galpy import potential
+from galpy.potential_src.planarPotential import \
+    planarPotentialFromRZPotential
+#Find and load the library
+_lib= None
+_libname= ctypes.util.find_library('galpy_integrate_c')
+if _libname:
+    _lib= ctypes.CDLL(_libname)
+if _lib is None:
+    for path in sys.path:
+        try:
+            _lib= ctypes.CDLL(os.path.join(path,'galpy_integrate_c.so'))
+        except OSError:
+            _lib= None
+        else:
+            break
+_ext_loaded= not _lib is None
+_GLNODES= {}
+
+def _parse_pot(pot):
+    """Parse the potential so it can be fed to C, returns None if (part of)
+    the potential does not have a C implementation of its value"""
+    #Figure out what's in pot
+    if not isinstance(pot,list):
+        pot= [pot]
+    #Initialize everything
+    pot_type= []
+    pot_args= []
+    npot= len(pot)
+    for p in pot:
+        if isinstance(p,planarPotentialFromRZPotential):
+            p= p._RZPot
+        if isinstance(p,potential.LogarithmicHaloPotential):
+            pot_type.append(0)
+            pot_args.extend([p._amp,p._q,p._core2])
+        elif isinstance(p,potential.MiyamotoNagaiPotential):
+            pot_type.append(5)
+            pot_args.extend([p._amp,p._a,p._b])
+        elif isinstance(p,potential.PowerSphericalPotential):
+            pot_type.append(7)
+            pot_args.extend([p._amp,p.alpha])
+        elif isinstance(p,potential.HernquistPotential):
+            pot_type.append(8)
+            pot_args.extend([p._amp,p.a])
+        elif isinstance(p,potential.NFWPotential):
+            pot_type.append(9)
+            pot_args.extend([p._amp,p.a])
+        elif isinstance(p,potential.JaffePotential):
+            pot_type.append(10)
+            pot_args.extend([p._amp,p.a])
+        else:
+            return None
+    pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
+    pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
+    return (npot,pot_type,pot_args)
+
+def _check_c(pot):
+    """
+    NAME:
+       _check_c
+    PURPOSE:
+       check whether the actions for a potential can be calculated in C
+    INPUT:
+       pot - potential or list of potentials (3D or planar versions of 3D
+             potentials)
+    OUTPUT:
+       True if the C extension is loaded and all potentials have a C
+       implementation of their value
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    return _ext_loaded and not _parse_pot(pot) is None
+
+def actionAngleAdiabatic_c(pot,gamma,phiinf,R,vR,vT,z,vz,order=20):
+    """
+    NAME:
+       actionAngleAdiabatic_c
+    PURPOSE:
+       calculate the turning points, actions, and periods in the adiabatic
+       approximation in C
+    INPUT:
+       pot - potential or list of potentials (3D)
+       gamma - replace Lz by Lz+gamma Jz in the effective potential
+       phiinf - Phi(infinity)
+       R, vR, vT, z, vz - arrays of phase-space coordinates
+       order= order of the Gauss-Legendre quadrature
+    OUTPUT:
+       (rperi,rap,zmax,jr,jz,TR,Tphi,Tz) arrays (jr, TR, and Tphi are
+       infinite for unbound orbits)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    npot, pot_type, pot_args= _parse_pot(pot)
+    if not _GLNODES.has_key(order):
+        _GLNODES[order]= [nu.require(x,dtype=nu.float64,
+                                     requirements=['C','W'])
+                          for x in nu.polynomial.legendre.leggauss(order)]
+    glx, glw= _GLNODES[order]
+    #Set up the input and result arrays
+    R, vR, vT, z, vz= [nu.require(nu.array(x,dtype=nu.float64).flatten(),
+                                  dtype=nu.float64,requirements=['C','W'])
+                       for x in [R,vR,vT,z,vz]]
+    ndata= len(R)
+    out= [nu.empty(ndata) for ii in range(8)]
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    actionFunc= _lib.actionAngleAdiabatic_actions
+    actionFunc.argtypes= [ctypes.c_int]\
+        +[ndpointer(dtype=nu.float64,flags=ndarrayFlags)]*5\
+        +[ctypes.c_int,
+          ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+          ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+          ctypes.c_double,
+          ctypes.c_double,
+          ctypes.c_int]\
+          +[ndpointer(dtype=nu.float64,flags=ndarrayFlags)]*10
+
+    #Run the C code
+    actionFunc(ctypes.c_int(ndata),
+               R,vR,vT,z,vz,
+               ctypes.c_int(npot),
+               pot_type,
+               pot_args,
+               ctypes.c_double(gamma),
+               ctypes.c_double(phiinf),
+               ctypes.c_int(order),
+               glx,glw,
+               *out)
+    return tuple(out)
@@ -20,7 +20,8 @@ from actionAngle import *
 from actionAngleVertical import actionAngleVertical
 from galpy.potential_src.planarPotential import evaluateplanarRforces,\
     planarPotential, evaluateplanarPotentials
-from galpy.potential import vcirc
+from galpy.potential import vcirc, Phiinf
+from actionAngleAdiabatic_c import _check_c, actionAngleAdiabatic_c
 _EPS= 10.**-15.
 class actionAngleAxi(actionAngle,actionAngleVertical):
     """Action-angle formalism for axisymmetric potentials"""
@@ -38,9 +39,11 @@ class actionAngleAxi(actionAngle,actionAngleVertical):
               pot= potential or list of potentials (planarPotentials)
               verticalPot= the vertical Potential
               gamma= (default=1.) replace Lz by Lz+gamma Jz in effective potential (if there is no vertical potential, this is set to zero)
+              c= (default=True) if True, calculate the turning points, actions, and periods in C if possible (their error estimates are then zero)
         OUTPUT:
         HISTORY:
            2010-12-01 - Written - Bovy (NYU)
+           2026-10-19 - Added c= - agent (local)
         """
         actionAngle.__init__(self,*args,**kwargs)
         if not kwargs.has_key('pot'):
@@ -56,7 +59,27 @@ class actionAngleAxi(actionAngle,actionAngleVertical):
                 self._gamma= 1.
         else:
             self._gamma= 0.
+        if not kwargs.has_key('c') or kwargs['c']:
+            _setupC([self],[kwargs.get('verticalPot',None)])
         return None
+
+    def _checkC(self,verticalPot):
+        """Check whether the turning points, actions, and periods can be 
+        calculated in C; the vertical potential needs to be the vertical 
+        slice at R of the potentials used for the radial motion"""
+        self._cVertical= False
+        if not _check_c(self._pot): return False
+        if verticalPot is None: return True
+        pot= self._pot
+        if not isinstance(pot,list): pot= [pot]
+        if not isinstance(verticalPot,list): verticalPot= [verticalPot]
+        if len(pot) != len(verticalPot): return False
+        for p,vp in zip(pot,verticalPot):
+            if not hasattr(p,'_RZPot') or not hasattr(vp,'_RZPot') \
+                    or not p._RZPot is vp._RZPot or vp._R != self._R:
+                return False
+        self._cVertical= True
+        return True
     
     def angleR(self,**kwargs):
         """
@@ -278,11 +301,14 @@ class actionAngleAxi(actionAngle,actionAngleVertical):
            (rperi,rap)
         HISTORY:
            2010-12-01 - Written - Bovy (NYU)
+           2026-10-19 - Raise UnboundError for E >= Phi(infinity) - agent (local)
         """
         if hasattr(self,'_rperirap'):
             return self._rperirap
         EL= self.calcEL(**kwargs)
         E, L= EL
+        if E >= Phiinf(self._pot):
+            raise UnboundError("Orbit is unbound")
         if self._vR == 0. and m.fabs(self._vT - vcirc(self._pot,self._R)) < _EPS: #We are on a circular orbit
             rperi= self._R
             rap = self._R
@@ -333,6 +359,56 @@ class actionAngleAxi(actionAngle,actionAngleVertical):
         self._rperirap= (rperi,rap)
         return self._rperirap
 
+def _setupC(aAs,verticalPots):
+    """
+    NAME:
+       _setupC
+    PURPOSE:
+       calculate the turning points, actions, and periods of a list of 
+       actionAngleAxi objects in C and cache them, all at once for objects 
+       that share their potential, if the potentials allow it
+    INPUT:
+       aAs - list of actionAngleAxi instances
+       verticalPots - list of their vertical potentials (None if none)
+    OUTPUT:
+       (none)
+    HISTORY:
+       2026-10-19 - Written as a method - agent (local)
+       2026-10-19 - Made a function for lists of objects - agent (local)
+    """
+    groups= {}
+    for aA,vp in zip(aAs,verticalPots):
+        if not aA._checkC(vp): continue
+        key= (id(aA._pot),aA._gamma,aA._cVertical)
+        if not groups.has_key(key): groups[key]= []
+        groups[key].append(aA)
+    for group in groups.values():
+        pot= group[0]._pot
+        R= [aA._R for aA in group]
+        vR= [aA._vR for aA in group]
+        vT= [aA._vT for aA in group]
+        if group[0]._cVertical:
+            z= [aA._z for aA in group]
+            vz= [aA._vz for aA in group]
+        else:
+            z, vz= nu.zeros(len(group)), nu.zeros(len(group))
+        rperi,rap,zmax,jr,jz,TR,Tphi,Tz= \
+            actionAngleAdiabatic_c(pot,group[0]._gamma,Phiinf(pot),
+                                   R,vR,vT,z,vz)
+        for ii,aA in enumerate(group):
+            if aA._cVertical:
+                aA._zmax= zmax[ii]
+                aA._Jz= nu.array([jz[ii],0.])
+                aA._Tz= nu.array([Tz[ii],0.])
+            #Leave unbound orbits to calcRapRperi, which raises UnboundError
+            if nu.isinf(rap[ii]): continue
+            aA._rperirap= (rperi[ii],rap[ii])
+            aA._JR= nu.array([jr[ii],0.])
+            aA._TR= nu.array([TR[ii],0.])
+            aA._Tphi= nu.array([Tphi[ii],0.])
+            aA._I= nu.array([TR[ii]/Tphi[ii]*m.pi,0.])
+    return None
+
 def calcRapRperiFromELAxi(E,L,pot,vc=1.,ro=1.):
     """
     NAME:
@@ -0,0 +1,182 @@
+###############################################################################
+#   actionAngle: a Python module to calculate  actions, angles, and frequencies
+#
+#      class: actionAngleIsochrone
+#
+#             actions, frequencies, and angles in the isochrone potential,
+#             calculated analytically for arrays of (R,vR,vT,z,vz,phi)
+#
+#      methods:
+#             __call__: returns (jr,lz,jz)
+#             actionsFreqs: returns (jr,lz,jz,Or,Op,Oz)
+#             actionsFreqsAngles: returns (jr,lz,jz,Or,Op,Oz,ar,ap,az)
+#
+###############################################################################
+import numpy as nu
+from actionAngleStaeckel import _parseArgs, _output
+from galpy.potential_src.IsochronePotential import IsochronePotential
+class actionAngleIsochrone():
+    """Action-angle formalism for the isochrone potential"""
+    def __init__(self,*args,**kwargs):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize an actionAngleIsochrone object
+        INPUT:
+           Either:
+              b= scale parameter of the isochrone potential, with amp= its
+                 amplitude (default: 1)
+              ip= instance of an IsochronePotential
+        OUTPUT:
+        HISTORY:
+            2026-10-19 - Written - agent (local)
+        """
+        if kwargs.has_key('ip'):
+            ip= kwargs['ip']
+            if not isinstance(ip,IsochronePotential):
+                raise IOError("'ip=' must be an instance of IsochronePotential")
+        elif kwargs.has_key('b'):
+            if kwargs.has_key('amp'):
+                amp= kwargs['amp']
+            else:
+                amp= 1.
+            ip= IsochronePotential(amp=amp,b=kwargs['b'])
+        else:
+            raise IOError("Must specify b= or ip= for actionAngleIsochrone")
+        self._ip= ip
+        self.amp= ip._amp
+        self.b= ip.b
+        return None
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the actions (jr,lz,jz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+        OUTPUT:
+           (jr,lz,jz) (arrays for array input, with jr=inf for unbound
+           orbits; an UnboundError is raised for a single unbound orbit)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        return _output(self._actions(xv)[:3],shape,scalar)
+
+    def actionsFreqs(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqs
+        PURPOSE:
+           evaluate the actions and frequencies (jr,lz,jz,Omegar,Omegaphi,
+           Omegaz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+        OUTPUT:
+           (jr,lz,jz,Omegar,Omegaphi,Omegaz) (NaN frequencies for unbound
+           orbits)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        return _output(self._actions(xv)[:6],shape,scalar)
+
+    def actionsFreqsAngles(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqsAngles
+        PURPOSE:
+           evaluate the actions, frequencies, and angles (jr,lz,jz,Omegar,
+           Omegaphi,Omegaz,angler,anglephi,anglez)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz,phi (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+        OUTPUT:
+           (jr,lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez) (angles
+           in [0,2pi); NaN frequencies and angles for unbound orbits)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args,phi=True)
+        return _output(self._actions(xv,angles=True),shape,scalar)
+
+    def _actions(self,xv,angles=False):
+        """
+        NAME:
+           _actions
+        PURPOSE:
+           calculate the actions, frequencies, and (if angles=True) angles for
+           a [5,N] ([6,N] with angles=True) array of phase-space points
+        INPUT:
+           xv - array of (R,vR,vT,z,vz[,phi])
+           angles= if True, also calculate the angles
+        OUTPUT:
+           [6,N] or [9,N] array
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        R, vR, vT, z, vz= xv[:5]
+        out= nu.empty((6+3*angles,xv.shape[1]))
+        r2= R**2.+z**2.
+        r= nu.sqrt(r2)
+        #Angular momentum vector at phi=0 and energy
+        Lx= -z*vT
+        Ly= z*vR-R*vz
+        Lz= R*vT
+        Lperp= nu.sqrt(Lx**2.+Ly**2.)
+        L= nu.sqrt(Lperp**2.+Lz**2.)
+        E= -self.amp/(self.b+nu.sqrt(r2+self.b**2.))+(vR**2.+vT**2.+vz**2.)/2.
+        unbound= (E >= 0.)
+        E[unbound]= -1. #avoid warnings, reset below
+        sqrtL4kb= nu.sqrt(L**2.+4.*self.amp*self.b)
+        out[0]= self.amp/nu.sqrt(-2.*E)-(L+sqrtL4kb)/2.
+        out[1]= Lz
+        out[2]= L-nu.fabs(Lz)
+        #Frequencies
+        out[3]= (-2.*E)**1.5/self.amp
+        out[5]= out[3]/2.*(1.+L/sqrtL4kb)
+        out[4]= nu.sign(Lz)*out[5]
+        out[4,Lz == 0.]= out[5,Lz == 0.]
+        if angles:
+            #Radial angle from the eccentric anomaly eta, with
+            #s= 1+sqrt(1+r^2/b^2)= 2+c/b(1-e cos eta)
+            c= -self.amp/2./E-self.b
+            e= nu.sqrt(nu.maximum(1.-L**2./self.amp/c*(1.+self.b/c),0.))
+            s= 1.+nu.sqrt(1.+r2/self.b**2.)
+            ecoseta= 1.-self.b/c*(s-2.)
+            eta= nu.zeros_like(e)
+            indx= (e > 0.)
+            eta[indx]= nu.arccos(nu.clip(ecoseta[indx]/e[indx],-1.,1.))
+            vr= (R*vR+z*vz)/r
+            eta[vr < 0.]= 2.*nu.pi-eta[vr < 0.]
+            out[6]= eta-e*c/(c+self.b)*nu.sin(eta)
+            #Angle in the orbital plane from the ascending node; for orbits
+            #in the mid-plane, the node is put at phi=0
+            psi= nu.arctan2(z*L,R*(R*vz-z*vR))
+            Omega= xv[5]+nu.arctan2(-Lx,Ly)
+            indx= (Lperp == 0.)
+            psi[indx]= nu.sign(Lz[indx])*xv[5,indx]
+            Omega[indx]= 0.
+            tan11= nu.arctan(nu.sqrt((1.+e)/(1.-e))*nu.tan(eta/2.))
+            tan12= nu.arctan(nu.sqrt((c*(1.+e)+2.*self.b)
+                                     /(c*(1.-e)+2.*self.b))*nu.tan(eta/2.))
+            tan11[tan11 < 0.]+= nu.pi
+            tan12[tan12 < 0.]+= nu.pi
+            out[8]= psi+out[5]/out[3]*out[6]-tan11-L/sqrtL4kb*tan12
+            out[7]= Omega+nu.sign(Lz)*out[8]
+            out[7,Lz == 0.]= (Omega+out[8])[Lz == 0.]
+            out[6:]= nu.mod(out[6:],2.*nu.pi)
+        out[0,unbound]= nu.inf
+        out[3:,unbound]= nu.nan
+        return out
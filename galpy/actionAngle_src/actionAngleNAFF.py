@@ -0,0 +1,334 @@
+###############################################################################
+#   actionAngle: a Python module to calculate  actions, angles, and frequencies
+#
+#      class: actionAngleNAFF
+#
+#             actions and frequencies from a frequency analysis of
+#             numerically-integrated orbits (NAFF): orbits are integrated in
+#             batch in C, the time series of each orbit are decomposed into
+#             discrete frequency lines by a windowed FFT that is refined to
+#             the exact peak, the strongest lines give the fundamental
+#             frequencies, and the actions follow from the amplitudes of all
+#             lines (Binney & Spergel 1982); works for any potential,
+#             including non-axisymmetric ones
+#
+#      methods:
+#             __call__: returns (jr,lz,jz)
+#             actionsFreqs: returns (jr,lz,jz,Or,Op,Oz)
+#
+###############################################################################
+import math as m
+import numpy as nu
+from actionAngleStaeckel import _parseArgs, _output
+from galpy.potential_src.Potential import Phiinf, evaluatePotentials, \
+    evaluateRforces, evaluatezforces
+from galpy.util import multi
+class actionAngleNAFF():
+    """Action-angle formalism from a frequency analysis of integrated orbits"""
+    def __init__(self,*args,**kwargs):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize an actionAngleNAFF object
+        INPUT:
+           pot= potential or list of potentials (3D)
+           nperiod= (default=30) integrate each orbit for this many periods,
+                    estimated from the star's energy and the force at its
+                    position
+           nt= (default=4096) number of time samples of each orbit
+           nlines= (default=12) number of frequency lines extracted from the
+                   azimuthal and vertical time series
+           nmax= (default=6) largest integer multiple of a fundamental
+                 frequency used to identify the lines
+           method= (default='dopr54_c') orbit integration method; potentials
+                   without a C implementation are integrated with odeint
+           numcores= (default=1) number of cores to split the orbits over
+        OUTPUT:
+        HISTORY:
+            2026-10-19 - Written - agent (local)
+        NOTE:
+           the frequencies of resonant orbits (e.g., Omegaphi = Omegaz for all
+           orbits in spherical potentials) do not uniquely identify the
+           lines, such that the actions of (nearly) resonant orbits are not
+           well determined
+        """
+        if not kwargs.has_key('pot'):
+            raise IOError("Must specify pot= for actionAngleNAFF")
+        self._pot= kwargs['pot']
+        if kwargs.has_key('nperiod'):
+            self._nperiod= kwargs['nperiod']
+        else:
+            self._nperiod= 30.
+        if kwargs.has_key('nt'):
+            self._nt= kwargs['nt']
+        else:
+            self._nt= 4096
+        if kwargs.has_key('nlines'):
+            self._nlines= kwargs['nlines']
+        else:
+            self._nlines= 12
+        if kwargs.has_key('nmax'):
+            self._nmax= kwargs['nmax']
+        else:
+            self._nmax= 6
+        if kwargs.has_key('method'):
+            self._method= kwargs['method']
+        else:
+            self._method= 'dopr54_c'
+        if kwargs.has_key('numcores'):
+            self._numcores= kwargs['numcores']
+        else:
+            self._numcores= 1
+        if isinstance(self._pot,list):
+            c_possible= nu.all([p.hasC for p in self._pot])
+        else:
+            c_possible= self._pot.hasC
+        if not c_possible or not '_c' in self._method:
+            self._method= 'odeint'
+        self._Phiinf= Phiinf(self._pot)
+        return None
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the actions (jr,lz,jz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays; phi=0 if not given)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+        OUTPUT:
+           (jr,lz,jz) (arrays for array input, with jr=inf for unbound
+           orbits; an UnboundError is raised for a single unbound orbit; lz
+           is the azimuthal action, equal to the angular momentum for
+           axisymmetric potentials)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgsPhi(args)
+        return _output(self._actions(xv)[:3],shape,scalar)
+
+    def actionsFreqs(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqs
+        PURPOSE:
+           evaluate the actions and frequencies (jr,lz,jz,Omegar,Omegaphi,
+           Omegaz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays; phi=0 if not given)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+        OUTPUT:
+           (jr,lz,jz,Omegar,Omegaphi,Omegaz) (NaN frequencies for unbound
+           orbits and NaN Omegaz for orbits in the mid-plane)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgsPhi(args)
+        return _output(self._actions(xv),shape,scalar)
+
+    def _actions(self,xv):
+        """Calculate the actions and frequencies for a [6,N] array of
+        (R,vR,vT,z,vz,phi), in numcores equal-sized chunks"""
+        ntot= xv.shape[1]
+        if self._numcores > 1 and ntot > self._numcores:
+            #Pad to equal-sized chunks, such that the outputs can be stacked
+            nchunk= int(m.ceil(float(ntot)/self._numcores))
+            xv= nu.concatenate((xv,nu.tile(xv[:,-1:],
+                                           (1,nchunk*self._numcores-ntot))),
+                               axis=1)
+            out= multi.parallel_map((lambda x: \
+                     _actionsNAFF(xv[:,x*nchunk:(x+1)*nchunk],self._pot,
+                                  self._Phiinf,self._nperiod,self._nt,
+                                  self._nlines,self._nmax,self._method)),
+                                    range(self._numcores),
+                                    numcores=self._numcores)
+            return nu.concatenate(out,axis=1)[:,:ntot]
+        return _actionsNAFF(xv,self._pot,self._Phiinf,self._nperiod,self._nt,
+                            self._nlines,self._nmax,self._method)
+
+def _parseArgsPhi(args):
+    """Parse the input into a [6,N] array, with phi=0 if it is not given"""
+    try:
+        return _parseArgs(args,phi=True)
+    except IOError:
+        xv, shape, scalar= _parseArgs(args)
+        return (nu.concatenate((xv,nu.zeros((1,xv.shape[1])))),shape,scalar)
+
+def _evaluatePhi(func,R,z,phi,Pot):
+    """Evaluate func(R,z,Pot,phi=phi) for arrays of (R,z,phi), all at once if
+    the potential supports array input, one at a time otherwise"""
+    try:
+        out= nu.array(func(R,z,Pot,phi=phi),dtype='float64')
+        if out.shape == R.shape: return out
+    except (TypeError,ValueError):
+        pass
+    return nu.array([func(R[ii],z[ii],Pot,phi=phi[ii])
+                     for ii in range(len(R))],dtype='float64')
+
+def _actionsNAFF(xv,pot,phiinf,nperiod,nt,nlines,nmax,method):
+    """
+    NAME:
+       _actionsNAFF
+    PURPOSE:
+       calculate the actions and frequencies from a frequency analysis of
+       the orbits of an array of phase-space points
+    INPUT:
+       xv - [6,N] array of (R,vR,vT,z,vz,phi)
+       pot - potential or list of potentials
+       phiinf - Phi(infinity)
+       nperiod - number of estimated periods to integrate for
+       nt - number of time samples
+       nlines - number of lines extracted from the azimuthal and vertical
+                time series
+       nmax - largest integer multiple of a fundamental frequency
+       method - orbit integration method
+    OUTPUT:
+       [6,N] array of (jr,lz,jz,Omegar,Omegaphi,Omegaz)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    R, vR, vT, z, vz, phi= xv
+    out= nu.empty((6,len(R)))
+    out[0]= nu.inf
+    out[1]= R*vT
+    out[2:]= nu.nan
+    E= _evaluatePhi(evaluatePotentials,R,z,phi,pot)+(vR**2.+vT**2.+vz**2.)/2.
+    bound= nu.arange(len(R))[E < phiinf]
+    if len(bound) == 0: return out
+    R, vR, vT, z, vz, phi= xv[:,bound]
+    #Integration time from the period of the Kepler orbit through this point
+    #with the same force, with its semi-major axis at most 10 r
+    r= nu.sqrt(R**2.+z**2.)
+    rF= r*nu.sqrt(_evaluatePhi(evaluateRforces,R,z,phi,pot)**2.
+                  +_evaluatePhi(evaluatezforces,R,z,phi,pot)**2.)
+    a= r*rF/nu.maximum(2.*rF-(vR**2.+vT**2.+vz**2.),0.1*rF)
+    T= nperiod*2.*nu.pi*nu.sqrt(a**3./r/rF)
+    ts= nu.linspace(0.,1.,nt)*T[:,nu.newaxis]
+    #Integrate, in rectangular coordinates
+    vxvv= nu.array([R*nu.cos(phi),R*nu.sin(phi),z,
+                    vR*nu.cos(phi)-vT*nu.sin(phi),
+                    vT*nu.cos(phi)+vR*nu.sin(phi),vz]).T
+    if method == 'odeint':
+        from galpy.orbit_src.FullOrbit import _integrateFullOrbit
+        orbs= nu.empty((len(bound),nt,6))
+        for ii in range(len(bound)):
+            o= _integrateFullOrbit(xv[:,bound[ii]],pot,ts[ii],'odeint')
+            orbs[ii,:,0]= o[:,0]*nu.cos(o[:,5])
+            orbs[ii,:,1]= o[:,0]*nu.sin(o[:,5])
+            orbs[ii,:,2]= o[:,3]
+    else:
+        from galpy.orbit_src.integrateFullOrbit import integrateFullOrbits_c
+        orbs, err= integrateFullOrbits_c(pot,vxvv,ts,method)
+    #Frequency analysis: the azimuthal frequency is the strongest line of
+    #x+iy, the vertical that of z, and the radial frequency is the strongest
+    #line of r that is not an overtone of the vertical frequency
+    rs= nu.sqrt(orbs[:,:,0]**2.+orbs[:,:,1]**2.+orbs[:,:,2]**2.)
+    rm= nu.mean(rs,axis=1)
+    freqR, powR= _naff(rs-rm[:,nu.newaxis],T,3,True)
+    freqP, powP= _naff(orbs[:,:,0]+1j*orbs[:,:,1],T,nlines,False)
+    planar= nu.all(orbs[:,:,2] == 0.,axis=1)
+    freqZ, powZ= _naff(orbs[:,:,2],T,nlines,True)
+    Oz= freqZ[:,0].copy()
+    Oz[planar]= 0.
+    powZ[planar]= 0.
+    Or= freqR[:,0].copy()
+    dO= 2.*nu.pi/T
+    for ii in range(freqR.shape[1]-1,-1,-1):
+        indx= (nu.fabs(freqR[:,ii]-2.*Oz) > dO)*(freqR[:,ii] > dO)
+        Or[indx]= freqR[indx,ii]
+    circ= (powR[:,0] < 10.**-16.*rm**2.)
+    Omegas= nu.array([Or,freqP[:,0],Oz]).T
+    #Identify each line with n.Omega for integer vectors n, preferring the
+    #smallest n for (near-)degenerate combinations, and sum the actions
+    ns= nu.array([n for n in nu.ndindex(2*nmax+1,2*nmax+1,2*nmax+1)])-nmax
+    ns= ns[nu.argsort(nu.sum(nu.fabs(ns),axis=1),kind='mergesort')]
+    nOmegas= nu.dot(Omegas,ns.T)
+    jrpz= nu.zeros((len(bound),3))
+    for freqs, pows in [(freqP,powP),(freqZ,2.*powZ)]:
+        for ii in range(freqs.shape[1]):
+            n= ns[nu.argmin(nu.fabs(freqs[:,ii:ii+1]-nOmegas),axis=1)]
+            jrpz+= n*(freqs[:,ii]*pows[:,ii])[:,nu.newaxis]
+    out[:3,bound]= jrpz.T
+    out[3:,bound]= Omegas.T
+    out[3,bound[circ]]= nu.nan
+    out[5,bound[planar]]= nu.nan
+    return out
+
+def _naff(f,T,nlines,real):
+    """
+    NAME:
+       _naff
+    PURPOSE:
+       extract the nlines strongest frequency lines from an array of time
+       series f(t)= sum_k A_k exp(i omega_k t)
+    INPUT:
+       f - [N,nt] array of time series, sampled uniformly from t=0 to T
+       T - [N] array of the lengths of the time series
+       nlines - number of lines to extract
+       real - if True, f is real and only lines with omega > 0 are extracted
+    OUTPUT:
+       (omega,|A|^2) [N,nlines] arrays, in the order in which they were
+       extracted
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    NOTE:
+       each line is found as the peak of the FFT of the Hann-windowed time
+       series, zero-padded by a factor of 4, refined by a Newton step on the
+       windowed Fourier integral, and subtracted before finding the next
+    """
+    nt= f.shape[1]
+    u= nu.linspace(0.,1.,nt)
+    ww= 1.-nu.cos(2.*nu.pi*u) #Hann window
+    wnorm= nu.sum(ww)
+    wf= ww*f
+    npad= 4*nt
+    domega= 2.*nu.pi*(nt-1.)/npad/T
+    if real:
+        js= nu.arange(npad//2+1)
+        fft= nu.fft.rfft
+    else:
+        js= nu.fft.fftfreq(npad)*npad
+        fft= nu.fft.fft
+    omegas= nu.empty((f.shape[0],nlines))
+    pows= nu.empty((f.shape[0],nlines))
+    alln= nu.arange(f.shape[0])
+    for kk in range(nlines):
+        #Initial guess from the peak of the padded FFT, interpolated
+        S= nu.absolute(fft(wf,n=npad,axis=1))
+        if real: S[:,0]= 0.
+        jpeak= nu.argmax(S,axis=1)
+        s0= S[alln,jpeak]
+        sm= S[alln,(jpeak-1) % S.shape[1]]
+        sp= S[alln,(jpeak+1) % S.shape[1]]
+        denom= sm-2.*s0+sp
+        delta= nu.zeros_like(s0)
+        indx= (denom < 0.)
+        delta[indx]= 0.5*(sm-sp)[indx]/denom[indx]
+        omega= (js[jpeak]+nu.clip(delta,-1.,1.))*domega
+        #Newton step towards the maximum of |F(omega)|^2, with
+        #F(omega)= sum w f exp(-i omega t)
+        g= wf*nu.exp(-1j*(omega*T)[:,nu.newaxis]*u)
+        F= nu.sum(g,axis=1)
+        F1= -1j*T*nu.dot(g,u)
+        F2= -T**2.*nu.dot(g,u**2.)
+        d2= nu.absolute(F1)**2.+nu.real(nu.conj(F)*F2)
+        step= nu.zeros_like(omega)
+        indx= (d2 < 0.)
+        step[indx]= -nu.real(nu.conj(F)*F1)[indx]/d2[indx]
+        omega+= nu.clip(step,-domega,domega)
+        #Amplitude, and subtract the line
+        ee= nu.exp(1j*(omega*T)[:,nu.newaxis]*u)
+        A= nu.sum(wf/ee,axis=1)/wnorm
+        omegas[:,kk]= omega
+        pows[:,kk]= nu.absolute(A)**2.
+        if real:
+            wf-= 2.*ww*nu.real(A[:,nu.newaxis]*ee)
+        else:
+            wf-= ww*A[:,nu.newaxis]*ee
+    return (omegas,pows)
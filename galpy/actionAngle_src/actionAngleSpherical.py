@@ -16,14 +16,25 @@
 #              I DONE
 #              calcRapRperi DONE
 #              calcEL DONE
+#
+#      batch mode (actionAngleSpherical(pot=) without a phase-space point):
+#              __call__: returns (jr,lz,jz) for arrays of phase-space points
+#              actionsFreqs: returns (jr,lz,jz,Or,Op,Oz)
+#              actionsFreqsAngles: returns (jr,lz,jz,Or,Op,Oz,ar,ap,az)
 ###############################################################################
 import math as m
 import numpy as nu
 from scipy import optimize, integrate
 from actionAngle import *
 from actionAngleAxi import actionAngleAxi, potentialAxi
+from actionAngleAdiabatic import _turningPoint
+from actionAngleStaeckel import _parseArgs, _output
+from galpy.potential_src.Potential import Phiinf, evaluateRforces, \
+    evaluateR2derivs
 from galpy.potential_src.planarPotential import evaluateplanarRforces,\
     planarPotential, evaluateplanarPotentials
+from galpy.potential_src.interpVerticalPotential import _evaluatePotentials, \
+    _evaluatePairs
 class actionAngleSpherical(actionAngle):
     """Action-angle formalism for spherical potentials"""
     def __init__(self,*args,**kwargs):
@@ -37,14 +48,28 @@ class actionAngleSpherical(actionAngle):
               a) R,vR,vT
               b) Orbit instance: initial condition used if that's it, orbit(t)
                  if there is a time given as well
-              pot= potential or list of potentials (planarPotentials)
+              c) nothing: batch mode, in which arrays of phase-space points
+                 are given to __call__, actionsFreqs, and actionsFreqsAngles
+              pot= potential or list of potentials (planarPotentials; 3D
+                   potentials in batch mode)
+              order= (default=20) order of the Gauss-Legendre quadrature in
+                     batch mode
         OUTPUT:
         HISTORY:
            2011-03-03 - Written - Bovy (NYU)
+           2026-10-19 - Added batch mode - agent (local)
         """
-        actionAngle.__init__(self,*args,**kwargs)
         if not kwargs.has_key('pot'):
             raise IOError("Must specify pot= for actionAngleSpherical")
+        if len(args) == 0:
+            self._pot= kwargs['pot']
+            if kwargs.has_key('order'):
+                self._order= kwargs['order']
+            else:
+                self._order= 20
+            self._Phiinf= Phiinf(self._pot)
+            return None
+        actionAngle.__init__(self,*args,**kwargs)
         self._pot= kwargs['pot']
         #Also set up an actionAngleAxi object for EL and rap/rperi calculations
         axiR= m.sqrt(self._R**2.+self._z**2.)
@@ -53,6 +78,79 @@ class actionAngleSpherical(actionAngle):
         self._axi= actionAngleAxi(axiR,axivR,axivT,pot=self._pot)
         return None
     
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the actions (jr,lz,jz) in batch mode
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           (jr,lz,jz) (arrays for array input, with jr=inf for unbound
+           orbits; an UnboundError is raised for a single unbound orbit)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        return _output(self._actions(xv,False,**kwargs)[:3],shape,scalar)
+
+    def actionsFreqs(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqs
+        PURPOSE:
+           evaluate the actions and frequencies (jr,lz,jz,Omegar,Omegaphi,
+           Omegaz) in batch mode
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz[,phi] (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           (jr,lz,jz,Omegar,Omegaphi,Omegaz) (NaN frequencies for unbound
+           orbits)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        return _output(self._actions(xv,False,**kwargs),shape,scalar)
+
+    def actionsFreqsAngles(self,*args,**kwargs):
+        """
+        NAME:
+           actionsFreqsAngles
+        PURPOSE:
+           evaluate the actions, frequencies, and angles (jr,lz,jz,Omegar,
+           Omegaphi,Omegaz,angler,anglephi,anglez) in batch mode
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz,phi (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           (jr,lz,jz,Omegar,Omegaphi,Omegaz,angler,anglephi,anglez) (angles
+           in [0,2pi); NaN frequencies and angles for unbound orbits)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args,phi=True)
+        return _output(self._actions(xv,True,**kwargs),shape,scalar)
+
+    def _actions(self,xv,angles,**kwargs):
+        """Batch-mode actions, frequencies, and angles"""
+        if kwargs.has_key('order'):
+            order= kwargs['order']
+        else:
+            order= self._order
+        return _actionsSpherical(xv,self._pot,self._Phiinf,order,angles)
+
     def angle1(self,**kwargs):
         """
         NAME:
@@ -427,3 +525,122 @@ def _ISphericalIntegrandSmall(t,E,L,pot,rperi):
 def _ISphericalIntegrandLarge(t,E,L,pot,rap):
     r= rap-t**2.#part of the transformation
     return 2.*t/_J3SphericalIntegrand(r,E,L,pot)/r**2.
+
+def _actionsSpherical(xv,pot,phiinf,order,angles):
+    """
+    NAME:
+       _actionsSpherical
+    PURPOSE:
+       calculate the actions, frequencies, and (if angles) angles in a
+       spherical potential for an array of phase-space points, finding the
+       turning points and evaluating the radial quadratures once per point
+    INPUT:
+       xv - [5,N] ([6,N] if angles) array of (R,vR,vT,z,vz[,phi])
+       pot - potential or list of potentials (3D)
+       phiinf - Phi(infinity)
+       order - order of the Gauss-Legendre quadrature
+       angles - if True, also calculate the angles
+    OUTPUT:
+       [6,N] or [9,N] array of (jr,lz,jz,Or,Op,Oz[,ar,ap,az])
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    R, vR, vT, z, vz= xv[:5]
+    ndata= xv.shape[1]
+    out= nu.empty((6+3*angles,ndata))
+    out[3:]= nu.nan
+    r= nu.sqrt(R**2.+z**2.)
+    vr= (R*vR+z*vz)/r
+    #Angular momentum vector at phi=0 and energy
+    Lx= -z*vT
+    Ly= z*vR-R*vz
+    Lz= R*vT
+    Lperp= nu.sqrt(Lx**2.+Ly**2.)
+    L= nu.sqrt(Lperp**2.+Lz**2.)
+    L2= L**2.
+    E= _evaluatePotentials(r,0.*r,pot)+(vR**2.+vT**2.+vz**2.)/2.
+    out[0]= nu.inf
+    out[1]= Lz
+    out[2]= L-nu.fabs(Lz)
+    bound= nu.arange(ndata)[E < phiinf]
+    if len(bound) == 0: return out
+    #Turning points of p_r^2= 2(E-Phi(r))-L^2/r^2
+    def pr2(rr,indx):
+        return 2.*(E[bound[indx]]-_evaluatePotentials(rr,0.*rr,pot))\
+            -L2[bound[indx]]/rr**2.
+    rb= r[bound]
+    rperi= _turningPoint(pr2,rb,vr[bound]**2.,0.5)
+    rap= _turningPoint(pr2,rb,vr[bound]**2.,2.)
+    rm= (rap+rperi)/2.
+    dr= (rap-rperi)/2.
+    nb= len(bound)
+    #sin(eta)/p_r is finite at the turning points, where p_r^2 ~ dr^2
+    #sin^2(eta) d(p_r^2)/dr / 2 / dr; use these limits where p_r^2 is lost
+    #to round-off
+    rp= nu.maximum(rperi,10.**-10.)
+    lim0= 1./nu.sqrt(nu.maximum(dr*(_evaluatePairs(evaluateRforces,rp,0.*rp,
+                                                   pot)
+                                    +L2[bound]/rp**3.),10.**-300.))
+    ra= nu.where(nu.isinf(rap),rp,rap)
+    limpi= 1./nu.sqrt(nu.maximum(-dr*(_evaluatePairs(evaluateRforces,ra,0.*ra,
+                                                     pot)
+                                      +L2[bound]/ra**3.),10.**-300.))
+    def prQuad(eta):
+        """Evaluate r, p_r, and sin(eta)/p_r at r= rm-dr cos(eta)"""
+        rs= rm[:,nu.newaxis]-dr[:,nu.newaxis]*nu.cos(eta)
+        p2= pr2(rs.flatten(),nu.repeat(nu.arange(nb),eta.shape[1]))\
+            .reshape(rs.shape)
+        sinpr= nu.where(eta < nu.pi/2.,lim0[:,nu.newaxis],
+                        limpi[:,nu.newaxis])
+        indx= (p2 > 0.)
+        sinpr[indx]= nu.sin(eta[indx])/nu.sqrt(p2[indx])
+        return (rs,nu.sqrt(nu.maximum(p2,0.)),sinpr)
+    #Radial action, period, and azimuthal advance over a radial period,
+    #r= rm-dr cos(eta)
+    x, w= nu.polynomial.legendre.leggauss(order)
+    eta= nu.tile(nu.pi/2.*(x+1.),(nb,1))
+    rs, pr, sinpr= prQuad(eta)
+    out[0,bound]= dr/2.*nu.sum(w*pr*nu.sin(eta),axis=1)
+    Tr= nu.pi*dr*nu.sum(w*sinpr,axis=1)
+    dpsi= nu.pi*dr*L[bound]*nu.sum(w*sinpr/rs**2.,axis=1)
+    Or= 2.*nu.pi/Tr
+    Opsi= dpsi/Tr
+    #Circular orbits: epicycle and circular frequencies
+    circ= (dr <= 10.**-5.*rm)
+    if nu.any(circ):
+        Rforce= _evaluatePairs(evaluateRforces,rm[circ],0.*rm[circ],pot)
+        Or[circ]= nu.sqrt(_evaluatePairs(evaluateR2derivs,rm[circ],
+                                         0.*rm[circ],pot)-3.*Rforce/rm[circ])
+        Opsi[circ]= nu.sqrt(-Rforce/rm[circ])
+    out[3,bound]= Or
+    out[5,bound]= Opsi
+    out[4,bound]= nu.where(Lz[bound] < 0.,-Opsi,Opsi)
+    if not angles: return out
+    #Radial angle and the correction to the angle in the orbital plane from
+    #the time and azimuthal advance since pericenter, r= rm-dr cos(eta),
+    #eta in [0,eta*]
+    etas= nu.zeros(len(bound))
+    etas[~circ]= nu.arccos(nu.clip((rm[~circ]-rb[~circ])/dr[~circ],-1.,1.))
+    eta= etas[:,nu.newaxis]*(x+1.)/2.
+    rs, pr, sinpr= prQuad(eta)
+    t= etas/2.*dr*nu.sum(w*sinpr,axis=1)
+    chi= etas/2.*dr*nu.sum(w*sinpr*(L[bound][:,nu.newaxis]/rs**2.
+                                    -Opsi[:,nu.newaxis]),axis=1)
+    inward= (vr[bound] < 0.)
+    t[inward]*= -1.
+    chi[inward]*= -1.
+    ar= Or*t
+    ar[circ]= 0.
+    #Angle in the orbital plane from the ascending node; for orbits in the
+    #mid-plane, the node is put at phi=0
+    psi= nu.arctan2(z*L,R*(R*vz-z*vR))
+    Omega= xv[5]+nu.arctan2(-Lx,Ly)
+    indx= (Lperp == 0.)
+    psi[indx]= nu.sign(Lz[indx])*xv[5,indx]
+    Omega[indx]= 0.
+    az= psi[bound]-chi
+    ap= nu.where(Lz[bound] < 0.,Omega[bound]-az,Omega[bound]+az)
+    out[6,bound]= nu.mod(ar,2.*nu.pi)
+    out[7,bound]= nu.mod(ap,2.*nu.pi)
+    out[8,bound]= nu.mod(az,2.*nu.pi)
+    return out
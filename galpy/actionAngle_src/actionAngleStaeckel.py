@@ -0,0 +1,289 @@
+###############################################################################
+#   actionAngle: a Python module to calculate  actions, angles, and frequencies
+#
+#      class: actionAngleStaeckel
+#
+#             actions in the Staeckel approximation ("Staeckel fudge"): the
+#             potential is approximated locally by a Staeckel potential in
+#             prolate spheroidal coordinates (u,v) with focal distance
+#             delta, in which the motion separates; arrays of
+#             (R,vR,vT,z,vz) are handled all at once, using vectorized
+#             root finding for the turning points and fixed-order
+#             Gauss-Legendre quadrature for the actions
+#
+#      methods:
+#             __call__: returns (jr,lz,jz)
+#             JR
+#             Jz
+#
+#      functions:
+#             estimateDeltaStaeckel: estimate the focal distance from the
+#                                    potential's derivatives
+#
+###############################################################################
+import numpy as nu
+from actionAngle import actionAngle, UnboundError
+from actionAngleAdiabatic import _turningPoint
+from galpy.potential_src.Potential import Phiinf, evaluateRforces, \
+    evaluatezforces, evaluateR2derivs, evaluatez2derivs, evaluateRzderivs
+from galpy.potential_src.interpRotcurve import _reshape
+from galpy.potential_src.interpVerticalPotential import _evaluatePotentials, \
+    _evaluatePairs, _glTheta
+from galpy.util import bovy_coords
+_DELTAMIN= 10.**-5.
+class actionAngleStaeckel():
+    """Action-angle formalism for axisymmetric potentials using the Staeckel approximation"""
+    def __init__(self,*args,**kwargs):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize an actionAngleStaeckel object
+        INPUT:
+           pot= potential or list of potentials (3D)
+           delta= focal distance of the prolate spheroidal coordinate system
+                  (default: None, estimate it for each star at its (R,z)
+                  using estimateDeltaStaeckel)
+           order= (default=20) order of the Gauss-Legendre quadrature
+        OUTPUT:
+        HISTORY:
+            2026-10-19 - Written - agent (local)
+        """
+        if not kwargs.has_key('pot'):
+            raise IOError("Must specify pot= for actionAngleStaeckel")
+        self._pot= kwargs['pot']
+        if kwargs.has_key('delta'):
+            self._delta= kwargs['delta']
+        else:
+            self._delta= None
+        if kwargs.has_key('order'):
+            self._order= kwargs['order']
+        else:
+            self._order= 20
+        self._Phiinf= Phiinf(self._pot)
+        return None
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the actions (jr,lz,jz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature (default: set at
+                  initialization)
+        OUTPUT:
+           (jr,lz,jz) (arrays for array input, with jr=inf for unbound
+           orbits; an UnboundError is raised for a single unbound orbit)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        if kwargs.has_key('order'):
+            order= kwargs['order']
+        else:
+            order= self._order
+        if self._delta is None:
+            delta= estimateDeltaStaeckel(self._pot,xv[0],xv[3])
+        else:
+            delta= self._delta*nu.ones(xv.shape[1])
+        return _output(_actionsStaeckel(xv,self._pot,delta,self._Phiinf,order),
+                       shape,scalar)
+
+    def JR(self,*args,**kwargs):
+        """
+        NAME:
+           JR
+        PURPOSE:
+           evaluate the action jr
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           Jr
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self(*args,**kwargs)[0]
+
+    def Jz(self,*args,**kwargs):
+        """
+        NAME:
+           Jz
+        PURPOSE:
+           evaluate the action jz
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           jz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self(*args,**kwargs)[2]
+
+def estimateDeltaStaeckel(pot,R,z):
+    """
+    NAME:
+
+       estimateDeltaStaeckel
+
+    PURPOSE:
+
+       estimate the focal distance of the prolate spheroidal coordinate
+       system of the Staeckel potential that best approximates a potential
+       at (R,z), from the potential's first and second derivatives
+
+    INPUT:
+
+       pot - potential or list of potentials (3D)
+
+       R - Galactocentric radius (can be array)
+
+       z - height (can be array)
+
+    OUTPUT:
+
+       delta (zero where the estimate of delta^2 is negative)
+
+    HISTORY:
+
+       2026-10-19 - Written - agent (local)
+
+    NOTE:
+
+       this is exact for Staeckel potentials; in the mid-plane, where the
+       estimate is 0/0, it is evaluated at |z|= 10^-4 R instead
+
+    """
+    R, z= nu.broadcast_arrays(nu.array(R,dtype='float64'),
+                              nu.array(z,dtype='float64'))
+    shape= R.shape
+    R= R.flatten()
+    z= nu.fabs(z.flatten()) #the estimate is symmetric in z
+    z[z < 10.**-4.*R]= 10.**-4.*R[z < 10.**-4.*R]
+    delta2= z**2.-R**2.\
+        +(3.*R*_evaluatePairs(evaluatezforces,R,z,pot)
+          -3.*z*_evaluatePairs(evaluateRforces,R,z,pot)
+          +R*z*(_evaluatePairs(evaluateR2derivs,R,z,pot)
+                -_evaluatePairs(evaluatez2derivs,R,z,pot)))\
+                /_evaluatePairs(evaluateRzderivs,R,z,pot)
+    return _reshape(nu.sqrt(nu.maximum(delta2,0.)),shape)
+
+def _parseArgs(args,phi=False):
+    """Parse (R,vR,vT,z,vz), (R,vR,vT,z,vz,phi), or an Orbit into a [5,N]
+    array ([6,N] including phi if phi=True), the shape of the input, and
+    whether the input is scalar"""
+    if len(args) == 5 or len(args) == 6:
+        xv= list(args)
+    else:
+        meta= actionAngle(*args)
+        xv= [meta._R, meta._vR, meta._vT, meta._z, meta._vz]
+        if hasattr(meta,'_phi'): xv.append(meta._phi)
+    if phi and len(xv) < 6:
+        raise IOError("Must specify phi")
+    xv= xv[:5+phi]
+    scalar= not nu.any([nu.ndim(a) > 0 for a in xv])
+    xv= nu.broadcast_arrays(*[nu.array(a,dtype='float64') for a in xv])
+    return (nu.array([a.flatten() for a in xv]),xv[0].shape,scalar)
+
+def _output(out,shape,scalar):
+    """Return scalars (raising UnboundError for an unbound orbit) or arrays
+    of the input shape"""
+    if scalar:
+        if nu.isinf(out[0,0]):
+            raise UnboundError("Orbit is unbound")
+        return tuple(out[:,0])
+    return tuple([_reshape(o,shape) for o in out])
+
+def _potentialStaeckel(u,v,pot,delta):
+    """Evaluate the potential at prolate spheroidal coordinates (u,v)"""
+    R,z= bovy_coords.uv_to_Rz(u,v,delta=delta)
+    return _evaluatePotentials(R,z,pot)
+
+def _actionsStaeckel(xv,pot,delta,phiinf,order):
+    """
+    NAME:
+       _actionsStaeckel
+    PURPOSE:
+       calculate the actions in the Staeckel approximation for an array of
+       phase-space points
+    INPUT:
+       xv - [5,N] array of (R,vR,vT,z,vz)
+       pot - potential or list of potentials
+       delta - focal distance for each point
+       phiinf - Phi(infinity)
+       order - order of the Gauss-Legendre quadrature
+    OUTPUT:
+       [3,N] array of (jr,lz,jz)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    R, vR, vT, z, vz= xv
+    delta= nu.maximum(delta,_DELTAMIN)
+    out= nu.empty((3,len(R)))
+    out[1]= R*vT
+    #Prolate spheroidal coordinates and momenta
+    u, v= bovy_coords.Rz_to_uv(R,z,delta=delta)
+    pu= delta*(nu.cosh(u)*nu.sin(v)*vR+nu.sinh(u)*nu.cos(v)*vz)
+    pv= delta*(nu.sinh(u)*nu.cos(v)*vR-nu.cosh(u)*nu.sin(v)*vz)
+    v= nu.minimum(v,nu.pi-v) #the motion in v is symmetric around pi/2
+    sinh2u= nu.sinh(u)**2.
+    cosh2u= nu.cosh(u)**2.
+    sin2v= nu.sin(v)**2.
+    Phi= _evaluatePotentials(R,z,pot)
+    E= Phi+(vR**2.+vT**2.+vz**2.)/2.
+    Lz22delta= out[1]**2./2./delta**2.
+    #Staeckel approximation: U(u) from the potential along the star's v,
+    #V(v) from the potential along the star's u, such that the separation
+    #constants follow from the star's position and momenta
+    Phiupi2= _potentialStaeckel(u,nu.pi/2.+0.*u,pot,delta)
+    I3U= E*sinh2u-pu**2./2./delta**2.-Lz22delta/sinh2u
+    I3V= pv**2./2./delta**2.-E*sin2v+Lz22delta/sin2v\
+        -cosh2u*Phiupi2+(sinh2u+sin2v)*Phi
+    def fu(uu,indx):
+        s2= nu.sinh(uu)**2.
+        dU= (s2+sin2v[indx])*_potentialStaeckel(uu,v[indx],pot,delta[indx])\
+            -(sinh2u[indx]+sin2v[indx])*Phi[indx]
+        return E[indx]*s2-I3U[indx]-dU-Lz22delta[indx]/s2
+    def fv(vv,indx):
+        s2= nu.sin(vv)**2.
+        dV= cosh2u[indx]*Phiupi2[indx]\
+            -(sinh2u[indx]+s2)*_potentialStaeckel(u[indx],vv,pot,delta[indx])
+        return E[indx]*s2+I3V[indx]+dV-Lz22delta[indx]/s2
+    #Vertical action, v= pi/2-(pi/2-vmin) cos(theta)
+    alln= nu.arange(len(R))
+    vmin= _turningPoint(fv,v,pv**2./2./delta**2.,0.5)
+    sintheta, costheta, w= _glTheta(order)
+    dv= nu.pi/2.-vmin
+    vs= nu.pi/2.-dv[:,nu.newaxis]*costheta
+    f= fv(vs.flatten(),nu.repeat(alln,order)).reshape(vs.shape)
+    out[2]= 2./nu.pi*delta*dv\
+        *nu.sum(w*nu.sqrt(nu.maximum(2.*f,0.))*sintheta,axis=1)
+    #Radial action, u= (umax+umin)/2-(umax-umin)/2 cos(eta)
+    unbound= (E >= phiinf)
+    out[0]= nu.inf
+    if nu.all(unbound): return out
+    bound= alln[~unbound]
+    fub= lambda uu,indx: fu(uu,bound[indx])
+    umin= _turningPoint(fub,u[bound],pu[bound]**2./2./delta[bound]**2.,0.5)
+    umax= _turningPoint(fub,u[bound],pu[bound]**2./2./delta[bound]**2.,2.)
+    x, w= nu.polynomial.legendre.leggauss(order)
+    eta= nu.pi/2.*(x+1.)
+    um= (umax+umin)/2.
+    du= (umax-umin)/2.
+    us= um[:,nu.newaxis]-du[:,nu.newaxis]*nu.cos(eta)
+    f= fu(us.flatten(),nu.repeat(bound,order)).reshape(us.shape)
+    out[0,bound]= delta[bound]*du/2.\
+        *nu.sum(w*nu.sqrt(nu.maximum(2.*f,0.))*nu.sin(eta),axis=1)
+    return out
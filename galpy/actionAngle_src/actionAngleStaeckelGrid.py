@@ -0,0 +1,233 @@
+###############################################################################
+#   actionAngle: a Python module to calculate  actions, angles, and frequencies
+#
+#      class: actionAngleStaeckelGrid
+#
+#             build grid in integrals of motion to quickly evaluate
+#             actionAngleStaeckel
+#
+#      methods:
+#             __call__: returns (jr,lz,jz)
+#             JR
+#             Jz
+#
+###############################################################################
+import numpy
+from scipy import interpolate, ndimage
+from actionAngle import UnboundError
+from actionAngleStaeckel import _parseArgs, _output, _actionsStaeckel, \
+    _potentialStaeckel
+from galpy.potential_src.Potential import Phiinf, evaluatePotentials
+from galpy.potential_src.interpRotcurve import rotcurveTable
+from galpy.potential_src.interpVerticalPotential import _evaluatePotentials
+from galpy.util import bovy_coords
+class actionAngleStaeckelGrid():
+    """Action-angle formalism for axisymmetric potentials using the Staeckel approximation, grid-based interpolation"""
+    def __init__(self,pot=None,delta=None,Rmax=5.,
+                 nE=25,npsi=25,nLz=30,order=20,**kwargs):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize an actionAngleStaeckelGrid object
+        INPUT:
+           pot= potential or list of potentials (3D)
+           delta= focal distance of the prolate spheroidal coordinate system
+           Rmax = Rmax for building grids (Lz up to Rmax vc(Rmax), E up to
+                  that of the circular orbit at 2 Rmax)
+           nE=, npsi=, nLz= grid size
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+        HISTORY:
+            2026-10-19 - Written - agent (local)
+        NOTE:
+           the grid is in (Lz,E,psi), with psi the angle between the
+           velocity and the mid-plane of an orbit launched from the
+           guiding-center radius with this Lz and E; for a star, psi follows
+           from its third integral in the Staeckel approximation, with V(v)
+           evaluated along the guiding-center radius
+        """
+        if pot is None:
+            raise IOError("Must specify pot= for actionAngleStaeckelGrid")
+        if delta is None:
+            raise IOError("Must specify delta= for actionAngleStaeckelGrid")
+        self._pot= pot
+        self._delta= delta
+        self._Rmax= Rmax
+        self._order= order
+        self._Phiinf= Phiinf(self._pot)
+        self._buildGrids(nE,npsi,nLz)
+        self._setupInterp()
+        return None
+
+    def _buildGrids(self,nE,npsi,nLz):
+        """Calculate the JR and Jz grids"""
+        rotcurve= rotcurveTable(self._pot)
+        self._Lzmin= 0.01
+        self._Lzs= numpy.linspace(self._Lzmin,
+                                  self._Rmax*rotcurve.vcirc(self._Rmax),nLz)
+        self._Lzmax= self._Lzs[-1]
+        #Guiding-center radii and energies of circular orbits
+        self._RL= rotcurve.rl(self._Lzs)
+        self._PhiRL= _evaluatePotentials(self._RL,0.*self._RL,self._pot)
+        self._Ec= self._PhiRL+self._Lzs**2./2./self._RL**2.
+        self._Emax= evaluatePotentials(2.*self._Rmax,0.,self._pot)\
+            +(2.*self._Rmax*rotcurve.vcirc(2.*self._Rmax))**2.\
+            /2./(2.*self._Rmax)**2.
+        #Orbits launched from (RL,z=0) with E= Ec+y^2(Emax-Ec), at an angle
+        #psi with the mid-plane; the actions are ~y^2 for small y
+        y= numpy.linspace(0.,1.,nE)
+        psi= numpy.linspace(0.,numpy.pi/2.,npsi)
+        Lz, y, psi= [x.flatten() for x in numpy.meshgrid(self._Lzs,y,psi,
+                                                         indexing='ij')]
+        RL= numpy.repeat(self._RL,nE*npsi)
+        v= y*numpy.sqrt(2.*(self._Emax-numpy.repeat(self._Ec,nE*npsi)))
+        xv= numpy.array([RL,v*numpy.cos(psi),Lz/RL,numpy.zeros_like(RL),
+                         v*numpy.sin(psi)])
+        jr, lz, jz= _actionsStaeckel(xv,self._pot,
+                                     self._delta*numpy.ones_like(RL),
+                                     self._Phiinf,self._order)
+        if numpy.any(numpy.isinf(jr)):
+            raise UnboundError("Orbit is unbound")
+        self._jr= jr.reshape((nLz,nE,npsi))
+        self._jz= jz.reshape((nLz,nE,npsi))
+        return None
+
+    def _setupInterp(self):
+        """Set up the interpolations of the JR and Jz grids"""
+        self._RLInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                 self._RL,k=3)
+        self._EcInterp= interpolate.InterpolatedUnivariateSpline(self._Lzs,
+                                                                 self._Ec,k=3)
+        #Tricubic spline coefficients, such that interpolating does not need
+        #to filter the grid again
+        self._jrCoeffs= ndimage.spline_filter(self._jr,order=3)
+        self._jzCoeffs= ndimage.spline_filter(self._jz,order=3)
+        return None
+
+    def __call__(self,*args,**kwargs):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the actions (jr,lz,jz)
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature for stars outside
+                  of the grid
+        OUTPUT:
+           (jr,lz,jz) (arrays for array input, with jr=inf for unbound
+           orbits; an UnboundError is raised for a single unbound orbit)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        xv, shape, scalar= _parseArgs(args)
+        R, vR, vT, z, vz= xv
+        out= numpy.empty((3,len(R)))
+        out[1]= R*vT
+        aLz= numpy.fabs(out[1])
+        E= _evaluatePotentials(R,z,self._pot)+(vR**2.+vT**2.+vz**2.)/2.
+        indx= (aLz >= self._Lzmin)*(aLz <= self._Lzmax)
+        Ec= numpy.zeros(len(R))
+        Ec[indx]= self._EcInterp(aLz[indx])
+        y= (E-Ec)/(self._Emax-Ec)
+        indx*= (y <= 1.)
+        y= numpy.sqrt(numpy.maximum(y,0.))
+        if numpy.any(indx):
+            out[0,indx], out[2,indx]= self._interpActions(xv[:,indx],
+                                                          aLz[indx],
+                                                          E[indx],Ec[indx],
+                                                          y[indx])
+            indx[indx]= ~numpy.isnan(out[0,indx])
+        if numpy.any(~indx):
+            #Directly, all at once
+            if kwargs.has_key('order'):
+                order= kwargs['order']
+            else:
+                order= self._order
+            out[:,~indx]= _actionsStaeckel(xv[:,~indx],self._pot,
+                                           self._delta\
+                                               *numpy.ones(numpy.sum(~indx)),
+                                           self._Phiinf,order)
+        return _output(out,shape,scalar)
+
+    def _interpActions(self,xv,aLz,E,Ec,y):
+        """Interpolate JR and Jz for stars inside of the grid in (Lz,E); NaN
+        for stars whose third integral is larger than that of all grid
+        orbits"""
+        R, vR, vT, z, vz= xv
+        nLz, nE, npsi= self._jr.shape
+        delta= self._delta
+        #Third integral with V(v) along the u of the guiding-center radius,
+        #such that it equals that of the grid orbits launched from there
+        RL= self._RLInterp(aLz)
+        uL= numpy.arcsinh(RL/delta)
+        sinh2uL= RL**2./delta**2.
+        cosh2uL= 1.+sinh2uL
+        PhiRL= Ec-aLz**2./2./RL**2.
+        u, v= bovy_coords.Rz_to_uv(R,z,delta=delta)
+        sin2v= numpy.sin(v)**2.
+        pv= delta*(numpy.sinh(u)*numpy.cos(v)*vR
+                   -numpy.cosh(u)*numpy.sin(v)*vz)
+        Lz22delta= aLz**2./2./delta**2.
+        dV= cosh2uL*PhiRL\
+            -(sinh2uL+sin2v)*_potentialStaeckel(uL,v,self._pot,delta)
+        I3V= pv**2./2./delta**2.-E*sin2v+Lz22delta/sin2v-dV
+        #Angle with the mid-plane of the grid orbit with this I3V
+        K= numpy.maximum(E-Ec,10.**-12.)
+        sin2psi= (I3V+E-Lz22delta)/cosh2uL/K
+        psi= numpy.arcsin(numpy.sqrt(numpy.clip(sin2psi,0.,1.)))
+        coords= numpy.array([(aLz-self._Lzmin)/(self._Lzmax-self._Lzmin)\
+                                 *(nLz-1.),
+                             y*(nE-1.),
+                             psi/(numpy.pi/2.)*(npsi-1.)])
+        jr= ndimage.map_coordinates(self._jrCoeffs,coords,order=3,
+                                    mode='nearest',prefilter=False)
+        jz= ndimage.map_coordinates(self._jzCoeffs,coords,order=3,
+                                    mode='nearest',prefilter=False)
+        jr= numpy.maximum(jr,0.)
+        jz= numpy.maximum(jz,0.)
+        jr[sin2psi > 1.]= numpy.nan
+        jz[sin2psi > 1.]= numpy.nan
+        return (jr,jz)
+
+    def JR(self,*args,**kwargs):
+        """
+        NAME:
+           JR
+        PURPOSE:
+           evaluate the action jr
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           Jr
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self(*args,**kwargs)[0]
+
+    def Jz(self,*args,**kwargs):
+        """
+        NAME:
+           Jz
+        PURPOSE:
+           evaluate the action jz
+        INPUT:
+           Either:
+              a) R,vR,vT,z,vz (can be arrays)
+              b) Orbit instance: initial condition used if that's it, orbit(t)
+                 if there is a time given as well
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           jz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self(*args,**kwargs)[2]
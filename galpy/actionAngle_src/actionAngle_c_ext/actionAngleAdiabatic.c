@@ -0,0 +1,300 @@
+/*
+  C code for the actions, turning points, and periods in the adiabatic
+  approximation for arrays of phase-space points
+*/
+#include <stdio.h>
+#include <stdlib.h>
+#include <math.h>
+#include <bovy_symplecticode.h>
+//Potentials
+#include <galpy_potentials.h>
+#ifndef M_PI
+#define M_PI 3.14159265358979323846
+#endif
+//Relative tolerance and maximum number of iterations of the root finder
+#define TURNINGXTOL 1e-12
+#define TURNINGMAXITER 100
+/*
+  Structure declarations
+*/
+struct turningPointArg{
+  double E; //(vertical) energy
+  double L2; //angular momentum squared (radial)
+  double R; //radius (vertical)
+  double Phi0; //Phi(R,0) (vertical)
+  int npot;
+  struct leapFuncArg * leapFuncArgs;
+};
+/*
+  Function declarations
+*/
+void actionAngleAdiabatic_actions(int,double *,double *,double *,double *,
+				  double *,int,int *,double *,double,double,
+				  int,double *,double *,double *,double *,
+				  double *,double *,double *,double *,
+				  double *,double *);
+static void parse_actionAngleArgs(int,struct leapFuncArg *,int *,double *);
+static double evaluatePotentials(double,double,int,struct leapFuncArg *);
+static double radialTurningEq(double,struct turningPointArg *);
+static double verticalTurningEq(double,struct turningPointArg *);
+static double turningPoint(double (*)(double,struct turningPointArg *),
+			   struct turningPointArg *,double,double,double);
+/*
+  Actual functions
+*/
+static void parse_actionAngleArgs(int npot,
+				  struct leapFuncArg * leapFuncArgs,
+				  int * pot_type,
+				  double * pot_args){
+  int ii,jj;
+  for (ii=0; ii < npot; ii++){
+    switch ( *pot_type++ ) {
+    case 0: //LogarithmicHaloPotential, 3 arguments
+      leapFuncArgs->potentialEval= &LogarithmicHaloPotentialEval;
+      leapFuncArgs->nargs= 3;
+      break;
+    case 5: //MiyamotoNagaiPotential, 3 arguments
+      leapFuncArgs->potentialEval= &MiyamotoNagaiPotentialEval;
+      leapFuncArgs->nargs= 3;
+      break;
+    case 7: //PowerSphericalPotential, 2 arguments
+      leapFuncArgs->potentialEval= &PowerSphericalPotentialEval;
+      leapFuncArgs->nargs= 2;
+      break;
+    case 8: //HernquistPotential, 2 arguments
+      leapFuncArgs->potentialEval= &HernquistPotentialEval;
+      leapFuncArgs->nargs= 2;
+      break;
+    case 9: //NFWPotential, 2 arguments
+      leapFuncArgs->potentialEval= &NFWPotentialEval;
+      leapFuncArgs->nargs= 2;
+      break;
+    case 10: //JaffePotential, 2 arguments
+      leapFuncArgs->potentialEval= &JaffePotentialEval;
+      leapFuncArgs->nargs= 2;
+      break;
+    }
+    leapFuncArgs->args= (double *) malloc( leapFuncArgs->nargs * sizeof(double));
+    for (jj=0; jj < leapFuncArgs->nargs; jj++){
+      *(leapFuncArgs->args)= *pot_args++;
+      leapFuncArgs->args++;
+    }
+    leapFuncArgs->args-= leapFuncArgs->nargs;
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= npot;
+}
+static double evaluatePotentials(double R, double Z, 
+				 int nargs, struct leapFuncArg * leapFuncArgs){
+  int ii;
+  double pot= 0.;
+  for (ii=0; ii < nargs; ii++){
+    pot+= leapFuncArgs->potentialEval(R,Z,0.,0.,
+				      leapFuncArgs->nargs,
+				      leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= nargs;
+  return pot;
+}
+static double radialTurningEq(double r,struct turningPointArg * a){
+  //E-Phi(r,0)-L^2/2/r^2, zero at the radial turning points
+  return a->E-evaluatePotentials(r,0.,a->npot,a->leapFuncArgs)
+    -0.5*a->L2/r/r;
+}
+static double verticalTurningEq(double z,struct turningPointArg * a){
+  //Ez-Phi(R,z)+Phi(R,0), zero at zmax
+  return a->E-evaluatePotentials(a->R,z,a->npot,a->leapFuncArgs)+a->Phi0;
+}
+static double turningPoint(double (*func)(double,struct turningPointArg *),
+			   struct turningPointArg * arg,
+			   double x0,double f0,double fac){
+  /*
+    Find the zero of func beyond x0, by stepping away from x0 by factors 
+    of fac (> 1 for outer, < 1 for inner turning points) to bracket it 
+    and refining it with the Illinois false-position method; func >= 0 
+    at x0 and decreases through the zero
+  */
+  double a,b,c,fa,fb,fc;
+  int ii;
+  //x0 itself is a turning point if func decreases away from it right away
+  if ( f0 <= 0. ) {
+    a= x0*(1.+(fac-1.)*1e-8);
+    fa= func(a,arg);
+    if ( fa <= 0. ) return x0;
+  }
+  else {
+    a= x0;
+    fa= f0;
+  }
+  //Bracket
+  b= x0*fac;
+  if ( b == 0. ) b= 1e-2;
+  fb= func(b,arg);
+  ii= 0;
+  while ( fb > 0. && ii < 200 ) {
+    if ( fac < 1. && b <= 1e-9 ) return 0.;
+    a= b;
+    fa= fb;
+    b*= fac;
+    fb= func(b,arg);
+    ii++;
+  }
+  if ( fb > 0. ) return ( fac < 1. ) ? 0. : INFINITY;
+  //Illinois iteration
+  for (ii=0; ii < TURNINGMAXITER; ii++){
+    c= b-fb*(b-a)/(fb-fa);
+    fc= func(c,arg);
+    if ( fc*fb < 0. ) {
+      a= b;
+      fa= fb;
+    }
+    else
+      fa*= 0.5;
+    b= c;
+    fb= fc;
+    if ( fabs(b-a) <= TURNINGXTOL*fabs(b) || fc == 0. ) break;
+  }
+  return b;
+}
+void actionAngleAdiabatic_actions(int ndata,
+				  double *R,
+				  double *vR,
+				  double *vT,
+				  double *z,
+				  double *vz,
+				  int npot,
+				  int * pot_type,
+				  double * pot_args,
+				  double gamma,
+				  double phiinf,
+				  int order,
+				  double *glx,
+				  double *glw,
+				  double *rperi,
+				  double *rap,
+				  double *zmax,
+				  double *jr,
+				  double *jz,
+				  double *TR,
+				  double *Tphi,
+				  double *Tz){
+  /*
+    Calculate the turning points (rperi,rap,zmax), the actions (jr,jz), 
+    and the periods (TR,Tphi,Tz) using Gauss-Legendre quadrature of order 
+    order with nodes glx and weights glw on [-1,1]; jr, TR, and Tphi are 
+    infinite for unbound orbits
+  */
+  int ii,jj;
+  double Ez,L,Lz,E,zz,r,f,s,h,nu2,kappa2,dr,rm,Isum,TRsum,jrsum;
+  //Tabulate the sines and cosines of the quadrature nodes in theta and eta
+  double * sintheta= (double *) malloc ( 4 * order * sizeof (double) );
+  double * costheta= sintheta+order;
+  double * sineta= sintheta+2*order;
+  double * coseta= sintheta+3*order;
+  for (jj=0; jj < order; jj++){
+    *(sintheta+jj)= sin(M_PI/4.*(*(glx+jj)+1.));
+    *(costheta+jj)= cos(M_PI/4.*(*(glx+jj)+1.));
+    *(sineta+jj)= sin(M_PI/2.*(*(glx+jj)+1.));
+    *(coseta+jj)= cos(M_PI/2.*(*(glx+jj)+1.));
+  }
+  struct turningPointArg * arg= (struct turningPointArg *) malloc ( sizeof (struct turningPointArg) );
+  struct leapFuncArg * leapFuncArgs= (struct leapFuncArg *) malloc ( npot * sizeof (struct leapFuncArg) );
+  parse_actionAngleArgs(npot,leapFuncArgs,pot_type,pot_args);
+  arg->npot= npot;
+  arg->leapFuncArgs= leapFuncArgs;
+  for (ii=0; ii < ndata; ii++){
+    //Vertical motion in Phi(R,z)-Phi(R,0)
+    arg->R= *(R+ii);
+    arg->Phi0= evaluatePotentials(*(R+ii),0.,npot,leapFuncArgs);
+    Ez= evaluatePotentials(*(R+ii),*(z+ii),npot,leapFuncArgs)-arg->Phi0
+      +0.5 * *(vz+ii) * *(vz+ii);
+    arg->E= Ez;
+    *(zmax+ii)= turningPoint(&verticalTurningEq,arg,fabs(*(z+ii)),
+			     0.5 * *(vz+ii) * *(vz+ii),2.);
+    if ( *(zmax+ii) == 0. ) {
+      //Orbits in the mid-plane: T_z= 2 pi / nu
+      h= 1e-4 * *(R+ii);
+      nu2= 2.*(evaluatePotentials(*(R+ii),h,npot,leapFuncArgs)-arg->Phi0)/h/h;
+      *(jz+ii)= 0.;
+      *(Tz+ii)= 2.*M_PI/sqrt(nu2);
+    }
+    else if ( isinf(*(zmax+ii)) ) {
+      *(jz+ii)= INFINITY;
+      *(Tz+ii)= INFINITY;
+    }
+    else {
+      //z= zmax sin(theta) removes the square-root singularity at zmax
+      *(jz+ii)= 0.;
+      *(Tz+ii)= 0.;
+      for (jj=0; jj < order; jj++){
+	zz= *(zmax+ii) * *(sintheta+jj);
+	f= 2.*verticalTurningEq(zz,arg);
+	if ( f <= 0. ) continue;
+	s= sqrt(f);
+	*(jz+ii)+= *(glw+jj) * *(costheta+jj) * s;
+	*(Tz+ii)+= *(glw+jj) * *(costheta+jj) / s;
+      }
+      *(jz+ii)*= 0.5 * *(zmax+ii);
+      *(Tz+ii)*= M_PI * *(zmax+ii);
+    }
+    //Radial motion in the effective potential, replacing Lz by Lz+gamma Jz
+    Lz= *(R+ii) * *(vT+ii);
+    L= fabs(Lz)+gamma * *(jz+ii);
+    E= arg->Phi0+0.5 * *(vR+ii) * *(vR+ii)+0.5*L*L / *(R+ii) / *(R+ii);
+    arg->E= E;
+    arg->L2= L*L;
+    *(rperi+ii)= turningPoint(&radialTurningEq,arg,*(R+ii),
+			      0.5 * *(vR+ii) * *(vR+ii),0.5);
+    if ( E >= phiinf || isinf(L) ) 
+      *(rap+ii)= INFINITY;
+    else
+      *(rap+ii)= turningPoint(&radialTurningEq,arg,*(R+ii),
+			      0.5 * *(vR+ii) * *(vR+ii),2.);
+    if ( isinf(*(rap+ii)) ) {
+      *(jr+ii)= INFINITY;
+      *(TR+ii)= INFINITY;
+      *(Tphi+ii)= INFINITY;
+    }
+    else if ( *(rap+ii)-*(rperi+ii) <= TURNINGXTOL * *(R+ii) ) {
+      //Circular orbit: T_R= 2 pi / kappa
+      h= 1e-4 * *(R+ii);
+      kappa2= -(radialTurningEq(*(R+ii)+h,arg)-2.*radialTurningEq(*(R+ii),arg)
+		+radialTurningEq(*(R+ii)-h,arg))/h/h;
+      *(jr+ii)= 0.;
+      *(TR+ii)= 2.*M_PI/sqrt(kappa2);
+      *(Tphi+ii)= 2.*M_PI * *(R+ii) / *(vT+ii);
+    }
+    else {
+      //r= rm-dr cos(eta) removes the square-root singularities at the 
+      //turning points
+      rm= 0.5*(*(rap+ii)+*(rperi+ii));
+      dr= 0.5*(*(rap+ii)-*(rperi+ii));
+      jrsum= 0.;
+      TRsum= 0.;
+      Isum= 0.;
+      for (jj=0; jj < order; jj++){
+	r= rm-dr * *(coseta+jj);
+	f= 2.*radialTurningEq(r,arg);
+	if ( f <= 0. ) continue;
+	s= sqrt(f);
+	jrsum+= *(glw+jj) * *(sineta+jj) * s;
+	TRsum+= *(glw+jj) * *(sineta+jj) / s;
+	Isum+= *(glw+jj) * *(sineta+jj) / s / r / r;
+      }
+      *(jr+ii)= 0.5 * dr * jrsum;
+      *(TR+ii)= M_PI * dr * TRsum;
+      //Tphi= pi TR / I, with I= Lz int dr / r^2 / v_R
+      *(Tphi+ii)= M_PI * *(TR+ii) / ( 0.5 * M_PI * Lz * dr * Isum );
+    }
+  }
+  //Free allocated memory
+  for (ii=0; ii < npot; ii++) {
+    free(leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= npot;
+  free(leapFuncArgs);
+  free(arg);
+  free(sintheta);
+}
@@ -49,6 +49,7 @@ class quasiisothermaldf:
         if pot is None:
             raise IOError("pot= must be set")
         self._pot= pot
+        self._rotcurve= potential.rotcurveTable(self._pot)
         if aA is None:
             raise IOError("aA= must be set")
         self._aA= aA
@@ -60,9 +61,9 @@ class quasiisothermaldf:
             self._precomputergnLz= _precomputergnLz
             self._precomputergLzmin= 0.01
             self._precomputergLzmax= self._precomputergrmax\
-                *potential.vcirc(self._pot,self._precomputergrmax)
+                *self._rotcurve.vcirc(self._precomputergrmax)
             self._precomputergLzgrid= numpy.linspace(self._precomputergLzmin,self._precomputergLzmax,self._precomputergnLz)
-            self._rls= numpy.array([potential.rl(self._pot,l) for l in self._precomputergLzgrid])
+            self._rls= self._rotcurve.rl(self._precomputergLzgrid)
             #Spline interpolate
             self._rgInterp= interpolate.InterpolatedUnivariateSpline(self._precomputergLzgrid,self._rls,k=3)
         else:
@@ -109,6 +110,13 @@ class quasiisothermaldf:
            neighborhood (includes some out of the grid)
 
            up to 200x faster when called with vector R,vR,vT,z,vz
+
+           For actionAngleAdiabatic called with vector R,vR,vT,z,vz the 
+           actions take about 15 to 30 microsec / evaluation
+
+           For actionAngleStaeckel called with vector R,vR,vT,z,vz the 
+           actions take about 15 microsec / evaluation; 
+           actionAngleStaeckelGrid is about 5 to 10x faster
         """
         #First parse log
         if kwargs.has_key('log'):
@@ -298,7 +306,7 @@ class quasiisothermaldf:
         logSigmaR= (self._ro-R)/self._hr
         sigmaR1= self._sr*numpy.exp((self._ro-R)/self._hsr)
         sigmaz1= self._sz*numpy.exp((self._ro-R)/self._hsz)
-        thisvc= potential.vcirc(self._pot,R)
+        thisvc= self._rotcurve.vcirc(R)
         #Use the asymmetric drift equation to estimate va
         gamma= numpy.sqrt(0.5)
         va= sigmaR1**2./2./thisvc\
@@ -366,7 +374,7 @@ class quasiisothermaldf:
         logSigmaR= (self._ro-R)/self._hr
         sigmaR1= self._sr*numpy.exp((self._ro-R)/self._hsr)
         sigmaz1= self._sz*numpy.exp((self._ro-R)/self._hsz)
-        thisvc= potential.vcirc(self._pot,R)
+        thisvc= self._rotcurve.vcirc(R)
         #Use the asymmetric drift equation to estimate va
         gamma= numpy.sqrt(0.5)
         va= sigmaR1**2./2./thisvc\
@@ -725,10 +733,11 @@ class quasiisothermaldf:
            kappa
         HISTORY:
            2012-07-25 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Use tabulated rotation curve - agent (local)
         NOTE:
-           takes about 0.1 ms for a Miyamoto-Nagai potential
+           uses the tabulated rotation curve, vectorized in r
         """
-        return potential.epifreq(self._pot,r)
+        return self._rotcurve.epifreq(r)
 
     def _calc_verticalfreq(self,r):
         """
@@ -742,10 +751,11 @@ class quasiisothermaldf:
            nu
         HISTORY:
            2012-07-25 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Use tabulated rotation curve - agent (local)
         NOTE:
-           takes about 0.05 ms for a Miyamoto-Nagai potential
+           uses the tabulated rotation curve, vectorized in r
         """
-        return potential.verticalfreq(self._pot,r)
+        return self._rotcurve.verticalfreq(r)
 
     def rg(self,lz):
         """
@@ -759,23 +769,26 @@ class quasiisothermaldf:
            radius
         HISTORY:
            2012-07-25 - Written - Bovy (IAS@MPIA)
+           2026-10-19 - Vectorized out-of-range Lz - agent (local)
         NOTE:
-           seems to take about ~0.5 ms for a Miyamoto-Nagai potential; 
-           ~0.75 ms for a MWPotential
-           about the same with or without interpolation of the rotation curve
+           Lz outside of the pre-computed range (or all Lz if rg is not 
+           pre-computed) use the tabulated rotation curve's rl, which is
+           vectorized
 
            Not sure what to do about negative lz...
         """
+        if not self._precomputerg:
+            return self._rotcurve.rl(lz)
         if isinstance(lz,numpy.ndarray):
-            indx= (lz > self._precomputergLzmax)*(lz < self._precomputergLzmin)
-            indxc= True-indx
+            indx= (lz > self._precomputergLzmax)+(lz < self._precomputergLzmin)
+            indxc= ~indx
             out= numpy.empty(lz.shape)
             out[indxc]= self._rgInterp(lz[indxc])
-            out[indx]= numpy.array([potential.rl(self._pot,lz[indx][ii]) for ii in range(numpy.sum(indx))])
+            out[indx]= self._rotcurve.rl(lz[indx])
             return out
         else:
             if lz > self._precomputergLzmax or lz < self._precomputergLzmin:
-                return potential.rl(self._pot,lz)
+                return self._rotcurve.rl(lz)
             return self._rgInterp(lz)
 
 def _surfaceIntegrand(vz,vR,vT,R,z,df,sigmaR1,gamma,sigmaz1):
@@ -6,11 +6,17 @@ from galpy import actionAngle
 from galpy.potential import LogarithmicHaloPotential, PowerSphericalPotential,\
     KeplerPotential
 from galpy.potential_src.Potential import evaluateRforces, evaluatezforces,\
-    evaluatePotentials, evaluatephiforces, evaluateDensities
+    evaluatePotentials, evaluatephiforces, evaluateDensities, \
+    evaluateR2derivs, evaluatez2derivs, evaluateRzderivs, \
+    evaluatephi2derivs, evaluateRphiderivs, evaluatezphiderivs
+from galpy.potential_src.planarPotential import planarTofullPotential
 import galpy.util.bovy_plot as plot
 import galpy.util.bovy_symplecticode as symplecticode
-from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c
-from OrbitTop import OrbitTop
+from galpy.orbit_src.integrateFullOrbit import integrateFullOrbit_c, \
+    integrateFullOrbit_dxdv_c, integrateFullOrbit_rotating_c
+from galpy.actionAngle_src.actionAngleAxi import _setupC
+from OrbitTop import OrbitTop, _patternSpeed, _parse_rotating_method, \
+    _inertialPhi
 class FullOrbit(OrbitTop):
     """Class that holds and integrates orbits in full 3D potentials"""
     def __init__(self,vxvv=[1.,0.,0.9,0.,0.1]):
@@ -31,7 +37,8 @@ class FullOrbit(OrbitTop):
         self._BCIntegrateFunction= _integrateFullOrbit
         return None
 
-    def integrate(self,t,pot,method='odeint'):
+    def integrate(self,t,pot,method='odeint',rotatingFrame=False,
+                  OmegaP=None):
         """
         NAME:
            integrate
@@ -42,19 +49,97 @@ class FullOrbit(OrbitTop):
            pot - potential instance or list of instances
            method= 'odeint' for scipy's odeint integration, 'leapfrog' for
                     a simple symplectic integrator
+           rotatingFrame= if True, integrate in the frame rotating around 
+                          the z axis with pattern speed OmegaP, in which a 
+                          steady bar or spiral is static (only 'rk4_c', 
+                          'rk6_c', 'dopr54_c', and 'odeint'; the orbit is 
+                          returned in the inertial frame)
+           OmegaP= pattern speed of the rotating frame (default: from the
+                   potential's OmegaP())
         OUTPUT:
            (none) (get the actual orbit using getOrbit()
         HISTORY:
            2010-08-01 - Written - Bovy (NYU)
+           2026-10-19 - Added rotatingFrame - agent (local)
         """
-        if method == 'leapfrog_c': method= 'odeint'
+        if method == 'leapfrog_c' and not rotatingFrame: method= 'odeint'
         #Reset things that may have been defined by a previous integration
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
+        self._resetaA()
         self.t= nu.array(t)
+        pot= planarTofullPotential(pot)
         self._pot= pot
+        if isinstance(pot,list):
+            c_possible= True
+            for p in pot:
+                if not p.hasC:
+                    c_possible= False
+                    break
+        else:
+            c_possible= pot.hasC
+        if rotatingFrame:
+            if OmegaP is None:
+                OmegaP= _patternSpeed(pot)
+                if OmegaP is None:
+                    raise AttributeError("Potential does not have a pattern speed; specify OmegaP=")
+            method= _parse_rotating_method(method,c_possible)
+            self.orbit= _integrateFullOrbit_rotating(self.vxvv,pot,t,
+                                                     OmegaP,method)
+            return None
+        if '_c' in method and not c_possible:
+            method= 'odeint'
         self.orbit= _integrateFullOrbit(self.vxvv,pot,t,method)
 
+    def integrate_dxdv(self,dxdv,t,pot,method='dopr54_c'):
+        """
+        NAME:
+           integrate_dxdv
+        PURPOSE:
+           integrate the orbit and a small area of phase space
+        INPUT:
+           dxdv - [dR,dvR,dvT,dz,dvz,dphi]
+           t - list of times at which to output (0 has to be in this!)
+           pot - potential instance or list of instances
+           method= 'odeint' for scipy's odeint, 'rk4_c', 'rk6_c', or
+                   'dopr54_c' for the C integrators (if possible)
+        OUTPUT:
+           (none) (get the actual orbit using getOrbit_dxdv()
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        pot= planarTofullPotential(pot)
+        self.t= nu.array(t)
+        self._pot_dxdv= pot
+        if isinstance(pot,list):
+            c_possible= True
+            for p in pot:
+                if not p.hasC:
+                    c_possible= False
+                    break
+        else:
+            c_possible= pot.hasC
+        if '_c' in method and not c_possible:
+            method= 'odeint'
+        self.orbit_dxdv, msg= _integrateFullOrbit_dxdv(self.vxvv,dxdv,pot,t,
+                                                       method)
+        return msg
+
+    def getOrbit_dxdv(self):
+        """
+        NAME:
+           getOrbit_dxdv
+        PURPOSE:
+           return a previously calculated orbit and phase-space difference
+        INPUT:
+           (none)
+        OUTPUT:
+           array orbit[nt,12] of [R,vR,vT,z,vz,phi,dR,dvR,dvT,dz,dvz,dphi]
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self.orbit_dxdv
+
     def Jacobi(self,*args,**kwargs):
         """
         NAME:
@@ -132,7 +217,7 @@ class FullOrbit(OrbitTop):
         thiso= self(*args,**kwargs)
         onet= (len(thiso.shape) == 1)
         if onet:
-            return evaluatePotentials(thiso[0],thiso[3],thispot,
+            return evaluatePotentials(thiso[0],thiso[3],pot,
                                       phi=thiso[5],t=t)\
                                       +thiso[1]**2./2.\
                                       +thiso[2]**2./2.\
@@ -258,78 +343,59 @@ class FullOrbit(OrbitTop):
         else:
             return self.vxvv[-1]
 
-    def _resetaA(self,pot=None):
-        """
-        NAME:
-           _resetaA
-        PURPOSE:
-           re-set up an actionAngle module for this Orbit
-           ONLY TO BE CALLED FROM WITHIN SETUPAA
-        INPUT:
-           pot - potential
-        OUTPUT:
-           True if reset happened, False otherwise
-        HISTORY:
-           2012-06-01 - Written - Bovy (IAS)
-        """
-        if not pot is None and pot != self._aAPot:
-            delattr(self,'_aA')
-            return True
-        else:
-            pass #Already set up
-
-    def _setupaA(self,pot=None):
+    def _buildaAs(self,pot,vxvvs):
         """
         NAME:
-           _setupaA
+           _buildaAs
         PURPOSE:
-           set up an actionAngle module for this Orbit
+           build the actionAngle objects for an array of phase-space points
         INPUT:
            pot - potential
+           vxvvs - [5 or 6,N] array of phase-space points
         OUTPUT:
+           list of actionAngle instances
         HISTORY:
-           2010-11-30 - Written - Bovy (NYU)
+           2010-11-30 - Written as _setupaA - Bovy (NYU)
+           2026-10-19 - Rewritten for arrays of phase-space points - agent (local)
         """
-        if hasattr(self,'_aA'): 
-            if not self._resetaA(pot=pot): return None
-        if pot is None:
-            try:
-                pot= self._pot
-            except AttributeError:
-                raise AttributeError("Integrate orbit or specify pot=")
-        self._aAPot= pot
-        L= self.L().flatten()
-        R= nu.sqrt(self.vxvv[0]**2.+self.vxvv[3]**2.)
-        vT= nu.sqrt(L[0]**2.+L[1]**2.+L[2]**2.)/R
-        vR= (self.x()*self.vx()+self.y()*self.vy()+self.z()*self.vz())/R
-        z= self.vxvv[3]
-        vz= self.vxvv[4]
-        if isinstance(pot,LogarithmicHaloPotential):
-            self._aA= actionAngle.actionAngleFlat(R,vR,vT,z,vz,
-                                                  verticalPot=pot.toVertical(R))
-        elif isinstance(pot,KeplerPotential):
-            self._aA= actionAngle.actionAnglePower(R,vR,vT,z,vz,beta=-0.5,
-                                                   verticalPot=pot.toVertical(R))
-        elif isinstance(pot,PowerSphericalPotential):
-            if pot.alpha == 2.:
-                self._aA= actionAngle.actionAngleFlat(R,vR,vT,z,vz,
-                                                  verticalPot=pot.toVertical(R))                
-            else:
-                self._aA= actionAngle.actionAnglePower(R,vR,vT,z,vz,
-                                                       beta=1.\
-                                                           -pot.alpha/2.,
-                                                       verticalPot=pot.toVertical(R))
+        Rs, vRs, vTs, zs, vzs= vxvvs[0:5]
+        #Spherical radius and velocities in the orbital plane
+        r= nu.sqrt(Rs**2.+zs**2.)
+        vT= nu.sqrt((zs*vTs)**2.+(zs*vRs-Rs*vzs)**2.+(Rs*vTs)**2.)/r
+        vR= (Rs*vRs+zs*vzs)/r
+        if isinstance(pot,LogarithmicHaloPotential) \
+                or (isinstance(pot,PowerSphericalPotential) \
+                        and pot.alpha == 2.):
+            return [actionAngle.actionAngleFlat(r[ii],vR[ii],vT[ii],
+                                                zs[ii],vzs[ii],
+                                                verticalPot=pot.toVertical(r[ii]))
+                    for ii in range(len(r))]
+        elif isinstance(pot,KeplerPotential) \
+                or isinstance(pot,PowerSphericalPotential):
+            if isinstance(pot,KeplerPotential): beta= -0.5
+            else: beta= 1.-pot.alpha/2.
+            return [actionAngle.actionAnglePower(r[ii],vR[ii],vT[ii],
+                                                 zs[ii],vzs[ii],beta=beta,
+                                                 verticalPot=pot.toVertical(r[ii]))
+                    for ii in range(len(r))]
+        if isinstance(pot,list):
+            thispot= [p.toPlanar() for p in pot]
         else:
+            thispot= pot.toPlanar()
+        aAs, verticalPots= [], []
+        for ii in range(len(r)):
             if isinstance(pot,list):
-                thispot= [p.toPlanar() for p in pot]
+                thisverticalpot= [p.toVertical(r[ii]) for p in pot]
             else:
-                thispot= pot.toPlanar()
-            if isinstance(pot,list):
-                thisverticalpot= [p.toVertical(R) for p in pot]
-            else:
-                thisverticalpot= pot.toVertical(R)
-            self._aA= actionAngle.actionAngleAxi(R,vR,vT,z,vz,pot=thispot,
-                                                 verticalPot=thisverticalpot)
+                thisverticalpot= pot.toVertical(r[ii])
+            aAs.append(actionAngle.actionAngleAxi(r[ii],vR[ii],vT[ii],
+                                                  zs[ii],vzs[ii],pot=thispot,
+                                                  verticalPot=thisverticalpot,
+                                                  c=False))
+            verticalPots.append(thisverticalpot)
+        #Calculate in C all at once, if possible
+        _setupC(aAs,verticalPots)
+        return aAs
 
     def plotE(self,*args,**kwargs):
         """
@@ -666,6 +732,188 @@ def _integrateFullOrbit(vxvv,pot,t,method):
     out[neg_radii,5]+= m.pi
     return out
 
+def _integrateFullOrbit_rotating(vxvv,pot,t,OmegaP,method):
+    """
+    NAME:
+       _integrateFullOrbit_rotating
+    PURPOSE:
+       integrate an orbit in a Phi(R,z,phi) potential in the frame rotating
+       around the z axis with pattern speed OmegaP
+    INPUT:
+       vxvv - array with the initial conditions stacked like
+              [R,vR,vT,z,vz,phi] in the inertial frame at t[0]; vR outward!
+       pot - Potential instance
+       t - list of times at which to output (0 has to be in this!)
+       OmegaP - pattern speed of the rotating frame
+       method - 'odeint', 'rk4_c', 'rk6_c', or 'dopr54_c'
+    OUTPUT:
+       [:,6] array of [R,vR,vT,z,vz,phi] in the inertial frame at each t
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    t= nu.array(t)
+    #go to the rectangular, rotating frame
+    phi= vxvv[5]-OmegaP*t[0]
+    vT= vxvv[2]-OmegaP*vxvv[0]
+    this_vxvv= nu.array([vxvv[0]*nu.cos(phi),
+                         vxvv[0]*nu.sin(phi),
+                         vxvv[3],
+                         vxvv[1]*nu.cos(phi)-vT*nu.sin(phi),
+                         vT*nu.cos(phi)+vxvv[1]*nu.sin(phi),
+                         vxvv[4]])
+    if method.lower() == 'odeint':
+        tmp_out= integrate.odeint(_FullEOM_rotating,this_vxvv,t,
+                                  args=(pot,OmegaP),rtol=10.**-8.)
+    else:
+        warnings.warn("Using C implementation to integrate orbits")
+        tmp_out, msg= integrateFullOrbit_rotating_c(pot,this_vxvv,t,
+                                                    OmegaP,method)
+    #go back to the cylindrical, inertial frame
+    R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
+    phi= nu.arccos(tmp_out[:,0]/R)
+    phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
+    out= nu.zeros((len(t),6))
+    out[:,0]= R
+    out[:,1]= tmp_out[:,3]*nu.cos(phi)+tmp_out[:,4]*nu.sin(phi)
+    out[:,2]= tmp_out[:,4]*nu.cos(phi)-tmp_out[:,3]*nu.sin(phi)+OmegaP*R
+    out[:,3]= tmp_out[:,2]
+    out[:,4]= tmp_out[:,5]
+    out[:,5]= _inertialPhi(phi,t,OmegaP,vxvv[5],method)
+    return out
+
+def _integrateFullOrbit_dxdv(vxvv,dxdv,pot,t,method):
+    """
+    NAME:
+       _integrateFullOrbit_dxdv
+    PURPOSE:
+       integrate an orbit and area of phase space in a Phi(R,z,phi) potential
+    INPUT:
+       vxvv - array with the initial conditions stacked like
+              [R,vR,vT,z,vz,phi]; vR outward!
+       dxdv - difference to integrate [dR,dvR,dvT,dz,dvz,dphi]
+       pot - Potential instance
+       t - list of times at which to output (0 has to be in this!)
+       method - 'odeint', 'rk4_c', 'rk6_c', or 'dopr54_c'
+    OUTPUT:
+       [:,12] array of [R,vR,vT,z,vz,phi,dR,dvR,dvT,dz,dvz,dphi] at each t
+       error message from integrator
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    #go to the rectangular frame
+    cp= nu.cos(vxvv[5])
+    sp= nu.sin(vxvv[5])
+    this_vxvv= nu.array([vxvv[0]*cp,
+                         vxvv[0]*sp,
+                         vxvv[3],
+                         vxvv[1]*cp-vxvv[2]*sp,
+                         vxvv[2]*cp+vxvv[1]*sp,
+                         vxvv[4]])
+    this_dxdv= nu.array([cp*dxdv[0]-vxvv[0]*sp*dxdv[5],
+                         sp*dxdv[0]+vxvv[0]*cp*dxdv[5],
+                         dxdv[3],
+                         -(vxvv[1]*sp+vxvv[2]*cp)*dxdv[5]
+                         +cp*dxdv[1]-sp*dxdv[2],
+                         (vxvv[1]*cp-vxvv[2]*sp)*dxdv[5]
+                         +sp*dxdv[1]+cp*dxdv[2],
+                         dxdv[4]])
+    if method.lower() == 'rk4_c' or method.lower() == 'rk6_c' \
+            or method.lower() == 'dopr54_c':
+        warnings.warn("Using C implementation to integrate orbits")
+        #integrate
+        tmp_out, msg= integrateFullOrbit_dxdv_c(pot,this_vxvv,this_dxdv,
+                                                t,method)
+    elif method.lower() == 'odeint':
+        init= nu.concatenate((this_vxvv,this_dxdv))
+        #integrate
+        tmp_out= integrate.odeint(_FullEOM_dxdv,init,t,args=(pot,),
+                                  rtol=10.**-8.)#,mxstep=100000000)
+        msg= 0
+    else:
+        raise NotImplementedError("requested integration method does not exist")
+    #go back to the cylindrical frame
+    R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
+    phi= nu.arccos(tmp_out[:,0]/R)
+    phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
+    cp= nu.cos(phi)
+    sp= nu.sin(phi)
+    vR= tmp_out[:,3]*cp+tmp_out[:,4]*sp
+    vT= tmp_out[:,4]*cp-tmp_out[:,3]*sp
+    dR= cp*tmp_out[:,6]+sp*tmp_out[:,7]
+    dphi= (cp*tmp_out[:,7]-sp*tmp_out[:,6])/R
+    dvR= cp*tmp_out[:,9]+sp*tmp_out[:,10]+vT*dphi
+    dvT= cp*tmp_out[:,10]-sp*tmp_out[:,9]-vR*dphi
+    out= nu.zeros((len(t),12))
+    out[:,0]= R
+    out[:,1]= vR
+    out[:,2]= vT
+    out[:,3]= tmp_out[:,2]
+    out[:,4]= tmp_out[:,5]
+    out[:,5]= phi
+    out[:,6]= dR
+    out[:,7]= dvR
+    out[:,8]= dvT
+    out[:,9]= tmp_out[:,8]
+    out[:,10]= tmp_out[:,11]
+    out[:,11]= dphi
+    if msg == 1:
+        warnings.warn("During numerical integration, steps smaller than the smallest step were requested; integration might not be accurate")
+    return (out,msg)
+
+def _FullEOM_dxdv(x,t,pot):
+    """
+    NAME:
+       _FullEOM_dxdv
+    PURPOSE:
+       implements the EOM, i.e., the right-hand side of the differential 
+       equation, for integrating phase space differences, rectangular
+    INPUT:
+       x - current phase-space position
+       t - current time
+       pot - (list of) Potential instance(s)
+    OUTPUT:
+       dy/dt
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    #x is rectangular so calculate R and phi
+    R= nu.sqrt(x[0]**2.+x[1]**2.)
+    phi= nu.arccos(x[0]/R)
+    sinphi= x[1]/R
+    cosphi= x[0]/R
+    if x[1] < 0.: phi= 2.*nu.pi-phi
+    z= x[2]
+    #calculate forces and second derivatives
+    Rforce= evaluateRforces(R,z,pot,phi=phi,t=t)
+    zforce= evaluatezforces(R,z,pot,phi=phi,t=t)
+    phiforce= evaluatephiforces(R,z,pot,phi=phi,t=t)
+    R2deriv= evaluateR2derivs(R,z,pot,phi=phi,t=t)
+    z2deriv= evaluatez2derivs(R,z,pot,phi=phi,t=t)
+    Rzderiv= evaluateRzderivs(R,z,pot,phi=phi,t=t)
+    phi2deriv= evaluatephi2derivs(R,z,pot,phi=phi,t=t)
+    Rphideriv= evaluateRphiderivs(R,z,pot,phi=phi,t=t)
+    zphideriv= evaluatezphiderivs(R,z,pot,phi=phi,t=t)
+    #Hessian of the potential in the rectangular frame
+    cc= cosphi**2.
+    ss= sinphi**2.
+    cs= cosphi*sinphi
+    Hxx= cc*R2deriv-2.*cs/R*Rphideriv+ss/R**2.*phi2deriv\
+        -ss/R*Rforce-2.*cs/R**2.*phiforce
+    Hyy= ss*R2deriv+2.*cs/R*Rphideriv+cc/R**2.*phi2deriv\
+        -cc/R*Rforce+2.*cs/R**2.*phiforce
+    Hxy= cs*R2deriv+(cc-ss)/R*Rphideriv-cs/R**2.*phi2deriv\
+        +cs/R*Rforce+(cc-ss)/R**2.*phiforce
+    Hxz= cosphi*Rzderiv-sinphi/R*zphideriv
+    Hyz= sinphi*Rzderiv+cosphi/R*zphideriv
+    return [x[3],x[4],x[5],
+            cosphi*Rforce-1./R*sinphi*phiforce,
+            sinphi*Rforce+1./R*cosphi*phiforce,
+            zforce,
+            x[9],x[10],x[11],
+            -Hxx*x[6]-Hxy*x[7]-Hxz*x[8],
+            -Hxy*x[6]-Hyy*x[7]-Hyz*x[8],
+            -Hxz*x[6]-Hyz*x[7]-z2deriv*x[8]]
+
 def _FullEOM(y,t,pot):
     """
     NAME:
@@ -691,6 +939,31 @@ def _FullEOM(y,t,pot):
             y[5],
             evaluatezforces(y[0],y[4],pot,phi=y[2],t=t)]
 
+def _FullEOM_rotating(x,t,pot,OmegaP):
+    """
+    NAME:
+       _FullEOM_rotating
+    PURPOSE:
+       implements the EOM, i.e., the right-hand side of the differential 
+       equation, in the rectangular frame rotating with pattern speed OmegaP
+    INPUT:
+       x - current phase-space position in the rotating frame
+       t - current time
+       pot - (list of) Potential instance(s)
+       OmegaP - pattern speed of the rotating frame
+    OUTPUT:
+       dy/dt
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    #the rotating frame is at azimuth OmegaP t in the inertial frame
+    c, s= nu.cos(OmegaP*t), nu.sin(OmegaP*t)
+    F= _rectForce([c*x[0]-s*x[1],s*x[0]+c*x[1],x[2]],pot,t=t)
+    return [x[3],x[4],x[5],
+            c*F[0]+s*F[1]+2.*OmegaP*x[4]+OmegaP**2.*x[0],
+            -s*F[0]+c*F[1]-2.*OmegaP*x[3]+OmegaP**2.*x[1],
+            F[2]]
+
 def _rectForce(x,pot,t=0.):
     """
     NAME:
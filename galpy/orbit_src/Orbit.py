@@ -218,7 +218,8 @@ class Orbit:
         elif len(self.vxvv) == 5 or len(self.vxvv) == 6:
             return 3
 
-    def integrate(self,t,pot,method='leapfrog_c'):
+    def integrate(self,t,pot,method='leapfrog_c',rotatingFrame=False,
+                  OmegaP=None):
         """
         NAME:
 
@@ -237,6 +238,15 @@ class Orbit:
            method= 'odeint' for scipy's odeint or 'leapfrog' for a simple
                    leapfrog implementation
 
+           rotatingFrame= if True, integrate in the frame rotating with 
+                          the pattern speed OmegaP, including the Coriolis
+                          and centrifugal forces (only for planar and full
+                          3D orbits; the orbit is returned in the inertial 
+                          frame)
+
+           OmegaP= pattern speed of the rotating frame (default: from the
+                   potential's OmegaP())
+
         OUTPUT:
 
            (none) (get the actual orbit using getOrbit()
@@ -245,8 +255,14 @@ class Orbit:
 
            2010-07-10 - Written - Bovy (NYU)
 
+           2026-10-19 - Added rotatingFrame - agent (local)
+
         """
-        self._orb.integrate(t,pot,method=method)
+        if rotatingFrame:
+            self._orb.integrate(t,pot,method=method,rotatingFrame=True,
+                                OmegaP=OmegaP)
+        else:
+            self._orb.integrate(t,pot,method=method)
 
     def integrateBC(self,pot,bc=_zEqZeroBC,method='odeint'):
         """
@@ -302,6 +318,8 @@ class Orbit:
         """
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
         if hasattr(self,'rs'): delattr(self,'rs')
+        if hasattr(self._orb,'_orbInterp'): delattr(self._orb,'_orbInterp')
+        self._orb._resetaA()
         sortindx = range(len(self._orb.t))
         sortindx.sort(lambda x,y: cmp(self._orb.t[x],self._orb.t[y]),
                       reverse=True)
@@ -549,7 +567,7 @@ class Orbit:
         """
         return self._orb.wp(pot=pot)
 
-    def jr(self,pot=None,**kwargs):
+    def jr(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -563,6 +581,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -573,11 +594,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.JR(**kwargs)
+        return self._orb._evalaA('JR',pot=pot,t=t,**kwargs)
 
-    def jp(self,pot=None,**kwargs):
+    def jp(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -591,6 +613,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -601,11 +626,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.Jphi(**kwargs)
+        return self._orb._evalaA('Jphi',pot=pot,t=t,**kwargs)
 
-    def jz(self,pot=None,**kwargs):
+    def jz(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -619,6 +645,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -629,11 +658,12 @@ class Orbit:
 
            2012-06-01 - Written - Bovy (IAS)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.Jz(**kwargs)
+        return self._orb._evalaA('Jz',pot=pot,t=t,**kwargs)
 
-    def wr(self,pot=None,**kwargs):
+    def wr(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -647,6 +677,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -657,11 +690,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.angleR(**kwargs)
+        return self._orb._evalaA('angleR',pot=pot,t=t,**kwargs)
 
-    def wz(self,pot=None,**kwargs):
+    def wz(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -675,6 +709,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -685,11 +722,12 @@ class Orbit:
 
            2012-06-01 - Written - Bovy (IAS)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.anglez(**kwargs)
+        return self._orb._evalaA('anglez',pot=pot,t=t,**kwargs)
 
-    def Tr(self,pot=None,**kwargs):
+    def Tr(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -703,6 +741,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -713,11 +754,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.TR(**kwargs)
+        return self._orb._evalaA('TR',pot=pot,t=t,**kwargs)
 
-    def Tp(self,pot=None,**kwargs):
+    def Tp(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -731,6 +773,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -741,11 +786,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.Tphi(**kwargs)
+        return self._orb._evalaA('Tphi',pot=pot,t=t,**kwargs)
 
-    def TrTp(self,pot=None,**kwargs):
+    def TrTp(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -759,6 +805,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -769,11 +818,12 @@ class Orbit:
 
            2010-11-30 - Written - Bovy (NYU)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.I(**kwargs)
+        return self._orb._evalaA('I',pot=pot,t=t,**kwargs)
  
-    def Tz(self,pot=None,**kwargs):
+    def Tz(self,pot=None,t=None,**kwargs):
         """
         NAME:
 
@@ -787,6 +837,9 @@ class Orbit:
 
            pot - potential
 
+           t - time or array of times along the orbit (default: initial 
+               condition)
+
            +scipy.integrate.quadrature keywords
 
         OUTPUT:
@@ -797,9 +850,10 @@ class Orbit:
 
            2012-06-01 - Written - Bovy (IAS)
 
+           2026-10-19 - Added t= and shared action cache - agent (local)
+
         """
-        self._orb._setupaA(pot=pot)
-        return self._orb._aA.Tz(**kwargs)
+        return self._orb._evalaA('Tz',pot=pot,t=t,**kwargs)
 
     def R(self,*args,**kwargs):
         """
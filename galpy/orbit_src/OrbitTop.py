@@ -1,9 +1,13 @@
 import math as m
+import warnings
+import collections
 import numpy as nu
 from scipy import integrate, interpolate, optimize
 import galpy.util.bovy_plot as plot
 import galpy.util.bovy_coords as coords
 from galpy.potential_src.planarPotential import RZToplanarPotential
+from galpy.potential_src.Potential import potentialFingerprint
+_MAXAACACHE= 10000 #maximum number of actionAngle objects cached per orbit
 class OrbitTop:
     """General class that holds orbits and integrates them"""
     def __init__(self,vxvv=None):
@@ -1515,6 +1519,146 @@ class OrbitTop:
             self._orbInterp= orbInterp
         return None
 
+    def _setupaA(self,pot=None,t=None):
+        """
+        NAME:
+           _setupaA
+        PURPOSE:
+           set up the actionAngle objects for this Orbit at time(s) t, from 
+           the orbit's action cache, keyed by the potential's fingerprint and 
+           the time, if possible; all action, angle, and frequency accessors 
+           share these objects and therefore their intermediate results 
+           (turning points, E, L, ...)
+        INPUT:
+           pot - potential (default: the potential the orbit was integrated 
+                 in)
+           t - time or array of times along the orbit (default: the initial 
+               condition)
+        OUTPUT:
+           actionAngle instance (list for array t); the (last) instance is 
+           also set as self._aA
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if pot is None:
+            try:
+                pot= self._pot
+            except AttributeError:
+                raise AttributeError("Integrate orbit or specify pot=")
+        if not hasattr(self,'_aACache'):
+            self._aACache= collections.OrderedDict()
+        fp= potentialFingerprint(pot)
+        if t is None:
+            ts= [None]
+        else:
+            ts= [float(tt) for tt in nu.atleast_1d(t)]
+        aAs= {}
+        for tt in ts:
+            if (fp,tt) in self._aACache:
+                #Move to the end, such that the cache is least-recently used
+                aAs[tt]= self._aACache.pop((fp,tt))
+        missing= sorted(set(ts)-set(aAs.keys()))
+        if len(missing) == 1 and missing[0] is None:
+            vxvvs= nu.array(self.vxvv).reshape((len(self.vxvv),1))
+        elif len(missing) == 1:
+            vxvvs= self(missing[0]).reshape((len(self.vxvv),1))
+        elif len(missing) > 1:
+            vxvvs= self(nu.array(missing))
+        if len(missing) > 0:
+            aAs.update(zip(missing,self._buildaAs(pot,vxvvs)))
+        for tt in aAs.keys():
+            self._aACache[(fp,tt)]= aAs[tt]
+        while len(self._aACache) > _MAXAACACHE:
+            self._aACache.popitem(last=False)
+        self._aA= aAs[ts[-1]]
+        if nu.ndim(t) == 0: return self._aA
+        else: return [aAs[tt] for tt in ts]
+
+    def _resetaA(self,all=False):
+        """
+        NAME:
+           _resetaA
+        PURPOSE:
+           remove the cached actionAngle objects at times along the orbit, 
+           which are invalid when the orbit is re-integrated
+        INPUT:
+           all= if True, also remove those for the initial condition
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if hasattr(self,'_aA'): delattr(self,'_aA')
+        if not hasattr(self,'_aACache'): return None
+        for key in self._aACache.keys():
+            if all or not key[1] is None:
+                self._aACache.pop(key)
+        return None
+
+    def _buildaAs(self,pot,vxvvs):
+        """
+        NAME:
+           _buildaAs
+        PURPOSE:
+           build the actionAngle objects for an array of phase-space points
+           of this type of orbit
+        INPUT:
+           pot - potential
+           vxvvs - [dim,N] array of phase-space points
+        OUTPUT:
+           list of actionAngle instances
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        raise AttributeError("actions are not implemented for this type of orbit")
+
+    def _evalaA(self,func,pot=None,t=None,**kwargs):
+        """Evaluate the method func of the actionAngle objects at time(s)
+        t in pot (arrays stacked along the first axis for array t)"""
+        aAs= self._setupaA(pot=pot,t=t)
+        if nu.ndim(t) == 0:
+            return getattr(aAs,func)(**kwargs)
+        else:
+            return nu.array([getattr(aA,func)(**kwargs) for aA in aAs])
+
+
+def _patternSpeed(pot):
+    """Return the pattern speed of the first potential in pot that has one
+    (None if none has); looks through planar <-> 3D wrappers"""
+    if not isinstance(pot,list):
+        pot= [pot]
+    for p in pot:
+        if hasattr(p,'_planarPot'): p= p._planarPot
+        elif hasattr(p,'_RZPot'): p= p._RZPot
+        if hasattr(p,'OmegaP'):
+            return p.OmegaP()
+    return None
+
+def _inertialPhi(phi,t,OmegaP,phio,method):
+    """Azimuth in the inertial frame from the azimuth phi in [0,2pi) in the
+    rotating frame, following the convention of the inertial integrators:
+    in [0,2pi) for the C integrators, continuous and starting at phio for
+    odeint"""
+    if method.lower() != 'odeint':
+        return (phi+OmegaP*t) % (2.*nu.pi)
+    out= nu.unwrap(phi)+OmegaP*t
+    return out+2.*nu.pi*nu.round((phio-out[0])/2./nu.pi)
+
+def _parse_rotating_method(method,c_possible):
+    """Pick an integrator for rotating-frame integration: the Coriolis 
+    force is velocity dependent, so the symplectic integrators cannot be 
+    used"""
+    method= method.lower()
+    if method in ['rk4_c','rk6_c','dopr54_c','odeint']:
+        if '_c' in method and not c_possible:
+            return 'odeint'
+        return method
+    if c_possible:
+        newmethod= 'dopr54_c'
+    else:
+        newmethod= 'odeint'
+    warnings.warn("Rotating-frame integration does not support the symplectic integrator %s; using %s instead" % (method,newmethod))
+    return newmethod
 
 class _fakeInterp: 
     """Fake class to simulate interpolation when orbit was not integrated"""
@@ -5,6 +5,7 @@ from numpy.ctypeslib import ndpointer
 import os
 from galpy import potential, potential_src
 from galpy.orbit_src.integratePlanarOrbit import _parse_integrator, _parse_tol
+from galpy.orbit_src.integratePlanarOrbit import _parse_pot as _parse_planar_pot
 #Find and load the library
 _lib = None
 _libname = ctypes.util.find_library('galpy_integrate_c')
@@ -35,12 +36,17 @@ def _parse_pot(pot):
         if isinstance(p,potential.LogarithmicHaloPotential):
             pot_type.append(0)
             pot_args.extend([p._amp,p._q,p._core2])
+        elif isinstance(p,potential_src.planarPotential.fullPotentialFromplanarPotential):
+            #3D version of a non-axisymmetric planarPotential
+            dum, ptype, pargs= _parse_planar_pot(p._planarPot)
+            pot_type.extend(ptype)
+            pot_args.extend(pargs)
         elif isinstance(p,potential.MiyamotoNagaiPotential):
             pot_type.append(5)
             pot_args.extend([p._amp,p._a,p._b])
         elif isinstance(p,potential.PowerSphericalPotential):
             pot_type.append(7)
-            pot_args.extend([p._amp,p.aalpha])
+            pot_args.extend([p._amp,p.alpha])
         elif isinstance(p,potential.HernquistPotential):
             pot_type.append(8)
             pot_args.extend([p._amp,p.a])
@@ -50,6 +56,43 @@ def _parse_pot(pot):
         elif isinstance(p,potential.JaffePotential):
             pot_type.append(10)
             pot_args.extend([p._amp,p.a])
+        elif isinstance(p,potential.MultipoleExpansionPotential):
+            pot_type.append(11)
+            args= [p._amp,p._lmax,p._mmax,p._nr,p._lnrmin,p._dlnr]
+            args.extend(nu.array([p._phi,p._dphi,p._d2phi])\
+                            .transpose(1,0,2).flatten())
+            pot_args.extend([len(args)]+args)
+        elif isinstance(p,potential.MovingObjectPotential):
+            pot_type.append(12)
+            args= [p._amp,p._gm,p._softening._softening_length,len(p._ts)]
+            args.extend(p._ts)
+            args.extend(p._xyz.flatten())
+            args.extend(p._vxyz.flatten())
+            args.extend([nu.nan,nu.nan,nu.nan,nu.nan]) #position cache
+            pot_args.extend([len(args)]+args)
+        elif isinstance(p,potential.MovingObjectsPotential):
+            pot_type.append(13)
+            if p._rcut is None: rcut= -1.
+            else: rcut= p._rcut
+            args= [p._amp,p._nobj,len(p._ts),rcut]
+            args.extend(p._gm)
+            args.extend(p._softening_length)
+            args.extend(p._ts)
+            args.extend(p._xyz.flatten())
+            args.extend(p._vxyz.flatten())
+            args.extend([nu.nan for ii in range(3*p._nobj+18)]) #caches
+            pot_args.extend([len(args)]+args)
+        elif isinstance(p,potential.interpGridPotential):
+            pot_type.append(14)
+            args= [p._amp,p._omegap,p._pa,p._gmout]
+            args.extend(p._n)
+            args.extend(p._min)
+            args.extend(p._h)
+            args.extend(p._coeffs.flatten())
+            args.extend([nu.nan for ii in range(17)]) #caches
+            pot_args.extend([len(args)]+args)
+    if len(pot_type) != npot:
+        raise NotImplementedError("C integration is not implemented for (one of) these potentials; use a Python integrator")
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
     return (npot,pot_type,pot_args)
@@ -123,12 +166,84 @@ def integrateFullOrbit_c(pot,yo,t,int_method,rtol=None,atol=None):
 
     return (result,err.value)
 
+def integrateFullOrbits_c(pot,yo,t,int_method,rtol=None,atol=None):
+    """
+    NAME:
+       integrateFullOrbits_c
+    PURPOSE:
+       C integrate the odes of a batch of FullOrbits in a single call
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial conditions [norb,6] array of [q,p]
+       t - set of times at which one wants the result, either the same for
+           all orbits ([nt]) or one set for each orbit ([norb,nt])
+       int_method= 'leapfrog_c', 'rk4_c', 'rk6_c', 'symplec4_c'
+       rtol, atol
+    OUTPUT:
+       (y,err)
+       y : array, shape (norb,nt,6)
+       Array containing the value of y for each orbit at each desired time
+       in t, with the initial value yo in the first row.
+       err: array of error messages for each orbit, if not zero: 1 means maximum step reduction happened for adaptive integrators
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    rtol, atol= _parse_tol(rtol,atol)
+    npot, pot_type, pot_args= _parse_pot(pot)
+    int_method_c= _parse_integrator(int_method)
+    yo= nu.atleast_2d(yo)
+    norb= yo.shape[0]
+    t= nu.array(t,dtype=nu.float64)
+    if t.ndim == 1:
+        t= nu.tile(t,(norb,1))
+    nt= t.shape[1]
+
+    #Set up result array
+    result= nu.empty((norb,nt,6))
+    err= nu.zeros(norb,dtype=nu.int32)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    integrationFunc= _lib.integrateFullOrbits
+    integrationFunc.argtypes= [ctypes.c_int,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,                             
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ctypes.c_int]
+
+    #Array requirements
+    yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
+    t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
+    result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+
+    #Run the C code
+    integrationFunc(ctypes.c_int(norb),
+                    yo,
+                    ctypes.c_int(nt),
+                    t,
+                    ctypes.c_int(npot),
+                    pot_type,
+                    pot_args,
+                    ctypes.c_double(rtol),ctypes.c_double(atol),
+                    result,
+                    err,
+                    ctypes.c_int(int_method_c))
+
+    return (result,err)
+
 def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None):
     """
     NAME:
        integrateFullOrbit_dxdv_c
     PURPOSE:
-       C integrate an ode for a planarOrbit+phase space volume dxdv
+       C integrate an ode for a FullOrbit+phase space volume dxdv
     INPUT:
        pot - Potential or list of such instances
        yo - initial condition [q,p]
@@ -193,3 +308,77 @@ def integrateFullOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None):
     if f_cont[1]: t= nu.asfortranarray(t)
 
     return (result,err.value)
+
+def integrateFullOrbit_rotating_c(pot,yo,t,OmegaP,int_method,
+                                  rtol=None,atol=None):
+    """
+    NAME:
+       integrateFullOrbit_rotating_c
+    PURPOSE:
+       C integrate an ode for a FullOrbit in a frame rotating around the z
+       axis with pattern speed OmegaP
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p] in the rotating frame
+       t - set of times at which one wants the result
+       OmegaP - pattern speed of the rotating frame
+       int_method= 'rk4_c', 'rk6_c', or 'dopr54_c'
+       rtol, atol
+    OUTPUT:
+       (y,err)
+       y : array, shape (len(y0), len(t))
+       Array containing the value of y in the rotating frame for each 
+       desired time in t, with the initial value y0 in the first row.
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    rtol, atol= _parse_tol(rtol,atol)
+    npot, pot_type, pot_args= _parse_pot(pot)
+    int_method_c= _parse_integrator(int_method)
+
+    #Set up result array
+    result= nu.empty((len(t),6))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    integrationFunc= _lib.integrateFullOrbit_rotating
+    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,                             
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int),
+                               ctypes.c_int]
+
+    #Array requirements, first store old order
+    f_cont= [yo.flags['F_CONTIGUOUS'],
+             t.flags['F_CONTIGUOUS']]
+    yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
+    t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
+    result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+
+    #Run the C code
+    integrationFunc(yo,
+                    ctypes.c_int(len(t)),
+                    t,
+                    ctypes.c_int(npot),
+                    pot_type,
+                    pot_args,
+                    ctypes.c_double(OmegaP),
+                    ctypes.c_double(rtol),ctypes.c_double(atol),
+                    result,
+                    ctypes.byref(err),
+                    ctypes.c_int(int_method_c))
+
+    #Reset input arrays
+    if f_cont[0]: yo= nu.asfortranarray(yo)
+    if f_cont[1]: t= nu.asfortranarray(t)
+
+    return (result,err.value)
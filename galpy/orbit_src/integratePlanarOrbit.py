@@ -106,6 +106,27 @@ def _parse_pot(pot):
                  and isinstance(p._RZPot,potential.JaffePotential):
             pot_type.append(10)
             pot_args.extend([p._RZPot._amp,p._RZPot.a])
+        elif isinstance(p,(potential_src.planarPotential.planarPotentialFromRZPotential,
+                           potential_src.planarPotential.planarPotentialFromFullPotential)) \
+                 and isinstance(p._RZPot,potential.MultipoleExpansionPotential):
+            pot_type.append(11)
+            args= [p._RZPot._amp,p._RZPot._lmax,p._RZPot._mmax,p._RZPot._nr,
+                   p._RZPot._lnrmin,p._RZPot._dlnr]
+            args.extend(nu.array([p._RZPot._phi,p._RZPot._dphi,
+                                  p._RZPot._d2phi]).transpose(1,0,2).flatten())
+            pot_args.extend([len(args)]+args)
+        elif isinstance(p,potential_src.planarPotential.planarPotentialFromFullPotential) \
+                 and isinstance(p._RZPot,(potential.MovingObjectPotential,
+                                          potential.MovingObjectsPotential,
+                                          potential.interpGridPotential)):
+            #Same arguments as the 3D potential, evaluated at z=0 in C
+            from galpy.orbit_src.integrateFullOrbit import \
+                _parse_pot as _parse_full_pot
+            dum, full_type, full_args= _parse_full_pot(p._RZPot)
+            pot_type.extend(full_type)
+            pot_args.extend(full_args)
+    if len(pot_type) != npot:
+        raise NotImplementedError("C integration is not implemented for (one of) these planar potentials; use a Python integrator")
     pot_type= nu.array(pot_type,dtype=nu.int32,order='C')
     pot_args= nu.array(pot_args,dtype=nu.float64,order='C')
     return (npot,pot_type,pot_args)
@@ -280,3 +301,77 @@ def integratePlanarOrbit_dxdv_c(pot,yo,dyo,t,int_method,rtol=None,atol=None):
     if f_cont[1]: t= nu.asfortranarray(t)
 
     return (result,err.value)
+
+def integratePlanarOrbit_rotating_c(pot,yo,t,OmegaP,int_method,
+                                    rtol=None,atol=None):
+    """
+    NAME:
+       integratePlanarOrbit_rotating_c
+    PURPOSE:
+       C integrate an ode for a planarOrbit in a frame rotating with 
+       pattern speed OmegaP
+    INPUT:
+       pot - Potential or list of such instances
+       yo - initial condition [q,p] in the rotating frame
+       t - set of times at which one wants the result
+       OmegaP - pattern speed of the rotating frame
+       int_method= 'rk4_c', 'rk6_c', or 'dopr54_c'
+       rtol, atol
+    OUTPUT:
+       (y,err)
+       y : array, shape (len(y0), len(t))
+       Array containing the value of y in the rotating frame for each 
+       desired time in t, with the initial value y0 in the first row.
+       err: error message, if not zero: 1 means maximum step reduction happened for adaptive integrators
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    rtol, atol= _parse_tol(rtol,atol)
+    npot, pot_type, pot_args= _parse_pot(pot)
+    int_method_c= _parse_integrator(int_method)
+
+    #Set up result array
+    result= nu.empty((len(t),4))
+    err= ctypes.c_int(0)
+
+    #Set up the C code
+    ndarrayFlags= ('C_CONTIGUOUS','WRITEABLE')
+    integrationFunc= _lib.integratePlanarOrbit_rotating
+    integrationFunc.argtypes= [ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,                             
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_int,
+                               ndpointer(dtype=nu.int32,flags=ndarrayFlags),
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ctypes.c_double,
+                               ndpointer(dtype=nu.float64,flags=ndarrayFlags),
+                               ctypes.POINTER(ctypes.c_int),
+                               ctypes.c_int]
+
+    #Array requirements, first store old order
+    f_cont= [yo.flags['F_CONTIGUOUS'],
+             t.flags['F_CONTIGUOUS']]
+    yo= nu.require(yo,dtype=nu.float64,requirements=['C','W'])
+    t= nu.require(t,dtype=nu.float64,requirements=['C','W'])
+    result= nu.require(result,dtype=nu.float64,requirements=['C','W'])
+
+    #Run the C code
+    integrationFunc(yo,
+                    ctypes.c_int(len(t)),
+                    t,
+                    ctypes.c_int(npot),
+                    pot_type,
+                    pot_args,
+                    ctypes.c_double(OmegaP),
+                    ctypes.c_double(rtol),ctypes.c_double(atol),
+                    result,
+                    ctypes.byref(err),
+                    ctypes.c_int(int_method_c))
+
+    #Reset input arrays
+    if f_cont[0]: yo= nu.asfortranarray(yo)
+    if f_cont[1]: t= nu.asfortranarray(t)
+
+    return (result,err.value)
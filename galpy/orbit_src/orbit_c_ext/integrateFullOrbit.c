@@ -21,6 +21,8 @@ void evalRectDeriv(double, double *, double *,
 			 int, struct leapFuncArg *);
 void evalRectDeriv_dxdv(double,double *, double *,
 			      int, struct leapFuncArg *);
+void evalRectDeriv_rotating(double, double *, double *,
+			    int, struct leapFuncArg *);
 double calcRforce(double, double,double, double, 
 			int, struct leapFuncArg *);
 double calczforce(double, double,double, double, 
@@ -29,10 +31,18 @@ double calcPhiforce(double, double,double, double,
 			int, struct leapFuncArg *);
 double calcR2deriv(double, double, double,double, 
 			 int, struct leapFuncArg *);
+double calcz2deriv(double, double, double,double, 
+		   int, struct leapFuncArg *);
+double calcRzderiv(double, double, double,double, 
+		   int, struct leapFuncArg *);
 double calcphi2deriv(double, double, double,double, 
 			   int, struct leapFuncArg *);
 double calcRphideriv(double, double, double,double, 
 			   int, struct leapFuncArg *);
+double calczphideriv(double, double, double,double, 
+		     int, struct leapFuncArg *);
+void integrateFullOrbits(int,double *,int,double *,int,int *,double *,
+			 double,double,double *,int *,int);
 /*
   Actual functions
 */
@@ -43,60 +53,186 @@ inline void parse_leapFuncArgs_Full(int npot,
   int ii,jj;
   for (ii=0; ii < npot; ii++){
     switch ( *pot_type++ ) {
-    case 0: //LogarithmicHaloPotential, 2 arguments
+    case 0: //LogarithmicHaloPotential, 3 arguments
       leapFuncArgs->Rforce= &LogarithmicHaloPotentialRforce;
       leapFuncArgs->zforce= &LogarithmicHaloPotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &LogarithmicHaloPotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
-      leapFuncArgs->nargs= 2;
+      leapFuncArgs->R2deriv= &LogarithmicHaloPotentialR2deriv;
+      leapFuncArgs->z2deriv= &LogarithmicHaloPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &LogarithmicHaloPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
+      leapFuncArgs->nargs= 3;
+      break;
+    case 1: //DehnenBarPotential, 7 arguments
+      leapFuncArgs->Rforce= &DehnenBarPotentialFullRforce;
+      leapFuncArgs->zforce= &DehnenBarPotentialFullzforce;
+      leapFuncArgs->phiforce= &DehnenBarPotentialFullphiforce;
+      leapFuncArgs->R2deriv= &DehnenBarPotentialFullR2deriv;
+      leapFuncArgs->z2deriv= &DehnenBarPotentialFullz2deriv;
+      leapFuncArgs->Rzderiv= &DehnenBarPotentialFullRzderiv;
+      leapFuncArgs->phi2deriv= &DehnenBarPotentialFullphi2deriv;
+      leapFuncArgs->Rphideriv= &DehnenBarPotentialFullRphideriv;
+      leapFuncArgs->zphideriv= &DehnenBarPotentialFullzphideriv;
+      leapFuncArgs->nargs= 7;
+      break;
+    case 2: //TransientLogSpiralPotential, 8 arguments
+      leapFuncArgs->Rforce= &TransientLogSpiralPotentialFullRforce;
+      leapFuncArgs->zforce= &TransientLogSpiralPotentialFullzforce;
+      leapFuncArgs->phiforce= &TransientLogSpiralPotentialFullphiforce;
+      leapFuncArgs->R2deriv= &TransientLogSpiralPotentialFullR2deriv;
+      leapFuncArgs->z2deriv= &TransientLogSpiralPotentialFullz2deriv;
+      leapFuncArgs->Rzderiv= &TransientLogSpiralPotentialFullRzderiv;
+      leapFuncArgs->phi2deriv= &TransientLogSpiralPotentialFullphi2deriv;
+      leapFuncArgs->Rphideriv= &TransientLogSpiralPotentialFullRphideriv;
+      leapFuncArgs->zphideriv= &TransientLogSpiralPotentialFullzphideriv;
+      leapFuncArgs->nargs= 8;
+      break;
+    case 3: //SteadyLogSpiralPotential, 8 arguments
+      leapFuncArgs->Rforce= &SteadyLogSpiralPotentialFullRforce;
+      leapFuncArgs->zforce= &SteadyLogSpiralPotentialFullzforce;
+      leapFuncArgs->phiforce= &SteadyLogSpiralPotentialFullphiforce;
+      leapFuncArgs->R2deriv= &SteadyLogSpiralPotentialFullR2deriv;
+      leapFuncArgs->z2deriv= &SteadyLogSpiralPotentialFullz2deriv;
+      leapFuncArgs->Rzderiv= &SteadyLogSpiralPotentialFullRzderiv;
+      leapFuncArgs->phi2deriv= &SteadyLogSpiralPotentialFullphi2deriv;
+      leapFuncArgs->Rphideriv= &SteadyLogSpiralPotentialFullRphideriv;
+      leapFuncArgs->zphideriv= &SteadyLogSpiralPotentialFullzphideriv;
+      leapFuncArgs->nargs= 8;
+      break;
+    case 4: //EllipticalDiskPotential, 6 arguments
+      leapFuncArgs->Rforce= &EllipticalDiskPotentialFullRforce;
+      leapFuncArgs->zforce= &EllipticalDiskPotentialFullzforce;
+      leapFuncArgs->phiforce= &EllipticalDiskPotentialFullphiforce;
+      leapFuncArgs->R2deriv= &EllipticalDiskPotentialFullR2deriv;
+      leapFuncArgs->z2deriv= &EllipticalDiskPotentialFullz2deriv;
+      leapFuncArgs->Rzderiv= &EllipticalDiskPotentialFullRzderiv;
+      leapFuncArgs->phi2deriv= &EllipticalDiskPotentialFullphi2deriv;
+      leapFuncArgs->Rphideriv= &EllipticalDiskPotentialFullRphideriv;
+      leapFuncArgs->zphideriv= &EllipticalDiskPotentialFullzphideriv;
+      leapFuncArgs->nargs= 6;
       break;
     case 5: //MiyamotoNagaiPotential, 3 arguments
       leapFuncArgs->Rforce= &MiyamotoNagaiPotentialRforce;
       leapFuncArgs->zforce= &MiyamotoNagaiPotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &MiyamotoNagaiPotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
+      leapFuncArgs->R2deriv= &MiyamotoNagaiPotentialR2deriv;
+      leapFuncArgs->z2deriv= &MiyamotoNagaiPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &MiyamotoNagaiPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
       leapFuncArgs->nargs= 3;
       break;
+    case 6: //LopsidedDiskPotential, 6 arguments
+      leapFuncArgs->Rforce= &LopsidedDiskPotentialFullRforce;
+      leapFuncArgs->zforce= &LopsidedDiskPotentialFullzforce;
+      leapFuncArgs->phiforce= &LopsidedDiskPotentialFullphiforce;
+      leapFuncArgs->R2deriv= &LopsidedDiskPotentialFullR2deriv;
+      leapFuncArgs->z2deriv= &LopsidedDiskPotentialFullz2deriv;
+      leapFuncArgs->Rzderiv= &LopsidedDiskPotentialFullRzderiv;
+      leapFuncArgs->phi2deriv= &LopsidedDiskPotentialFullphi2deriv;
+      leapFuncArgs->Rphideriv= &LopsidedDiskPotentialFullRphideriv;
+      leapFuncArgs->zphideriv= &LopsidedDiskPotentialFullzphideriv;
+      leapFuncArgs->nargs= 6;
+      break;
     case 7: //PowerSphericalPotential, 2 arguments
       leapFuncArgs->Rforce= &PowerSphericalPotentialRforce;
       leapFuncArgs->zforce= &PowerSphericalPotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &PowerSphericalPotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
+      leapFuncArgs->R2deriv= &PowerSphericalPotentialR2deriv;
+      leapFuncArgs->z2deriv= &PowerSphericalPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &PowerSphericalPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
       leapFuncArgs->nargs= 2;
       break;
     case 8: //HernquistPotential, 2 arguments
       leapFuncArgs->Rforce= &HernquistPotentialRforce;
       leapFuncArgs->zforce= &HernquistPotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &HernquistPotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
+      leapFuncArgs->R2deriv= &HernquistPotentialR2deriv;
+      leapFuncArgs->z2deriv= &HernquistPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &HernquistPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
       leapFuncArgs->nargs= 2;
       break;
     case 9: //NFWPotential, 2 arguments
       leapFuncArgs->Rforce= &NFWPotentialRforce;
       leapFuncArgs->zforce= &NFWPotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &NFWPotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
+      leapFuncArgs->R2deriv= &NFWPotentialR2deriv;
+      leapFuncArgs->z2deriv= &NFWPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &NFWPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
       leapFuncArgs->nargs= 2;
       break;
     case 10: //JaffePotential, 2 arguments
       leapFuncArgs->Rforce= &JaffePotentialRforce;
       leapFuncArgs->zforce= &JaffePotentialzforce;
       leapFuncArgs->phiforce= &ZeroForce;
-      //leapFuncArgs->R2deriv= &JaffePotentialR2deriv;
-      //leapFuncArgs->planarphi2deriv= &ZeroForce;
-      //leapFuncArgs->planarRphideriv= &ZeroForce;
+      leapFuncArgs->R2deriv= &JaffePotentialR2deriv;
+      leapFuncArgs->z2deriv= &JaffePotentialz2deriv;
+      leapFuncArgs->Rzderiv= &JaffePotentialRzderiv;
+      leapFuncArgs->phi2deriv= &ZeroForce;
+      leapFuncArgs->Rphideriv= &ZeroForce;
+      leapFuncArgs->zphideriv= &ZeroForce;
       leapFuncArgs->nargs= 2;
       break;
+    case 11: //MultipoleExpansionPotential, variable number of arguments
+      leapFuncArgs->Rforce= &MultipoleExpansionPotentialRforce;
+      leapFuncArgs->zforce= &MultipoleExpansionPotentialzforce;
+      leapFuncArgs->phiforce= &MultipoleExpansionPotentialphiforce;
+      leapFuncArgs->R2deriv= &MultipoleExpansionPotentialR2deriv;
+      leapFuncArgs->z2deriv= &MultipoleExpansionPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &MultipoleExpansionPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &MultipoleExpansionPotentialphi2deriv;
+      leapFuncArgs->Rphideriv= &MultipoleExpansionPotentialRphideriv;
+      leapFuncArgs->zphideriv= &MultipoleExpansionPotentialzphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 12: //MovingObjectPotential, variable number of arguments
+      leapFuncArgs->Rforce= &MovingObjectPotentialRforce;
+      leapFuncArgs->zforce= &MovingObjectPotentialzforce;
+      leapFuncArgs->phiforce= &MovingObjectPotentialphiforce;
+      leapFuncArgs->R2deriv= &MovingObjectPotentialR2deriv;
+      leapFuncArgs->z2deriv= &MovingObjectPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &MovingObjectPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &MovingObjectPotentialphi2deriv;
+      leapFuncArgs->Rphideriv= &MovingObjectPotentialRphideriv;
+      leapFuncArgs->zphideriv= &MovingObjectPotentialzphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 13: //MovingObjectsPotential, variable number of arguments
+      leapFuncArgs->Rforce= &MovingObjectsPotentialRforce;
+      leapFuncArgs->zforce= &MovingObjectsPotentialzforce;
+      leapFuncArgs->phiforce= &MovingObjectsPotentialphiforce;
+      leapFuncArgs->R2deriv= &MovingObjectsPotentialR2deriv;
+      leapFuncArgs->z2deriv= &MovingObjectsPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &MovingObjectsPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &MovingObjectsPotentialphi2deriv;
+      leapFuncArgs->Rphideriv= &MovingObjectsPotentialRphideriv;
+      leapFuncArgs->zphideriv= &MovingObjectsPotentialzphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 14: //interpGridPotential, variable number of arguments
+      leapFuncArgs->Rforce= &interpGridPotentialRforce;
+      leapFuncArgs->zforce= &interpGridPotentialzforce;
+      leapFuncArgs->phiforce= &interpGridPotentialphiforce;
+      leapFuncArgs->R2deriv= &interpGridPotentialR2deriv;
+      leapFuncArgs->z2deriv= &interpGridPotentialz2deriv;
+      leapFuncArgs->Rzderiv= &interpGridPotentialRzderiv;
+      leapFuncArgs->phi2deriv= &interpGridPotentialphi2deriv;
+      leapFuncArgs->Rphideriv= &interpGridPotentialRphideriv;
+      leapFuncArgs->zphideriv= &interpGridPotentialzphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
     }
     leapFuncArgs->args= (double *) malloc( leapFuncArgs->nargs * sizeof(double));
     for (jj=0; jj < leapFuncArgs->nargs; jj++){
@@ -119,7 +255,25 @@ void integrateFullOrbit(double *yo,
 			double *result,
 			int * err,
 			int odeint_type){
-  //Set up the forces, first count
+  integrateFullOrbits(1,yo,nt,t,npot,pot_type,pot_args,rtol,atol,result,err,
+		      odeint_type);
+}
+
+void integrateFullOrbits(int norb,
+			 double *yo,
+			 int nt, 
+			 double *t,
+			 int npot,
+			 int * pot_type,
+			 double * pot_args,
+			 double rtol,
+			 double atol,
+			 double *result,
+			 int * err,
+			 int odeint_type){
+  //Integrate norb orbits with initial conditions yo[norb*6], each on its own
+  //set of nt times t[norb*nt], into result[norb*nt*6] and err[norb]; the
+  //potential is only set up once
   int ii;
   int dim;
   struct leapFuncArg * leapFuncArgs= (struct leapFuncArg *) malloc ( npot * sizeof (struct leapFuncArg) );
@@ -167,8 +321,9 @@ void integrateFullOrbit(double *yo,
     dim= 6;
     break;
   }
-  odeint_func(odeint_deriv_func,dim,yo,nt,t,npot,leapFuncArgs,rtol,atol,
-	      result,err);
+  for (ii=0; ii < norb; ii++)
+    odeint_func(odeint_deriv_func,dim,yo+6*ii,nt,t+nt*ii,npot,leapFuncArgs,
+		rtol,atol,result+6*nt*ii,err+ii);
   //Free allocated memory
   for (ii=0; ii < npot; ii++) {
     free(leapFuncArgs->args);
@@ -179,17 +334,73 @@ void integrateFullOrbit(double *yo,
   //Done!
 }
 
-void integrateOrbit_dxdv(double *yo,
-			 int nt, 
-			 double *t,
-			 int npot,
-			 int * pot_type,
-			 double * pot_args,
-			 double rtol,
-			 double atol,
-			 double *result,
-			 int * err,
-			 int odeint_type){
+void integrateFullOrbit_rotating(double *yo,
+				 int nt, 
+				 double *t,
+				 int npot,
+				 int * pot_type,
+				 double * pot_args,
+				 double OmegaP,
+				 double rtol,
+				 double atol,
+				 double *result,
+				 int * err,
+				 int odeint_type){
+  //Integrate in the frame rotating at OmegaP around the z axis; yo and 
+  //result are the rectangular coordinates and velocities in the rotating 
+  //frame
+  int ii;
+  //The pattern speed is passed to the derivative function in an extra
+  //leapFuncArg after those of the potentials
+  struct leapFuncArg * leapFuncArgs= (struct leapFuncArg *) malloc ( (npot+1) * sizeof (struct leapFuncArg) );
+  parse_leapFuncArgs_Full(npot,leapFuncArgs,pot_type,pot_args);
+  (leapFuncArgs+npot)->nargs= 1;
+  (leapFuncArgs+npot)->args= (double *) malloc ( sizeof (double) );
+  *(leapFuncArgs+npot)->args= OmegaP;
+  //Integrate, the Coriolis force is velocity dependent, so only the
+  //non-symplectic integrators can be used
+  void (*odeint_func)(void (*func)(double, double *, double *,
+			   int, struct leapFuncArg *),
+		      int,
+		      double *,
+		      int, double *,
+		      int, struct leapFuncArg *,
+		      double, double,
+		      double *,int *);
+  switch ( odeint_type ) {
+  case 1: //RK4
+    odeint_func= &bovy_rk4;
+    break;
+  case 2: //RK6
+    odeint_func= &bovy_rk6;
+    break;
+  default: //DOPR54
+    odeint_func= &bovy_dopr54;
+    break;
+  }
+  odeint_func(&evalRectDeriv_rotating,6,yo,nt,t,npot,leapFuncArgs,
+	      rtol,atol,result,err);
+  //Free allocated memory
+  for (ii=0; ii < npot+1; ii++) {
+    free(leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= npot+1;
+  free(leapFuncArgs);
+  //Done!
+}
+
+void integrateFullOrbit_dxdv(double *yo,
+			     int nt, 
+			     double *t,
+			     int npot,
+			     int * pot_type,
+			     double * pot_args,
+			     double rtol,
+			     double atol,
+			     double *result,
+			     int * err,
+			     int odeint_type){
   //Set up the forces, first count
   int ii;
   int dim;
@@ -296,6 +507,38 @@ void evalRectDeriv(double t, double *q, double *a,
   *a= zforce;
 }
 
+void evalRectDeriv_rotating(double t, double *q, double *a,
+			    int nargs, struct leapFuncArg * leapFuncArgs){
+  double sinphi, cosphi, x, y, vx, vy, phi,R,Rforce,phiforce,z,zforce;
+  double OmegaP= *(leapFuncArgs+nargs)->args;
+  //q is rectangular in the rotating frame; the inertial azimuth is
+  //phi+OmegaP t
+  x= *q;
+  y= *(q+1);
+  z= *(q+2);
+  vx= *(q+3);
+  vy= *(q+4);
+  //first three derivatives are just the velocities
+  *a++= vx;
+  *a++= vy;
+  *a++= *(q+5);
+  R= sqrt(x*x+y*y);
+  phi= acos(x/R);
+  sinphi= y/R;
+  cosphi= x/R;
+  if ( y < 0. ) phi= 2.*M_PI-phi;
+  //Calculate the forces
+  Rforce= calcRforce(R,z,phi+OmegaP*t,t,nargs,leapFuncArgs);
+  zforce= calczforce(R,z,phi+OmegaP*t,t,nargs,leapFuncArgs);
+  phiforce= calcPhiforce(R,z,phi+OmegaP*t,t,nargs,leapFuncArgs);
+  //Add the Coriolis and centrifugal forces
+  *a++= cosphi*Rforce-1./R*sinphi*phiforce
+    +2.*OmegaP*vy+OmegaP*OmegaP*x;
+  *a++= sinphi*Rforce+1./R*cosphi*phiforce
+    -2.*OmegaP*vx+OmegaP*OmegaP*y;
+  *a= zforce;
+}
+
 double calcRforce(double R, double Z, double phi, double t, 
 		  int nargs, struct leapFuncArg * leapFuncArgs){
   int ii;
@@ -339,7 +582,8 @@ double calcPhiforce(double R, double Z, double phi, double t,
 void evalRectDeriv_dxdv(double t, double *q, double *a,
 			int nargs, struct leapFuncArg * leapFuncArgs){
   double sinphi, cosphi, x, y, phi,R,Rforce,phiforce,z,zforce;
-  double R2deriv, phi2deriv, Rphideriv, dFxdx, dFxdy, dFydx, dFydy;
+  double R2deriv, z2deriv, Rzderiv, phi2deriv, Rphideriv, zphideriv;
+  double cc, ss, cs, Hxx, Hxy, Hyy, Hxz, Hyz, Hzz;
   //first three derivatives are just the velocities
   *a++= *(q+3);
   *a++= *(q+4);
@@ -365,34 +609,29 @@ void evalRectDeriv_dxdv(double t, double *q, double *a,
   *a++= *(q+9);
   *a++= *(q+10);
   *a++= *(q+11);
-  //for the dv derivatives we need also R2deriv, phi2deriv, and Rphideriv
+  //for the dv derivatives we need the full Hessian of the potential
   R2deriv= calcR2deriv(R,z,phi,t,nargs,leapFuncArgs);
+  z2deriv= calcz2deriv(R,z,phi,t,nargs,leapFuncArgs);
+  Rzderiv= calcRzderiv(R,z,phi,t,nargs,leapFuncArgs);
   phi2deriv= calcphi2deriv(R,z,phi,t,nargs,leapFuncArgs);
   Rphideriv= calcRphideriv(R,z,phi,t,nargs,leapFuncArgs);
-  //..and dFxdx, dFxdy, dFydx, dFydy
-  dFxdx= -cosphi*cosphi*R2deriv
-    +2.*cosphi*sinphi/R/R*phiforce
-    +sinphi*sinphi/R*Rforce
-    +2.*sinphi*cosphi/R*Rphideriv
-    -sinphi*sinphi/R/R*phi2deriv;
-  dFxdy= -sinphi*cosphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phiforce
-    -cosphi*sinphi/R*Rforce
-    -(cosphi*cosphi-sinphi*sinphi)/R*Rphideriv
-    +cosphi*sinphi/R/R*phi2deriv;
-  dFydx= -cosphi*sinphi*R2deriv
-    +(sinphi*sinphi-cosphi*cosphi)/R/R*phiforce
-    +(sinphi*sinphi-cosphi*cosphi)/R*Rphideriv
-    -sinphi*cosphi/R*Rforce
-    +sinphi*cosphi/R/R*phi2deriv;
-  dFydy= -sinphi*sinphi*R2deriv
-    -2.*sinphi*cosphi/R/R*phiforce
-    -2.*sinphi*cosphi/R*Rphideriv
-    +cosphi*cosphi/R*Rforce
-    -cosphi*cosphi/R/R*phi2deriv;
-  *a++= dFxdx * *(q+4) + dFxdy * *(q+5);
-  *a++= dFydx * *(q+4) + dFydy * *(q+5);
-  *a= 0; //BOVY: PUT IN Z2DERIVS
+  zphideriv= calczphideriv(R,z,phi,t,nargs,leapFuncArgs);
+  //..transformed to rectangular coordinates
+  cc= cosphi*cosphi;
+  ss= sinphi*sinphi;
+  cs= cosphi*sinphi;
+  Hxx= cc*R2deriv-2.*cs/R*Rphideriv+ss/R/R*phi2deriv
+    -ss/R*Rforce-2.*cs/R/R*phiforce;
+  Hyy= ss*R2deriv+2.*cs/R*Rphideriv+cc/R/R*phi2deriv
+    -cc/R*Rforce+2.*cs/R/R*phiforce;
+  Hxy= cs*R2deriv+(cc-ss)/R*Rphideriv-cs/R/R*phi2deriv
+    +cs/R*Rforce+(cc-ss)/R/R*phiforce;
+  Hxz= cosphi*Rzderiv-sinphi/R*zphideriv;
+  Hyz= sinphi*Rzderiv+cosphi/R*zphideriv;
+  Hzz= z2deriv;
+  *a++= -Hxx * *(q+6) - Hxy * *(q+7) - Hxz * *(q+8);
+  *a++= -Hxy * *(q+6) - Hyy * *(q+7) - Hyz * *(q+8);
+  *a= -Hxz * *(q+6) - Hyz * *(q+7) - Hzz * *(q+8);
 }
 
 double calcR2deriv(double R, double Z, double phi, double t, 
@@ -409,6 +648,34 @@ double calcR2deriv(double R, double Z, double phi, double t,
   return R2deriv;
 }
 
+double calcz2deriv(double R, double Z, double phi, double t, 
+		   int nargs, struct leapFuncArg * leapFuncArgs){
+  int ii;
+  double z2deriv= 0.;
+  for (ii=0; ii < nargs; ii++){
+    z2deriv+= leapFuncArgs->z2deriv(R,Z,phi,t,
+				    leapFuncArgs->nargs,
+				    leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= nargs;
+  return z2deriv;
+}
+
+double calcRzderiv(double R, double Z, double phi, double t, 
+		   int nargs, struct leapFuncArg * leapFuncArgs){
+  int ii;
+  double Rzderiv= 0.;
+  for (ii=0; ii < nargs; ii++){
+    Rzderiv+= leapFuncArgs->Rzderiv(R,Z,phi,t,
+				    leapFuncArgs->nargs,
+				    leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= nargs;
+  return Rzderiv;
+}
+
 double calcphi2deriv(double R, double Z, double phi, double t, 
 			 int nargs, struct leapFuncArg * leapFuncArgs){
   int ii;
@@ -435,3 +702,16 @@ double calcRphideriv(double R, double Z, double phi, double t,
   leapFuncArgs-= nargs;
   return Rphideriv;
 }
+double calczphideriv(double R, double Z, double phi, double t, 
+		   int nargs, struct leapFuncArg * leapFuncArgs){
+  int ii;
+  double zphideriv= 0.;
+  for (ii=0; ii < nargs; ii++){
+    zphideriv+= leapFuncArgs->zphideriv(R,Z,phi,t,
+				    leapFuncArgs->nargs,
+				    leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= nargs;
+  return zphideriv;
+}
@@ -21,6 +21,8 @@ void evalPlanarRectDeriv(double, double *, double *,
 			 int, struct leapFuncArg *);
 void evalPlanarRectDeriv_dxdv(double, double *, double *,
 			      int, struct leapFuncArg *);
+void evalPlanarRectDeriv_rotating(double, double *, double *,
+				  int, struct leapFuncArg *);
 double calcPlanarRforce(double, double, double, 
 			int, struct leapFuncArg *);
 double calcPlanarphiforce(double, double, double, 
@@ -59,11 +61,17 @@ inline void parse_leapFuncArgs(int npot,struct leapFuncArg * leapFuncArgs,
     case 2: //TransientLogSpiralPotential, 8 arguments
       leapFuncArgs->planarRforce= &TransientLogSpiralPotentialRforce;
       leapFuncArgs->planarphiforce= &TransientLogSpiralPotentialphiforce;
+      leapFuncArgs->planarR2deriv= &TransientLogSpiralPotentialR2deriv;
+      leapFuncArgs->planarphi2deriv= &TransientLogSpiralPotentialphi2deriv;
+      leapFuncArgs->planarRphideriv= &TransientLogSpiralPotentialRphideriv;
       leapFuncArgs->nargs= 8;
       break;
     case 3: //SteadyLogSpiralPotential, 8 arguments
       leapFuncArgs->planarRforce= &SteadyLogSpiralPotentialRforce;
       leapFuncArgs->planarphiforce= &SteadyLogSpiralPotentialphiforce;
+      leapFuncArgs->planarR2deriv= &SteadyLogSpiralPotentialR2deriv;
+      leapFuncArgs->planarphi2deriv= &SteadyLogSpiralPotentialphi2deriv;
+      leapFuncArgs->planarRphideriv= &SteadyLogSpiralPotentialRphideriv;
       leapFuncArgs->nargs= 8;
       break;
     case 4: //EllipticalDiskPotential, 6 arguments
@@ -122,6 +130,38 @@ inline void parse_leapFuncArgs(int npot,struct leapFuncArg * leapFuncArgs,
       leapFuncArgs->planarRphideriv= &ZeroPlanarForce;
       leapFuncArgs->nargs= 2;
       break;
+    case 11: //MultipoleExpansionPotential, variable number of arguments
+      leapFuncArgs->planarRforce= &MultipoleExpansionPotentialPlanarRforce;
+      leapFuncArgs->planarphiforce= &MultipoleExpansionPotentialPlanarphiforce;
+      leapFuncArgs->planarR2deriv= &MultipoleExpansionPotentialPlanarR2deriv;
+      leapFuncArgs->planarphi2deriv= &MultipoleExpansionPotentialPlanarphi2deriv;
+      leapFuncArgs->planarRphideriv= &MultipoleExpansionPotentialPlanarRphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 12: //MovingObjectPotential, variable number of arguments
+      leapFuncArgs->planarRforce= &MovingObjectPotentialPlanarRforce;
+      leapFuncArgs->planarphiforce= &MovingObjectPotentialPlanarphiforce;
+      leapFuncArgs->planarR2deriv= &MovingObjectPotentialPlanarR2deriv;
+      leapFuncArgs->planarphi2deriv= &MovingObjectPotentialPlanarphi2deriv;
+      leapFuncArgs->planarRphideriv= &MovingObjectPotentialPlanarRphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 13: //MovingObjectsPotential, variable number of arguments
+      leapFuncArgs->planarRforce= &MovingObjectsPotentialPlanarRforce;
+      leapFuncArgs->planarphiforce= &MovingObjectsPotentialPlanarphiforce;
+      leapFuncArgs->planarR2deriv= &MovingObjectsPotentialPlanarR2deriv;
+      leapFuncArgs->planarphi2deriv= &MovingObjectsPotentialPlanarphi2deriv;
+      leapFuncArgs->planarRphideriv= &MovingObjectsPotentialPlanarRphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
+    case 14: //interpGridPotential, variable number of arguments
+      leapFuncArgs->planarRforce= &interpGridPotentialPlanarRforce;
+      leapFuncArgs->planarphiforce= &interpGridPotentialPlanarphiforce;
+      leapFuncArgs->planarR2deriv= &interpGridPotentialPlanarR2deriv;
+      leapFuncArgs->planarphi2deriv= &interpGridPotentialPlanarphi2deriv;
+      leapFuncArgs->planarRphideriv= &interpGridPotentialPlanarRphideriv;
+      leapFuncArgs->nargs= (int) *pot_args++;
+      break;
     }
     leapFuncArgs->args= (double *) malloc( leapFuncArgs->nargs * sizeof(double));
     for (jj=0; jj < leapFuncArgs->nargs; jj++){
@@ -204,6 +244,61 @@ void integratePlanarOrbit(double *yo,
   //Done!
 }
 
+void integratePlanarOrbit_rotating(double *yo,
+				   int nt, 
+				   double *t,
+				   int npot,
+				   int * pot_type,
+				   double * pot_args,
+				   double OmegaP,
+				   double rtol,
+				   double atol,
+				   double *result,
+				   int * err,
+				   int odeint_type){
+  //Integrate in the frame rotating at OmegaP; yo and result are the 
+  //rectangular coordinates and velocities in the rotating frame
+  int ii;
+  //The pattern speed is passed to the derivative function in an extra
+  //leapFuncArg after those of the potentials
+  struct leapFuncArg * leapFuncArgs= (struct leapFuncArg *) malloc ( (npot+1) * sizeof (struct leapFuncArg) );
+  parse_leapFuncArgs(npot,leapFuncArgs,pot_type,pot_args);
+  (leapFuncArgs+npot)->nargs= 1;
+  (leapFuncArgs+npot)->args= (double *) malloc ( sizeof (double) );
+  *(leapFuncArgs+npot)->args= OmegaP;
+  //Integrate, the Coriolis force is velocity dependent, so only the
+  //non-symplectic integrators can be used
+  void (*odeint_func)(void (*func)(double, double *, double *,
+			   int, struct leapFuncArg *),
+		      int,
+		      double *,
+		      int, double *,
+		      int, struct leapFuncArg *,
+		      double, double,
+		      double *,int *);
+  switch ( odeint_type ) {
+  case 1: //RK4
+    odeint_func= &bovy_rk4;
+    break;
+  case 2: //RK6
+    odeint_func= &bovy_rk6;
+    break;
+  default: //DOPR54
+    odeint_func= &bovy_dopr54;
+    break;
+  }
+  odeint_func(&evalPlanarRectDeriv_rotating,4,yo,nt,t,npot,leapFuncArgs,
+	      rtol,atol,result,err);
+  //Free allocated memory
+  for (ii=0; ii < npot+1; ii++) {
+    free(leapFuncArgs->args);
+    leapFuncArgs++;
+  }
+  leapFuncArgs-= npot+1;
+  free(leapFuncArgs);
+  //Done!
+}
+
 void integratePlanarOrbit_dxdv(double *yo,
 			       int nt, 
 			       double *t,
@@ -314,6 +409,33 @@ void evalPlanarRectDeriv(double t, double *q, double *a,
   *a= sinphi*Rforce+1./R*cosphi*phiforce;
 }
 
+void evalPlanarRectDeriv_rotating(double t, double *q, double *a,
+				  int nargs, struct leapFuncArg * leapFuncArgs){
+  double sinphi, cosphi, x, y, vx, vy, phi,R,Rforce,phiforce;
+  double OmegaP= *(leapFuncArgs+nargs)->args;
+  //q is rectangular in the rotating frame; the inertial azimuth is
+  //phi+OmegaP t
+  x= *q;
+  y= *(q+1);
+  vx= *(q+2);
+  vy= *(q+3);
+  //first two derivatives are just the velocities
+  *a++= vx;
+  *a++= vy;
+  R= sqrt(x*x+y*y);
+  phi= acos(x/R);
+  sinphi= y/R;
+  cosphi= x/R;
+  if ( y < 0. ) phi= 2.*M_PI-phi;
+  //Calculate the forces
+  Rforce= calcPlanarRforce(R,phi+OmegaP*t,t,nargs,leapFuncArgs);
+  phiforce= calcPlanarphiforce(R,phi+OmegaP*t,t,nargs,leapFuncArgs);
+  //Add the Coriolis and centrifugal forces
+  *a++= cosphi*Rforce-1./R*sinphi*phiforce
+    +2.*OmegaP*vy+OmegaP*OmegaP*x;
+  *a= sinphi*Rforce+1./R*cosphi*phiforce
+    -2.*OmegaP*vx+OmegaP*OmegaP*y;
+}
 double calcPlanarRforce(double R, double phi, double t, 
 			int nargs, struct leapFuncArg * leapFuncArgs){
   int ii;
@@ -7,14 +7,17 @@ import galpy.util.bovy_symplecticode as symplecticode
 from galpy import actionAngle
 from galpy.potential import LogarithmicHaloPotential, PowerSphericalPotential,\
     KeplerPotential
-from OrbitTop import OrbitTop
+from galpy.actionAngle_src.actionAngleAxi import _setupC
+from OrbitTop import OrbitTop, _patternSpeed, _parse_rotating_method, \
+    _inertialPhi
 from RZOrbit import RZOrbit
 from galpy.potential_src.planarPotential import evaluateplanarRforces,\
     planarPotential, RZToplanarPotential, evaluateplanarphiforces,\
-    evaluateplanarPotentials, planarPotentialFromRZPotential
+    evaluateplanarPotentials, planarPotentialFromRZPotential,\
+    evaluateplanarR2derivs, evaluateplanarphi2derivs, evaluateplanarRphiderivs
 from galpy.potential_src.Potential import Potential
 from galpy.orbit_src.integratePlanarOrbit import integratePlanarOrbit_c,\
-    integratePlanarOrbit_dxdv_c
+    integratePlanarOrbit_dxdv_c, integratePlanarOrbit_rotating_c
 def _warning(
     message,
     category = UserWarning,
@@ -54,8 +57,7 @@ class planarOrbitTop(OrbitTop):
            2010-09-15 - Written - Bovy (NYU)
         """
         if analytic:
-            if not hasattr(self,'_aA'):
-                self._setupaA(pot=pot)
+            self._setupaA(pot=pot)
             (rperi,rap)= self._aA.calcRapRperi()
             return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
@@ -118,8 +120,7 @@ class planarOrbitTop(OrbitTop):
            2010-09-20 - Written - Bovy (NYU)
         """
         if analytic:
-            if not hasattr(self,'_aA'):
-                self._setupaA(pot=pot)
+            self._setupaA(pot=pot)
             (rperi,rap)= self._aA.calcRapRperi()
             return rap
         if not hasattr(self,'orbit'):
@@ -143,8 +144,7 @@ class planarOrbitTop(OrbitTop):
            2010-09-20 - Written - Bovy (NYU)
         """
         if analytic:
-            if not hasattr(self,'_aA'):
-                self._setupaA(pot=pot)
+            self._setupaA(pot=pot)
             (rperi,rap)= self._aA.calcRapRperi()
             return rperi
         if not hasattr(self,'orbit'):
@@ -174,59 +174,49 @@ class planarOrbitTop(OrbitTop):
         else:
             return self.vxvv[-1]
 
-    def _setupaA(self,pot=None):
+    def _buildaAs(self,pot,vxvvs):
         """
         NAME:
-           _setupaA
+           _buildaAs
         PURPOSE:
-           set up an actionAngle module for this Orbit
+           build the actionAngle objects for an array of phase-space points
         INPUT:
            pot - potential
+           vxvvs - [3 or 4,N] array of phase-space points
         OUTPUT:
+           list of actionAngle instances
         HISTORY:
-           2010-11-30 - Written - Bovy (NYU)
+           2010-11-30 - Written as _setupaA - Bovy (NYU)
+           2026-10-19 - Rewritten for arrays of phase-space points - agent (local)
         """
-        if pot is None:
-            try:
-                pot= self._pot
-            except AttributeError:
-                raise AttributeError("Integrate orbit or specify pot=")
         if isinstance(pot,Potential) or isinstance(pot,list):
             thispot= RZToplanarPotential(pot)
         else:
             thispot= pot
-        if isinstance(thispot,LogarithmicHaloPotential) or \
-                (isinstance(thispot,planarPotentialFromRZPotential) and \
-                     isinstance(thispot._RZPot,LogarithmicHaloPotential)):
-            self._aA= actionAngle.actionAngleFlat(self.vxvv[0],
-                                                  self.vxvv[1],
-                                                  self.vxvv[2])
-        elif isinstance(thispot,KeplerPotential) or \
-                (isinstance(thispot,planarPotentialFromRZPotential) and \
-                     isinstance(thispot._RZPot,KeplerPotential)):
-            self._aA= actionAngle.actionAnglePower(self.vxvv[0],
-                                                   self.vxvv[1],
-                                                   self.vxvv[2],
-                                                   beta=-0.5)
-        elif isinstance(thispot,PowerSphericalPotential) or \
-                (isinstance(thispot,planarPotentialFromRZPotential) and \
-                     isinstance(thispot._RZPot,PowerSphericalPotential)):
-            if isinstance(thispot,planarPotentialFromRZPotential) and \
-                    isinstance(thispot._RZPot,PowerSphericalPotential):
-                thispot= thispot._RZPot
-            if thispot.alpha == 2.:
-                self._aA= actionAngle.actionAngleFlat(self.vxvv[0],
-                                                      self.vxvv[1],
-                                                      self.vxvv[2])
-            else:
-                self._aA= actionAngle.actionAnglePower(self.vxvv[0],
-                                                       self.vxvv[1],
-                                                       self.vxvv[2],
-                                                       beta=1.-thispot.alpha/2.)
+        R, vR, vT= vxvvs[0:3]
+        if isinstance(thispot,planarPotentialFromRZPotential) and \
+                isinstance(thispot._RZPot,(LogarithmicHaloPotential,
+                                           PowerSphericalPotential)):
+            powpot= thispot._RZPot
         else:
-            
-            self._aA= actionAngle.actionAngleAxi(self.vxvv[0],self.vxvv[1],
-                                                 self.vxvv[2],pot=thispot)
+            powpot= thispot
+        if isinstance(powpot,LogarithmicHaloPotential) or \
+                (isinstance(powpot,PowerSphericalPotential) \
+                     and powpot.alpha == 2.):
+            return [actionAngle.actionAngleFlat(R[ii],vR[ii],vT[ii])
+                    for ii in range(len(R))]
+        elif isinstance(powpot,PowerSphericalPotential):
+            if isinstance(powpot,KeplerPotential): beta= -0.5
+            else: beta= 1.-powpot.alpha/2.
+            return [actionAngle.actionAnglePower(R[ii],vR[ii],vT[ii],
+                                                 beta=beta)
+                    for ii in range(len(R))]
+        aAs= [actionAngle.actionAngleAxi(R[ii],vR[ii],vT[ii],pot=thispot,
+                                         c=False)
+              for ii in range(len(R))]
+        #Calculate in C all at once, if possible
+        _setupC(aAs,[None for ii in range(len(R))])
+        return aAs
 
     def plotJacobi(self,*args,**kwargs):
         """
@@ -312,6 +302,7 @@ class planarROrbit(planarOrbitTop):
            2010-07-20
         """
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
+        self._resetaA()
         if hasattr(self,'rs'): delattr(self,'rs')
         thispot= RZToplanarPotential(pot)
         self.t= nu.array(t)
@@ -465,7 +456,8 @@ class planarOrbit(planarOrbitTop):
         self._BCIntegrateFunction= _integrateOrbit
         return None
 
-    def integrate(self,t,pot,method='leapfrog_c'):
+    def integrate(self,t,pot,method='leapfrog_c',rotatingFrame=False,
+                  OmegaP=None):
         """
         NAME:
            integrate
@@ -477,12 +469,21 @@ class planarOrbit(planarOrbitTop):
            method= 'odeint' for scipy's odeint, 'leapfrog' for a simple
                    leapfrog implementation, 'leapfrog_c' for a simple
                    leapfrog implemenation in C (if possible)
+           rotatingFrame= if True, integrate in the frame rotating with 
+                          pattern speed OmegaP, in which a steady bar or 
+                          spiral is static (only 'rk4_c', 'rk6_c', 
+                          'dopr54_c', and 'odeint'; the orbit is returned
+                          in the inertial frame)
+           OmegaP= pattern speed of the rotating frame (default: from the
+                   potential's OmegaP())
         OUTPUT:
            (none) (get the actual orbit using getOrbit()
         HISTORY:
            2010-07-20
+           2026-10-19 - Added rotatingFrame - agent (local)
         """
         if hasattr(self,'_orbInterp'): delattr(self,'_orbInterp')
+        self._resetaA()
         if hasattr(self,'rs'): delattr(self,'rs')
         thispot= RZToplanarPotential(pot)
         self.t= nu.array(t)
@@ -495,6 +496,15 @@ class planarOrbit(planarOrbitTop):
                     break
         else:
             c_possible= pot.hasC
+        if rotatingFrame:
+            if OmegaP is None:
+                OmegaP= _patternSpeed(thispot)
+                if OmegaP is None:
+                    raise AttributeError("Potential does not have a pattern speed; specify OmegaP=")
+            method= _parse_rotating_method(method,c_possible)
+            self.orbit, msg= _integrateOrbit_rotating(self.vxvv,thispot,t,
+                                                      OmegaP,method)
+            return msg
         if '_c' in method and not c_possible:
             method= 'odeint'
         self.orbit, msg= _integrateOrbit(self.vxvv,thispot,t,method)
@@ -601,8 +611,7 @@ class planarOrbit(planarOrbitTop):
            2010-09-15 - Written - Bovy (NYU)
         """
         if analytic:
-            if not hasattr(self,'_aA'):
-                self._setupaA(pot=pot)
+            self._setupaA(pot=pot)
             (rperi,rap)= self._aA.calcRapRperi()
             return (rap-rperi)/(rap+rperi)
         if not hasattr(self,'orbit'):
@@ -830,6 +839,54 @@ def _integrateOrbit(vxvv,pot,t,method):
     _parse_warnmessage(msg)
     return (out,msg)
 
+def _integrateOrbit_rotating(vxvv,pot,t,OmegaP,method):
+    """
+    NAME:
+       _integrateOrbit_rotating
+    PURPOSE:
+       integrate an orbit in a Phi(R,phi) potential in the frame rotating
+       with pattern speed OmegaP
+    INPUT:
+       vxvv - array with the initial conditions stacked like
+              [R,vR,vT,phi] in the inertial frame at t[0]; vR outward!
+       pot - Potential instance
+       t - list of times at which to output (0 has to be in this!)
+       OmegaP - pattern speed of the rotating frame
+       method - 'odeint', 'rk4_c', 'rk6_c', or 'dopr54_c'
+    OUTPUT:
+       [:,4] array of [R,vR,vT,phi] in the inertial frame at each t
+       error message from integrator
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    t= nu.array(t)
+    #go to the rectangular, rotating frame
+    phi= vxvv[3]-OmegaP*t[0]
+    vT= vxvv[2]-OmegaP*vxvv[0]
+    this_vxvv= nu.array([vxvv[0]*nu.cos(phi),
+                         vxvv[0]*nu.sin(phi),
+                         vxvv[1]*nu.cos(phi)-vT*nu.sin(phi),
+                         vT*nu.cos(phi)+vxvv[1]*nu.sin(phi)])
+    if method.lower() == 'odeint':
+        tmp_out= integrate.odeint(_EOM_rotating,this_vxvv,t,
+                                  args=(pot,OmegaP),rtol=10.**-8.)
+        msg= 0
+    else:
+        warnings.warn("Using C implementation to integrate orbits")
+        tmp_out, msg= integratePlanarOrbit_rotating_c(pot,this_vxvv,t,
+                                                      OmegaP,method)
+    #go back to the cylindrical, inertial frame
+    R= nu.sqrt(tmp_out[:,0]**2.+tmp_out[:,1]**2.)
+    phi= nu.arccos(tmp_out[:,0]/R)
+    phi[(tmp_out[:,1] < 0.)]= 2.*nu.pi-phi[(tmp_out[:,1] < 0.)]
+    out= nu.zeros((len(t),4))
+    out[:,0]= R
+    out[:,1]= tmp_out[:,2]*nu.cos(phi)+tmp_out[:,3]*nu.sin(phi)
+    out[:,2]= tmp_out[:,3]*nu.cos(phi)-tmp_out[:,2]*nu.sin(phi)+OmegaP*R
+    out[:,3]= _inertialPhi(phi,t,OmegaP,vxvv[3],method)
+    _parse_warnmessage(msg)
+    return (out,msg)
+
 def _integrateOrbit_dxdv(vxvv,dxdv,pot,t,method):
     """
     NAME:
@@ -927,9 +984,9 @@ def _EOM_dxdv(x,t,pot):
     #calculate forces
     Rforce= evaluateplanarRforces(R,pot,phi=phi,t=t)
     phiforce= evaluateplanarphiforces(R,pot,phi=phi,t=t)
-    R2deriv= evaluateplanarPotentials(R,pot,phi=phi,t=t,dR=2)
-    phi2deriv= evaluateplanarPotentials(R,pot,phi=phi,t=t,dphi=2)
-    Rphideriv= evaluateplanarPotentials(R,pot,phi=phi,t=t,dR=1,dphi=1)
+    R2deriv= evaluateplanarR2derivs(R,pot,phi=phi,t=t)
+    phi2deriv= evaluateplanarphi2derivs(R,pot,phi=phi,t=t)
+    Rphideriv= evaluateplanarRphiderivs(R,pot,phi=phi,t=t)
     #Calculate derivatives and derivatives+time derivatives
     dFxdx= -cosphi**2.*R2deriv\
            +2.*cosphi*sinphi/R**2.*phiforce\
@@ -982,6 +1039,30 @@ def _EOM(y,t,pot):
             1./y[0]**2.*(evaluateplanarphiforces(y[0],pot,phi=y[2],t=t)-
                          2.*y[0]*y[1]*y[3])]
 
+def _EOM_rotating(x,t,pot,OmegaP):
+    """
+    NAME:
+       _EOM_rotating
+    PURPOSE:
+       implements the EOM, i.e., the right-hand side of the differential 
+       equation, in the rectangular frame rotating with pattern speed OmegaP
+    INPUT:
+       x - current phase-space position in the rotating frame
+       t - current time
+       pot - (list of) Potential instance(s)
+       OmegaP - pattern speed of the rotating frame
+    OUTPUT:
+       dy/dt
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    #the rotating frame is at azimuth OmegaP t in the inertial frame
+    c, s= nu.cos(OmegaP*t), nu.sin(OmegaP*t)
+    F= _rectForce([c*x[0]-s*x[1],s*x[0]+c*x[1]],pot,t=t)
+    return [x[2],x[3],
+            c*F[0]+s*F[1]+2.*OmegaP*x[3]+OmegaP**2.*x[0],
+            -s*F[0]+c*F[1]-2.*OmegaP*x[2]+OmegaP**2.*x[1]]
+
 def _rectForce(x,pot,t=0.):
     """
     NAME:
@@ -7,17 +7,25 @@ from galpy.potential_src import LogarithmicHaloPotential
 from galpy.potential_src import DoubleExponentialDiskPotential
 from galpy.potential_src import PowerSphericalPotential
 from galpy.potential_src import TwoPowerSphericalPotential
+from galpy.potential_src import IsochronePotential
 from galpy.potential_src import plotRotcurve
 from galpy.potential_src import plotEscapecurve
+from galpy.potential_src import interpRotcurve
 from galpy.potential_src import KGPotential
 from galpy.potential_src import interpRZPotential
 from galpy.potential_src import DehnenBarPotential
 from galpy.potential_src import SteadyLogSpiralPotential
 from galpy.potential_src import TransientLogSpiralPotential
 from galpy.potential_src import MovingObjectPotential
+from galpy.potential_src import MovingObjectsPotential
 from galpy.potential_src import ForceSoftening
 from galpy.potential_src import EllipticalDiskPotential
 from galpy.potential_src import CosmphiDiskPotential
+from galpy.potential_src import MultipoleExpansionPotential
+from galpy.potential_src import cachedPotential
+from galpy.potential_src import interpVerticalPotential
+from galpy.potential_src import interpEscapecurve
+from galpy.potential_src import interpGridPotential
 #
 # Functions
 #
@@ -26,8 +34,16 @@ evaluateDensities= Potential.evaluateDensities
 evaluateRforces= Potential.evaluateRforces
 evaluatephiforces= Potential.evaluatephiforces
 evaluatezforces= Potential.evaluatezforces
+evaluateR2derivs= Potential.evaluateR2derivs
+evaluatez2derivs= Potential.evaluatez2derivs
+evaluateRzderivs= Potential.evaluateRzderivs
+evaluatephi2derivs= Potential.evaluatephi2derivs
+evaluateRphiderivs= Potential.evaluateRphiderivs
+evaluatezphiderivs= Potential.evaluatezphiderivs
 RZToplanarPotential= planarPotential.RZToplanarPotential
+planarTofullPotential= planarPotential.planarTofullPotential
 RZToverticalPotential= verticalPotential.RZToverticalPotential
+tabulateVerticalPotentials= verticalPotential.tabulateVerticalPotentials
 plotPotentials= Potential.plotPotentials
 plotplanarPotentials= planarPotential.plotplanarPotentials
 plotlinearPotentials= linearPotential.plotlinearPotentials
@@ -37,16 +53,25 @@ epifreq= Potential.epifreq
 verticalfreq= Potential.verticalfreq
 flattening= Potential.flattening
 rl= Potential.rl
+Phiinf= Potential.Phiinf
+potentialFingerprint= Potential.potentialFingerprint
 omegac= plotRotcurve.omegac
 epifreq= plotRotcurve.epifreq
 lindbladR= plotRotcurve.lindbladR
 plotRotcurve= plotRotcurve.plotRotcurve
+rotcurveTable= interpRotcurve.rotcurveTable
+resonanceRadii= interpRotcurve.resonanceRadii
+verticalPotentialTable= interpVerticalPotential.verticalPotentialTable
 calcEscapecurve= plotEscapecurve.calcEscapecurve
 vesc= plotEscapecurve.vesc
+escapecurveTable= interpEscapecurve.escapecurveTable
 plotEscapecurve= plotEscapecurve.plotEscapecurve
 evaluateplanarPotentials= planarPotential.evaluateplanarPotentials
 evaluateplanarRforces= planarPotential.evaluateplanarRforces
 evaluateplanarphiforces= planarPotential.evaluateplanarphiforces
+evaluateplanarR2derivs= planarPotential.evaluateplanarR2derivs
+evaluateplanarphi2derivs= planarPotential.evaluateplanarphi2derivs
+evaluateplanarRphiderivs= planarPotential.evaluateplanarRphiderivs
 evaluatelinearPotentials= linearPotential.evaluatelinearPotentials
 evaluatelinearForces= linearPotential.evaluatelinearForces
 #
@@ -65,15 +90,23 @@ NFWPotential= TwoPowerSphericalPotential.NFWPotential
 JaffePotential= TwoPowerSphericalPotential.JaffePotential
 HernquistPotential= TwoPowerSphericalPotential.HernquistPotential
 TwoPowerSphericalPotential= TwoPowerSphericalPotential.TwoPowerSphericalPotential
+IsochronePotential= IsochronePotential.IsochronePotential
 KGPotential= KGPotential.KGPotential
 interpRZPotential= interpRZPotential.interpRZPotential
+interpGridPotential= interpGridPotential.interpGridPotential
+interpRotcurve= interpRotcurve.interpRotcurve
+interpVerticalPotential= interpVerticalPotential.interpVerticalPotential
+interpEscapecurve= interpEscapecurve.interpEscapecurve
 DehnenBarPotential= DehnenBarPotential.DehnenBarPotential
 SteadyLogSpiralPotential= SteadyLogSpiralPotential.SteadyLogSpiralPotential
 TransientLogSpiralPotential= TransientLogSpiralPotential.TransientLogSpiralPotential
 MovingObjectPotential= MovingObjectPotential.MovingObjectPotential
+MovingObjectsPotential= MovingObjectsPotential.MovingObjectsPotential
 EllipticalDiskPotential= EllipticalDiskPotential.EllipticalDiskPotential
 LopsidedDiskPotential= CosmphiDiskPotential.LopsidedDiskPotential
 CosmphiDiskPotential= CosmphiDiskPotential.CosmphiDiskPotential
+MultipoleExpansionPotential= MultipoleExpansionPotential.MultipoleExpansionPotential
+cachedPotential= cachedPotential.cachedPotential
 #Softenings
 PlummerSoftening= ForceSoftening.PlummerSoftening
 
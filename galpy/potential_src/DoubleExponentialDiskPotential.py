@@ -12,6 +12,8 @@ _MAXITER= 20
 class DoubleExponentialDiskPotential(Potential):
     """Class that implements the double exponential disk potential
     rho(R,z) = rho_0 e^-R/h_R e^-|z|/h_z"""
+    #Lazily computed, not part of the fingerprint
+    _fingerprintSkip= ('_zforceNotSetUp','_typicalKz')
     def __init__(self,amp=1.,ro=1.,hr=1./3.,hz=1./16.,
                  maxiter=_MAXITER,tol=0.001,normalize=False):
         """
@@ -23,7 +25,8 @@ class DoubleExponentialDiskPotential(Potential):
            amp - amplitude to be applied to the potential (default: 1)
            hr - disk scale-length in terms of ro
            hz - scale-height
-           tol - relative accuracy of potential-evaluations
+           tol - relative accuracy of potential-evaluations (the forces 
+                 and second derivatives are accurate to about tol as well)
            maxiter - scipy.integrate keyword
            normalize - if True, normalize such that vc(1.,0.)=1., or, if 
                        given as a number, such that the force is this fraction 
@@ -124,6 +127,21 @@ class DoubleExponentialDiskPotential(Potential):
                     notConvergedLarge= False
         return -4.*nu.pi/self._alpha/self._beta*(smallkIntegral[0]+largekIntegral[0])
     
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return 0.
+
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -299,8 +317,11 @@ class DoubleExponentialDiskPotential(Potential):
            -d K_R (R,z) d R
         HISTORY:
            2012-05-01 - Written - Bovy (NYU)
+           2026-10-19 - Loop over array input - agent (local)
         DOCTEST:
         """
+        if isinstance(R,nu.ndarray) or isinstance(z,nu.ndarray):
+            return _vectorize(self._R2deriv,R,z)
         notConvergedSmall= True
         notConvergedLarge= True
         smallkIntegral= integrate.quadrature(_doubleExponentialDiskPotentialR2derivIntegrandSmallk,
@@ -351,6 +372,107 @@ class DoubleExponentialDiskPotential(Potential):
             else:
                 notConvergedLarge= False
         return 4.*nu.pi*self._alpha/self._beta*(smallkIntegral[0]+largekIntegral[0])
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           z2deriv
+        PURPOSE:
+           evaluate z2 derivative
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           -d K_z (R,z) d z
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Integrate d2Phi/dz2 directly - agent (local)
+        """
+        if isinstance(R,nu.ndarray) or isinstance(z,nu.ndarray):
+            return _vectorize(self._z2deriv,R,z)
+        return 4.*nu.pi\
+            *self._kIntegral(_doubleExponentialDiskPotentialz2derivIntegrandSmallk,
+                             _doubleExponentialDiskPotentialz2derivIntegrandLargek,
+                             R,z)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative
+        INPUT:
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           -d K_R (R,z) d z
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if isinstance(R,nu.ndarray) or isinstance(z,nu.ndarray):
+            return _vectorize(self._Rzderiv,R,z)
+        integral= self._kIntegral(_doubleExponentialDiskPotentialRzderivIntegrandSmallk,
+                                  _doubleExponentialDiskPotentialRzderivIntegrandLargek,
+                                  R,z)
+        if z < 0.:
+            return 4.*nu.pi*self._gamma*integral
+        else:
+            return -4.*nu.pi*self._gamma*integral
+
+    def _kIntegral(self,smallkIntegrand,largekIntegrand,R,z):
+        """
+        NAME:
+           _kIntegral
+        PURPOSE:
+           integrate a pair of small-k/large-k integrands to the requested
+           relative accuracy
+        INPUT:
+           smallkIntegrand, largekIntegrand - integrands for k < 1/gamma and
+                                              k > 1/gamma
+           R - Cylindrical Galactocentric radius
+           z - vertical height
+        OUTPUT:
+           integral over all k
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        args= (self._alpha*R,self._beta*nu.fabs(z),self._gamma)
+        maxiterFactorSmall= 2
+        maxiterFactorLarge= 2
+        notConvergedSmall= True
+        notConvergedLarge= True
+        smallkIntegral= largekIntegral= None
+        while notConvergedSmall or notConvergedLarge:
+            if notConvergedSmall:
+                smallkIntegral= integrate.quadrature(smallkIntegrand,
+                                                     0.,1./self._gamma,
+                                                     args=args,tol=_TOL,
+                                                     maxiter=maxiterFactorSmall*self._maxiter,
+                                                     vec_func=True)
+            if notConvergedLarge:
+                largekIntegral= integrate.quadrature(largekIntegrand,
+                                                     0.,self._gamma,
+                                                     args=args,tol=_TOL,
+                                                     maxiter=maxiterFactorLarge*self._maxiter,
+                                                     vec_func=True)
+            total= smallkIntegral[0]+largekIntegral[0]
+            if notConvergedSmall:
+                if nu.fabs(smallkIntegral[1]/total) > self._tol \
+                        and maxiterFactorSmall < 2**10:
+                    maxiterFactorSmall*= 2
+                else:
+                    notConvergedSmall= False
+            if notConvergedLarge:
+                if nu.fabs(largekIntegral[1]/total) > self._tol \
+                        and maxiterFactorLarge < 2**10:
+                    maxiterFactorLarge*= 2
+                else:
+                    notConvergedLarge= False
+        return total
     
     def _dens(self,R,z,phi=0.,t=0.):
         """
@@ -419,6 +541,35 @@ def _doubleExponentialDiskPotentialR2derivIntegrandLargek(k,R,z,gamma):
     exponential disk radial force for k > 1/gamma"""
     return 1./k**2.*_doubleExponentialDiskPotentialR2derivIntegrandSmallk(1./k,R,z,gamma)
 
+def _doubleExponentialDiskPotentialz2derivIntegrandSmallk(k,R,z,gamma):
+    """Internal function that gives the integrand for the double
+    exponential disk second vertical derivative for k < 1/gamma"""
+    gammak= gamma*k
+    return k*special.jn(0,k*R)*(1.+k**2.)**-1.5*(nu.exp(-z)
+                                                 -gammak*nu.exp(-gammak*z))/(1.-gammak**2.)
+
+def _doubleExponentialDiskPotentialz2derivIntegrandLargek(k,R,z,gamma):
+    """Internal function that gives the integrand for the double
+    exponential disk second vertical derivative for k > 1/gamma"""
+    return 1./k**2.*_doubleExponentialDiskPotentialz2derivIntegrandSmallk(1./k,R,z,gamma)
+
+def _doubleExponentialDiskPotentialRzderivIntegrandSmallk(k,R,z,gamma):
+    """Internal function that gives the integrand for the double
+    exponential disk mixed R,z derivative for k < 1/gamma"""
+    gammak= gamma*k
+    return k*k*special.jn(1,k*R)*(1.+k**2.)**-1.5*(nu.exp(-gammak*z)
+                                                   -nu.exp(-z))/(1.-gammak**2.)
+
+def _doubleExponentialDiskPotentialRzderivIntegrandLargek(k,R,z,gamma):
+    """Internal function that gives the integrand for the double
+    exponential disk mixed R,z derivative for k > 1/gamma"""
+    return 1./k**2.*_doubleExponentialDiskPotentialRzderivIntegrandSmallk(1./k,R,z,gamma)
+
+def _vectorize(func,R,z):
+    """Evaluate func(R,z) element by element for array input"""
+    R,z= nu.broadcast_arrays(R,z)
+    return nu.array([func(rr,zz) for rr,zz in zip(R.flatten(),z.flatten())])\
+        .reshape(R.shape)
 
 if __name__ == '__main__':
     print "doctesting ..."
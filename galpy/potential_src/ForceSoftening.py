@@ -1,6 +1,7 @@
 ###############################################################################
 #   ForceSoftening: class representing a force softening kernel
 ###############################################################################
+import numpy as nu
 class ForceSoftening:
     """class representing a force softening kernel"""
     def __init__(self):
@@ -21,6 +22,22 @@ class ForceSoftening:
         """
         raise AttributeError("'__call__' not implemented for this softening kernel")
 
+    def forcederiv(self,d):
+        """
+        NAME:
+           forcederiv
+        PURPOSE:
+           evaluate the derivative of the force of the softening kernel
+           with respect to distance
+        INPUT:
+           d - distance
+        OUTPUT:
+           d force / d d (amplitude; without GM)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        raise AttributeError("'forcederiv' not implemented for this softening kernel")
+
     def potential(self,d):
         """
         NAME:
@@ -82,6 +99,23 @@ class PlummerSoftening (ForceSoftening):
         """
         return d/(d**2.+self._softening_length**2.)**1.5
 
+    def forcederiv(self,d):
+        """
+        NAME:
+           forcederiv
+        PURPOSE:
+           evaluate the derivative of the force of the softening kernel
+           with respect to distance
+        INPUT:
+           d - distance
+        OUTPUT:
+           d force / d d (amplitude; without GM)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return (self._softening_length**2.-2.*d**2.)\
+            /(d**2.+self._softening_length**2.)**2.5
+
     def potential(self,d):
         """
         NAME:
@@ -109,6 +143,8 @@ class PlummerSoftening (ForceSoftening):
            density (without GM)
         HISTORY:
            2011-04-13 - Written - Bovy (NYU)
+           2026-10-19 - Added the missing 3/4/pi normalization, such that 
+                        this is the density of the softened potential - agent (local)
         """
-        return self._softening_length**2.\
-            *(d**2.+self._softening_length**2.)**-2.5
+        return 3.*self._softening_length**2.\
+            *(d**2.+self._softening_length**2.)**-2.5/4./nu.pi
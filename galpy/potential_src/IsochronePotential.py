@@ -0,0 +1,204 @@
+###############################################################################
+#   IsochronePotential.py: The isochrone potential
+#
+#                                     amp
+#                       Phi(r)= - -------------
+#                                 b+\sqrt(r^2+b^2)
+###############################################################################
+import numpy as nu
+from Potential import Potential
+class IsochronePotential(Potential):
+    """Class that implements the isochrone potential
+                 amp
+    Phi(r)= - -------------
+              b+\sqrt(r^2+b^2)
+    """
+    def __init__(self,amp=1.,b=1.,normalize=False):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize an isochrone potential
+
+        INPUT:
+
+           amp - amplitude to be applied to the potential, GM (default: 1)
+
+           b - scale radius of the isochrone potential (in terms of Ro)
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if
+                       given as a number, such that the force is this fraction
+                       of the force necessary to make vc(1.,0.)=1.
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent (local)
+
+        """
+        Potential.__init__(self,amp=amp)
+        self.b= b
+        self._b2= self.b**2.
+        if normalize:
+            self.normalize(normalize)
+        return None
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if dR == 0 and dphi == 0:
+            return -1./(self.b+nu.sqrt(R**2.+z**2.+self._b2))
+        elif dR == 1 and dphi == 0:
+            return -self._Rforce(R,z,phi=phi,t=t)
+        elif dR == 0 and dphi == 1:
+            return -self._phiforce(R,z,phi=phi,t=t)
+
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return 0.
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        s= nu.sqrt(R**2.+z**2.+self._b2)
+        return -R/s/(self.b+s)**2.
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        s= nu.sqrt(R**2.+z**2.+self._b2)
+        return -z/s/(self.b+s)**2.
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        r2= R**2.+z**2.
+        s= nu.sqrt(r2+self._b2)
+        return (3.*(self.b+s)*s**2.-r2*(self.b+3.*s))\
+            /(self.b+s)**3./s**3./4./nu.pi
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        s= nu.sqrt(R**2.+z**2.+self._b2)
+        return 1./s/(self.b+s)**2.-R**2.*(self.b+3.*s)/s**3./(self.b+s)**3.
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        s= nu.sqrt(R**2.+z**2.+self._b2)
+        return 1./s/(self.b+s)**2.-z**2.*(self.b+3.*s)/s**3./(self.b+s)**3.
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        s= nu.sqrt(R**2.+z**2.+self._b2)
+        return -R*z*(self.b+3.*s)/s**3./(self.b+s)**3.
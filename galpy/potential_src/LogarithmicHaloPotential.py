@@ -64,6 +64,21 @@ class LogarithmicHaloPotential(Potential):
         elif dR == 1 and dphi == 1:
             return 0.
 
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return nu.inf
+
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -155,3 +170,22 @@ class LogarithmicHaloPotential(Potential):
         denom= 1./(R**2.+(z/self._q)**2.+self._core2)
         return denom/self._q**2.-2.*z**2.*denom**2./self._q**4.
 
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        denom= 1./(R**2.+(z/self._q)**2.+self._core2)
+        return -2.*R*z*denom**2./self._q**2.
+
@@ -76,6 +76,21 @@ class MiyamotoNagaiPotential(Potential):
         elif dR == 0 and dphi == 1:
             return -self._phiforce(R,z,phi=phi,t=t)
 
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return 0.
+
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -112,7 +127,7 @@ class MiyamotoNagaiPotential(Potential):
         """
         sqrtbz= nu.sqrt(self._b2+z**2.)
         asqrtbz= self._a+sqrtbz
-        if sqrtbz == asqrtbz:
+        if self._a == 0.:
             return (-z/
                      (R**2.+(self._a+nu.sqrt(z**2.+self._b2))**2.)**(3./2.))
         else:
@@ -177,7 +192,7 @@ class MiyamotoNagaiPotential(Potential):
         """
         sqrtbz= nu.sqrt(self._b2+z**2.)
         asqrtbz= self._a+sqrtbz
-        if sqrtbz == asqrtbz:
+        if self._a == 0.:
             return (self._b2+R**2.-2.*z**2.)*(self._b2+R**2.+z**2.)**-2.5
         else:
             return ((self._a**3.*self._b2 + 
@@ -186,3 +201,23 @@ class MiyamotoNagaiPotential(Potential):
                      + (self._b2 + R**2. - 2.*z**2.)*(self._b2 + z**2.)**1.5
                      +self._a* (3.*self._b2**2. - 4.*z**4. + self._b2*(R**2. - z**2.)))/
                     ((self._b2 + z**2.)**1.5* (R**2. + asqrtbz**2.)**2.5))
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        sqrtbz= nu.sqrt(self._b2+z**2.)
+        asqrtbz= self._a+sqrtbz
+        return -3.*R*z*asqrtbz/sqrtbz/(R**2.+asqrtbz**2.)**2.5
@@ -64,8 +64,12 @@ class MovingObjectPotential(Potential):
                 self._softening= PlummerSoftening(softening_length=softening_length)
         else:
             self._softening= softening
+        #Tabulate the object's trajectory
+        self._ts, self._xyz, self._vxyz= _tabulateOrbit(orbit)
         if normalize:
             self.normalize(normalize)
+        self.isNonAxi= True
+        self.hasC= isinstance(self._softening,PlummerSoftening)
 
     def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
         """
@@ -85,8 +89,7 @@ class MovingObjectPotential(Potential):
         """
         if dR == 0 and dphi == 0:
             #Calculate distance
-            dist= _cyldist(R,phi,z,
-                           self._orb.R(t),self._orb.phi(t),self._orb.z(t))
+            dist= _rectdist(R,phi,z,self._objpos(t))
             #Evaluate potential
             return -self._gm*self._softening.potential(dist)
         elif dR == 1 and dphi == 0:
@@ -111,10 +114,7 @@ class MovingObjectPotential(Potential):
            2011-04-10 - Written - Bovy (NYU)
         """
         #Calculate distance and difference vector
-        (xd,yd,zd,dist)= _cyldiffdist(self._orb.R(t),self._orb.phi(t),
-                                   self._orb.z(t),
-                                   R,phi,z)
-                                   
+        (xd,yd,zd,dist)= _rectdiffdist(self._objpos(t),R,phi,z)
         #Evaluate force
         return self._gm*(nu.cos(phi)*xd+nu.sin(phi)*yd)/dist\
             *self._softening(dist)
@@ -136,10 +136,7 @@ class MovingObjectPotential(Potential):
            2011-04-10 - Written - Bovy (NYU)
         """
         #Calculate distance and difference vector
-        (xd,yd,zd,dist)= _cyldiffdist(self._orb.R(t),self._orb.phi(t),
-                                   self._orb.z(t),
-                                   R,phi,z)
-                                   
+        (xd,yd,zd,dist)= _rectdiffdist(self._objpos(t),R,phi,z)
         #Evaluate force
         return self._gm*zd/dist*self._softening(dist)
 
@@ -160,10 +157,7 @@ class MovingObjectPotential(Potential):
            2011-04-10 - Written - Bovy (NYU)
         """
         #Calculate distance and difference vector
-        (xd,yd,zd,dist)= _cyldiffdist(self._orb.R(t),self._orb.phi(t),
-                                   self._orb.z(t),
-                                   R,phi,z)
-                                   
+        (xd,yd,zd,dist)= _rectdiffdist(self._objpos(t),R,phi,z)
         #Evaluate force
         return self._gm*R*(nu.cos(phi)*yd-nu.sin(phi)*xd)/dist\
             *self._softening(dist)
@@ -184,18 +178,205 @@ class MovingObjectPotential(Potential):
         HISTORY:
            2010-08-08 - Written - Bovy (NYU)
         """
-        dist= _cyldist(R,phi,z,
-                       self._orb.R(t),self._orb.phi(t),self._orb.z(t))
+        dist= _rectdist(R,phi,z,self._objpos(t))
         return self._gm*self._softening.density(dist)
 
-def _cyldist(R1,phi1,z1,R2,phi2,z2):
-    return nu.sqrt( (R1*nu.cos(phi1)-R2*nu.cos(phi2))**2.
-                    +(R1*nu.sin(phi1)-R2*nu.sin(phi2))**2.
-                    +(z1-z2)**2.)     
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[0]
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[1]
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[2]
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[3]
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[4]
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._hessian(R,z,phi,t)[5]
+
+    def _hessian(self,R,z,phi,t):
+        """Cylindrical second derivatives (RR,zz,Rz,phiphi,Rphi,zphi)"""
+        (xd,yd,zd,dist)= _rectdiffdist(self._objpos(t),R,phi,z)
+        a= self._gm*self._softening(dist)/dist
+        b= (a-self._gm*self._softening.forcederiv(dist))/dist**2.
+        return _cylHessian(a,b,xd,yd,zd,R,phi)
+
+    def _objpos(self,t):
+        """
+        NAME:
+           _objpos
+        PURPOSE:
+           rectangular position of the object at time t, interpolated from
+           the tabulated trajectory (cached for repeated calls at the same t)
+        INPUT:
+           t - time
+        OUTPUT:
+           [x,y,z]
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if hasattr(self,'_cachet') and self._cachet == t:
+            return self._cachepos
+        self._cachet= t
+        self._cachepos= _interpOrbit(self._ts,self._xyz,self._vxyz,t)
+        return self._cachepos
+
+def _tabulateOrbit(orbit):
+    """Tabulate the rectangular positions and velocities of an Orbit
+    (static at its initial condition if the orbit has not been integrated)"""
+    orb= orbit._orb
+    if hasattr(orb,'orbit'):
+        ts= nu.array(orb.t,dtype='float64')
+        vxvv= nu.array(orb.orbit,dtype='float64')
+    else:
+        ts= nu.array([0.])
+        vxvv= nu.array(orb.vxvv,dtype='float64').reshape((1,-1))
+    R, vR, vT= vxvv[:,0], vxvv[:,1], vxvv[:,2]
+    z, vz, phi= nu.zeros(len(ts)), nu.zeros(len(ts)), nu.zeros(len(ts))
+    if vxvv.shape[1] == 4:
+        phi= vxvv[:,3]
+    elif vxvv.shape[1] > 4:
+        z, vz= vxvv[:,3], vxvv[:,4]
+        if vxvv.shape[1] == 6: phi= vxvv[:,5]
+    cp, sp= nu.cos(phi), nu.sin(phi)
+    xyz= nu.array([R*cp,R*sp,z])
+    vxyz= nu.array([vR*cp-vT*sp,vR*sp+vT*cp,vz])
+    #Times need to be increasing for the interpolation
+    if len(ts) > 1 and ts[-1] < ts[0]:
+        ts, xyz, vxyz= ts[::-1], xyz[:,::-1], vxyz[:,::-1]
+    return (ts,nu.ascontiguousarray(xyz),nu.ascontiguousarray(vxyz))
+
+def _interpOrbit(ts,xyz,vxyz,t):
+    """Cubic Hermite interpolation of a tabulated trajectory, linearly
+    extrapolated outside of the tabulated times"""
+    if t <= ts[0]:
+        return xyz[:,0]+vxyz[:,0]*(t-ts[0])
+    elif t >= ts[-1]:
+        return xyz[:,-1]+vxyz[:,-1]*(t-ts[-1])
+    k= nu.searchsorted(ts,t)-1
+    h= ts[k+1]-ts[k]
+    s= (t-ts[k])/h
+    s2= s*s
+    s3= s2*s
+    return (2.*s3-3.*s2+1.)*xyz[:,k]+(s3-2.*s2+s)*h*vxyz[:,k]\
+        +(-2.*s3+3.*s2)*xyz[:,k+1]+(s3-s2)*h*vxyz[:,k+1]
+
+def _rectdist(R,phi,z,pos):
+    return nu.sqrt((R*nu.cos(phi)-pos[0])**2.
+                   +(R*nu.sin(phi)-pos[1])**2.
+                   +(z-pos[2])**2.)
 
-def _cyldiffdist(R1,phi1,z1,R2,phi2,z2):
-    x= R1*nu.cos(phi1)-R2*nu.cos(phi2)
-    y= R1*nu.sin(phi1)-R2*nu.sin(phi2)
-    z= z1-z2
+def _rectdiffdist(pos,R,phi,z):
+    x= pos[0]-R*nu.cos(phi)
+    y= pos[1]-R*nu.sin(phi)
+    z= pos[2]-z
     return (x,y,z,nu.sqrt(x**2.+y**2.+z**2.))
 
+def _cylHessian(a,b,xd,yd,zd,R,phi):
+    """Cylindrical second derivatives (RR,zz,Rz,phiphi,Rphi,zphi) of the
+    potential of an object at rectangular offset (xd,yd,zd) with rectangular
+    Hessian a delta_ij - b xd_i xd_j"""
+    cp, sp= nu.cos(phi), nu.sin(phi)
+    dR= cp*xd+sp*yd
+    dp= cp*yd-sp*xd
+    return (a-b*dR**2.,
+            a-b*zd**2.,
+            -b*dR*zd,
+            R**2.*(a-b*dp**2.)+R*a*dR,
+            -R*b*dR*dp-a*dp,
+            -R*b*dp*zd)
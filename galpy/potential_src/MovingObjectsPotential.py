@@ -0,0 +1,392 @@
+###############################################################################
+#   MovingObjectsPotential.py: class that implements the potential coming from
+#                              a collection of moving, Plummer-softened
+#                              objects (e.g., a population of subhalos)
+#
+#                                       GM_i
+#   phi(R,z,phi,t) = - \sum_i ---------------------------
+#                              sqrt(d_i(t)^2+epsilon_i^2)
+###############################################################################
+import numpy as nu
+from Potential import Potential
+from MovingObjectPotential import _tabulateOrbit, _interpOrbit, \
+    _cylHessian
+class MovingObjectsPotential(Potential):
+    """Class that implements the potential coming from a collection of
+    moving, Plummer-softened objects
+                                      GM_i
+    phi(R,z,phi,t) = - \sum_i ---------------------------
+                               sqrt(d_i(t)^2+epsilon_i^2)
+    """
+    def __init__(self,orbits,amp=1.,GM=.06,softening_length=0.01,
+                 rcut=None,normalize=False):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a MovingObjectsPotential
+
+        INPUT:
+
+           orbits - list of Orbits of the objects (Orbit objects)
+
+           amp= - amplitude to be applied to the potential (default: 1)
+
+           GM - 'mass' of the objects (number or array with one entry per
+                object; degenerate with amp)
+
+           softening_length= Plummer softening length (number or array with
+                             one entry per object)
+
+           rcut= if set, ignore objects further than this distance
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if
+                       given as a number, such that the force is this fraction
+                       of the force necessary to make vc(1.,0.)=1. (at t=0)
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent (local)
+
+        """
+        Potential.__init__(self,amp=amp)
+        self._nobj= len(orbits)
+        self._gm= nu.array(GM,dtype='float64')*nu.ones(self._nobj)
+        self._softening_length= nu.array(softening_length,dtype='float64')\
+            *nu.ones(self._nobj)
+        self._rcut= rcut
+        #Tabulate all trajectories on a common time grid
+        tabs= [_tabulateOrbit(o) for o in orbits]
+        ts= tabs[0][0]
+        for tab in tabs[1:]:
+            if len(tab[0]) != len(ts) or nu.any(tab[0] != ts):
+                ts= nu.unique(nu.concatenate([tab[0] for tab in tabs]))
+                break
+        self._ts= ts
+        self._xyz= nu.empty((len(ts),3,self._nobj))
+        self._vxyz= nu.empty((len(ts),3,self._nobj))
+        for ii, tab in enumerate(tabs):
+            if len(tab[0]) == len(ts) and nu.all(tab[0] == ts):
+                self._xyz[:,:,ii]= tab[1].T
+                self._vxyz[:,:,ii]= tab[2].T
+            else:
+                for jj in range(len(ts)):
+                    self._xyz[jj,:,ii]= _interpOrbit(tab[0],tab[1],tab[2],
+                                                     ts[jj])
+                    self._vxyz[jj,:,ii]= _interpVel(tab[0],tab[1],tab[2],
+                                                    ts[jj])
+        if normalize:
+            self.normalize(normalize)
+        self.isNonAxi= True
+        self.hasC= True
+
+    def _objpos(self,t):
+        """
+        NAME:
+           _objpos
+        PURPOSE:
+           rectangular positions of all objects at time t (cached for
+           repeated calls at the same t)
+        INPUT:
+           t - time
+        OUTPUT:
+           [3,nobj] array
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if hasattr(self,'_cachet') and self._cachet == t:
+            return self._cachepos
+        ts= self._ts
+        if t <= ts[0]:
+            pos= self._xyz[0]+self._vxyz[0]*(t-ts[0])
+        elif t >= ts[-1]:
+            pos= self._xyz[-1]+self._vxyz[-1]*(t-ts[-1])
+        else:
+            k= nu.searchsorted(ts,t)-1
+            h= ts[k+1]-ts[k]
+            s= (t-ts[k])/h
+            s2= s*s
+            s3= s2*s
+            pos= (2.*s3-3.*s2+1.)*self._xyz[k]+(s3-2.*s2+s)*h*self._vxyz[k]\
+                +(-2.*s3+3.*s2)*self._xyz[k+1]+(s3-s2)*h*self._vxyz[k+1]
+        self._cachet= t
+        self._cachepos= pos
+        return pos
+
+    def _diffs(self,R,z,phi,t):
+        """Difference vectors between all objects and all input points,
+        as [npoints,nobj] arrays, with the mask of objects within rcut"""
+        R= nu.array(R,dtype='float64')
+        z= nu.array(z,dtype='float64')
+        phi= nu.array(phi,dtype='float64')
+        shape= nu.broadcast(R,z,phi).shape
+        R= (R*nu.ones(shape)).flatten()[:,nu.newaxis]
+        z= (z*nu.ones(shape)).flatten()[:,nu.newaxis]
+        phi= (phi*nu.ones(shape)).flatten()[:,nu.newaxis]
+        pos= self._objpos(t)
+        xd= pos[0]-R*nu.cos(phi)
+        yd= pos[1]-R*nu.sin(phi)
+        zd= pos[2]-z
+        d2= xd**2.+yd**2.+zd**2.
+        if self._rcut is None:
+            mask= nu.ones(d2.shape,dtype='bool')
+        else:
+            mask= (d2 <= self._rcut**2.)
+        return (shape,R[:,0],phi[:,0],xd,yd,zd,d2,mask)
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z, phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           Phi(R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if dR == 0 and dphi == 0:
+            shape, R, phi, xd, yd, zd, d2, mask= self._diffs(R,z,phi,t)
+            out= -nu.sum(mask*self._gm/nu.sqrt(d2+self._softening_length**2.),
+                          axis=1)
+            return _reshape(out,shape)
+        elif dR == 1 and dphi == 0:
+            return -self._Rforce(R,z,phi=phi,t=t)
+        elif dR == 0 and dphi == 1:
+            return -self._phiforce(R,z,phi=phi,t=t)
+
+    def _rectforce(self,R,z,phi,t):
+        """Summed rectangular force of all objects"""
+        shape, R, phi, xd, yd, zd, d2, mask= self._diffs(R,z,phi,t)
+        f= mask*self._gm*(d2+self._softening_length**2.)**-1.5
+        return (shape,R,phi,
+                nu.sum(f*xd,axis=1),nu.sum(f*yd,axis=1),nu.sum(f*zd,axis=1))
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, R, phi, Fx, Fy, Fz= self._rectforce(R,z,phi,t)
+        return _reshape(nu.cos(phi)*Fx+nu.sin(phi)*Fy,shape)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, R, phi, Fx, Fy, Fz= self._rectforce(R,z,phi,t)
+        return _reshape(Fz,shape)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, R, phi, Fx, Fy, Fz= self._rectforce(R,z,phi,t)
+        return _reshape(R*(nu.cos(phi)*Fy-nu.sin(phi)*Fx),shape)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, R, phi, xd, yd, zd, d2, mask= self._diffs(R,z,phi,t)
+        soft2= self._softening_length**2.
+        out= nu.sum(mask*3.*self._gm*soft2*(d2+soft2)**-2.5,axis=1)/4./nu.pi
+        return _reshape(out,shape)
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[0],shape)
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[1],shape)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[2],shape)
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[3],shape)
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[4],shape)
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        shape, hess= self._hessian(R,z,phi,t)
+        return _reshape(hess[5],shape)
+
+    def _hessian(self,R,z,phi,t):
+        """Summed cylindrical second derivatives (RR,zz,Rz,phiphi,Rphi,zphi)"""
+        shape, R, phi, xd, yd, zd, d2, mask= self._diffs(R,z,phi,t)
+        a= mask*self._gm*(d2+self._softening_length**2.)**-1.5
+        b= 3.*a/(d2+self._softening_length**2.)
+        hess= _cylHessian(a,b,xd,yd,zd,R[:,nu.newaxis],phi[:,nu.newaxis])
+        return (shape,[nu.sum(h,axis=1) for h in hess])
+
+def _interpVel(ts,xyz,vxyz,t):
+    """Velocity of the cubic Hermite interpolation in _interpOrbit"""
+    if t <= ts[0]:
+        return vxyz[:,0]
+    elif t >= ts[-1]:
+        return vxyz[:,-1]
+    k= nu.searchsorted(ts,t)-1
+    h= ts[k+1]-ts[k]
+    s= (t-ts[k])/h
+    s2= s*s
+    return ((6.*s2-6.*s)*xyz[:,k]+(-6.*s2+6.*s)*xyz[:,k+1])/h\
+        +(3.*s2-4.*s+1.)*vxyz[:,k]+(3.*s2-2.*s)*vxyz[:,k+1]
+
+def _reshape(out,shape):
+    if len(shape) == 0: return out[0]
+    return out.reshape(shape)
@@ -0,0 +1,633 @@
+###############################################################################
+#   MultipoleExpansionPotential.py: potential of an arbitrary density
+#                                   computed using a spherical-harmonic
+#                                   multipole expansion
+#
+#   Phi(r,theta,phi) = \sum_lm Phi_lm(r) Y_lm(theta,phi)
+#
+#   Phi_lm(r) = -4pi/(2l+1) [r^(-l-1) \int_0^r dr' r'^(l+2) rho_lm(r')
+#                            + r^l \int_r^\infty dr' r'^(1-l) rho_lm(r')]
+#
+#   (in natural units, G=1), with Phi_lm and its first two derivatives
+#   tabulated on a grid in ln r and quintic-Hermite interpolated in between
+###############################################################################
+import math
+import numpy as nu
+from scipy import interpolate
+from Potential import Potential
+class MultipoleExpansionPotential(Potential):
+    """Class that implements the multipole-expansion potential of an
+    arbitrary density (function or Snapshot)"""
+    def __init__(self,dens,amp=1.,lmax=8,mmax=0,rmin=10.**-3.,rmax=100.,
+                 nr=201,ntheta=None,nphi=None,normalize=False):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize a multipole-expansion potential
+
+        INPUT:
+
+           dens - density function dens(R,z,phi) (vectorized if possible; a
+                  Potential instance can be given, in which case its dens
+                  is used) or a Snapshot instance
+
+           amp - amplitude to be applied to the potential (default: 1)
+
+           lmax= maximum order of the spherical harmonics
+
+           mmax= maximum azimuthal order (0 for axisymmetric potentials)
+
+           rmin=, rmax=, nr= logarithmically-spaced radial grid on which
+                             the expansion is tabulated
+
+           ntheta= number of Gauss-Legendre points in cos(theta) for the
+                   angular integration (default: max(4*lmax+4,256)); 
+                   flattened densities need many points: a disk with 
+                   scale height b is only resolved out to r ~ ntheta b/4
+                   (e.g., ntheta=32 gives errors of 5% at r=20-50 for 
+                   a Miyamoto-Nagai disk with a=0.5, b=0.3, 256 gives <1%)
+
+           nphi= number of azimuthal points for the angular integration
+                 (default: 4*mmax+4, 1 if mmax=0)
+
+           normalize - if True, normalize such that vc(1.,0.)=1., or, if
+                       given as a number, such that the force is this fraction
+                       of the force necessary to make vc(1.,0.)=1.
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent (local)
+
+           2026-10-19 - Raised the default ntheta to resolve flattened 
+                        densities - agent (local)
+
+        """
+        Potential.__init__(self,amp=amp)
+        self._lmax= lmax
+        self._mmax= min(mmax,lmax)
+        self._nr= nr
+        self._lnrmin= math.log(rmin)
+        self._dlnr= (math.log(rmax)-self._lnrmin)/(nr-1.)
+        self._rgrid= nu.exp(self._lnrmin+self._dlnr*nu.arange(nr))
+        #Enumerate the (l,m,cos/sin) terms
+        ls, ms, sins= [], [], []
+        for l in range(self._lmax+1):
+            for m in range(min(l,self._mmax)+1):
+                ls.append(l)
+                ms.append(m)
+                sins.append(0)
+                if m > 0:
+                    ls.append(l)
+                    ms.append(m)
+                    sins.append(1)
+        self._ls= nu.array(ls,dtype='int')
+        self._ms= nu.array(ms,dtype='int')
+        self._sins= nu.array(sins,dtype='int')
+        #Compute Phi_lm and its ln r derivatives on the grid
+        if hasattr(dens,'orbits') and hasattr(dens,'masses'):
+            self._phi, self._dphi, self._d2phi= self._expandSnapshot(dens)
+        else:
+            if hasattr(dens,'dens') and hasattr(dens,'_amp'):
+                dens= dens.dens
+            if ntheta is None: ntheta= max(4*self._lmax+4,256)
+            if nphi is None:
+                if self._mmax == 0: nphi= 1
+                else: nphi= 4*self._mmax+4
+            self._phi, self._dphi, self._d2phi= \
+                self._expandDensity(dens,ntheta,nphi)
+        if self._mmax > 0:
+            self.isNonAxi= True
+        if normalize:
+            self.normalize(normalize)
+        self.hasC= True
+
+    def _expandDensity(self,dens,ntheta,nphi):
+        """Compute the expansion coefficients of a density function"""
+        x, wx= nu.polynomial.legendre.leggauss(ntheta)
+        phis= 2.*nu.pi*nu.arange(nphi)/nphi
+        #Density on the (r,x,phi) grid
+        rr, xx, pp= nu.meshgrid(self._rgrid,x,phis,indexing='ij')
+        Rs= (rr*nu.sqrt(1.-xx**2.)).flatten()
+        zs= (rr*xx).flatten()
+        phs= pp.flatten()
+        try:
+            rhos= nu.array(dens(Rs,zs,phs),dtype='float64')
+            if not rhos.shape == Rs.shape: raise ValueError
+        except (TypeError,ValueError):
+            rhos= nu.array([dens(Rs[ii],zs[ii],phs[ii])
+                            for ii in range(len(Rs))],dtype='float64')
+        rhos= nu.reshape(rhos,(self._nr,ntheta,nphi))
+        #Project onto the spherical harmonics
+        P= _legendre(self._lmax,self._mmax,x)[0]
+        trig= self._trig(phis)
+        rholm= nu.empty((len(self._ls),self._nr))
+        for ii in range(len(self._ls)):
+            Y= nu.outer(P[self._ls[ii],self._ms[ii]],trig[ii])
+            rholm[ii]= nu.sum(nu.sum(rhos*Y,axis=2)*wx,axis=1)*2.*nu.pi/nphi
+        #Radial integrals
+        lnr= nu.log(self._rgrid)
+        Iin= nu.empty((len(self._ls),self._nr))
+        Iout= nu.empty((len(self._ls),self._nr))
+        for ii in range(len(self._ls)):
+            l= self._ls[ii]
+            spl= interpolate.InterpolatedUnivariateSpline(\
+                lnr,rholm[ii]*self._rgrid**(l+3.),k=3)
+            dIin= nu.array([spl.integral(lnr[jj],lnr[jj+1])
+                            for jj in range(self._nr-1)])
+            #Assume rho_lm \propto r^l inside rmin
+            Iin[ii]= rholm[ii,0]*self._rgrid[0]**(l+3.)/(2.*l+3.)\
+                +nu.concatenate(([0.],nu.cumsum(dIin)))
+            spl= interpolate.InterpolatedUnivariateSpline(\
+                lnr,rholm[ii]*self._rgrid**(2.-l),k=3)
+            dIout= nu.array([spl.integral(lnr[jj],lnr[jj+1])
+                             for jj in range(self._nr-1)])
+            #Power-law extrapolation of rho_lm outside rmax
+            if rholm[ii,-1]*rholm[ii,-2] > 0.:
+                gamma= -nu.log(rholm[ii,-1]/rholm[ii,-2])/self._dlnr
+            else:
+                gamma= 0.
+            if gamma+l-2. > 0.:
+                outer= rholm[ii,-1]*self._rgrid[-1]**(2.-l)/(gamma+l-2.)
+            else:
+                outer= 0.
+            Iout[ii]= outer+nu.concatenate((nu.cumsum(dIout[::-1])[::-1],
+                                            [0.]))
+        phi, dphi= self._phiFromIntegrals(Iin,Iout)
+        #Second derivative from Poisson's equation
+        l= self._ls[:,nu.newaxis]
+        d2phi= 4.*nu.pi*rholm*self._rgrid**2.-dphi+l*(l+1.)*phi
+        return (phi,dphi,d2phi)
+
+    def _expandSnapshot(self,snap):
+        """Compute the expansion coefficients of a Snapshot's particles"""
+        npart= len(snap.orbits)
+        Rs, zs, phis= nu.zeros(npart), nu.zeros(npart), nu.zeros(npart)
+        for ii in range(npart):
+            vxvv= snap.orbits[ii]._orb.vxvv
+            Rs[ii]= vxvv[0]
+            if len(vxvv) == 4: phis[ii]= vxvv[3]
+            elif len(vxvv) > 4: zs[ii]= vxvv[3]
+            if len(vxvv) == 6: phis[ii]= vxvv[5]
+        masses= nu.array(snap.masses,dtype='float64')*nu.ones(npart)
+        rs= nu.sqrt(Rs**2.+zs**2.)
+        x= zs/rs
+        sindx= nu.argsort(rs)
+        rs, x, phis, masses= rs[sindx], x[sindx], phis[sindx], masses[sindx]
+        P= _legendre(self._lmax,self._mmax,x)[0]
+        trig= self._trig(phis)
+        #Number of particles inside each grid radius
+        nin= nu.searchsorted(rs,self._rgrid)
+        Iin= nu.empty((len(self._ls),self._nr))
+        Iout= nu.empty((len(self._ls),self._nr))
+        for ii in range(len(self._ls)):
+            l= self._ls[ii]
+            Y= P[l,self._ms[ii]]*trig[ii]*masses
+            cumin= nu.concatenate(([0.],nu.cumsum(Y*rs**l)))
+            cumout= nu.concatenate((nu.cumsum((Y*rs**(-l-1.))[::-1])[::-1],
+                                    [0.]))
+            Iin[ii]= cumin[nin]
+            Iout[ii]= cumout[nin]
+        phi, dphi= self._phiFromIntegrals(Iin,Iout)
+        d2phi= nu.gradient(dphi,self._dlnr,axis=1)
+        return (phi,dphi,d2phi)
+
+    def _phiFromIntegrals(self,Iin,Iout):
+        """Phi_lm and r dPhi_lm/dr from the inner and outer integrals"""
+        l= self._ls[:,nu.newaxis]
+        r= self._rgrid
+        phi= -4.*nu.pi/(2.*l+1.)*(r**(-l-1.)*Iin+r**l*Iout)
+        dphi= -4.*nu.pi/(2.*l+1.)*(-(l+1.)*r**(-l-1.)*Iin+l*r**l*Iout)
+        return (phi,dphi)
+
+    def _trig(self,phi):
+        """Azimuthal part of the real spherical harmonics"""
+        phi= nu.atleast_1d(phi)
+        out= nu.empty((len(self._ls),len(phi)))
+        for ii in range(len(self._ls)):
+            if self._ms[ii] == 0:
+                out[ii]= 1.
+            elif self._sins[ii]:
+                out[ii]= math.sqrt(2.)*nu.sin(self._ms[ii]*phi)
+            else:
+                out[ii]= math.sqrt(2.)*nu.cos(self._ms[ii]*phi)
+        return out
+
+    def _dtrig(self,phi,order=1):
+        """Azimuthal derivatives of _trig"""
+        phi= nu.atleast_1d(phi)
+        out= nu.zeros((len(self._ls),len(phi)))
+        for ii in range(len(self._ls)):
+            m= self._ms[ii]
+            if m == 0: continue
+            if order == 1:
+                if self._sins[ii]:
+                    out[ii]= math.sqrt(2.)*m*nu.cos(m*phi)
+                else:
+                    out[ii]= -math.sqrt(2.)*m*nu.sin(m*phi)
+            else:
+                if self._sins[ii]:
+                    out[ii]= -math.sqrt(2.)*m**2.*nu.sin(m*phi)
+                else:
+                    out[ii]= -math.sqrt(2.)*m**2.*nu.cos(m*phi)
+        return out
+
+    def _radial(self,r):
+        """Interpolate Phi_lm and its first two r derivatives at r"""
+        lnr= nu.log(r)
+        l= self._ls[:,nu.newaxis]
+        f= nu.empty((len(self._ls),len(r)))
+        fr= nu.empty((len(self._ls),len(r)))
+        frr= nu.empty((len(self._ls),len(r)))
+        inner= (lnr < self._lnrmin)
+        outer= (lnr > self._lnrmin+self._dlnr*(self._nr-1))
+        indx= ~inner*~outer
+        if nu.any(indx):
+            s= (lnr[indx]-self._lnrmin)/self._dlnr
+            k= nu.clip(nu.floor(s).astype('int'),0,self._nr-2)
+            t= s-k
+            h= self._dlnr
+            H, dH, d2H= _quinticHermite(t)
+            tf= H[0]*self._phi[:,k]+H[1]*h*self._dphi[:,k]\
+                +H[2]*h**2.*self._d2phi[:,k]+H[3]*h**2.*self._d2phi[:,k+1]\
+                +H[4]*h*self._dphi[:,k+1]+H[5]*self._phi[:,k+1]
+            tfu= (dH[0]*self._phi[:,k]+dH[1]*h*self._dphi[:,k]\
+                      +dH[2]*h**2.*self._d2phi[:,k]\
+                      +dH[3]*h**2.*self._d2phi[:,k+1]\
+                      +dH[4]*h*self._dphi[:,k+1]+dH[5]*self._phi[:,k+1])/h
+            tfuu= (d2H[0]*self._phi[:,k]+d2H[1]*h*self._dphi[:,k]\
+                       +d2H[2]*h**2.*self._d2phi[:,k]\
+                       +d2H[3]*h**2.*self._d2phi[:,k+1]\
+                       +d2H[4]*h*self._dphi[:,k+1]\
+                       +d2H[5]*self._phi[:,k+1])/h**2.
+            f[:,indx]= tf
+            fr[:,indx]= tfu/r[indx]
+            frr[:,indx]= (tfuu-tfu)/r[indx]**2.
+        if nu.any(outer):
+            #Exterior multipoles
+            ro= self._rgrid[-1]
+            x= ro/r[outer]
+            f[:,outer]= self._phi[:,-1:]*x**(l+1.)
+            fr[:,outer]= -(l+1.)*f[:,outer]/r[outer]
+            frr[:,outer]= (l+1.)*(l+2.)*f[:,outer]/r[outer]**2.
+        if nu.any(inner):
+            #Interior multipoles, harmonic core for l=0
+            ri= self._rgrid[0]
+            x= r[inner]/ri
+            f[:,inner]= self._phi[:,:1]*x**l
+            fr[:,inner]= l*f[:,inner]/r[inner]
+            frr[:,inner]= l*(l-1.)*f[:,inner]/r[inner]**2.
+            l0= (self._ls == 0)
+            f[l0,inner]= self._phi[l0,0]+0.5*self._dphi[l0,0]*(x**2.-1.)
+            fr[l0,inner]= self._dphi[l0,0]*x/ri
+            frr[l0,inner]= self._dphi[l0,0]/ri**2.
+        return (f,fr,frr)
+
+    def _derivs(self,R,z,phi,second=False):
+        """Compute Phi, its first derivatives wrt r, x=cos(theta), and phi,
+        and (optionally) its second derivatives"""
+        R= nu.array(R,dtype='float64')
+        z= nu.array(z,dtype='float64')
+        phi= nu.array(phi,dtype='float64')
+        shape= nu.broadcast(R,z,phi).shape
+        R= (R*nu.ones(shape)).flatten()
+        z= (z*nu.ones(shape)).flatten()
+        phi= (phi*nu.ones(shape)).flatten()
+        r= nu.sqrt(R**2.+z**2.)
+        x= z/r
+        f, fr, frr= self._radial(r)
+        P, dP, d2P= _legendre(self._lmax,self._mmax,x,second=second)
+        PP= P[self._ls,self._ms]
+        dPP= dP[self._ls,self._ms]
+        T= self._trig(phi)
+        dT= self._dtrig(phi)
+        out= {'shape':shape,'R':R,'z':z,'r':r,'x':x}
+        out['Phi']= nu.sum(f*PP*T,axis=0)
+        out['Phir']= nu.sum(fr*PP*T,axis=0)
+        out['Phix']= nu.sum(f*dPP*T,axis=0)
+        out['Phiphi']= nu.sum(f*PP*dT,axis=0)
+        if second:
+            d2PP= d2P[self._ls,self._ms]
+            d2T= self._dtrig(phi,order=2)
+            out['Phirr']= nu.sum(frr*PP*T,axis=0)
+            out['Phirx']= nu.sum(fr*dPP*T,axis=0)
+            out['Phixx']= nu.sum(f*d2PP*T,axis=0)
+            out['Phirphi']= nu.sum(fr*PP*dT,axis=0)
+            out['Phixphi']= nu.sum(f*dPP*dT,axis=0)
+            out['Phiphiphi']= nu.sum(f*PP*d2T,axis=0)
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z,phi
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+           dR, dphi - return dR, dphi-th derivative (only implemented for 0 and 1)
+        OUTPUT:
+           Phi(R,z,phi)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if dR == 0 and dphi == 0:
+            d= self._derivs(R,z,phi)
+            return _reshape(d['Phi'],d['shape'])
+        elif dR == 1 and dphi == 0:
+            return -self._Rforce(R,z,phi=phi,t=t)
+        elif dR == 0 and dphi == 1:
+            return -self._phiforce(R,z,phi=phi,t=t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the radial force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi)
+        R, z, r= d['R'], d['z'], d['r']
+        return _reshape(-d['Phir']*R/r+d['Phix']*z*R/r**3.,d['shape'])
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the vertical force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi)
+        R, z, r= d['R'], d['z'], d['r']
+        return _reshape(-d['Phir']*z/r-d['Phix']*R**2./r**3.,d['shape'])
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the azimuthal force
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi)
+        return _reshape(-d['Phiphi'],d['shape'])
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        R, z, r= d['R'], d['z'], d['r']
+        rR, xR= R/r, -z*R/r**3.
+        rRR, xRR= z**2./r**3., z*(2.*R**2.-z**2.)/r**5.
+        return _reshape(d['Phirr']*rR**2.+2.*d['Phirx']*rR*xR
+                        +d['Phixx']*xR**2.+d['Phir']*rRR+d['Phix']*xRR,
+                        d['shape'])
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second vertical derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        R, z, r= d['R'], d['z'], d['r']
+        rz, xz= z/r, R**2./r**3.
+        rzz, xzz= R**2./r**3., -3.*z*R**2./r**5.
+        return _reshape(d['Phirr']*rz**2.+2.*d['Phirx']*rz*xz
+                        +d['Phixx']*xz**2.+d['Phir']*rzz+d['Phix']*xzz,
+                        d['shape'])
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        R, z, r= d['R'], d['z'], d['r']
+        rR, xR= R/r, -z*R/r**3.
+        rz, xz= z/r, R**2./r**3.
+        rRz, xRz= -R*z/r**3., R*(2.*z**2.-R**2.)/r**5.
+        return _reshape(d['Phirr']*rR*rz+d['Phirx']*(rR*xz+rz*xR)
+                        +d['Phixx']*xR*xz+d['Phir']*rRz+d['Phix']*xRz,
+                        d['shape'])
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        return _reshape(d['Phiphiphi'],d['shape'])
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        R, z, r= d['R'], d['z'], d['r']
+        return _reshape(d['Phirphi']*R/r-d['Phixphi']*z*R/r**3.,d['shape'])
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed vertical, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        R, z, r= d['R'], d['z'], d['r']
+        return _reshape(d['Phirphi']*z/r+d['Phixphi']*R**2./r**3.,d['shape'])
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density of the expansion (Laplacian/4pi)
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the density
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._derivs(R,z,phi,second=True)
+        r, x= d['r'], d['x']
+        omx2= nu.where(1.-x**2. < 10.**-14.,10.**-14.,1.-x**2.)
+        return _reshape((d['Phirr']+2./r*d['Phir']
+                         +((1.-x**2.)*d['Phixx']-2.*x*d['Phix'])/r**2.
+                         +d['Phiphiphi']/r**2./omx2)/4./nu.pi,
+                        d['shape'])
+
+def _legendre(lmax,mmax,x,second=False):
+    """Orthonormalized associated Legendre functions
+    sqrt((2l+1)/4pi (l-m)!/(l+m)!) P_l^m(x) and their first (and second)
+    x derivatives, as [l,m,len(x)] arrays"""
+    x= nu.atleast_1d(x)
+    P= nu.zeros((lmax+1,mmax+1,len(x)))
+    dP= nu.zeros((lmax+1,mmax+1,len(x)))
+    omx2= 1.-x**2.
+    #Avoid the poles for the derivatives
+    omx2d= nu.where(omx2 < 10.**-14.,10.**-14.,omx2)
+    sintheta= nu.sqrt(omx2)
+    Pmm= nu.ones(len(x))/nu.sqrt(4.*nu.pi)
+    for m in range(mmax+1):
+        if m > 0:
+            Pmm= nu.sqrt((2.*m+1.)/2./m)*sintheta*Pmm
+        P[m,m]= Pmm
+        if m < lmax:
+            P[m+1,m]= nu.sqrt(2.*m+3.)*x*Pmm
+        for l in range(m+2,lmax+1):
+            alm= nu.sqrt((4.*l**2.-1.)/(l**2.-m**2.))
+            alm1= nu.sqrt((4.*(l-1.)**2.-1.)/((l-1.)**2.-m**2.))
+            P[l,m]= alm*(x*P[l-1,m]-P[l-2,m]/alm1)
+        for l in range(m,lmax+1):
+            #(1-x^2) dP_l^m/dx = -l x P_l^m + c P_{l-1}^m
+            if l > m:
+                c= nu.sqrt((2.*l+1.)/(2.*l-1.)*(l**2.-m**2.))
+                dP[l,m]= (-l*x*P[l,m]+c*P[l-1,m])/omx2d
+            else:
+                dP[l,m]= -l*x*P[l,m]/omx2d
+    if not second:
+        return (P,dP,None)
+    d2P= nu.zeros((lmax+1,mmax+1,len(x)))
+    for l in range(lmax+1):
+        for m in range(min(l,mmax)+1):
+            d2P[l,m]= (2.*x*dP[l,m]-(l*(l+1.)-m**2./omx2d)*P[l,m])/omx2d
+    return (P,dP,d2P)
+
+def _quinticHermite(t):
+    """Quintic Hermite basis functions and their first two derivatives
+    (order: p0, v0, a0, a1, v1, p1)"""
+    t2= t*t
+    t3= t2*t
+    t4= t3*t
+    t5= t4*t
+    H= [1.-10.*t3+15.*t4-6.*t5,
+        t-6.*t3+8.*t4-3.*t5,
+        0.5*t2-1.5*t3+1.5*t4-0.5*t5,
+        0.5*t3-t4+0.5*t5,
+        -4.*t3+7.*t4-3.*t5,
+        10.*t3-15.*t4+6.*t5]
+    dH= [-30.*t2+60.*t3-30.*t4,
+         1.-18.*t2+32.*t3-15.*t4,
+         t-4.5*t2+6.*t3-2.5*t4,
+         1.5*t2-4.*t3+2.5*t4,
+         -12.*t2+28.*t3-15.*t4,
+         30.*t2-60.*t3+30.*t4]
+    d2H= [-60.*t+180.*t2-120.*t3,
+          -36.*t+96.*t2-60.*t3,
+          1.-9.*t+18.*t2-10.*t3,
+          3.*t-12.*t2+10.*t3,
+          -24.*t+84.*t2-60.*t3,
+          60.*t-180.*t2+120.*t3]
+    return (H,dH,d2H)
+
+def _reshape(out,shape):
+    if len(shape) == 0: return out[0]
+    return out.reshape(shape)
@@ -67,6 +67,23 @@ class PowerSphericalPotential(Potential):
         elif dR == 0 and dphi == 1:
             return -self._phiforce(R,z,phi=phi,t=t)
 
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        #Phi(r) ~ r^(2-alpha) diverges for alpha <= 2
+        if self.alpha > 2.: return 0.
+        else: return nu.inf
+
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -140,6 +157,24 @@ class PowerSphericalPotential(Potential):
         """
         return self._R2deriv(z,R) #Spherical potential
 
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return -self.alpha*R*z*(R**2.+z**2.)**(-self.alpha/2.-1.)
+
 class KeplerPotential(PowerSphericalPotential):
     """Class that implements the Kepler potential
 
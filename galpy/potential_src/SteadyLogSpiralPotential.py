@@ -112,6 +112,12 @@ class SteadyLogSpiralPotential(planarPotential):
             return -self._Rforce(R,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
             return -self._phiforce(R,phi=phi,t=t)
+        elif dR == 2 and dphi == 0:
+            return self._R2deriv(R,phi=phi,t=t)
+        elif dR == 0 and dphi == 2:
+            return self._phi2deriv(R,phi=phi,t=t)
+        elif dR == 1 and dphi == 1:
+            return self._Rphideriv(R,phi=phi,t=t)
 
     def _Rforce(self,R,phi=0.,t=0.):
         """
@@ -173,6 +179,69 @@ class SteadyLogSpiralPotential(planarPotential):
                                                            -self._m*(phi
                                                                      -self._omegas*t
                                                                      -self._gamma))
+
+    def _R2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return self._smooth(t)*self._A/R**2.*(math.sin(g)-self._alpha*math.cos(g))
+
+    def _phi2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return -self._smooth(t)*self._A/self._alpha*self._m**2.*math.cos(g)
+
+    def _Rphideriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return self._smooth(t)*self._A/R*self._m*math.cos(g)
+
+    def _smooth(self,t):
+        """Smooth growth factor of the spiral's amplitude at time t"""
+        if self._tform is None or t >= self._tsteady:
+            return 1.
+        elif t < self._tform:
+            return 0.
+        xi= 2.*(t-self._tform)/(self._tsteady-self._tform)-1.
+        return 3./16.*xi**5.-5./8*xi**3.+15./16.*xi+.5
     
     def OmegaP(self):
         """
@@ -97,6 +97,12 @@ class TransientLogSpiralPotential(planarPotential):
             return -self._Rforce(R,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
             return -self._phiforce(R,phi=phi,t=t)
+        elif dR == 2 and dphi == 0:
+            return self._R2deriv(R,phi=phi,t=t)
+        elif dR == 0 and dphi == 2:
+            return self._phi2deriv(R,phi=phi,t=t)
+        elif dR == 1 and dphi == 1:
+            return self._Rphideriv(R,phi=phi,t=t)
 
     def _Rforce(self,R,phi=0.,t=0.):
         """
@@ -137,6 +143,63 @@ class TransientLogSpiralPotential(planarPotential):
                                           -self._m*(phi-self._omegas*t
                                                     -self._gamma))
 
+    def _R2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
+            /R**2.*(math.sin(g)-self._alpha*math.cos(g))
+
+    def _phi2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return -self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
+            /self._alpha*self._m**2.*math.cos(g)
+
+    def _Rphideriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed radial, azimuthal derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        g= self._alpha*math.log(R)-self._m*(phi-self._omegas*t-self._gamma)
+        return self._A*math.exp(-(t-self._to)**2./2./self._sigma2)\
+            /R*self._m*math.cos(g)
+
     def OmegaP(self):
         """
         NAME:
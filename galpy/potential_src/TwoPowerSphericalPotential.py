@@ -6,7 +6,7 @@
 #                             rho(r)= ------------------------------------
 #                                      (r/a)^\alpha (1+r/a)^(\beta-\alpha)
 ###############################################################################
-import math as m
+import numpy as nu
 from scipy import special, integrate
 from Potential import Potential
 class TwoPowerSphericalPotential(Potential):
@@ -72,7 +72,7 @@ class TwoPowerSphericalPotential(Potential):
             if not self.integerSelf == None:
                 return self.integerSelf._evaluate(R,z,phi=phi,t=t)
             else:
-                r= m.sqrt(R**2.+z**2.)
+                r= nu.sqrt(R**2.+z**2.)
                 return integrate.quadrature(_potIntegrandTransform,
                                             0.,self.a/r,
                                             args=(self.alpha,self.beta))[0]
@@ -81,6 +81,23 @@ class TwoPowerSphericalPotential(Potential):
         elif dR == 0 and dphi == 1:
             return -self._phiforce(R,z,phi=phi,t=t)
 
+    def _Phiinf(self):
+        """
+        NAME:
+           _Phiinf
+        PURPOSE:
+           return the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        #Phi(r) ~ r^(2-beta) at large r diverges for beta <= 2
+        if self.beta > 2.: return 0.
+        else: return nu.inf
+
     def _Rforce(self,R,z,phi=0.,t=0.):
         """
         NAME:
@@ -100,7 +117,7 @@ class TwoPowerSphericalPotential(Potential):
         if not self.integerSelf == None:
             return self.integerSelf._Rforce(R,z,phi=phi,t=t)
         else:
-            r= m.sqrt(R**2.+z**2.)
+            r= nu.sqrt(R**2.+z**2.)
             return R/r**self.alpha*special.hyp2f1(3.-self.alpha,
                                                   self.beta-self.alpha,
                                                   4.-self.alpha,
@@ -124,7 +141,7 @@ class TwoPowerSphericalPotential(Potential):
         if not self.integerSelf == None:
             return self.integerSelf._zforce(R,z,phi=phi,t=t)
         else:
-            r= m.sqrt(R**2.+z**2.)
+            r= nu.sqrt(R**2.+z**2.)
             return z/r**self.alpha*special.hyp2f1(3.-self.alpha,
                                                   self.beta-self.alpha,
                                                   4.-self.alpha,
@@ -146,8 +163,8 @@ class TwoPowerSphericalPotential(Potential):
         HISTORY:
            2010-08-08 - Written - Bovy (NYU)
         """
-        r= m.sqrt(R**2.+z**2.)
-        return (self.a/r)**self.alpha/(1.+r/self.a)**(self.beta-self.alpha)/4./m.pi/self.a**3.
+        r= nu.sqrt(R**2.+z**2.)
+        return (self.a/r)**self.alpha/(1.+r/self.a)**(self.beta-self.alpha)/4./nu.pi/self.a**3.
 
     def _z2deriv(self,R,z,phi=0.,t=0.):
         """
@@ -167,6 +184,66 @@ class TwoPowerSphericalPotential(Potential):
         """
         return self._R2deriv(z,R) #Spherical potential
 
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if not self.integerSelf == None:
+            return self.integerSelf._R2deriv(R,z,phi=phi,t=t)
+        else:
+            r= nu.sqrt(R**2.+z**2.)
+            return -self._gr(r)-R**2./r*self._dgrdr(r)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if not self.integerSelf == None:
+            return self.integerSelf._Rzderiv(R,z,phi=phi,t=t)
+        else:
+            r= nu.sqrt(R**2.+z**2.)
+            return -R*z/r*self._dgrdr(r)
+
+    def _gr(self,r):
+        """Radial force divided by R (or vertical force divided by z)"""
+        return r**-self.alpha*special.hyp2f1(3.-self.alpha,
+                                             self.beta-self.alpha,
+                                             4.-self.alpha,
+                                             -r/self.a)
+
+    def _dgrdr(self,r):
+        """Derivative of _gr wrt r"""
+        return -self.alpha*self._gr(r)/r\
+            -r**-self.alpha/self.a*(3.-self.alpha)*(self.beta-self.alpha)\
+            /(4.-self.alpha)*special.hyp2f1(4.-self.alpha,
+                                            self.beta-self.alpha+1.,
+                                            5.-self.alpha,
+                                            -r/self.a)
+
 def _potIntegrandTransform(t,alpha,beta):
     """Internal function that transforms the integrand such that the integral becomes finite-ranged"""
     return 1./t**2.*_potIntegrand(1./t,alpha,beta)
@@ -305,6 +382,56 @@ class TwoPowerIntegerSphericalPotential(TwoPowerSphericalPotential):
         else:
             raise AttributeError
 
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the second radial derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if not self.HernquistSelf == None:
+            return self.HernquistSelf._R2deriv(R,z,phi=phi,t=t)
+        elif not self.JaffeSelf == None:
+            return self.JaffeSelf._R2deriv(R,z,phi=phi,t=t)
+        elif not self.NFWSelf == None:
+            return self.NFWSelf._R2deriv(R,z,phi=phi,t=t)
+        else:
+            return TwoPowerSphericalPotential._R2deriv(self,R,z,phi=phi,t=t)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if not self.HernquistSelf == None:
+            return self.HernquistSelf._Rzderiv(R,z,phi=phi,t=t)
+        elif not self.JaffeSelf == None:
+            return self.JaffeSelf._Rzderiv(R,z,phi=phi,t=t)
+        elif not self.NFWSelf == None:
+            return self.NFWSelf._Rzderiv(R,z,phi=phi,t=t)
+        else:
+            return TwoPowerSphericalPotential._Rzderiv(self,R,z,phi=phi,t=t)
+
 class HernquistPotential(TwoPowerIntegerSphericalPotential):
     """Class that implements the Hernquist potential"""
     def __init__(self,amp=1.,a=1.,normalize=False):
@@ -350,7 +477,7 @@ class HernquistPotential(TwoPowerIntegerSphericalPotential):
            2010-07-09 - Started - Bovy (NYU)
         """
         if dR == 0 and dphi == 0:
-            return -1./(1.+m.sqrt(R**2.+z**2.)/self.a)
+            return -1./(1.+nu.sqrt(R**2.+z**2.)/self.a)
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,z,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
@@ -372,7 +499,7 @@ class HernquistPotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2010-07-09 - Written - Bovy (NYU)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return -R/self.a/sqrtRz/(1.+sqrtRz/self.a)**2.
 
     def _zforce(self,R,z,phi=0.,t=0.):
@@ -390,7 +517,7 @@ class HernquistPotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2010-07-09 - Written - Bovy (NYU)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return -z/self.a/sqrtRz/(1.+sqrtRz/self.a)**2.
 
     def _R2deriv(self,R,z,phi=0.,t=0.):
@@ -409,10 +536,30 @@ class HernquistPotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2011-10-09 - Written - Bovy (IAS)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return self.a*(self.a*z**2.+(z**2.-2.*R**2.)*sqrtRz)/sqrtRz**3.\
             /(self.a+sqrtRz)**3.
 
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        sqrtRz= nu.sqrt(R**2.+z**2.)
+        return -self.a*R*z*(self.a+3.*sqrtRz)/sqrtRz**3.\
+            /(self.a+sqrtRz)**3.
+
 class JaffePotential(TwoPowerIntegerSphericalPotential):
     """Class that implements the Jaffe potential"""
     def __init__(self,amp=1.,a=1.,normalize=False):
@@ -458,7 +605,7 @@ class JaffePotential(TwoPowerIntegerSphericalPotential):
            2010-07-09 - Started - Bovy (NYU)
         """
         if dR == 0 and dphi == 0:
-            return -m.log(1.+self.a/m.sqrt(R**2.+z**2.))
+            return -nu.log(1.+self.a/nu.sqrt(R**2.+z**2.))
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,z,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
@@ -480,7 +627,7 @@ class JaffePotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2010-07-09 - Written - Bovy (NYU)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return -self.a*R/sqrtRz**3./(1.+self.a/sqrtRz)
 
     def _zforce(self,R,z,phi=0.,t=0.):
@@ -499,7 +646,7 @@ class JaffePotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2010-07-09 - Written - Bovy (NYU)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return -self.a*z/sqrtRz**3./(1.+self.a/sqrtRz)
 
     def _R2deriv(self,R,z,phi=0.,t=0.):
@@ -518,10 +665,30 @@ class JaffePotential(TwoPowerIntegerSphericalPotential):
         HISTORY:
            2011-10-09 - Written - Bovy (IAS)
         """
-        sqrtRz= m.sqrt(R**2.+z**2.)
+        sqrtRz= nu.sqrt(R**2.+z**2.)
         return self.a*(self.a*(z**2.-R**2.)+(z**2.-2.*R**2.)*sqrtRz)\
             /sqrtRz**4./(self.a+sqrtRz)**2.
 
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        sqrtRz= nu.sqrt(R**2.+z**2.)
+        return -self.a*R*z*(2.*self.a+3.*sqrtRz)/sqrtRz**4.\
+            /(self.a+sqrtRz)**2.
+
 class NFWPotential(TwoPowerIntegerSphericalPotential):
     """Class that implements the NFW potential"""
     def __init__(self,amp=1.,a=1.,normalize=False):
@@ -567,8 +734,8 @@ class NFWPotential(TwoPowerIntegerSphericalPotential):
            2010-07-09 - Started - Bovy (NYU)
         """
         if dR == 0 and dphi == 0:
-            r= m.sqrt(R**2.+z**2.)
-            return -m.log(1.+r/self.a)/r
+            r= nu.sqrt(R**2.+z**2.)
+            return -nu.log(1.+r/self.a)/r
         elif dR == 1 and dphi == 0:
             return -self._Rforce(R,z,phi=phi,t=t)
         elif dR == 0 and dphi == 1:
@@ -591,8 +758,8 @@ class NFWPotential(TwoPowerIntegerSphericalPotential):
            2010-07-09 - Written - Bovy (NYU)
         """
         Rz= R**2.+z**2.
-        sqrtRz= m.sqrt(Rz)
-        return R*(1./Rz/(self.a+sqrtRz)-m.log(1.+sqrtRz/self.a)/sqrtRz/Rz)
+        sqrtRz= nu.sqrt(Rz)
+        return R*(1./Rz/(self.a+sqrtRz)-nu.log(1.+sqrtRz/self.a)/sqrtRz/Rz)
 
     def _zforce(self,R,z,phi=0.,t=0.):
         """
@@ -611,8 +778,8 @@ class NFWPotential(TwoPowerIntegerSphericalPotential):
            2010-07-09 - Written - Bovy (NYU)
         """
         Rz= R**2.+z**2.
-        sqrtRz= m.sqrt(Rz)
-        return z*(1./Rz/(self.a+sqrtRz)-m.log(1.+sqrtRz/self.a)/sqrtRz/Rz)
+        sqrtRz= nu.sqrt(Rz)
+        return z*(1./Rz/(self.a+sqrtRz)-nu.log(1.+sqrtRz/self.a)/sqrtRz/Rz)
 
     def _R2deriv(self,R,z,phi=0.,t=0.):
         """
@@ -631,9 +798,31 @@ class NFWPotential(TwoPowerIntegerSphericalPotential):
            2011-10-09 - Written - Bovy (IAS)
         """
         Rz= R**2.+z**2.
-        sqrtRz= m.sqrt(Rz)
+        sqrtRz= nu.sqrt(Rz)
         return (3.*R**4.+2.*R**2.*(z**2.+self.a*sqrtRz)\
                     -z**2.*(z**2.+self.a*sqrtRz)\
                     -(2.*R**2.-z**2.)*(self.a**2.+R**2.+z**2.+2.*self.a*sqrtRz)\
-                    *m.log(1.+sqrtRz/self.a))\
+                    *nu.log(1.+sqrtRz/self.a))\
+                    /Rz**2.5/(self.a+sqrtRz)**2.
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative for this potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           the mixed R,z derivative
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Rz= R**2.+z**2.
+        sqrtRz= nu.sqrt(Rz)
+        return R*z*(sqrtRz*(3.*self.a+4.*sqrtRz)
+                    -3.*(self.a+sqrtRz)**2.*nu.log(1.+sqrtRz/self.a))\
                     /Rz**2.5/(self.a+sqrtRz)**2.
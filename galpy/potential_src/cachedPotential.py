@@ -0,0 +1,126 @@
+###############################################################################
+#   cachedPotential.py: memoizing wrapper around an expensive Potential
+#
+#   Scalar evaluations of the potential, its forces, density, and second
+#   derivatives are stored in a bounded least-recently-used cache, keyed on
+#   the (rounded) arguments
+###############################################################################
+import collections
+import numpy as nu
+from Potential import Potential
+class cachedPotential(Potential):
+    """Class that memoizes the evaluations of a given potential"""
+    def __init__(self,pot,maxsize=10000,decimals=10):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           initialize a cachedPotential
+        INPUT:
+           pot - Potential instance to be memoized
+           maxsize= maximum number of cached evaluations; the least recently
+                    used evaluation is dropped when the cache is full
+           decimals= number of decimals to which (R,z,phi,t) are rounded
+                     to form the cache key
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Potential.__init__(self,amp=1.)
+        self._pot= pot
+        self._maxsize= maxsize
+        self._decimals= decimals
+        self.isNonAxi= pot.isNonAxi
+        self.clearCache()
+        return None
+
+    def clearCache(self):
+        """
+        NAME:
+           clearCache
+        PURPOSE:
+           remove all cached evaluations and reset the statistics
+        INPUT:
+           (none)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        self._cacheStore= collections.OrderedDict()
+        self._cacheHits= 0
+        self._cacheMisses= 0
+        return None
+
+    def cacheInfo(self):
+        """
+        NAME:
+           cacheInfo
+        PURPOSE:
+           return statistics on the use of the cache
+        INPUT:
+           (none)
+        OUTPUT:
+           dictionary with hits, misses, size, and maxsize
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return {'hits':self._cacheHits,
+                'misses':self._cacheMisses,
+                'size':len(self._cacheStore),
+                'maxsize':self._maxsize}
+
+    def _cached(self,func,R,z,phi,t,*args):
+        """Return func(R,z,phi=phi,t=t,*args) from the cache if possible;
+        array inputs bypass the cache"""
+        if isinstance(R,nu.ndarray) or isinstance(z,nu.ndarray) \
+                or isinstance(phi,nu.ndarray) or isinstance(t,nu.ndarray):
+            return func(R,z,phi,t,*args)
+        key= (func.__name__,
+              round(R,self._decimals),round(z,self._decimals),
+              round(phi,self._decimals),round(t,self._decimals))+args
+        try:
+            out= self._cacheStore.pop(key)
+        except KeyError:
+            self._cacheMisses+= 1
+            out= func(R,z,phi,t,*args)
+            if len(self._cacheStore) >= self._maxsize:
+                self._cacheStore.popitem(last=False)
+        else:
+            self._cacheHits+= 1
+        self._cacheStore[key]= out
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        return self._cached(self._pot.__call__,R,z,phi,t,dR,dphi)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.Rforce,R,z,phi,t)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.zforce,R,z,phi,t)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.phiforce,R,z,phi,t)
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.dens,R,z,phi,t)
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.R2deriv,R,z,phi,t)
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.z2deriv,R,z,phi,t)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.Rzderiv,R,z,phi,t)
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.phi2deriv,R,z,phi,t)
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.Rphideriv,R,z,phi,t)
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        return self._cached(self._pot.zphideriv,R,z,phi,t)
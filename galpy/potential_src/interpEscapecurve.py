@@ -0,0 +1,188 @@
+###############################################################################
+#   interpEscapecurve.py: tabulated escape-velocity curve of an axisymmetric
+#                         potential
+#
+#   Tabulates the depth of the potential well Phi(R,0) in the mid-plane on a
+#   log R grid once and spline interpolates it for fast, vectorized
+#   evaluation of the escape velocity and of unbound-orbit checks; the
+#   potential at infinity is taken from Phiinf, which knows that it is
+#   infinite for logarithmic and shallow power-law halos
+###############################################################################
+import math
+import warnings
+import numpy as nu
+from scipy import interpolate
+from Potential import PotentialError, potentialFingerprint, Phiinf
+from planarPotential import RZToplanarPotential, evaluateplanarPotentials
+from interpRotcurve import _evaluateScalar, _reshape, _interleave
+_ESCAPETABLES= {}
+_MAXTABLES= 20
+class interpEscapecurve:
+    """Class that tabulates the escape-velocity curve of an axisymmetric potential"""
+    def __init__(self,Pot,Rrange=(10.**-3.,100.),nR=101,tol=10.**-8.,
+                 maxnR=6401):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           Initialize an interpEscapecurve instance
+        INPUT:
+           Pot - Potential instance or list thereof (or planarPotential)
+           Rrange= range in R to tabulate the potential on
+           nR= initial number of (logarithmically spaced) grid points
+           tol= maximum interpolation error in Phi at the mid-points of the
+                grid, relative to the depth of the potential well
+                Phi(infinity)-Phi (or to max |Phi| if Phi(infinity) is
+                infinite); the grid is doubled until this is reached
+           maxnR= maximum number of grid points
+        OUTPUT:
+           instance
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        isList= isinstance(Pot,list)
+        if (isList and nu.any([p.isNonAxi for p in Pot])) \
+                or (not isList and Pot.isNonAxi):
+            raise PotentialError("Tabulating the escape-velocity curve of non-axisymmetric potentials is not supported")
+        self._pot= RZToplanarPotential(Pot)
+        self._Phiinf= Phiinf(self._pot)
+        self._Rmin= Rrange[0]
+        self._Rmax= Rrange[1]
+        self._tol= tol
+        #Tabulate, then double the grid until the mid-points are accurate
+        self._lnR= nu.linspace(math.log(self._Rmin),math.log(self._Rmax),nR)
+        self._Phi= self._tabulate(nu.exp(self._lnR))
+        self._setupSpline()
+        while True:
+            lnRmid= 0.5*(self._lnR[1:]+self._lnR[:-1])
+            Phimid= self._tabulate(nu.exp(lnRmid))
+            if nu.isinf(self._Phiinf):
+                scale= nu.amax(nu.fabs(self._Phi))
+            else:
+                scale= self._Phiinf-Phimid
+            maxerr= nu.amax(nu.fabs(self._PhiSpline(lnRmid)-Phimid)/scale)
+            self._lnR= _interleave(self._lnR,lnRmid)
+            self._Phi= _interleave(self._Phi,Phimid)
+            self._setupSpline()
+            if maxerr < self._tol: break
+            if 2*len(self._lnR)-1 > maxnR:
+                warnings.warn("interpEscapecurve: maximum number of grid points reached before reaching the requested tolerance (%g > %g)" % (maxerr,self._tol),RuntimeWarning)
+                break
+        return None
+
+    def _tabulate(self,Rs):
+        """Directly evaluate Phi(R,0) at Rs"""
+        return _evaluateScalar(lambda p,x: evaluateplanarPotentials(x,p),
+                               self._pot,Rs)
+
+    def _setupSpline(self):
+        """Spline interpolate the tabulated potential in ln R"""
+        self._PhiSpline= interpolate.InterpolatedUnivariateSpline(self._lnR,
+                                                                  self._Phi,
+                                                                  k=3)
+        return None
+
+    def Phiinf(self):
+        """
+        NAME:
+           Phiinf
+        PURPOSE:
+           return the value of the potential at infinity
+        INPUT:
+           (none)
+        OUTPUT:
+           Phi(infinity) (can be infinite)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._Phiinf
+
+    def Phi(self,R):
+        """
+        NAME:
+           Phi
+        PURPOSE:
+           evaluate the potential in the mid-plane
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           Phi(R,0)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        R= nu.array(R,dtype='float64')
+        shape= R.shape
+        R= R.flatten()
+        out= nu.empty(R.shape)
+        indx= (R >= self._Rmin)*(R <= self._Rmax)
+        out[indx]= self._PhiSpline(nu.log(R[indx]))
+        if nu.any(~indx):
+            out[~indx]= self._tabulate(R[~indx])
+        return _reshape(out,shape)
+
+    def vesc(self,R):
+        """
+        NAME:
+           vesc
+        PURPOSE:
+           calculate the escape velocity in the mid-plane
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           escape velocity (infinite if Phi(infinity) is)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return nu.sqrt(2.*(self._Phiinf-self.Phi(R)))
+
+    def unbound(self,R,v):
+        """
+        NAME:
+           unbound
+        PURPOSE:
+           check whether orbits in the mid-plane are unbound
+        INPUT:
+           R - Galactocentric radius (can be array)
+           v - total velocity (can be array)
+        OUTPUT:
+           True where v^2/2+Phi(R,0) >= Phi(infinity)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if nu.isinf(self._Phiinf):
+            return nu.zeros(nu.broadcast(nu.array(R),nu.array(v)).shape,
+                            dtype='bool')
+        return nu.array(v)**2./2.+self.Phi(R) >= self._Phiinf
+
+def escapecurveTable(Pot,**kwargs):
+    """
+    NAME:
+
+       escapecurveTable
+
+    PURPOSE:
+
+       return the tabulated escape-velocity curve for a potential, computing
+       it only once for each potential (as identified by its fingerprint)
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+       +interpEscapecurve kwargs (Rrange, nR, tol, maxnR)
+
+    OUTPUT:
+
+       interpEscapecurve instance
+
+    HISTORY:
+
+       2026-10-19 - Written - agent (local)
+
+    """
+    key= (potentialFingerprint(Pot),tuple(sorted(kwargs.items())))
+    if not _ESCAPETABLES.has_key(key):
+        if len(_ESCAPETABLES) >= _MAXTABLES:
+            _ESCAPETABLES.clear()
+        _ESCAPETABLES[key]= interpEscapecurve(Pot,**kwargs)
+    return _ESCAPETABLES[key]
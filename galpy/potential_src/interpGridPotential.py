@@ -0,0 +1,586 @@
+###############################################################################
+#   interpGridPotential.py: non-axisymmetric potential interpolated on a
+#                           3D Cartesian grid in a frame rotating with a
+#                           pattern speed
+#
+#   The potential and its derivatives (f, fx, fy, fz, fxy, fxz, fyz, fxyz)
+#   are tabulated on a uniform (x,y,z) grid in the frame of the pattern and
+#   tricubic-Hermite interpolated in between; outside of the grid, the
+#   potential is that of a point mass
+###############################################################################
+import os, os.path
+import cPickle as pickle
+import numpy as nu
+from galpy.util import multi
+from Potential import Potential, evaluatePotentials, evaluateRforces, \
+    evaluatezforces, evaluatephiforces
+class interpGridPotential(Potential):
+    """Class that interpolates a (non-axisymmetric) potential on a 3D Cartesian grid rotating with a pattern speed"""
+    def __init__(self,Pot=None,amp=None,xgrid=(-5.,5.,101),
+                 ygrid=(-5.,5.,101),zgrid=(-1.,1.,41),OmegaP=None,pa=None,
+                 tgrid=0.,grid=None,
+                 GMout=None,numcores=None,savefilename=None):
+        """
+        NAME:
+
+           __init__
+
+        PURPOSE:
+
+           initialize an interpGridPotential
+
+        INPUT:
+
+           Pot - Potential instance or list thereof to be tabulated (at time
+                 tgrid, in the frame in which the pattern has position
+                 angle pa)
+
+           amp - amplitude to be applied to the potential (default: 1, or 
+                 that stored in savefilename)
+
+           xgrid=, ygrid=, zgrid= (min,max,n) of the uniform grids in the
+                                  frame of the pattern (given to linspace)
+
+           OmegaP= pattern speed (default: 0, or that stored in 
+                   savefilename)
+
+           pa= position angle of the grid's x axis at t=0 (default: 0, or 
+               that stored in savefilename)
+
+           tgrid= time at which Pot is tabulated
+
+           grid= instead of Pot, give the potential on the grid as an
+                 array with shape (nx,ny,nz) (e.g., fit to an N-body
+                 snapshot); its derivatives are then computed using finite
+                 differences
+
+           GMout= mass of the point mass that represents the potential
+                  outside of the grid (default: estimated from the potential
+                  on the boundary of the grid)
+
+           numcores= number of cores to use to tabulate Pot (default: all)
+
+           savefilename= save the tabulated grid to or restore it from this
+                         savefile (pickle); amp, OmegaP, and pa are stored 
+                         with the grid and an IOError is raised when they 
+                         are given and differ from the stored values
+
+        OUTPUT:
+
+           (none)
+
+        HISTORY:
+
+           2026-10-19 - Written - agent (local)
+
+           2026-10-19 - Store and check amp, OmegaP, and pa in the savefile - agent (local)
+
+        """
+        params= {'amp':amp,'OmegaP':OmegaP,'pa':pa}
+        if not savefilename is None and os.path.exists(savefilename):
+            savefile= open(savefilename,'rb')
+            tables= pickle.load(savefile)
+            savefile.close()
+            for key in params.keys():
+                if not tables.has_key(key): continue
+                if params[key] is None:
+                    params[key]= tables[key]
+                elif params[key] != tables[key]:
+                    raise IOError("%s= given to interpGridPotential (%g) differs from that stored in %s (%g)" % (key,params[key],savefilename,tables[key]))
+        params= _fillDefaults(params)
+        Potential.__init__(self,amp=params['amp'])
+        self._omegap= params['OmegaP']
+        self._pa= params['pa']
+        if not savefilename is None and os.path.exists(savefilename):
+            self._setupGrids(tables['xgrid'],tables['ygrid'],tables['zgrid'])
+            self._coeffs= tables['coeffs']
+            self._gmout= tables['GMout']
+        else:
+            self._setupGrids(xgrid,ygrid,zgrid)
+            if not grid is None:
+                self._coeffs= self._coeffsFromGrid(nu.array(grid,
+                                                            dtype='float64'))
+            elif not Pot is None:
+                self._coeffs= self._coeffsFromPotential(Pot,tgrid,numcores)
+            else:
+                raise IOError("One of Pot= or grid= needs to be given to interpGridPotential")
+            if GMout is None:
+                self._gmout= self._estimateGMout()
+            else:
+                self._gmout= GMout
+            if not savefilename is None:
+                savefile= open(savefilename,'wb')
+                self._dump(savefile,xgrid,ygrid,zgrid)
+                savefile.close()
+        self.isNonAxi= True
+        self.hasC= True
+        return None
+
+    def _setupGrids(self,xgrid,ygrid,zgrid):
+        """Set up the uniform grids"""
+        self._x= nu.linspace(*xgrid)
+        self._y= nu.linspace(*ygrid)
+        self._z= nu.linspace(*zgrid)
+        self._n= nu.array([len(self._x),len(self._y),len(self._z)],
+                          dtype='int')
+        self._min= nu.array([self._x[0],self._y[0],self._z[0]])
+        self._h= nu.array([self._x[1]-self._x[0],self._y[1]-self._y[0],
+                           self._z[1]-self._z[0]])
+        return None
+
+    def _coeffsFromPotential(self,Pot,tgrid,numcores):
+        """Tabulate Pot and its first derivatives on the grid (in parallel
+        over the x grid, each (y,z) plane evaluated all at once if the
+        potential supports array input); the mixed derivatives are obtained
+        by finite differences of the first derivatives"""
+        xx, yy, zz= nu.meshgrid(self._x,self._y,self._z,indexing='ij')
+        xx, yy, zz= xx.flatten(), yy.flatten(), zz.flatten()
+        R= nu.sqrt(xx**2.+yy**2.)
+        #Potentials are often singular on the z axis; step just off it
+        R[R == 0.]= 10.**-8.*self._h[0]
+        phi= nu.arctan2(yy,xx)+self._pa+self._omegap*tgrid
+        #One (y,z) plane per task
+        nyz= self._n[1]*self._n[2]
+        out= multi.parallel_map(\
+            (lambda x: _evaluateNodes(Pot,R[x*nyz:(x+1)*nyz],
+                                      zz[x*nyz:(x+1)*nyz],
+                                      phi[x*nyz:(x+1)*nyz],tgrid)),
+            range(self._n[0]),numcores=numcores)
+        Phi, FR, Fz, Fphi= nu.concatenate(out,axis=1)
+        #Convert the forces to Cartesian derivatives in the grid's frame
+        cp= nu.cos(phi-self._pa-self._omegap*tgrid)
+        sp= nu.sin(phi-self._pa-self._omegap*tgrid)
+        FphioR= Fphi/R
+        shape= tuple(self._n)
+        coeffs= nu.empty(shape+(8,))
+        coeffs[...,0]= Phi.reshape(shape)
+        coeffs[...,4]= -(cp*FR-sp*FphioR).reshape(shape)
+        coeffs[...,2]= -(sp*FR+cp*FphioR).reshape(shape)
+        coeffs[...,1]= -Fz.reshape(shape)
+        self._mixedFromGradient(coeffs)
+        return coeffs
+
+    def _coeffsFromGrid(self,grid):
+        """Compute the derivatives of a given grid by finite differences"""
+        if not grid.shape == tuple(self._n):
+            raise IOError("Shape of grid= does not match the x, y, and z grids")
+        coeffs= nu.empty(grid.shape+(8,))
+        coeffs[...,0]= grid
+        coeffs[...,4]= nu.gradient(grid,self._h[0],axis=0,edge_order=2)
+        coeffs[...,2]= nu.gradient(grid,self._h[1],axis=1,edge_order=2)
+        coeffs[...,1]= nu.gradient(grid,self._h[2],axis=2,edge_order=2)
+        self._mixedFromGradient(coeffs)
+        return coeffs
+
+    def _mixedFromGradient(self,coeffs):
+        """Fill in fyz, fxz, fxy, and fxyz from fx, fy, and fz"""
+        def d(f,axis):
+            return nu.gradient(f,self._h[axis],axis=axis,edge_order=2)
+        coeffs[...,3]= 0.5*(d(coeffs[...,2],2)+d(coeffs[...,1],1))
+        coeffs[...,5]= 0.5*(d(coeffs[...,4],2)+d(coeffs[...,1],0))
+        coeffs[...,6]= 0.5*(d(coeffs[...,4],1)+d(coeffs[...,2],0))
+        coeffs[...,7]= (d(coeffs[...,6],2)+d(coeffs[...,5],1)
+                        +d(coeffs[...,3],0))/3.
+        return None
+
+    def _estimateGMout(self):
+        """GM of a point mass with the mean r Phi on the boundary of the
+        grid"""
+        xx, yy, zz= nu.meshgrid(self._x,self._y,self._z,indexing='ij')
+        boundary= nu.ones(tuple(self._n),dtype='bool')
+        boundary[1:-1,1:-1,1:-1]= False
+        r= nu.sqrt(xx**2.+yy**2.+zz**2.)[boundary]
+        return -nu.mean(r*self._coeffs[...,0][boundary])
+
+    def OmegaP(self):
+        """
+        NAME:
+           OmegaP
+        PURPOSE:
+           return the pattern speed
+        INPUT:
+           (none)
+        OUTPUT:
+           pattern speed
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._omegap
+
+    def save(self,savefilename):
+        """
+        NAME:
+           save
+        PURPOSE:
+           save the tabulated grid to a file (restore it by giving
+           savefilename= to interpGridPotential)
+        INPUT:
+           savefilename - name of the file (pickle)
+        OUTPUT:
+           (none)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        savefile= open(savefilename,'wb')
+        self._dump(savefile,(self._x[0],self._x[-1],self._n[0]),
+                   (self._y[0],self._y[-1],self._n[1]),
+                   (self._z[0],self._z[-1],self._n[2]))
+        savefile.close()
+        return None
+
+    def _dump(self,savefile,xgrid,ygrid,zgrid):
+        """Pickle the grid, its coefficients, and the parameters needed to 
+        evaluate it"""
+        pickle.dump({'xgrid':xgrid,'ygrid':ygrid,'zgrid':zgrid,
+                     'coeffs':self._coeffs,'GMout':self._gmout,
+                     'amp':self._amp,'OmegaP':self._omegap,'pa':self._pa},
+                    savefile,pickle.HIGHEST_PROTOCOL)
+        return None
+
+    def _toGrid(self,R,z,phi,t):
+        """Cartesian coordinates in the frame of the grid"""
+        R= nu.array(R,dtype='float64')
+        z= nu.array(z,dtype='float64')
+        phi= nu.array(phi,dtype='float64')
+        t= nu.array(t,dtype='float64')
+        shape= nu.broadcast(R,z,phi,t).shape
+        R= (R*nu.ones(shape)).flatten()
+        z= (z*nu.ones(shape)).flatten()
+        phig= ((phi-self._pa-self._omegap*t)*nu.ones(shape)).flatten()
+        cp= nu.cos(phig)
+        sp= nu.sin(phig)
+        return (R*cp,R*sp,z,R,cp,sp,shape)
+
+    def _derivs(self,x,y,z,second=False):
+        """Phi and its Cartesian derivatives at (x,y,z) in the grid's frame;
+        tricubic Hermite inside the grid, point mass outside"""
+        out= {}
+        keys= ['f','fx','fy','fz']
+        if second: keys.extend(['fxx','fyy','fzz','fxy','fxz','fyz'])
+        for key in keys: out[key]= nu.empty(len(x))
+        pos= [x,y,z]
+        inside= nu.ones(len(x),dtype='bool')
+        for ii in range(3):
+            inside*= (pos[ii] >= self._min[ii])\
+                *(pos[ii] <= self._min[ii]+(self._n[ii]-1)*self._h[ii])
+        if nu.any(inside):
+            #Cell indices and local coordinates, and the 1D Hermite basis
+            idx, B= [], []
+            for ii in range(3):
+                s= (pos[ii][inside]-self._min[ii])/self._h[ii]
+                k= nu.clip(nu.floor(s).astype('int'),0,self._n[ii]-2)
+                idx.append(k)
+                B.append(_hermiteBasis(s-k,self._h[ii],second))
+            #Derivative orders (x,y,z) of each output
+            orders= {'f':(0,0,0),'fx':(1,0,0),'fy':(0,1,0),'fz':(0,0,1),
+                     'fxx':(2,0,0),'fyy':(0,2,0),'fzz':(0,0,2),
+                     'fxy':(1,1,0),'fxz':(1,0,1),'fyz':(0,1,1)}
+            for key in keys: out[key][inside]= 0.
+            for a in range(2):
+                for b in range(2):
+                    for c in range(2):
+                        C= self._coeffs[idx[0]+a,idx[1]+b,idx[2]+c]
+                        for key in keys:
+                            dx, dy, dz= orders[key]
+                            tmp= 0.
+                            for p in range(2):
+                                for q in range(2):
+                                    for r in range(2):
+                                        tmp+= B[0][dx][a][p]*B[1][dy][b][q]\
+                                            *B[2][dz][c][r]*C[:,4*p+2*q+r]
+                            out[key][inside]+= tmp
+        outside= ~inside
+        if nu.any(outside):
+            xo, yo, zo= x[outside], y[outside], z[outside]
+            r2= xo**2.+yo**2.+zo**2.
+            r= nu.sqrt(r2)
+            gm3= self._gmout/r**3.
+            out['f'][outside]= -self._gmout/r
+            out['fx'][outside]= gm3*xo
+            out['fy'][outside]= gm3*yo
+            out['fz'][outside]= gm3*zo
+            if second:
+                out['fxx'][outside]= gm3*(1.-3.*xo**2./r2)
+                out['fyy'][outside]= gm3*(1.-3.*yo**2./r2)
+                out['fzz'][outside]= gm3*(1.-3.*zo**2./r2)
+                out['fxy'][outside]= -3.*gm3*xo*yo/r2
+                out['fxz'][outside]= -3.*gm3*xo*zo/r2
+                out['fyz'][outside]= -3.*gm3*yo*zo/r2
+        return out
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential at R,z,phi,t
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+           dR, dphi - return dR, dphi-th derivative (only implemented for 0 and 1)
+        OUTPUT:
+           Phi(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if dR == 0 and dphi == 0:
+            x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+            return _reshape(self._derivs(x,y,z)['f'],shape)
+        elif dR == 1 and dphi == 0:
+            return -self._Rforce(R,z,phi=phi,t=t)
+        elif dR == 0 and dphi == 1:
+            return -self._phiforce(R,z,phi=phi,t=t)
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           F_R(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+        d= self._derivs(x,y,z)
+        return _reshape(-cp*d['fx']-sp*d['fy'],shape)
+
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           F_z(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+        return _reshape(-self._derivs(x,y,z)['fz'],shape)
+
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           F_phi(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+        d= self._derivs(x,y,z)
+        return _reshape(y*d['fx']-x*d['fy'],shape)
+
+    def _hessian(self,R,z,phi,t):
+        """Cylindrical second derivatives"""
+        x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+        d= self._derivs(x,y,z,second=True)
+        out= {'shape':shape}
+        out['RR']= cp**2.*d['fxx']+2.*cp*sp*d['fxy']+sp**2.*d['fyy']
+        out['zz']= d['fzz']
+        out['Rz']= cp*d['fxz']+sp*d['fyz']
+        out['phiphi']= R**2.*(sp**2.*d['fxx']-2.*cp*sp*d['fxy']
+                              +cp**2.*d['fyy'])\
+                              -R*(cp*d['fx']+sp*d['fy'])
+        out['Rphi']= R*(cp*sp*(d['fyy']-d['fxx'])
+                        +(cp**2.-sp**2.)*d['fxy'])\
+                        -sp*d['fx']+cp*d['fy']
+        out['zphi']= R*(cp*d['fyz']-sp*d['fxz'])
+        return out
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dR2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['RR'],d['shape'])
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dz2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['zz'],d['shape'])
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['Rz'],d['shape'])
+
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dphi2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['phiphi'],d['shape'])
+
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed R,phi derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dR/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['Rphi'],d['shape'])
+
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed z,phi derivative
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           d2Phi/dz/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        d= self._hessian(R,z,phi,t)
+        return _reshape(d['zphi'],d['shape'])
+
+    def _dens(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _dens
+        PURPOSE:
+           evaluate the density from the Laplacian of the interpolated
+           potential
+        INPUT:
+           R - Galactocentric cylindrical radius
+           z - vertical height
+           phi - azimuth
+           t - time
+        OUTPUT:
+           rho(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        x, y, z, R, cp, sp, shape= self._toGrid(R,z,phi,t)
+        d= self._derivs(x,y,z,second=True)
+        return _reshape((d['fxx']+d['fyy']+d['fzz'])/4./nu.pi,shape)
+
+def _evaluateNodes(Pot,R,z,phi,t):
+    """Evaluate the potential and the forces at a set of nodes, all at once
+    if the potential supports array input, one at a time otherwise"""
+    out= nu.empty((4,len(R)))
+    for ii, func in enumerate([evaluatePotentials,evaluateRforces,
+                               evaluatezforces,evaluatephiforces]):
+        try:
+            tout= nu.array(func(R,z,Pot,phi=phi,t=t),dtype='float64')
+            if not tout.shape == R.shape: raise ValueError
+        except (TypeError,ValueError):
+            tout= nu.array([func(R[jj],z[jj],Pot,phi=phi[jj],t=t)
+                            for jj in range(len(R))],dtype='float64')
+        out[ii]= tout
+    return out
+
+def _hermiteBasis(t,h,second):
+    """1D cubic Hermite basis B[deriv][node][value/derivative] at t in
+    [0,1] for a cell of width h (derivatives are with respect to x)"""
+    t2= t**2.
+    t3= t2*t
+    B= [[[2.*t3-3.*t2+1.,(t3-2.*t2+t)*h],
+         [-2.*t3+3.*t2,(t3-t2)*h]],
+        [[(6.*t2-6.*t)/h,3.*t2-4.*t+1.],
+         [(-6.*t2+6.*t)/h,3.*t2-2.*t]]]
+    if second:
+        B.append([[(12.*t-6.)/h**2.,(6.*t-4.)/h],
+                  [(-12.*t+6.)/h**2.,(6.*t-2.)/h]])
+    return B
+
+def _fillDefaults(params):
+    """Default amp=1, OmegaP=0, and pa=0"""
+    defaults= {'amp':1.,'OmegaP':0.,'pa':0.}
+    for key in params.keys():
+        if params[key] is None: params[key]= defaults[key]
+    return params
+
+def _reshape(out,shape):
+    """Return out with the shape of the input, a float for scalar input"""
+    if len(shape) == 0: return out[0]
+    return out.reshape(shape)
@@ -4,6 +4,8 @@ from Potential import Potential
 _DEBUG= True
 class interpRZPotential(Potential):
     """Class that interpolates a given potential on a grid for fast orbit integration"""
+    #Interpolation objects are derived from _origPot and the grids
+    _fingerprintSkip= ('_interpRforce','_interpzforce')
     def __init__(self,RZPot,rgrid=(0.01,2.,101),zgrid=(-0.2,0.2,101),
                  logR=False):
         """
@@ -20,6 +22,8 @@ class interpRZPotential(Potential):
            instance
         HISTORY:
            2010-07-21 - Written - Bovy (NYU)
+           2026-10-19 - Interpolate the forces with cubic splines, added 
+                        second derivatives - agent (local)
         """
         Potential.__init__(self,amp=1.)
         self._origPot= RZPot
@@ -27,8 +31,6 @@ class interpRZPotential(Potential):
         if logR:
             self._rgrid= nu.exp(self._rgrid)
         self._zgrid= nu.linspace(*zgrid)
-        R= nu.zeros(len(self._rgrid)*len(self._zgrid))
-        z= nu.zeros(len(self._rgrid)*len(self._zgrid))
         Rforce= nu.zeros(len(self._rgrid)*len(self._zgrid))
         zforce= nu.zeros(len(self._rgrid)*len(self._zgrid))
         if _DEBUG:
@@ -39,13 +41,16 @@ class interpRZPotential(Potential):
                                                              self._zgrid[jj])
                 zforce[ii*len(self._zgrid)+jj]= RZPot.zforce(self._rgrid[ii],
                                                              self._zgrid[jj])
-                R[ii*len(self._zgrid)+jj]= self._rgrid[ii]
-                z[ii*len(self._zgrid)+jj]= self._zgrid[jj]
         if _DEBUG:
             print "Interpolating ..."
-        self._interpRforce= interpolate.interp2d(R,z,Rforce,bounds_error=True)
-        self._interpzforce= interpolate.interp2d(R,z,zforce,bounds_error=True)
-                                                 
+        #Cubic splines, such that the second derivatives are the
+        #derivatives of the interpolated forces
+        self._interpRforce= interpolate.RectBivariateSpline(\
+            self._rgrid,self._zgrid,
+            Rforce.reshape((len(self._rgrid),len(self._zgrid))),kx=3,ky=3,s=0.)
+        self._interpzforce= interpolate.RectBivariateSpline(\
+            self._rgrid,self._zgrid,
+            zforce.reshape((len(self._rgrid),len(self._zgrid))),kx=3,ky=3,s=0.)
 
     def _Rforce(self,R,z,phi=0.,t=0.):
         if R < self._rgrid[0] or R > self._rgrid[-1] \
@@ -53,7 +58,7 @@ class interpRZPotential(Potential):
             print "Current position out of range of interpolation, consider interpolating on a larger range"
             return self._origPot.Rforce(R,z)
         else:
-            return self._interpRforce(R,z)
+            return self._interpRforce.ev(R,z)
 
     def _zforce(self,R,z,phi=0.,t=0.):
         if R < self._rgrid[0] or R > self._rgrid[-1] \
@@ -61,4 +66,28 @@ class interpRZPotential(Potential):
             print "Current position out of range of interpolation, consider interpolating on a larger range"
             return self._origPot.zforce(R,z)
         else:
-            return self._interpzforce(R,z)
+            return self._interpzforce.ev(R,z)
+
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        if R < self._rgrid[0] or R > self._rgrid[-1] \
+                or z < self._zgrid[0] or z > self._zgrid[-1]:
+            print "Current position out of range of interpolation, consider interpolating on a larger range"
+            return self._origPot.R2deriv(R,z)
+        else:
+            return -self._interpRforce.ev(R,z,dx=1)
+
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        if R < self._rgrid[0] or R > self._rgrid[-1] \
+                or z < self._zgrid[0] or z > self._zgrid[-1]:
+            print "Current position out of range of interpolation, consider interpolating on a larger range"
+            return self._origPot.z2deriv(R,z)
+        else:
+            return -self._interpzforce.ev(R,z,dy=1)
+
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        if R < self._rgrid[0] or R > self._rgrid[-1] \
+                or z < self._zgrid[0] or z > self._zgrid[-1]:
+            print "Current position out of range of interpolation, consider interpolating on a larger range"
+            return self._origPot.Rzderiv(R,z)
+        else:
+            return -self._interpRforce.ev(R,z,dy=1)
@@ -0,0 +1,526 @@
+###############################################################################
+#   interpRotcurve.py: tabulated rotation curve of an axisymmetric potential
+#
+#   Tabulates vc, kappa, and nu in the mid-plane on a log R grid once and
+#   spline interpolates these for fast, vectorized evaluation of
+#   vc, Omega, kappa, nu, rl(Lz), and Lindblad radii
+###############################################################################
+import math
+import warnings
+import numpy as nu
+from scipy import interpolate
+from Potential import PotentialError, potentialFingerprint, verticalfreq, \
+    _rlScalar
+from plotRotcurve import vcirc, epifreq, lindbladR
+_ROTCURVETABLES= {}
+_MAXTABLES= 20
+class interpRotcurve:
+    """Class that tabulates the rotation curve of an axisymmetric potential"""
+    def __init__(self,Pot,Rrange=(10.**-3.,100.),nR=101,tol=10.**-6.,
+                 maxnR=6401):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           Initialize an interpRotcurve instance
+        INPUT:
+           Pot - Potential instance or list thereof (or planarPotential)
+           Rrange= range in R to tabulate the rotation curve on
+           nR= initial number of (logarithmically spaced) grid points
+           tol= maximum relative interpolation error at the mid-points of
+                the grid; the grid is doubled until this is reached
+           maxnR= maximum number of grid points
+        OUTPUT:
+           instance
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        isList= isinstance(Pot,list)
+        if (isList and nu.any([p.isNonAxi for p in Pot])) \
+                or (not isList and Pot.isNonAxi):
+            raise PotentialError("Tabulating the rotation curve of non-axisymmetric potentials is not supported")
+        self._pot= Pot
+        self._is3D= (isList and Pot[0].dim == 3) \
+            or (not isList and Pot.dim == 3)
+        self._Rmin= Rrange[0]
+        self._Rmax= Rrange[1]
+        self._lnRmin= math.log(self._Rmin)
+        self._lnRmax= math.log(self._Rmax)
+        self._tol= tol
+        #Tabulate, then double the grid until the mid-points are accurate
+        self._lnR= nu.linspace(self._lnRmin,self._lnRmax,nR)
+        self._vc, self._kappa, self._nu= self._tabulate(nu.exp(self._lnR))
+        self._setupSplines()
+        while True:
+            lnRmid= 0.5*(self._lnR[1:]+self._lnR[:-1])
+            vcmid, kappamid, numid= self._tabulate(nu.exp(lnRmid))
+            maxerr= _relerr(self._vcSpline(lnRmid),vcmid)
+            if self._kappaSpline is not None:
+                maxerr= max(maxerr,_relerr(self._kappaSpline(lnRmid),
+                                           kappamid))
+            if self._nuSpline is not None:
+                maxerr= max(maxerr,_relerr(self._nuSpline(lnRmid),numid))
+            self._lnR= _interleave(self._lnR,lnRmid)
+            self._vc= _interleave(self._vc,vcmid)
+            if self._kappa is not None:
+                self._kappa= _interleave(self._kappa,kappamid)
+            if self._nu is not None:
+                self._nu= _interleave(self._nu,numid)
+            self._setupSplines()
+            if maxerr < self._tol: break
+            if 2*len(self._lnR)-1 > maxnR:
+                warnings.warn("interpRotcurve: maximum number of grid points reached before reaching the requested tolerance (%g > %g)" % (maxerr,self._tol),RuntimeWarning)
+                break
+        self._R= nu.exp(self._lnR)
+        self._setupLz()
+        return None
+
+    def _tabulate(self,Rs):
+        """Directly evaluate vc, kappa, and nu at Rs"""
+        vc= _evaluateScalar(vcirc,self._pot,Rs)
+        try:
+            kappa= _evaluateScalar(epifreq,self._pot,Rs)
+        except PotentialError:
+            kappa= None
+        if self._is3D:
+            try:
+                nuz= _evaluateScalar(verticalfreq,self._pot,Rs)
+            except PotentialError:
+                nuz= None
+        else:
+            nuz= None
+        return (vc,kappa,nuz)
+
+    def _setupSplines(self):
+        """Spline interpolate the tabulated quantities in ln R"""
+        self._vcSpline= _logSpline(self._lnR,self._vc)
+        if self._kappa is None:
+            self._kappaSpline= None
+        else:
+            self._kappaSpline= _logSpline(self._lnR,self._kappa)
+        if self._nu is None:
+            self._nuSpline= None
+        else:
+            self._nuSpline= _logSpline(self._lnR,self._nu)
+        return None
+
+    def _setupLz(self):
+        """Set up the inverse of Lz(R)= R vc(R) on the part of the grid where
+        it increases monotonically"""
+        Lz= self._R*self._vc
+        dLz= Lz[1:]-Lz[:-1]
+        if dLz[0] <= 0.:
+            self._lnLz= None
+            return None
+        nonmono= (dLz <= 0.)
+        if nu.any(nonmono):
+            last= nu.arange(len(dLz))[nonmono][0]+1
+        else:
+            last= len(Lz)
+        self._lnLz= nu.log(Lz[:last])
+        self._lnRLz= self._lnR[:last]
+        self._Lzmin= Lz[0]
+        self._Lzmax= Lz[last-1]
+        self._rlSpline= interpolate.InterpolatedUnivariateSpline(self._lnLz,
+                                                                 self._lnRLz,
+                                                                 k=3)
+        return None
+
+    def vcirc(self,R):
+        """
+        NAME:
+           vcirc
+        PURPOSE:
+           calculate the circular velocity at R
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           circular rotation velocity
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._evaluate(R,self._vcSpline,vcirc)
+
+    def omegac(self,R):
+        """
+        NAME:
+           omegac
+        PURPOSE:
+           calculate the circular angular speed at R
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           circular angular speed
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self.vcirc(R)/R
+
+    def epifreq(self,R):
+        """
+        NAME:
+           epifreq
+        PURPOSE:
+           calculate the epicycle frequency at R
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           epicycle frequency
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        NOTE:
+           for potentials without second derivatives, kappa is obtained from
+           the derivative of the spline of the rotation curve
+        """
+        if self._kappaSpline is None:
+            return self._evaluate(R,self._kappaFromvcSpline,None)
+        return self._evaluate(R,self._kappaSpline,epifreq)
+
+    def verticalfreq(self,R):
+        """
+        NAME:
+           verticalfreq
+        PURPOSE:
+           calculate the vertical frequency at R
+        INPUT:
+           R - Galactocentric radius (can be array)
+        OUTPUT:
+           vertical frequency
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if self._nuSpline is None:
+            raise PotentialError("vertical frequency not available for this potential")
+        return self._evaluate(R,self._nuSpline,verticalfreq)
+
+    def rl(self,lz,tol=10.**-10.,maxiter=20):
+        """
+        NAME:
+           rl
+        PURPOSE:
+           calculate the radius of a circular orbit of Lz
+        INPUT:
+           lz - Angular momentum (can be array)
+           tol= relative tolerance for the Newton polishing
+           maxiter= maximum number of Newton iterations
+        OUTPUT:
+           radius
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        NOTE:
+           inside the tabulated range, the inverse of the tabulated Lz(R)
+           is polished by Newton iterations on the rotation-curve spline; 
+           outside of it, a power-law extrapolation of Lz(R) is polished by
+           Newton iterations on the potential itself; any Lz for which the
+           latter does not converge is found by bracketing (Potential.rl)
+        """
+        lz= nu.fabs(nu.array(lz,dtype='float64'))
+        shape= lz.shape
+        lz= lz.flatten()
+        out= nu.zeros(lz.shape)
+        if self._lnLz is None:
+            nz= (lz > 0.)
+            out[nz]= [_rlScalar(self._pot,l) for l in lz[nz]]
+            return _reshape(out,shape)
+        indx= (lz >= self._Lzmin)*(lz <= self._Lzmax)
+        if nu.any(indx):
+            lnlz= nu.log(lz[indx])
+            lnR= self._rlSpline(lnlz)
+            for ii in range(maxiter):
+                vc= self._vcSpline(lnR)
+                dlnLzdlnR= 1.+self._vcSpline(lnR,deriv=1)/vc
+                dlnR= (lnR+nu.log(vc)-lnlz)/dlnLzdlnR
+                lnR-= dlnR
+                if nu.all(nu.fabs(dlnR) < tol): break
+            out[indx]= nu.exp(lnR)
+        outdx= (~indx)*(lz > 0.)
+        if nu.any(outdx):
+            out[outdx]= self._rlOutside(lz[outdx],tol,maxiter)
+        return _reshape(out,shape)
+
+    def _rlOutside(self,lz,tol,maxiter):
+        """rl outside of the tabulated range: Newton iterations using 
+        d ln Lz / d ln R = kappa^2/2/Omega^2, starting from a power-law 
+        extrapolation of the tabulated Lz(R)"""
+        lnlz= nu.log(lz)
+        lnR= nu.empty(lz.shape)
+        low= (lnlz < self._lnLz[0])
+        lnR[low]= self._lnRLz[0]+(lnlz[low]-self._lnLz[0])\
+            *(self._lnRLz[1]-self._lnRLz[0])/(self._lnLz[1]-self._lnLz[0])
+        lnR[~low]= self._lnRLz[-1]+(lnlz[~low]-self._lnLz[-1])\
+            *(self._lnRLz[-1]-self._lnRLz[-2])/(self._lnLz[-1]-self._lnLz[-2])
+        todo= nu.ones(lz.shape,dtype='bool')
+        failed= nu.zeros(lz.shape,dtype='bool')
+        if not self._kappaSpline is None:
+            for ii in range(maxiter):
+                R= nu.exp(lnR[todo])
+                try:
+                    vc= _evaluateScalar(vcirc,self._pot,R)
+                    kappa= _evaluateScalar(epifreq,self._pot,R)
+                except PotentialError:
+                    break
+                dlnLzdlnR= kappa**2.*R**2./2./vc**2.
+                dlnR= (lnR[todo]+nu.log(vc)-lnlz[todo])/dlnLzdlnR
+                bad= ~(nu.fabs(dlnR) < 1.) #also catches nans
+                dlnR[bad]= 0.
+                lnR[todo]-= dlnR
+                thisindx= nu.arange(len(lz))[todo]
+                failed[thisindx[bad]]= True
+                todo[thisindx[bad+(nu.fabs(dlnR) < tol)]]= False
+                if not nu.any(todo): break
+        out= nu.exp(lnR)
+        failed+= todo
+        if nu.any(failed):
+            out[failed]= [_rlScalar(self._pot,l) for l in lz[failed]]
+        return out
+
+    def lindbladR(self,OmegaP,m=2,**kwargs):
+        """
+        NAME:
+           lindbladR
+        PURPOSE:
+           calculate the radius of a Lindblad resonance
+        INPUT:
+           OmegaP - pattern speed (can be array)
+           m= order of the resonance (as in m(O-Op)=kappa (negative m for outer)
+              use m='corotation' for corotation
+           +scipy.optimize.brentq xtol,rtol,maxiter kwargs (direct lindbladR)
+        OUTPUT:
+           radius of Linblad resonance, None if there is no resonance
+           (NaN for array OmegaP)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Direct fallback for array OmegaP - agent (local)
+        NOTE:
+           the innermost resonance in the tabulated range is returned; 
+           resonances outside of the tabulated range are found using the 
+           direct (un-tabulated) lindbladR, element by element for array 
+           OmegaP
+        """
+        if isinstance(OmegaP,nu.ndarray):
+            OmegaP= nu.array(OmegaP,dtype='float64')
+            return _reshape(self._resonanceR(OmegaP.flatten(),m,**kwargs),
+                            OmegaP.shape)
+        out= self._resonanceR(nu.array([OmegaP],dtype='float64'),m,
+                              **kwargs)[0]
+        if nu.isnan(out): return None
+        return out
+
+    def resonances(self,OmegaP,m=2):
+        """
+        NAME:
+           resonances
+        PURPOSE:
+           calculate the radii of the corotation, inner and outer Lindblad,
+           and inner and outer ultraharmonic resonances for (arrays of) 
+           pattern speeds
+        INPUT:
+           OmegaP - pattern speed (can be array)
+           m= multiplicity of the pattern (2 for a bar)
+        OUTPUT:
+           dictionary with keys 'corotation', 'ILR', 'OLR', 'IUHR', 'OUHR'
+           (radii have the shape of OmegaP, NaN where there is no resonance)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Direct fallback outside of the table - agent (local)
+        NOTE:
+           the ultraharmonic resonances are m(O-Op)= +/-kappa/2 (the 4:1 
+           resonances for a bar)
+        """
+        OmegaP= nu.array(OmegaP,dtype='float64')
+        shape= OmegaP.shape
+        OmegaP= OmegaP.flatten()
+        out= {}
+        for key, thism in [('corotation','corotation'),
+                           ('ILR',m),('OLR',-m),
+                           ('IUHR',2*m),('OUHR',-2*m)]:
+            out[key]= _reshape(self._resonanceR(OmegaP,thism),shape)
+        return out
+
+    def _resonanceR(self,OmegaP,m,xtol=10.**-13.,**kwargs):
+        """Vectorized resonance solver: find the innermost ln R at which 
+        Omega-kappa/m = OmegaP on the grid, then bisect on the splines; 
+        resonances outside of the grid are found with the direct lindbladR 
+        (NaN where there is no resonance)"""
+        directm= m
+        if isinstance(m,str):
+            if 'corot' in m.lower():
+                m= None
+            else:
+                raise IOError("'m' input not recognized, should be an integer or 'corotation'")
+        out= nu.empty(len(OmegaP))
+        gR= self._resonanceFunc(self._lnR,m)
+        chunk= max(1,2**20/len(gR))
+        for jj in range(0,len(OmegaP),chunk):
+            thisOmegaP= OmegaP[jj:jj+chunk]
+            diff= gR-thisOmegaP[:,nu.newaxis]
+            cross= (diff[:,1:]*diff[:,:-1] <= 0.)
+            hasres= nu.any(cross,axis=1)
+            first= nu.argmax(cross,axis=1)
+            lo= self._lnR[first]
+            hi= self._lnR[first+1]
+            flo= diff[nu.arange(len(thisOmegaP)),first]
+            while nu.amax(hi-lo) > xtol:
+                mid= 0.5*(lo+hi)
+                fmid= self._resonanceFunc(mid,m)-thisOmegaP
+                right= (fmid*flo > 0.)
+                lo[right]= mid[right]
+                flo[right]= fmid[right]
+                hi[~right]= mid[~right]
+            thisout= nu.exp(0.5*(lo+hi))
+            thisout[~hasres]= nu.nan
+            out[jj:jj+chunk]= thisout
+        nores= nu.isnan(out)
+        if nu.any(nores):
+            out[nores]= [_lindbladRScalar(self._pot,o,directm,**kwargs)
+                         for o in OmegaP[nores]]
+        return out
+
+    def _resonanceFunc(self,lnR,m):
+        """Omega-kappa/m (Omega for m=None)"""
+        out= self._vcSpline(lnR)/nu.exp(lnR)
+        if m is None: return out
+        if self._kappaSpline is None:
+            return out-self._kappaFromvcSpline(lnR)/m
+        return out-self._kappaSpline(lnR)/m
+
+    def _kappaFromvcSpline(self,lnR):
+        """kappa^2= 2 Omega^2 (1+dlnvc/dlnR)"""
+        vc= self._vcSpline(lnR)
+        dlnvcdlnR= self._vcSpline(lnR,deriv=1)/vc
+        return nu.sqrt(2.*(1.+dlnvcdlnR))*vc/nu.exp(lnR)
+
+    def _evaluate(self,R,spline,directfunc):
+        """Evaluate spline(ln R) inside the tabulated range and directfunc
+        outside of it"""
+        R= nu.array(R,dtype='float64')
+        shape= R.shape
+        R= R.flatten()
+        out= nu.empty(R.shape)
+        indx= (R >= self._Rmin)*(R <= self._Rmax)
+        out[indx]= spline(nu.log(R[indx]))
+        if nu.any(~indx):
+            if directfunc is None:
+                raise PotentialError("R outside of the range of the tabulated rotation curve")
+            out[~indx]= _evaluateScalar(directfunc,self._pot,R[~indx])
+        return _reshape(out,shape)
+
+def rotcurveTable(Pot,**kwargs):
+    """
+    NAME:
+
+       rotcurveTable
+
+    PURPOSE:
+
+       return the tabulated rotation curve for a potential, computing it
+       only once for each potential (as identified by its fingerprint)
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+       +interpRotcurve kwargs (Rrange, nR, tol, maxnR)
+
+    OUTPUT:
+
+       interpRotcurve instance
+
+    HISTORY:
+
+       2026-10-19 - Written - agent (local)
+
+    """
+    key= (potentialFingerprint(Pot),tuple(sorted(kwargs.items())))
+    if not _ROTCURVETABLES.has_key(key):
+        if len(_ROTCURVETABLES) >= _MAXTABLES:
+            _ROTCURVETABLES.clear()
+        _ROTCURVETABLES[key]= interpRotcurve(Pot,**kwargs)
+    return _ROTCURVETABLES[key]
+
+def resonanceRadii(Pot,OmegaP,m=2,**kwargs):
+    """
+    NAME:
+
+       resonanceRadii
+
+    PURPOSE:
+
+       calculate the radii of the corotation, inner and outer Lindblad, and
+       inner and outer ultraharmonic resonances for (arrays of) pattern 
+       speeds, using the tabulated rotation curve
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+       OmegaP - pattern speed (can be array)
+
+       m= multiplicity of the pattern (2 for a bar)
+
+       +interpRotcurve kwargs (Rrange, nR, tol, maxnR)
+
+    OUTPUT:
+
+       dictionary with keys 'corotation', 'ILR', 'OLR', 'IUHR', 'OUHR'
+       (NaN where there is no resonance)
+
+    HISTORY:
+
+       2026-10-19 - Written - agent (local)
+
+       2026-10-19 - Direct fallback outside of the table - agent (local)
+
+    """
+    return rotcurveTable(Pot,**kwargs).resonances(OmegaP,m=m)
+
+def _lindbladRScalar(Pot,OmegaP,m,**kwargs):
+    """Direct lindbladR, NaN if there is no resonance"""
+    out= lindbladR(Pot,OmegaP,m=m,**kwargs)
+    if out is None: return nu.nan
+    return out
+
+def _evaluateScalar(func,Pot,xs):
+    """Evaluate func(Pot,x) for an array of xs, all at once if the potential
+    supports array input, one at a time otherwise"""
+    xs= nu.atleast_1d(xs)
+    try:
+        out= nu.array(func(Pot,xs),dtype='float64')
+        if out.shape == xs.shape: return out
+    except (TypeError,ValueError):
+        pass
+    return nu.array([func(Pot,x) for x in xs],dtype='float64')
+
+def _reshape(out,shape):
+    """Return out with the shape of the input, a float for scalar input"""
+    if len(shape) == 0: return out[0]
+    return out.reshape(shape)
+
+def _logSpline(lnR,y):
+    """Cubic spline of ln y in ln R if y > 0 everywhere, of y otherwise"""
+    if nu.all(y > 0.):
+        spl= interpolate.InterpolatedUnivariateSpline(lnR,nu.log(y),k=3)
+        return lambda x,deriv=0: _expSpline(spl,x,deriv)
+    spl= interpolate.InterpolatedUnivariateSpline(lnR,y,k=3)
+    return lambda x,deriv=0: spl(x,nu=deriv)
+
+def _expSpline(spl,x,deriv):
+    """Derivative (0, 1, or 2) of exp(spl(x))"""
+    if deriv == 0:
+        return nu.exp(spl(x))
+    elif deriv == 1:
+        return nu.exp(spl(x))*spl(x,nu=1)
+    elif deriv == 2:
+        return nu.exp(spl(x))*(spl(x,nu=2)+spl(x,nu=1)**2.)
+    else:
+        raise ValueError("deriv= must be 0, 1, or 2")
+
+def _relerr(approx,exact):
+    return nu.amax(nu.fabs(approx/exact-1.))
+
+def _interleave(a,b):
+    """Interleave a (length n) and b (length n-1)"""
+    out= nu.empty(len(a)+len(b))
+    out[0::2]= a
+    out[1::2]= b
+    return out
@@ -0,0 +1,329 @@
+###############################################################################
+#   interpVerticalPotential.py: tabulated family of vertical potentials
+#
+#   Tabulates Phi_z(z;R)= Phi(R,z)-Phi(R,0) of an axisymmetric potential on
+#   a (ln R,z) grid once and spline interpolates it for fast, vectorized
+#   evaluation of Phi_z, the vertical force, zmax(Ez;R), and the vertical
+#   action and period (using fixed-order Gauss-Legendre quadrature)
+###############################################################################
+import math
+import numpy as nu
+from scipy import interpolate
+from Potential import PotentialError, potentialFingerprint, \
+    evaluatePotentials, evaluatezforces, verticalfreq, _cachedFingerprint, \
+    _canonicalParams
+from interpRotcurve import _evaluateScalar, _reshape
+_VERTICALTABLES= {}
+_MAXTABLES= 20
+class interpVerticalPotential:
+    """Class that tabulates the vertical potentials Phi(R,z)-Phi(R,0) of an axisymmetric potential over a range of R"""
+    #Derived from the potential and the grid, not part of the fingerprint
+    _fingerprintSkip= ('_phiz','_phizSpline')
+    def __init__(self,Pot,Rrange=(10.**-2.,20.),nR=101,zmax=5.,nz=101,
+                 zscale=0.1):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           Initialize an interpVerticalPotential instance
+        INPUT:
+           Pot - Potential instance or list thereof
+           Rrange= range in R to tabulate the vertical potentials on
+           nR= number of (logarithmically spaced) grid points in R
+           zmax= maximum |z| of the table
+           nz= number of grid points in |z|, spaced uniformly in
+               asinh(|z|/zscale)
+           zscale= scale at which the |z| grid changes from linear to
+                   logarithmic spacing
+        OUTPUT:
+           instance
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        NOTE:
+           the potential is assumed to be symmetric with respect to the
+           mid-plane
+        """
+        isList= isinstance(Pot,list)
+        if (isList and nu.any([p.isNonAxi for p in Pot])) \
+                or (not isList and Pot.isNonAxi):
+            raise PotentialError("Tabulating the vertical potentials of non-axisymmetric potentials is not supported")
+        self._pot= Pot
+        self._Rmin= Rrange[0]
+        self._Rmax= Rrange[1]
+        self._zmax= zmax
+        self._lnR= nu.linspace(math.log(self._Rmin),math.log(self._Rmax),nR)
+        self._z= zscale*nu.sinh(nu.linspace(0.,math.asinh(zmax/zscale),nz))
+        self._z[-1]= zmax
+        #Tabulate Phi(R,z)-Phi(R,0)
+        R= nu.exp(self._lnR)
+        RR= nu.tile(R,(nz,1)).T.flatten()
+        zz= nu.tile(self._z,(nR,1)).flatten()
+        self._phiz= (_evaluatePotentials(RR,zz,self._pot)
+                     -_evaluatePotentials(RR,0.*zz,self._pot)).reshape((nR,
+                                                                        nz))
+        #Spline, mirroring the table such that the spline is symmetric in z
+        self._phizSpline= interpolate.RectBivariateSpline(\
+            self._lnR,nu.concatenate((-self._z[:0:-1],self._z)),
+            nu.concatenate((self._phiz[:,:0:-1],self._phiz),axis=1),
+            kx=3,ky=3,s=0.)
+        return None
+
+    def fingerprint(self):
+        """
+        NAME:
+           fingerprint
+        PURPOSE:
+           return a stable hash of the tabulated potential and the grid,
+           suitable as a key for memoization and disk caches
+        INPUT:
+        OUTPUT:
+           hexadecimal sha1 digest (string)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return _cachedFingerprint(self)
+
+    def _canonicalParams(self):
+        """Canonical string serialization of the class and parameters"""
+        return _canonicalParams(self)
+
+    def __call__(self,R,z):
+        """
+        NAME:
+           __call__
+        PURPOSE:
+           evaluate the vertical potential Phi(R,z)-Phi(R,0)
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+        OUTPUT:
+           Phi_z(z;R)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._evaluate(R,z,0)
+
+    def zforce(self,R,z):
+        """
+        NAME:
+           zforce
+        PURPOSE:
+           evaluate the vertical force
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+        OUTPUT:
+           F_z(z;R)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._evaluate(R,z,1)
+
+    def Ez(self,R,z,vz):
+        """
+        NAME:
+           Ez
+        PURPOSE:
+           calculate the vertical energy
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+           vz - vertical velocity (can be array)
+        OUTPUT:
+           Ez= Phi_z(z;R)+vz^2/2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self(R,z)+nu.array(vz)**2./2.
+
+    def zmax(self,Ez,R,xtol=10.**-12.):
+        """
+        NAME:
+           zmax
+        PURPOSE:
+           calculate the maximum height reached at vertical energy Ez
+        INPUT:
+           Ez - vertical energy (can be array)
+           R - Galactocentric radius (can be array)
+           xtol= absolute tolerance in zmax
+        OUTPUT:
+           zmax (NaN outside of the tabulated range)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Ez, R= nu.broadcast_arrays(nu.array(Ez,dtype='float64'),
+                                   nu.array(R,dtype='float64'))
+        shape= Ez.shape
+        Ez= Ez.flatten()
+        R= R.flatten()
+        out= nu.empty(len(Ez))
+        indx= (R >= self._Rmin)*(R <= self._Rmax)*(Ez >= 0.)
+        out[~indx]= nu.nan
+        if nu.any(indx):
+            out[indx]= self._zmax_tab(Ez[indx],nu.log(R[indx]),xtol)
+        return _reshape(out,shape)
+
+    def Jz(self,R,z,vz,order=20):
+        """
+        NAME:
+           Jz
+        PURPOSE:
+           calculate the vertical action
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+           vz - vertical velocity (can be array)
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           J_z (NaN outside of the tabulated range)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Ez, zmax, lnR, shape= self._setupQuad(R,z,vz)
+        #z= zmax sin(theta) removes the square-root singularity at zmax
+        sintheta, costheta, w= _glTheta(order)
+        zs= zmax[:,nu.newaxis]*sintheta
+        phiz= self._phizSpline.ev(nu.tile(lnR,(order,1)).T.flatten(),
+                                  zs.flatten()).reshape(zs.shape)
+        integrand= nu.sqrt(nu.maximum(2.*(Ez[:,nu.newaxis]-phiz),0.))\
+            *costheta
+        return _reshape(2./nu.pi*zmax*nu.sum(w*integrand,axis=1),shape)
+
+    def Tz(self,R,z,vz,order=20):
+        """
+        NAME:
+           Tz
+        PURPOSE:
+           calculate the vertical period
+        INPUT:
+           R - Galactocentric radius (can be array)
+           z - height (can be array)
+           vz - vertical velocity (can be array)
+           order= order of the Gauss-Legendre quadrature
+        OUTPUT:
+           T_z (NaN outside of the tabulated range)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Ez, zmax, lnR, shape= self._setupQuad(R,z,vz)
+        sintheta, costheta, w= _glTheta(order)
+        zs= zmax[:,nu.newaxis]*sintheta
+        phiz= self._phizSpline.ev(nu.tile(lnR,(order,1)).T.flatten(),
+                                  zs.flatten()).reshape(zs.shape)
+        integrand= costheta/nu.sqrt(2.*(Ez[:,nu.newaxis]-phiz))
+        out= 4.*zmax*nu.sum(w*integrand,axis=1)
+        #Orbits in the mid-plane: T_z= 2 pi / nu
+        zero= (zmax < 10.**-8.)
+        if nu.any(zero):
+            out[zero]= 2.*nu.pi/_evaluateScalar(verticalfreq,self._pot,
+                                                nu.exp(lnR[zero]))
+        return _reshape(out,shape)
+
+    def _setupQuad(self,R,z,vz):
+        """Broadcast the input and compute Ez and zmax"""
+        R, z, vz= nu.broadcast_arrays(nu.array(R,dtype='float64'),
+                                      nu.array(z,dtype='float64'),
+                                      nu.array(vz,dtype='float64'))
+        shape= R.shape
+        R= R.flatten()
+        Ez= nu.maximum(self.Ez(R,z.flatten(),vz.flatten()),0.)
+        zmax= self.zmax(Ez,R)
+        return (Ez,zmax,nu.log(R),shape)
+
+    def _zmax_tab(self,Ez,lnR,xtol):
+        """Vectorized zmax solver: bisect on the |z| grid for the interval
+        containing zmax, then bisect on the spline within it"""
+        out= nu.empty(len(Ez))
+        inrange= (self._phizSpline.ev(lnR,self._zmax+0.*lnR) >= Ez)
+        ilo= nu.zeros(len(Ez),dtype='int')
+        ihi= (len(self._z)-1)*nu.ones(len(Ez),dtype='int')
+        while nu.any(ihi-ilo > 1):
+            imid= (ilo+ihi)/2
+            below= (self._phizSpline.ev(lnR,self._z[imid]) < Ez)
+            ilo[below]= imid[below]
+            ihi[~below]= imid[~below]
+        lo= self._z[ilo]
+        hi= self._z[ihi]
+        while nu.amax(hi-lo) > xtol:
+            mid= 0.5*(lo+hi)
+            below= (self._phizSpline.ev(lnR,mid) < Ez)
+            lo[below]= mid[below]
+            hi[~below]= mid[~below]
+        out= 0.5*(lo+hi)
+        out[~inrange]= nu.nan
+        return out
+
+    def _evaluate(self,R,z,deriv):
+        """Evaluate Phi_z (deriv=0) or F_z (deriv=1) from the spline inside
+        the tabulated range and directly outside of it"""
+        R, z= nu.broadcast_arrays(nu.array(R,dtype='float64'),
+                                  nu.array(z,dtype='float64'))
+        shape= R.shape
+        R= R.flatten()
+        z= z.flatten()
+        out= nu.empty(R.shape)
+        indx= (R >= self._Rmin)*(R <= self._Rmax)*(nu.fabs(z) <= self._zmax)
+        if deriv == 0:
+            out[indx]= self._phizSpline.ev(nu.log(R[indx]),z[indx])
+            if nu.any(~indx):
+                out[~indx]= _evaluatePotentials(R[~indx],z[~indx],self._pot)\
+                    -_evaluatePotentials(R[~indx],0.*z[~indx],self._pot)
+        else:
+            out[indx]= -self._phizSpline.ev(nu.log(R[indx]),z[indx],dy=1)
+            if nu.any(~indx):
+                out[~indx]= _evaluatePairs(evaluatezforces,R[~indx],z[~indx],
+                                           self._pot)
+        return _reshape(out,shape)
+
+def verticalPotentialTable(Pot,**kwargs):
+    """
+    NAME:
+
+       verticalPotentialTable
+
+    PURPOSE:
+
+       return the tabulated vertical potentials for a potential, computing
+       them only once for each potential (as identified by its fingerprint)
+
+    INPUT:
+
+       Pot - Potential instance or list thereof
+
+       +interpVerticalPotential kwargs (Rrange, nR, zmax, nz, zscale)
+
+    OUTPUT:
+
+       interpVerticalPotential instance
+
+    HISTORY:
+
+       2026-10-19 - Written - agent (local)
+
+    """
+    key= (potentialFingerprint(Pot),tuple(sorted(kwargs.items())))
+    if not _VERTICALTABLES.has_key(key):
+        if len(_VERTICALTABLES) >= _MAXTABLES:
+            _VERTICALTABLES.clear()
+        _VERTICALTABLES[key]= interpVerticalPotential(Pot,**kwargs)
+    return _VERTICALTABLES[key]
+
+def _evaluatePotentials(R,z,Pot):
+    return _evaluatePairs(evaluatePotentials,R,z,Pot)
+
+def _evaluatePairs(func,R,z,Pot):
+    """Evaluate func(R,z,Pot) for arrays of (R,z), all at once if the
+    potential supports array input, one at a time otherwise"""
+    try:
+        out= nu.array(func(R,z,Pot),dtype='float64')
+        if out.shape == R.shape: return out
+    except (TypeError,ValueError):
+        pass
+    return nu.array([func(R[ii],z[ii],Pot) for ii in range(len(R))],
+                    dtype='float64')
+
+def _glTheta(order):
+    """Gauss-Legendre nodes and weights for theta in [0,pi/2]"""
+    x, w= nu.polynomial.legendre.leggauss(order)
+    theta= nu.pi/4.*(x+1.)
+    return (nu.sin(theta),nu.cos(theta),nu.pi/4.*w)
@@ -1,6 +1,7 @@
 import numpy as nu
 import galpy.util.bovy_plot as plot
-from Potential import PotentialError, Potential
+from Potential import PotentialError, Potential, _cachedFingerprint, \
+    _canonicalParams, _potentialEq
 class linearPotential:
     """Class representing 1D potentials"""
     def __init__(self,amp=1.):
@@ -86,6 +87,38 @@ class linearPotential:
                               xlabel=r"$x/x_0$",ylabel=r"$\Phi(x)$",
                               xrange=[min,max])
 
+    def fingerprint(self):
+        """
+        NAME:
+           fingerprint
+        PURPOSE:
+           return a stable hash of the class and parameters of this potential,
+           suitable as a key for memoization and disk caches
+        INPUT:
+        OUTPUT:
+           hexadecimal sha1 digest (string)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Cache the fingerprint - agent (local)
+        NOTE:
+           the fingerprint is computed once and cached; normalize resets it,
+           but other in-place changes to the parameters are not tracked
+        """
+        return _cachedFingerprint(self)
+
+    def _canonicalParams(self):
+        """Canonical string serialization of the class and parameters"""
+        return _canonicalParams(self)
+
+    def __eq__(self,other):
+        return _potentialEq(self,other)
+
+    def __ne__(self,other):
+        return not _potentialEq(self,other)
+
+    def __hash__(self):
+        return hash(self.fingerprint())
+
 class linearPotentialFromRZPotential(linearPotential):
     def __init__(self,RZPot,R=1.):
         """
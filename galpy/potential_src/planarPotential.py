@@ -1,6 +1,7 @@
 import numpy as nu
 import galpy.util.bovy_plot as plot
-from Potential import PotentialError, Potential
+from Potential import PotentialError, Potential, _cachedFingerprint, \
+    _canonicalParams, _potentialEq
 from plotRotcurve import plotRotcurve, lindbladR
 from plotEscapecurve import plotEscapecurve
 _INF= 1000000.
@@ -95,6 +96,46 @@ class planarPotential:
         except AttributeError:
             raise PotentialError("'_R2deriv' function not implemented for this potential")      
 
+    def phi2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+           d2phi/dphi2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        try:
+            return self._amp*self._phi2deriv(R,phi=phi,t=t)
+        except AttributeError:
+            raise PotentialError("'_phi2deriv' function not implemented for this potential")      
+
+    def Rphideriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+           d2phi/dR/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        try:
+            return self._amp*self._Rphideriv(R,phi=phi,t=t)
+        except AttributeError:
+            raise PotentialError("'_Rphideriv' function not implemented for this potential")      
+
     def plot(self,*args,**kwargs):
         """
         NAME:
@@ -113,6 +154,54 @@ class planarPotential:
         """
         plotplanarPotentials(self,*args,**kwargs)
 
+    def toFull(self):
+        """
+        NAME:
+           toFull
+        PURPOSE:
+           convert a planar potential into a 3D potential, evaluated at 
+           r= sqrt(R^2+z^2)
+        INPUT:
+           (none)
+        OUTPUT:
+           Potential
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return planarTofullPotential(self)
+
+    def fingerprint(self):
+        """
+        NAME:
+           fingerprint
+        PURPOSE:
+           return a stable hash of the class and parameters of this potential,
+           suitable as a key for memoization and disk caches
+        INPUT:
+        OUTPUT:
+           hexadecimal sha1 digest (string)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Cache the fingerprint - agent (local)
+        NOTE:
+           the fingerprint is computed once and cached; normalize resets it,
+           but other in-place changes to the parameters are not tracked
+        """
+        return _cachedFingerprint(self)
+
+    def _canonicalParams(self):
+        """Canonical string serialization of the class and parameters"""
+        return _canonicalParams(self)
+
+    def __eq__(self,other):
+        return _potentialEq(self,other)
+
+    def __ne__(self,other):
+        return not _potentialEq(self,other)
+
+    def __hash__(self):
+        return hash(self.fingerprint())
+
 class planarAxiPotential(planarPotential):
     """Class representing axisymmetric planar potentials"""
     def __init__(self,amp=1.):
@@ -123,7 +212,7 @@ class planarAxiPotential(planarPotential):
     def _phiforce(self,R,phi=0.,t=0.):
         return 0.
 
-    def _phi2deriv(self,R,z,phi=0.,t=0.):
+    def _phi2deriv(self,R,phi=0.,t=0.):
         """
         NAME:
            _phi2deriv
@@ -131,7 +220,6 @@ class planarAxiPotential(planarPotential):
            evaluate the second azimuthal derivative for this potential
         INPUT:
            R - Galactocentric cylindrical radius
-           z - vertical height
            phi - azimuth
            t - time
         OUTPUT:
@@ -141,7 +229,7 @@ class planarAxiPotential(planarPotential):
         """
         return 0.
 
-    def _Rphideriv(self,R,z,phi=0.,t=0.):
+    def _Rphideriv(self,R,phi=0.,t=0.):
         """
         NAME:
            _Rphideriv
@@ -149,7 +237,6 @@ class planarAxiPotential(planarPotential):
            evaluate the radial+azimuthal derivative for this potential
         INPUT:
            R - Galactocentric cylindrical radius
-           z - vertical height
            phi - azimuth
            t - time
         OUTPUT:
@@ -297,8 +384,41 @@ class planarAxiPotential(planarPotential):
 
             2011-10-09 - Written - Bovy (IAS)
 
+            2026-10-19 - Use Phi(infinity) from Phiinf - agent (local)
+
+        """
+        return nu.sqrt(2.*(self.Phiinf()-self(R)))
+
+    def Phiinf(self):
         """
-        return nu.sqrt(2.*(self(_INF)-self(R)))
+
+        NAME:
+
+            Phiinf
+
+        PURPOSE:
+
+            return the value of the potential at infinity
+
+        INPUT:
+
+            (none)
+
+        OUTPUT:
+
+            Phi(infinity) (can be infinite, e.g., for logarithmic halos)
+
+        HISTORY:
+
+            2026-10-19 - Written - agent (local)
+
+        """
+        return self._amp*self._Phiinf()
+
+    def _Phiinf(self):
+        """Phi(infinity) without the amplitude; estimated as the potential
+        at a large radius unless a potential knows its asymptotic value"""
+        return self._evaluate(_INF)
         
     def plotRotcurve(self,*args,**kwargs):
         """
@@ -406,6 +526,132 @@ class planarPotentialFromRZPotential(planarAxiPotential):
            2011-10-09 - Written - Bovy (IAS)
         """
         return self._RZPot.R2deriv(R,0.,t=t)
+
+    def _Phiinf(self):
+        return self._RZPot.Phiinf()
+
+class planarPotentialFromFullPotential(planarPotential):
+    """Class that represents a non-axisymmetric planar potential derived 
+    from a non-axisymmetric 3D potential in its mid-plane"""
+    def __init__(self,RZPot):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           Initialize
+        INPUT:
+           RZPot - non-axisymmetric Potential instance
+        OUTPUT:
+           planarPotential instance
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        planarPotential.__init__(self,amp=1.)
+        self._RZPot= RZPot
+        self.hasC= RZPot.hasC
+        return None
+
+    def _evaluate(self,R,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+          Pot(R,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot(R,0.,phi=phi,t=t,dR=dR,dphi=dphi)
+
+    def _Rforce(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+          F_R(R,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot.Rforce(R,0.,phi=phi,t=t)
+
+    def _phiforce(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+          F_phi(R,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot.phiforce(R,0.,phi=phi,t=t)
+
+    def _R2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+           d2phi/dR2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot.R2deriv(R,0.,phi=phi,t=t)
+
+    def _phi2deriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+           d2phi/dphi2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot.phi2deriv(R,0.,phi=phi,t=t)
+
+    def _Rphideriv(self,R,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative
+        INPUT:
+           R
+           phi
+           t
+        OUTPUT:
+           d2phi/dR/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._RZPot.Rphideriv(R,0.,phi=phi,t=t)
             
 def RZToplanarPotential(RZPot):
     """
@@ -417,9 +663,13 @@ def RZToplanarPotential(RZPot):
        RZPot - RZPotential instance or list of such instances (existing 
                planarPotential instances are just copied to the output)
     OUTPUT:
-       planarPotential instance(s)
+       planarPotential instance(s) (non-axisymmetric for non-axisymmetric 
+       RZPotentials)
     HISTORY:
        2010-07-13 - Written - Bovy (NYU)
+       2026-10-19 - Added caching on the RZPotential - agent (local)
+       2026-10-19 - Keep the azimuthal dependence of non-axisymmetric 
+                    potentials - agent (local)
     """
     if isinstance(RZPot,list):
         out= []
@@ -427,15 +677,347 @@ def RZToplanarPotential(RZPot):
             if isinstance(pot,planarPotential):
                 out.append(pot)
             else:
-                out.append(planarPotentialFromRZPotential(pot))
+                out.append(_planarPotentialFromRZPotential(pot))
         return out
     elif isinstance(RZPot,Potential):
-        return planarPotentialFromRZPotential(RZPot)
+        return _planarPotentialFromRZPotential(RZPot)
     elif isinstance(RZPot,planarPotential):
         return RZPot
     else:
         raise PotentialError("Input to 'RZToplanarPotential' is neither an RZPotential-instance or a list of such instances")
 
+def _planarPotentialFromRZPotential(RZPot):
+    """Return the planar projection of RZPot, re-using the one cached on 
+    RZPot by a previous call"""
+    try:
+        return RZPot._cachePlanar
+    except AttributeError:
+        if RZPot.isNonAxi:
+            RZPot._cachePlanar= planarPotentialFromFullPotential(RZPot)
+        else:
+            RZPot._cachePlanar= planarPotentialFromRZPotential(RZPot)
+        return RZPot._cachePlanar
+
+class fullPotentialFromplanarPotential(Potential):
+    """Class that represents a 3D potential derived from a planarPotential 
+    by evaluating the planarPotential at the spherical radius 
+    r= sqrt(R^2+z^2), such that it is unchanged in the mid-plane and falls 
+    off smoothly with |z|"""
+    def __init__(self,planarPot):
+        """
+        NAME:
+           __init__
+        PURPOSE:
+           Initialize
+        INPUT:
+           planarPot - planarPotential instance
+        OUTPUT:
+           Potential instance
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        Potential.__init__(self,amp=1.)
+        self._planarPot= planarPot
+        self.isNonAxi= planarPot.isNonAxi
+        self.hasC= planarPot.hasC
+        return None
+
+    def _evaluate(self,R,z,phi=0.,t=0.,dR=0,dphi=0):
+        """
+        NAME:
+           _evaluate
+        PURPOSE:
+           evaluate the potential
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           Pot(r,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            R,z,phi= nu.broadcast_arrays(R,z,phi)
+            return nu.array([self._evaluate(rr,zz,phi=pp,t=t,dR=dR,dphi=dphi)
+                             for rr,zz,pp in zip(R.flatten(),z.flatten(),
+                                                 phi.flatten())])\
+                                                 .reshape(R.shape)
+        if dR == 0:
+            return self._planarPot(nu.sqrt(R**2.+z**2.),phi=phi,t=t,
+                                   dphi=dphi)
+        elif dR == 1 and dphi == 0:
+            return -self._Rforce(R,z,phi=phi,t=t)
+        elif dR == 2 and dphi == 0:
+            return self._R2deriv(R,z,phi=phi,t=t)
+        elif dR == 1 and dphi == 1:
+            return self._Rphideriv(R,z,phi=phi,t=t)
+        else:
+            raise NotImplementedError("'_evaluate' for dR=%i and dphi=%i not implemented for fullPotentialFromplanarPotential" % (dR,dphi))
+
+    def _Rforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rforce
+        PURPOSE:
+           evaluate the radial force
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           F_R(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._Rforce,R,z,phi,t)
+        r= nu.sqrt(R**2.+z**2.)
+        return self._planarPot.Rforce(r,phi=phi,t=t)*R/r
+    def _zforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zforce
+        PURPOSE:
+           evaluate the vertical force
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           F_z(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._zforce,R,z,phi,t)
+        r= nu.sqrt(R**2.+z**2.)
+        return self._planarPot.Rforce(r,phi=phi,t=t)*z/r
+    def _phiforce(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phiforce
+        PURPOSE:
+           evaluate the azimuthal force
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           F_phi(R,z,phi,t)
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._phiforce,R,z,phi,t)
+        return self._planarPot.phiforce(nu.sqrt(R**2.+z**2.),phi=phi,t=t)
+    def _R2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _R2deriv
+        PURPOSE:
+           evaluate the second radial derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dR2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._R2deriv,R,z,phi,t)
+        r2= R**2.+z**2.
+        r= nu.sqrt(r2)
+        return (self._planarPot.R2deriv(r,phi=phi,t=t)*R**2.
+                -self._planarPot.Rforce(r,phi=phi,t=t)*z**2./r)/r2
+    def _z2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _z2deriv
+        PURPOSE:
+           evaluate the second vertical derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dz2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._z2deriv,R,z,phi,t)
+        r2= R**2.+z**2.
+        r= nu.sqrt(r2)
+        return (self._planarPot.R2deriv(r,phi=phi,t=t)*z**2.
+                -self._planarPot.Rforce(r,phi=phi,t=t)*R**2./r)/r2
+    def _Rzderiv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rzderiv
+        PURPOSE:
+           evaluate the mixed R,z derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dR/dz
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._Rzderiv,R,z,phi,t)
+        r2= R**2.+z**2.
+        r= nu.sqrt(r2)
+        return (self._planarPot.R2deriv(r,phi=phi,t=t)
+                +self._planarPot.Rforce(r,phi=phi,t=t)/r)*R*z/r2
+    def _phi2deriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _phi2deriv
+        PURPOSE:
+           evaluate the second azimuthal derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dphi2
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._phi2deriv,R,z,phi,t)
+        return self._planarPot.phi2deriv(nu.sqrt(R**2.+z**2.),phi=phi,t=t)
+    def _Rphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _Rphideriv
+        PURPOSE:
+           evaluate the mixed radial, azimuthal derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dR/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._Rphideriv,R,z,phi,t)
+        r= nu.sqrt(R**2.+z**2.)
+        return self._planarPot.Rphideriv(r,phi=phi,t=t)*R/r
+    def _zphideriv(self,R,z,phi=0.,t=0.):
+        """
+        NAME:
+           _zphideriv
+        PURPOSE:
+           evaluate the mixed vertical, azimuthal derivative
+        INPUT:
+           R
+           z
+           phi
+           t
+        OUTPUT:
+           d2phi/dz/dphi
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+           2026-10-19 - Loop over array input - agent (local)
+           2026-10-19 - Evaluate at r= sqrt(R^2+z^2) - agent (local)
+        """
+        if _isArray(R,z,phi):
+            return _elementwise(self._zphideriv,R,z,phi,t)
+        r= nu.sqrt(R**2.+z**2.)
+        return self._planarPot.Rphideriv(r,phi=phi,t=t)*z/r
+    def toPlanar(self):
+        """
+        NAME:
+           toPlanar
+        PURPOSE:
+           return the planar potential that this potential was derived from
+        INPUT:
+           (none)
+        OUTPUT:
+           planarPotential
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        return self._planarPot
+
+def planarTofullPotential(planarPot):
+    """
+    NAME:
+       planarTofullPotential
+    PURPOSE:
+       convert a planarPotential to a 3D potential (e.g., to add a bar or 
+       spiral to a 3D potential); the planarPotential is evaluated at the 
+       spherical radius r= sqrt(R^2+z^2), so the 3D potential equals the 
+       planarPotential in the mid-plane
+    INPUT:
+       planarPot - planarPotential instance or list of such instances
+                   (existing 3D Potential instances are just copied to the
+                   output)
+    OUTPUT:
+       Potential instance(s)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    if isinstance(planarPot,list):
+        out= []
+        for pot in planarPot:
+            if isinstance(pot,Potential):
+                out.append(pot)
+            else:
+                out.append(planarTofullPotential(pot))
+        return out
+    elif isinstance(planarPot,Potential):
+        return planarPot
+    elif isinstance(planarPot,planarPotentialFromRZPotential):
+        return planarPot._RZPot
+    elif isinstance(planarPot,planarPotential):
+        return fullPotentialFromplanarPotential(planarPot)
+    else:
+        raise PotentialError("Input to 'planarTofullPotential' is neither a planarPotential-instance or a list of such instances")
+
+def _isArray(R,z,phi):
+    return isinstance(R,nu.ndarray) or isinstance(z,nu.ndarray) \
+        or isinstance(phi,nu.ndarray)
+
+def _elementwise(func,R,z,phi,t):
+    """Evaluate func(R,z,phi=phi,t=t) element by element for array input, 
+    as the planarPotentials only take scalars"""
+    R,z,phi= nu.broadcast_arrays(R,z,phi)
+    return nu.array([func(rr,zz,phi=pp,t=t)
+                     for rr,zz,pp in zip(R.flatten(),z.flatten(),
+                                         phi.flatten())]).reshape(R.shape)
+
 def evaluateplanarPotentials(R,Pot,phi=None,t=0.,dR=0,dphi=0):
     """
     NAME:
@@ -593,6 +1175,84 @@ def evaluateplanarR2derivs(R,Pot,phi=None,t=0.):
     else:
         raise TypeError("Input to 'evaluateplanarR2derivs' is neither a Potential-instance or a list of such instances")
 
+def evaluateplanarphi2derivs(R,Pot,phi=None,t=0.):
+    """
+    NAME:
+       evaluateplanarphi2derivs
+    PURPOSE:
+       evaluate the second azimuthal derivative of a (list of) planarPotential instance(s)
+    INPUT:
+       R (+phi optional)
+       Pot - (list of) planarPotential instance(s)
+       t - time (optional)
+    OUTPUT:
+       d2phi/dphi2(R(,phi,t))
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    isList= isinstance(Pot,list)
+    if isList:
+        isAxis= [not p.isNonAxi for p in Pot]
+        nonAxi= not nu.prod(nu.array(isAxis))
+    else:
+        nonAxi= Pot.isNonAxi
+    if nonAxi and phi is None:
+        raise PotentialError("The (list of) planarPotential instances is non-axisymmetric, but you did not provide phi")
+    if isinstance(Pot,list):
+        sum= 0.
+        for pot in Pot:
+            if nonAxi:
+                sum+= pot.phi2deriv(R,phi=phi,t=t)
+            else:
+                sum+= pot.phi2deriv(R,t=t)
+        return sum
+    elif isinstance(Pot,planarPotential):
+        if nonAxi:
+            return Pot.phi2deriv(R,phi=phi,t=t)
+        else:
+            return Pot.phi2deriv(R,t=t)
+    else:
+        raise TypeError("Input to 'evaluateplanarphi2derivs' is neither a Potential-instance or a list of such instances")
+
+def evaluateplanarRphiderivs(R,Pot,phi=None,t=0.):
+    """
+    NAME:
+       evaluateplanarRphiderivs
+    PURPOSE:
+       evaluate the mixed radial, azimuthal derivative of a (list of) planarPotential instance(s)
+    INPUT:
+       R (+phi optional)
+       Pot - (list of) planarPotential instance(s)
+       t - time (optional)
+    OUTPUT:
+       d2phi/dR/dphi(R(,phi,t))
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    isList= isinstance(Pot,list)
+    if isList:
+        isAxis= [not p.isNonAxi for p in Pot]
+        nonAxi= not nu.prod(nu.array(isAxis))
+    else:
+        nonAxi= Pot.isNonAxi
+    if nonAxi and phi is None:
+        raise PotentialError("The (list of) planarPotential instances is non-axisymmetric, but you did not provide phi")
+    if isinstance(Pot,list):
+        sum= 0.
+        for pot in Pot:
+            if nonAxi:
+                sum+= pot.Rphideriv(R,phi=phi,t=t)
+            else:
+                sum+= pot.Rphideriv(R,t=t)
+        return sum
+    elif isinstance(Pot,planarPotential):
+        if nonAxi:
+            return Pot.Rphideriv(R,phi=phi,t=t)
+        else:
+            return Pot.Rphideriv(R,t=t)
+    else:
+        raise TypeError("Input to 'evaluateplanarRphiderivs' is neither a Potential-instance or a list of such instances")
+
 def plotplanarPotentials(Pot,*args,**kwargs):
     """
     NAME:
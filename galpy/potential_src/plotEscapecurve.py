@@ -88,16 +88,7 @@ def calcEscapecurve(Pot,Rs):
     except TypeError:
         grid=1
         Rs= nu.array([Rs])
-    esccurve= nu.zeros(grid)
-    from planarPotential import evaluateplanarPotentials
-    for ii in range(grid):
-        try:
-            esccurve[ii]= nu.sqrt(2.*(evaluateplanarPotentials(_INF,Pot)-evaluateplanarPotentials(Rs[ii],Pot)))
-        except TypeError:
-            from planarPotential import RZToplanarPotential
-            Pot= RZToplanarPotential(Pot)
-            esccurve[ii]= nu.sqrt(2.*(evaluateplanarPotentials(_INF,Pot)-evaluateplanarPotentials(Rs[ii],Pot)))
-    return esccurve
+    return vesc(Pot,nu.array(Rs,dtype='float64'))
 
 def vesc(Pot,R):
     """
@@ -124,12 +115,17 @@ def vesc(Pot,R):
 
        2011-10-09 - Written - Bovy (IAS)
 
+       2026-10-19 - Vectorized, using Phi(infinity) from Phiinf - agent (local)
+
     """
-    from planarPotential import evaluateplanarPotentials
-    try:
-        return nu.sqrt(2.*(evaluateplanarPotentials(_INF,Pot)-evaluateplanarPotentials(R,Pot)))
-    except TypeError:
-        from planarPotential import RZToplanarPotential
-        Pot= RZToplanarPotential(Pot)
-        return nu.sqrt(2.*(evaluateplanarPotentials(_INF,Pot)-evaluateplanarPotentials(R,Pot)))
+    from Potential import Phiinf
+    from planarPotential import evaluateplanarPotentials, RZToplanarPotential
+    from interpRotcurve import _evaluateScalar
+    Pot= RZToplanarPotential(Pot)
+    if isinstance(R,nu.ndarray):
+        PhiR= _evaluateScalar(lambda p,x: evaluateplanarPotentials(x,p),
+                              Pot,R.flatten()).reshape(R.shape)
+    else:
+        PhiR= evaluateplanarPotentials(R,Pot)
+    return nu.sqrt(2.*(Phiinf(Pot)-PhiR))
         
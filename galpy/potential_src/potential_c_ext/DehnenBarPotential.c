@@ -107,3 +107,43 @@ double DehnenBarPotentialRphideriv(double R,double phi,double t,
   else
     return -6.*amp*af*smooth*sin(2.*(phi-omegab*t-barphi))*pow(rb/R,3.)/R;
 }
+//3D version, evaluated at r= sqrt(R^2+Z^2)
+double DehnenBarPotentialFullRforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRforce(&DehnenBarPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullzforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzforce(&DehnenBarPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullphiforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphiforce(&DehnenBarPotentialphiforce,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullR2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullR2deriv(&DehnenBarPotentialRforce,
+			     &DehnenBarPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullz2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullz2deriv(&DehnenBarPotentialRforce,
+			     &DehnenBarPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullRzderiv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRzderiv(&DehnenBarPotentialRforce,
+			     &DehnenBarPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullphi2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphi2deriv(&DehnenBarPotentialphi2deriv,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullRphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRphideriv(&DehnenBarPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
+double DehnenBarPotentialFullzphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzphideriv(&DehnenBarPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
@@ -98,4 +98,44 @@ double EllipticalDiskPotentialRphideriv(double R,double phi,double t,
   smooth= EllipticalDiskSmooth(t,tform,tsteady);
   return - amp * smooth * p * twophio * pow(R,p-1.)
     * sin( 2. * ( phi - phib ) );
-} 
+}
+//3D version, evaluated at r= sqrt(R^2+Z^2)
+double EllipticalDiskPotentialFullRforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRforce(&EllipticalDiskPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullzforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzforce(&EllipticalDiskPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullphiforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphiforce(&EllipticalDiskPotentialphiforce,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullR2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullR2deriv(&EllipticalDiskPotentialRforce,
+			     &EllipticalDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullz2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullz2deriv(&EllipticalDiskPotentialRforce,
+			     &EllipticalDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullRzderiv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRzderiv(&EllipticalDiskPotentialRforce,
+			     &EllipticalDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullphi2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphi2deriv(&EllipticalDiskPotentialphi2deriv,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullRphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRphideriv(&EllipticalDiskPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
+double EllipticalDiskPotentialFullzphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzphideriv(&EllipticalDiskPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
@@ -2,6 +2,16 @@
 #include <galpy_potentials.h>
 //HernquistPotential
 //2 arguments: amp, a
+double HernquistPotentialEval(double R,double Z, double phi,
+			      double t,
+			      int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate potential
+  double sqrtRz= sqrt(R*R+Z*Z);
+  return - amp / (1. + sqrtRz / a );
+}
 double HernquistPotentialRforce(double R,double Z, double phi,
 				double t,
 				int nargs, double *args){
@@ -40,3 +50,34 @@ double HernquistPotentialPlanarR2deriv(double R,double phi,
   //Calculate R2deriv
   return -2. * amp / a / a * pow(1. + R / a, -3. );
 }
+//Second derivatives from dPhi/dr and d2Phi/dr2
+static void HernquistPotentialDerivs(double R,double Z,int nargs,double *args,
+                                     double *r,double *dPhi,double *d2Phi){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  *r= sqrt(R*R+Z*Z);
+  *dPhi= amp * a * pow(a + *r,-2.);
+  *d2Phi= -2. * amp * a * pow(a + *r,-3.);
+}
+double HernquistPotentialR2deriv(double R,double Z, double phi,
+                                 double t,
+                                 int nargs, double *args){
+  double r,dPhi,d2Phi;
+  HernquistPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * R * R / r / r + dPhi * Z * Z / r / r / r;
+}
+double HernquistPotentialz2deriv(double R,double Z, double phi,
+                                 double t,
+                                 int nargs, double *args){
+  double r,dPhi,d2Phi;
+  HernquistPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * Z * Z / r / r + dPhi * R * R / r / r / r;
+}
+double HernquistPotentialRzderiv(double R,double Z, double phi,
+                                 double t,
+                                 int nargs, double *args){
+  double r,dPhi,d2Phi;
+  HernquistPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return ( d2Phi - dPhi / r ) * R * Z / r / r;
+}
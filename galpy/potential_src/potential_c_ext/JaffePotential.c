@@ -2,6 +2,16 @@
 #include <galpy_potentials.h>
 //JaffePotential
 //2 arguments: amp, a
+double JaffePotentialEval(double R,double Z, double phi,
+			  double t,
+			  int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate potential
+  double sqrtRz= sqrt(R*R+Z*Z);
+  return - amp * log(1. + a / sqrtRz );
+}
 double JaffePotentialRforce(double R,double Z, double phi,
 				double t,
 				int nargs, double *args){
@@ -40,3 +50,34 @@ double JaffePotentialPlanarR2deriv(double R,double phi,
   //Calculate R2deriv
   return - amp * a * (a + 2. * R) * pow(R,-4.) * pow(1.+a/R,-2.);
 }
+//Second derivatives from dPhi/dr and d2Phi/dr2
+static void JaffePotentialDerivs(double R,double Z,int nargs,double *args,
+                                 double *r,double *dPhi,double *d2Phi){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  *r= sqrt(R*R+Z*Z);
+  *dPhi= amp * a / *r / (*r + a);
+  *d2Phi= - amp * a * (2. * *r + a) / *r / *r / (*r + a) / (*r + a);
+}
+double JaffePotentialR2deriv(double R,double Z, double phi,
+                             double t,
+                             int nargs, double *args){
+  double r,dPhi,d2Phi;
+  JaffePotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * R * R / r / r + dPhi * Z * Z / r / r / r;
+}
+double JaffePotentialz2deriv(double R,double Z, double phi,
+                             double t,
+                             int nargs, double *args){
+  double r,dPhi,d2Phi;
+  JaffePotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * Z * Z / r / r + dPhi * R * R / r / r / r;
+}
+double JaffePotentialRzderiv(double R,double Z, double phi,
+                             double t,
+                             int nargs, double *args){
+  double r,dPhi,d2Phi;
+  JaffePotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return ( d2Phi - dPhi / r ) * R * Z / r / r;
+}
@@ -1,6 +1,18 @@
+#include <math.h>
 #include <galpy_potentials.h>
 //LogarithmicHaloPotential
 //3 (2)  arguments: amp, c2, (and q)
+double LogarithmicHaloPotentialEval(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double q= *args++;
+  double c= *args;
+  //Calculate potential
+  double zq= Z/q;
+  return 0.5 * amp * log(R*R+zq*zq+c);
+}
 double LogarithmicHaloPotentialRforce(double R,double Z, double phi,
 				      double t,
 				      int nargs, double *args){
@@ -41,3 +53,39 @@ double LogarithmicHaloPotentialPlanarR2deriv(double R,double phi,
   //Calculate Rforce
   return amp * (1.- 2.*R*R/(R*R+c))/(R*R+c);
 }
+double LogarithmicHaloPotentialR2deriv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double q= *args++;
+  double c= *args;
+  //Calculate R2deriv
+  double zq= Z/q;
+  double denom= R*R+zq*zq+c;
+  return amp * (1.- 2.*R*R/denom)/denom;
+}
+double LogarithmicHaloPotentialz2deriv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double q= *args++;
+  double c= *args;
+  //Calculate z2deriv
+  double zq= Z/q;
+  double denom= R*R+zq*zq+c;
+  return amp * (1.- 2.*zq*zq/denom)/denom/q/q;
+}
+double LogarithmicHaloPotentialRzderiv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double q= *args++;
+  double c= *args;
+  //Calculate Rzderiv
+  double zq= Z/q;
+  double denom= R*R+zq*zq+c;
+  return - 2. * amp * R * Z / q / q / denom / denom;
+}
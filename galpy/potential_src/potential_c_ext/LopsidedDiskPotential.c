@@ -98,4 +98,44 @@ double LopsidedDiskPotentialRphideriv(double R,double phi,double t,
   smooth= LopsidedDiskSmooth(t,tform,tsteady);
   return - amp * smooth * p * phio * pow(R,p-1.)
     * sin( phi - phib );
-} 
+}
+//3D version, evaluated at r= sqrt(R^2+Z^2)
+double LopsidedDiskPotentialFullRforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRforce(&LopsidedDiskPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullzforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzforce(&LopsidedDiskPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullphiforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphiforce(&LopsidedDiskPotentialphiforce,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullR2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullR2deriv(&LopsidedDiskPotentialRforce,
+			     &LopsidedDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullz2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullz2deriv(&LopsidedDiskPotentialRforce,
+			     &LopsidedDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullRzderiv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRzderiv(&LopsidedDiskPotentialRforce,
+			     &LopsidedDiskPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullphi2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphi2deriv(&LopsidedDiskPotentialphi2deriv,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullRphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRphideriv(&LopsidedDiskPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
+double LopsidedDiskPotentialFullzphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzphideriv(&LopsidedDiskPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
@@ -2,6 +2,17 @@
 #include <galpy_potentials.h>
 //Miyamoto-Nagai potential
 //3 arguments: amp, a, b
+double MiyamotoNagaiPotentialEval(double R,double z, double phi,
+				  double t,
+				  int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //Calculate potential
+  double asqrtbz= a+sqrt(z*z+b*b);
+  return - amp / sqrt(R*R+asqrtbz*asqrtbz);
+}
 double MiyamotoNagaiPotentialRforce(double R,double z, double phi,
 				    double t,
 				    int nargs, double *args){
@@ -46,6 +57,47 @@ double MiyamotoNagaiPotentialPlanarR2deriv(double R,double phi,
   double b= *args;
   //calculate R2deriv
   double denom= R*R+pow(a+b,2.);
-  return pow(denom,-1.5) - 3. * R * R * pow(denom,-2.5);
+  return amp * ( pow(denom,-1.5) - 3. * R * R * pow(denom,-2.5) );
+}
+double MiyamotoNagaiPotentialR2deriv(double R,double z, double phi,
+				     double t,
+				     int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate R2deriv
+  double asqrtbz= a+pow(z*z+b*b,0.5);
+  double denom= R*R+asqrtbz*asqrtbz;
+  return amp * ( pow(denom,-1.5) - 3. * R * R * pow(denom,-2.5) );
+}
+double MiyamotoNagaiPotentialz2deriv(double R,double z, double phi,
+				     double t,
+				     int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate z2deriv
+  double sqrtbz= pow(z*z+b*b,0.5);
+  double asqrtbz= a+sqrtbz;
+  double denom= R*R+asqrtbz*asqrtbz;
+  return amp * ( ( asqrtbz / sqrtbz + z * z / sqrtbz / sqrtbz
+		   - z * z * asqrtbz / sqrtbz / sqrtbz / sqrtbz )
+		 * pow(denom,-1.5)
+		 - 3. * z * z * asqrtbz * asqrtbz / sqrtbz / sqrtbz
+		 * pow(denom,-2.5) );
+}
+double MiyamotoNagaiPotentialRzderiv(double R,double z, double phi,
+				     double t,
+				     int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args++;
+  double b= *args;
+  //calculate Rzderiv
+  double sqrtbz= pow(z*z+b*b,0.5);
+  double asqrtbz= a+sqrtbz;
+  return - 3. * amp * R * z * asqrtbz / sqrtbz
+    * pow(R*R+asqrtbz*asqrtbz,-2.5);
 }
-
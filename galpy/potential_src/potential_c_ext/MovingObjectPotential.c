@@ -0,0 +1,189 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//MovingObjectPotential with Plummer softening
+//arguments: amp, GM, softening_length, nt, t[nt], x[nt], y[nt], z[nt],
+//vx[nt], vy[nt], vz[nt], followed by a 4-element cache [t,x,y,z] of the
+//last evaluated position (initialized to NaN)
+static void MovingObjectPotentialPosition(double t,int nargs,double *args,
+					  double *x,double *y,double *z){
+  int nt= (int) *(args+3);
+  double *ts= args+4;
+  double *xyz= ts+nt;
+  double *vxyz= ts+4*nt;
+  double *cache= args+nargs-4;
+  int lo,hi,mid,ii;
+  double h,s,s2,s3,h00,h10,h01,h11;
+  double out[3];
+  if ( *cache == t ) {
+    *x= *(cache+1);
+    *y= *(cache+2);
+    *z= *(cache+3);
+    return;
+  }
+  if ( t <= *ts )
+    for (ii=0; ii < 3; ii++)
+      out[ii]= *(xyz+ii*nt)+*(vxyz+ii*nt)*(t-*ts);
+  else if ( t >= *(ts+nt-1) )
+    for (ii=0; ii < 3; ii++)
+      out[ii]= *(xyz+ii*nt+nt-1)+*(vxyz+ii*nt+nt-1)*(t-*(ts+nt-1));
+  else {
+    //Bisect for the tabulated interval containing t
+    lo= 0;
+    hi= nt-1;
+    while ( hi-lo > 1 ) {
+      mid= (lo+hi)/2;
+      if ( *(ts+mid) > t ) hi= mid;
+      else lo= mid;
+    }
+    h= *(ts+hi)-*(ts+lo);
+    s= (t-*(ts+lo))/h;
+    s2= s*s;
+    s3= s2*s;
+    h00= 2.*s3-3.*s2+1.;
+    h10= (s3-2.*s2+s)*h;
+    h01= -2.*s3+3.*s2;
+    h11= (s3-s2)*h;
+    for (ii=0; ii < 3; ii++)
+      out[ii]= h00 * *(xyz+ii*nt+lo)+h10 * *(vxyz+ii*nt+lo)
+	+h01 * *(xyz+ii*nt+hi)+h11 * *(vxyz+ii*nt+hi);
+  }
+  *cache= t;
+  *x= *(cache+1)= out[0];
+  *y= *(cache+2)= out[1];
+  *z= *(cache+3)= out[2];
+}
+static double MovingObjectPotentialForceAmp(double R,double Z,double phi,
+					    double t,int nargs,double *args,
+					    double *xd,double *yd,double *zd){
+  //Get args
+  double amp= *args;
+  double GM= *(args+1);
+  double soft2= *(args+2) * *(args+2);
+  double x,y,z,d2;
+  MovingObjectPotentialPosition(t,nargs,args,&x,&y,&z);
+  *xd= x-R*cos(phi);
+  *yd= y-R*sin(phi);
+  *zd= z-Z;
+  d2= *xd * *xd + *yd * *yd + *zd * *zd;
+  return amp * GM * pow(d2+soft2,-1.5);
+}
+double MovingObjectPotentialRforce(double R,double Z, double phi,
+				   double t,
+				   int nargs, double *args){
+  double xd,yd,zd;
+  double f= MovingObjectPotentialForceAmp(R,Z,phi,t,nargs,args,&xd,&yd,&zd);
+  return f * ( cos(phi) * xd + sin(phi) * yd );
+}
+double MovingObjectPotentialzforce(double R,double Z, double phi,
+				   double t,
+				   int nargs, double *args){
+  double xd,yd,zd;
+  double f= MovingObjectPotentialForceAmp(R,Z,phi,t,nargs,args,&xd,&yd,&zd);
+  return f * zd;
+}
+double MovingObjectPotentialphiforce(double R,double Z, double phi,
+				     double t,
+				     int nargs, double *args){
+  double xd,yd,zd;
+  double f= MovingObjectPotentialForceAmp(R,Z,phi,t,nargs,args,&xd,&yd,&zd);
+  return f * R * ( cos(phi) * yd - sin(phi) * xd );
+}
+/*
+  Cylindrical second derivatives of a Plummer-softened object at
+  rectangular offset (xd,yd,zd), whose rectangular Hessian is
+  a delta_ij - b xd_i xd_j; out= [RR,zz,Rz,phiphi,Rphi,zphi]
+*/
+void PlummerCylHessian(double a,double b,double xd,double yd,double zd,
+		       double R,double phi,double *out){
+  double cp= cos(phi);
+  double sp= sin(phi);
+  double dR= cp*xd+sp*yd;
+  double dp= cp*yd-sp*xd;
+  *out+= a-b*dR*dR;
+  *(out+1)+= a-b*zd*zd;
+  *(out+2)+= -b*dR*zd;
+  *(out+3)+= R*R*(a-b*dp*dp)+R*a*dR;
+  *(out+4)+= -R*b*dR*dp-a*dp;
+  *(out+5)+= -R*b*dp*zd;
+}
+static void MovingObjectPotentialHessian(double R,double Z,double phi,
+					 double t,int nargs,double *args,
+					 double *out){
+  double xd,yd,zd,a,s2;
+  double soft2= *(args+2) * *(args+2);
+  int ii;
+  a= MovingObjectPotentialForceAmp(R,Z,phi,t,nargs,args,&xd,&yd,&zd);
+  s2= xd*xd+yd*yd+zd*zd+soft2;
+  for (ii=0; ii < 6; ii++) *(out+ii)= 0.;
+  PlummerCylHessian(a,3.*a/s2,xd,yd,zd,R,phi,out);
+}
+double MovingObjectPotentialR2deriv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[0];
+}
+double MovingObjectPotentialz2deriv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[1];
+}
+double MovingObjectPotentialRzderiv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[2];
+}
+double MovingObjectPotentialphi2deriv(double R,double Z, double phi,
+				      double t,
+				      int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[3];
+}
+double MovingObjectPotentialRphideriv(double R,double Z, double phi,
+				      double t,
+				      int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[4];
+}
+double MovingObjectPotentialzphideriv(double R,double Z, double phi,
+				      double t,
+				      int nargs, double *args){
+  double out[6];
+  MovingObjectPotentialHessian(R,Z,phi,t,nargs,args,out);
+  return out[5];
+}
+/*
+  Planar (z=0) forces and second derivatives
+*/
+double MovingObjectPotentialPlanarRforce(double R,double phi,
+					 double t,
+					 int nargs, double *args){
+  return MovingObjectPotentialRforce(R,0.,phi,t,nargs,args);
+}
+double MovingObjectPotentialPlanarphiforce(double R,double phi,
+					   double t,
+					   int nargs, double *args){
+  return MovingObjectPotentialphiforce(R,0.,phi,t,nargs,args);
+}
+double MovingObjectPotentialPlanarR2deriv(double R,double phi,
+					  double t,
+					  int nargs, double *args){
+  return MovingObjectPotentialR2deriv(R,0.,phi,t,nargs,args);
+}
+double MovingObjectPotentialPlanarphi2deriv(double R,double phi,
+					    double t,
+					    int nargs, double *args){
+  return MovingObjectPotentialphi2deriv(R,0.,phi,t,nargs,args);
+}
+double MovingObjectPotentialPlanarRphideriv(double R,double phi,
+					    double t,
+					    int nargs, double *args){
+  return MovingObjectPotentialRphideriv(R,0.,phi,t,nargs,args);
+}
@@ -0,0 +1,201 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//MovingObjectsPotential: collection of Plummer-softened moving objects
+//arguments: amp, nobj, nt, rcut (<= 0 for no cut), GM[nobj], soft[nobj],
+//t[nt], xyz[nt,3,nobj], vxyz[nt,3,nobj], followed by a cache of the
+//positions [t,pos[3,nobj]], of the second derivatives
+//[R,z,phi,t,RR,zz,Rz,phiphi,Rphi,zphi], and of the force
+//[R,z,phi,t,FR,Fz,Fphi] (all initialized to NaN)
+static double * MovingObjectsPotentialPositions(double t,int nargs,
+						double *args){
+  int nobj= (int) *(args+1);
+  int nt= (int) *(args+2);
+  double *ts= args+4+2*nobj;
+  double *xyz= ts+nt;
+  double *vxyz= xyz+3*nobj*nt;
+  double *cache= vxyz+3*nobj*nt;
+  double *pos= cache+1;
+  int lo,hi,mid,ii;
+  double h,s,s2,s3,h00,h10,h01,h11,dt;
+  if ( *cache == t ) return pos;
+  if ( t <= *ts ) {
+    dt= t-*ts;
+    for (ii=0; ii < 3*nobj; ii++)
+      *(pos+ii)= *(xyz+ii)+*(vxyz+ii)*dt;
+  }
+  else if ( t >= *(ts+nt-1) ) {
+    dt= t-*(ts+nt-1);
+    for (ii=0; ii < 3*nobj; ii++)
+      *(pos+ii)= *(xyz+(nt-1)*3*nobj+ii)+*(vxyz+(nt-1)*3*nobj+ii)*dt;
+  }
+  else {
+    //Bisect for the tabulated interval containing t
+    lo= 0;
+    hi= nt-1;
+    while ( hi-lo > 1 ) {
+      mid= (lo+hi)/2;
+      if ( *(ts+mid) > t ) hi= mid;
+      else lo= mid;
+    }
+    h= *(ts+hi)-*(ts+lo);
+    s= (t-*(ts+lo))/h;
+    s2= s*s;
+    s3= s2*s;
+    h00= 2.*s3-3.*s2+1.;
+    h10= (s3-2.*s2+s)*h;
+    h01= -2.*s3+3.*s2;
+    h11= (s3-s2)*h;
+    for (ii=0; ii < 3*nobj; ii++)
+      *(pos+ii)= h00 * *(xyz+lo*3*nobj+ii)+h10 * *(vxyz+lo*3*nobj+ii)
+	+h01 * *(xyz+hi*3*nobj+ii)+h11 * *(vxyz+hi*3*nobj+ii);
+  }
+  *cache= t;
+  return pos;
+}
+static double * MovingObjectsPotentialForces(double R,double Z,double phi,
+					     double t,int nargs,
+					     double *args){
+  double amp= *args;
+  int nobj= (int) *(args+1);
+  double rcut2= *(args+3) * *(args+3);
+  double *GM= args+4;
+  double *soft= args+4+nobj;
+  double *fcache= args+nargs-7;
+  double *pos;
+  double x,y,xd,yd,zd,d2,f,cp,sp;
+  double Fx= 0.,Fy= 0.,Fz= 0.;
+  int ii;
+  if ( *fcache == R && *(fcache+1) == Z && *(fcache+2) == phi
+       && *(fcache+3) == t )
+    return fcache+4;
+  pos= MovingObjectsPotentialPositions(t,nargs,args);
+  cp= cos(phi);
+  sp= sin(phi);
+  x= R*cp;
+  y= R*sp;
+  for (ii=0; ii < nobj; ii++){
+    xd= *(pos+ii)-x;
+    yd= *(pos+nobj+ii)-y;
+    zd= *(pos+2*nobj+ii)-Z;
+    d2= xd*xd+yd*yd+zd*zd;
+    if ( *(args+3) > 0. && d2 > rcut2 ) continue;
+    f= *(GM+ii) * pow(d2 + *(soft+ii) * *(soft+ii),-1.5);
+    Fx+= f*xd;
+    Fy+= f*yd;
+    Fz+= f*zd;
+  }
+  *fcache= R;
+  *(fcache+1)= Z;
+  *(fcache+2)= phi;
+  *(fcache+3)= t;
+  *(fcache+4)= amp * ( cp*Fx+sp*Fy );
+  *(fcache+5)= amp * Fz;
+  *(fcache+6)= amp * R * ( cp*Fy-sp*Fx );
+  return fcache+4;
+}
+double MovingObjectsPotentialRforce(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  return *MovingObjectsPotentialForces(R,Z,phi,t,nargs,args);
+}
+double MovingObjectsPotentialzforce(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  return *(MovingObjectsPotentialForces(R,Z,phi,t,nargs,args)+1);
+}
+double MovingObjectsPotentialphiforce(double R,double Z, double phi,
+				      double t,
+				      int nargs, double *args){
+  return *(MovingObjectsPotentialForces(R,Z,phi,t,nargs,args)+2);
+}
+static double * MovingObjectsPotentialHessian(double R,double Z,double phi,
+						double t,int nargs,
+						double *args){
+  double amp= *args;
+  int nobj= (int) *(args+1);
+  double rcut2= *(args+3) * *(args+3);
+  double *GM= args+4;
+  double *soft= args+4+nobj;
+  double *hcache= args+nargs-17;
+  double *pos;
+  double xd,yd,zd,d2,s2,a;
+  int ii;
+  if ( *hcache == R && *(hcache+1) == Z && *(hcache+2) == phi
+       && *(hcache+3) == t )
+    return hcache+4;
+  pos= MovingObjectsPotentialPositions(t,nargs,args);
+  for (ii=0; ii < 6; ii++) *(hcache+4+ii)= 0.;
+  for (ii=0; ii < nobj; ii++){
+    xd= *(pos+ii)-R*cos(phi);
+    yd= *(pos+nobj+ii)-R*sin(phi);
+    zd= *(pos+2*nobj+ii)-Z;
+    d2= xd*xd+yd*yd+zd*zd;
+    if ( *(args+3) > 0. && d2 > rcut2 ) continue;
+    s2= d2 + *(soft+ii) * *(soft+ii);
+    a= amp * *(GM+ii) * pow(s2,-1.5);
+    PlummerCylHessian(a,3.*a/s2,xd,yd,zd,R,phi,hcache+4);
+  }
+  *hcache= R;
+  *(hcache+1)= Z;
+  *(hcache+2)= phi;
+  *(hcache+3)= t;
+  return hcache+4;
+}
+double MovingObjectsPotentialR2deriv(double R,double Z, double phi,
+				     double t,
+				     int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+0);
+}
+double MovingObjectsPotentialz2deriv(double R,double Z, double phi,
+				     double t,
+				     int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+1);
+}
+double MovingObjectsPotentialRzderiv(double R,double Z, double phi,
+				     double t,
+				     int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+2);
+}
+double MovingObjectsPotentialphi2deriv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+3);
+}
+double MovingObjectsPotentialRphideriv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+4);
+}
+double MovingObjectsPotentialzphideriv(double R,double Z, double phi,
+				       double t,
+				       int nargs, double *args){
+  return *(MovingObjectsPotentialHessian(R,Z,phi,t,nargs,args)+5);
+}
+/*
+  Planar (z=0) forces and second derivatives
+*/
+double MovingObjectsPotentialPlanarRforce(double R,double phi,
+					  double t,
+					  int nargs, double *args){
+  return MovingObjectsPotentialRforce(R,0.,phi,t,nargs,args);
+}
+double MovingObjectsPotentialPlanarphiforce(double R,double phi,
+					    double t,
+					    int nargs, double *args){
+  return MovingObjectsPotentialphiforce(R,0.,phi,t,nargs,args);
+}
+double MovingObjectsPotentialPlanarR2deriv(double R,double phi,
+					   double t,
+					   int nargs, double *args){
+  return MovingObjectsPotentialR2deriv(R,0.,phi,t,nargs,args);
+}
+double MovingObjectsPotentialPlanarphi2deriv(double R,double phi,
+					     double t,
+					     int nargs, double *args){
+  return MovingObjectsPotentialphi2deriv(R,0.,phi,t,nargs,args);
+}
+double MovingObjectsPotentialPlanarRphideriv(double R,double phi,
+					     double t,
+					     int nargs, double *args){
+  return MovingObjectsPotentialRphideriv(R,0.,phi,t,nargs,args);
+}
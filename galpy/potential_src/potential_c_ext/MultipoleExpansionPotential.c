@@ -0,0 +1,261 @@
+#include <stdlib.h>
+#include <math.h>
+#include <galpy_potentials.h>
+//MultipoleExpansionPotential
+//arguments: amp, lmax, mmax, nr, lnrmin, dlnr, followed by, for each
+//(l,m,cos/sin) term (l=0..lmax, m=0..min(l,mmax), cos before sin),
+//Phi_lm, dPhi_lm/dlnr, and d^2Phi_lm/dlnr^2 on the ln r grid
+static void MultipoleExpansionPotentialRadial(double r,int l,int nr,
+					      double lnrmin,double dlnr,
+					      double *phi,double *dphi,
+					      double *d2phi,
+					      double *f,double *fr,
+					      double *frr){
+  double lnr= log(r);
+  double s= (lnr-lnrmin)/dlnr;
+  double x,t,t2,t3,t4,t5,tf,tfu,tfuu;
+  int k;
+  if ( s > nr-1 ) { //Exterior multipole
+    x= exp(lnrmin+dlnr*(nr-1))/r;
+    *f= *(phi+nr-1)*pow(x,l+1);
+    *fr= -(l+1)* *f/r;
+    *frr= (l+1)*(l+2)* *f/r/r;
+  }
+  else if ( s < 0. ) { //Interior multipole, harmonic core for l=0
+    x= r/exp(lnrmin);
+    if ( l == 0 ) {
+      *f= *phi+0.5* *dphi*(x*x-1.);
+      *fr= *dphi*x/r*x;
+      *frr= *dphi*x*x/r/r;
+    }
+    else {
+      *f= *phi*pow(x,l);
+      *fr= l* *f/r;
+      *frr= l*(l-1)* *f/r/r;
+    }
+  }
+  else { //Quintic Hermite interpolation
+    k= (int) floor(s);
+    if ( k > nr-2 ) k= nr-2;
+    t= s-k;
+    t2= t*t;
+    t3= t2*t;
+    t4= t3*t;
+    t5= t4*t;
+    tf= (1.-10.*t3+15.*t4-6.*t5) * *(phi+k)
+      +(t-6.*t3+8.*t4-3.*t5) * dlnr * *(dphi+k)
+      +(0.5*t2-1.5*t3+1.5*t4-0.5*t5) * dlnr*dlnr * *(d2phi+k)
+      +(0.5*t3-t4+0.5*t5) * dlnr*dlnr * *(d2phi+k+1)
+      +(-4.*t3+7.*t4-3.*t5) * dlnr * *(dphi+k+1)
+      +(10.*t3-15.*t4+6.*t5) * *(phi+k+1);
+    tfu= ((-30.*t2+60.*t3-30.*t4) * *(phi+k)
+	  +(1.-18.*t2+32.*t3-15.*t4) * dlnr * *(dphi+k)
+	  +(t-4.5*t2+6.*t3-2.5*t4) * dlnr*dlnr * *(d2phi+k)
+	  +(1.5*t2-4.*t3+2.5*t4) * dlnr*dlnr * *(d2phi+k+1)
+	  +(-12.*t2+28.*t3-15.*t4) * dlnr * *(dphi+k+1)
+	  +(30.*t2-60.*t3+30.*t4) * *(phi+k+1))/dlnr;
+    tfuu= ((-60.*t+180.*t2-120.*t3) * *(phi+k)
+	   +(-36.*t+96.*t2-60.*t3) * dlnr * *(dphi+k)
+	   +(1.-9.*t+18.*t2-10.*t3) * dlnr*dlnr * *(d2phi+k)
+	   +(3.*t-12.*t2+10.*t3) * dlnr*dlnr * *(d2phi+k+1)
+	   +(-24.*t+84.*t2-60.*t3) * dlnr * *(dphi+k+1)
+	   +(60.*t-180.*t2+120.*t3) * *(phi+k+1))/dlnr/dlnr;
+    *f= tf;
+    *fr= tfu/r;
+    *frr= (tfuu-tfu)/r/r;
+  }
+}
+/*
+  Evaluate the derivatives of the potential wrt (r,x=cos(theta),phi);
+  out= [Phi_r,Phi_x,Phi_phi,Phi_rr,Phi_rphi,Phi_phiphi,Phi_rx,Phi_xx,
+        Phi_xphi]
+*/
+static void MultipoleExpansionPotentialDerivs(double r,double x,double phi,
+					      int nargs,double *args,
+					      double *out){
+  double amp= *args++;
+  int lmax= (int) *args++;
+  int mmax= (int) *args++;
+  int nr= (int) *args++;
+  double lnrmin= *args++;
+  double dlnr= *args++;
+  int l,m,ii,sc;
+  double f,fr,frr,P,dP,d2P,T,dT,d2T,alm,alm1,c;
+  double omx2= 1.-x*x;
+  double omx2d= (omx2 < 1e-14) ? 1e-14: omx2;
+  double sintheta= sqrt(omx2);
+  double * Plm= (double *) malloc ( (lmax+1) * (mmax+1) * sizeof(double) );
+  double Pmm= 1./sqrt(4.*M_PI);
+  //Orthonormalized associated Legendre functions, Plm[l*(mmax+1)+m]
+  for (m=0; m <= mmax; m++){
+    if ( m > 0 ) Pmm*= sqrt((2.*m+1.)/2./m)*sintheta;
+    *(Plm+m*(mmax+1)+m)= Pmm;
+    if ( m < lmax ) *(Plm+(m+1)*(mmax+1)+m)= sqrt(2.*m+3.)*x*Pmm;
+    for (l=m+2; l <= lmax; l++){
+      alm= sqrt((4.*l*l-1.)/(l*l-m*m));
+      alm1= sqrt((4.*(l-1.)*(l-1.)-1.)/((l-1.)*(l-1.)-m*m));
+      *(Plm+l*(mmax+1)+m)= alm*(x * *(Plm+(l-1)*(mmax+1)+m)
+				- *(Plm+(l-2)*(mmax+1)+m)/alm1);
+    }
+  }
+  for (ii=0; ii < 9; ii++) *(out+ii)= 0.;
+  for (l=0; l <= lmax; l++){
+    for (m=0; m <= ( l < mmax ? l : mmax ); m++){
+      P= *(Plm+l*(mmax+1)+m);
+      if ( l > m ) {
+	c= sqrt((2.*l+1.)/(2.*l-1.)*(l*l-m*m));
+	dP= (-l*x*P+c * *(Plm+(l-1)*(mmax+1)+m))/omx2d;
+      }
+      else
+	dP= -l*x*P/omx2d;
+      //Associated Legendre equation
+      d2P= (2.*x*dP-(l*(l+1.)-m*m/omx2d)*P)/omx2d;
+      for (sc=0; sc < ( m > 0 ? 2 : 1 ); sc++){
+	MultipoleExpansionPotentialRadial(r,l,nr,lnrmin,dlnr,
+					  args,args+nr,args+2*nr,
+					  &f,&fr,&frr);
+	args+= 3*nr;
+	if ( m == 0 ) {
+	  T= 1.;
+	  dT= 0.;
+	  d2T= 0.;
+	}
+	else if ( sc == 0 ) {
+	  T= M_SQRT2*cos(m*phi);
+	  dT= -M_SQRT2*m*sin(m*phi);
+	  d2T= -m*m*T;
+	}
+	else {
+	  T= M_SQRT2*sin(m*phi);
+	  dT= M_SQRT2*m*cos(m*phi);
+	  d2T= -m*m*T;
+	}
+	*out+= fr*P*T;
+	*(out+1)+= f*dP*T;
+	*(out+2)+= f*P*dT;
+	*(out+3)+= frr*P*T;
+	*(out+4)+= fr*P*dT;
+	*(out+5)+= f*P*d2T;
+	*(out+6)+= fr*dP*T;
+	*(out+7)+= f*d2P*T;
+	*(out+8)+= f*dP*dT;
+      }
+    }
+  }
+  for (ii=0; ii < 9; ii++) *(out+ii)*= amp;
+  free(Plm);
+}
+double MultipoleExpansionPotentialRforce(double R,double z, double phi,
+					 double t,
+					 int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return -out[0]*R/r+out[1]*z*R/r/r/r;
+}
+double MultipoleExpansionPotentialzforce(double R,double z, double phi,
+					 double t,
+					 int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return -out[0]*z/r-out[1]*R*R/r/r/r;
+}
+double MultipoleExpansionPotentialphiforce(double R,double z, double phi,
+					   double t,
+					   int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return -out[2];
+}
+double MultipoleExpansionPotentialR2deriv(double R,double z, double phi,
+					  double t,
+					  int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  double rR= R/r, xR= -z*R/r/r/r;
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[3]*rR*rR+2.*out[6]*rR*xR+out[7]*xR*xR
+    +out[0]*z*z/r/r/r+out[1]*z*(2.*R*R-z*z)/r/r/r/r/r;
+}
+double MultipoleExpansionPotentialz2deriv(double R,double z, double phi,
+					  double t,
+					  int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  double rz= z/r, xz= R*R/r/r/r;
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[3]*rz*rz+2.*out[6]*rz*xz+out[7]*xz*xz
+    +out[0]*R*R/r/r/r-3.*out[1]*z*R*R/r/r/r/r/r;
+}
+double MultipoleExpansionPotentialRzderiv(double R,double z, double phi,
+					  double t,
+					  int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  double rR= R/r, xR= -z*R/r/r/r;
+  double rz= z/r, xz= R*R/r/r/r;
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[3]*rR*rz+out[6]*(rR*xz+rz*xR)+out[7]*xR*xz
+    -out[0]*R*z/r/r/r+out[1]*R*(2.*z*z-R*R)/r/r/r/r/r;
+}
+double MultipoleExpansionPotentialphi2deriv(double R,double z, double phi,
+					    double t,
+					    int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[5];
+}
+double MultipoleExpansionPotentialRphideriv(double R,double z, double phi,
+					    double t,
+					    int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[4]*R/r-out[8]*z*R/r/r/r;
+}
+double MultipoleExpansionPotentialzphideriv(double R,double z, double phi,
+					    double t,
+					    int nargs, double *args){
+  double out[9];
+  double r= sqrt(R*R+z*z);
+  MultipoleExpansionPotentialDerivs(r,z/r,phi,nargs,args,out);
+  return out[4]*z/r+out[8]*R*R/r/r/r;
+}
+double MultipoleExpansionPotentialPlanarRforce(double R,double phi,
+					       double t,
+					       int nargs, double *args){
+  double out[9];
+  MultipoleExpansionPotentialDerivs(R,0.,phi,nargs,args,out);
+  return -out[0];
+}
+double MultipoleExpansionPotentialPlanarphiforce(double R,double phi,
+						 double t,
+						 int nargs, double *args){
+  double out[9];
+  MultipoleExpansionPotentialDerivs(R,0.,phi,nargs,args,out);
+  return -out[2];
+}
+double MultipoleExpansionPotentialPlanarR2deriv(double R,double phi,
+						double t,
+						int nargs, double *args){
+  double out[9];
+  MultipoleExpansionPotentialDerivs(R,0.,phi,nargs,args,out);
+  return out[3];
+}
+double MultipoleExpansionPotentialPlanarphi2deriv(double R,double phi,
+						  double t,
+						  int nargs, double *args){
+  double out[9];
+  MultipoleExpansionPotentialDerivs(R,0.,phi,nargs,args,out);
+  return out[5];
+}
+double MultipoleExpansionPotentialPlanarRphideriv(double R,double phi,
+						  double t,
+						  int nargs, double *args){
+  double out[9];
+  MultipoleExpansionPotentialDerivs(R,0.,phi,nargs,args,out);
+  return out[4];
+}
@@ -2,6 +2,16 @@
 #include <galpy_potentials.h>
 //NFWPotential
 //2 arguments: amp, a
+double NFWPotentialEval(double R,double Z, double phi,
+			double t,
+			int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  //Calculate potential
+  double sqrtRz= sqrt(R*R+Z*Z);
+  return - amp * log(1. + sqrtRz / a ) / sqrtRz;
+}
 double NFWPotentialRforce(double R,double Z, double phi,
 				double t,
 				int nargs, double *args){
@@ -42,5 +52,37 @@ double NFWPotentialPlanarR2deriv(double R,double phi,
   //Calculate R2deriv
   double aR= a+R;
   double aR2= aR*aR;
-  return ((R*(2.*a+3.*R))-2.*aR2*log(1.+R/a))/R/R/R/aR2;
+  return amp * ((R*(2.*a+3.*R))-2.*aR2*log(1.+R/a))/R/R/R/aR2;
+}
+//Second derivatives from dPhi/dr and d2Phi/dr2
+static void NFWPotentialDerivs(double R,double Z,int nargs,double *args,
+                               double *r,double *dPhi,double *d2Phi){
+  //Get args
+  double amp= *args++;
+  double a= *args;
+  *r= sqrt(R*R+Z*Z);
+  *dPhi= amp * ( log(1.+ *r / a) / *r / *r - 1. / *r / (a + *r) );
+  *d2Phi= amp * ( 1. / *r / *r / (a + *r) - 2. * log(1.+ *r / a) / *r / *r / *r
+	     + (a + 2. * *r) / *r / *r / (a + *r) / (a + *r) );
+}
+double NFWPotentialR2deriv(double R,double Z, double phi,
+                           double t,
+                           int nargs, double *args){
+  double r,dPhi,d2Phi;
+  NFWPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * R * R / r / r + dPhi * Z * Z / r / r / r;
+}
+double NFWPotentialz2deriv(double R,double Z, double phi,
+                           double t,
+                           int nargs, double *args){
+  double r,dPhi,d2Phi;
+  NFWPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * Z * Z / r / r + dPhi * R * R / r / r / r;
+}
+double NFWPotentialRzderiv(double R,double Z, double phi,
+                           double t,
+                           int nargs, double *args){
+  double r,dPhi,d2Phi;
+  NFWPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return ( d2Phi - dPhi / r ) * R * Z / r / r;
 }
@@ -2,6 +2,18 @@
 #include <galpy_potentials.h>
 //PowerSphericalPotential
 //2  arguments: amp, alpha
+double PowerSphericalPotentialEval(double R,double Z, double phi,
+				   double t,
+				   int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double alpha= *args;
+  //Calculate potential
+  if ( alpha == 2. )
+    return 0.5 * amp * log(R*R+Z*Z);
+  else
+    return - amp * pow(R*R+Z*Z,1.-0.5*alpha) / (alpha - 2.);
+}
 double PowerSphericalPotentialRforce(double R,double Z, double phi,
 				      double t,
 				      int nargs, double *args){
@@ -38,3 +50,34 @@ double PowerSphericalPotentialPlanarR2deriv(double R,double phi,
   //Calculate R2deriv
   return amp * (1. - alpha ) * pow(R,-alpha);
 }
+//Second derivatives from dPhi/dr and d2Phi/dr2
+static void PowerSphericalPotentialDerivs(double R,double Z,int nargs,double *args,
+                                          double *r,double *dPhi,double *d2Phi){
+  //Get args
+  double amp= *args++;
+  double alpha= *args;
+  *r= sqrt(R*R+Z*Z);
+  *dPhi= amp * pow(*r,1.-alpha);
+  *d2Phi= amp * (1.-alpha) * pow(*r,-alpha);
+}
+double PowerSphericalPotentialR2deriv(double R,double Z, double phi,
+                                      double t,
+                                      int nargs, double *args){
+  double r,dPhi,d2Phi;
+  PowerSphericalPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * R * R / r / r + dPhi * Z * Z / r / r / r;
+}
+double PowerSphericalPotentialz2deriv(double R,double Z, double phi,
+                                      double t,
+                                      int nargs, double *args){
+  double r,dPhi,d2Phi;
+  PowerSphericalPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return d2Phi * Z * Z / r / r + dPhi * R * R / r / r / r;
+}
+double PowerSphericalPotentialRzderiv(double R,double Z, double phi,
+                                      double t,
+                                      int nargs, double *args){
+  double r,dPhi,d2Phi;
+  PowerSphericalPotentialDerivs(R,Z,nargs,args,&r,&dPhi,&d2Phi);
+  return ( d2Phi - dPhi / r ) * R * Z / r / r;
+}
@@ -54,3 +54,97 @@ double SteadyLogSpiralPotentialphiforce(double R,double phi,double t,
   return -amp * smooth * A / alpha * m * 
     sin(alpha * log(R) - m * (phi-omegas*t-gamma));
 }
+double SteadyLogSpiralPotentialR2deriv(double R,double phi,double t,
+				       int nargs, double *args){
+  //declare
+  double smooth;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args++;
+  double A= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  smooth= dehnenSpiralSmooth(t,tform,tsteady);
+  return amp * smooth * A / R / R
+    * (sin(g) - alpha * cos(g));
+}
+double SteadyLogSpiralPotentialphi2deriv(double R,double phi,double t,
+					 int nargs, double *args){
+  //declare
+  double smooth;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args++;
+  double A= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  smooth= dehnenSpiralSmooth(t,tform,tsteady);
+  return - amp * smooth * A / alpha * m * m
+    * cos(g);
+}
+double SteadyLogSpiralPotentialRphideriv(double R,double phi,double t,
+					 int nargs, double *args){
+  //declare
+  double smooth;
+  //Get args
+  double amp= *args++;
+  double tform= *args++;
+  double tsteady= *args++;
+  double A= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  smooth= dehnenSpiralSmooth(t,tform,tsteady);
+  return amp * smooth * A / R * m
+    * cos(g);
+}
+//3D version, evaluated at r= sqrt(R^2+Z^2)
+double SteadyLogSpiralPotentialFullRforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRforce(&SteadyLogSpiralPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullzforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzforce(&SteadyLogSpiralPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullphiforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphiforce(&SteadyLogSpiralPotentialphiforce,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullR2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullR2deriv(&SteadyLogSpiralPotentialRforce,
+			     &SteadyLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullz2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullz2deriv(&SteadyLogSpiralPotentialRforce,
+			     &SteadyLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullRzderiv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRzderiv(&SteadyLogSpiralPotentialRforce,
+			     &SteadyLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullphi2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphi2deriv(&SteadyLogSpiralPotentialphi2deriv,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullRphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRphideriv(&SteadyLogSpiralPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
+double SteadyLogSpiralPotentialFullzphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzphideriv(&SteadyLogSpiralPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
@@ -32,3 +32,88 @@ double TransientLogSpiralPotentialphiforce(double R,double phi,double t,
   return -amp * A * exp(-pow(t-to,2.)/2./sigma2) / alpha * m 
     * sin(alpha*log(R)-m*(phi-omegas*t-gamma));
 }
+double TransientLogSpiralPotentialR2deriv(double R,double phi,double t,
+					  int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double A= *args++;
+  double to= *args++;
+  double sigma2= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  return amp * A * exp(-pow(t-to,2.)/2./sigma2) / R / R
+    * (sin(g) - alpha * cos(g));
+}
+double TransientLogSpiralPotentialphi2deriv(double R,double phi,double t,
+					    int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double A= *args++;
+  double to= *args++;
+  double sigma2= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  return - amp * A * exp(-pow(t-to,2.)/2./sigma2) / alpha * m * m
+    * cos(g);
+}
+double TransientLogSpiralPotentialRphideriv(double R,double phi,double t,
+					    int nargs, double *args){
+  //Get args
+  double amp= *args++;
+  double A= *args++;
+  double to= *args++;
+  double sigma2= *args++;
+  double alpha= *args++;
+  double m= *args++;
+  double omegas= *args++;
+  double gamma= *args++;
+  double g= alpha * log(R) - m * (phi-omegas*t-gamma);
+  return amp * A * exp(-pow(t-to,2.)/2./sigma2) / R * m
+    * cos(g);
+}
+//3D version, evaluated at r= sqrt(R^2+Z^2)
+double TransientLogSpiralPotentialFullRforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRforce(&TransientLogSpiralPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullzforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzforce(&TransientLogSpiralPotentialRforce,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullphiforce(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphiforce(&TransientLogSpiralPotentialphiforce,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullR2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullR2deriv(&TransientLogSpiralPotentialRforce,
+			     &TransientLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullz2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullz2deriv(&TransientLogSpiralPotentialRforce,
+			     &TransientLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullRzderiv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRzderiv(&TransientLogSpiralPotentialRforce,
+			     &TransientLogSpiralPotentialR2deriv,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullphi2deriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullphi2deriv(&TransientLogSpiralPotentialphi2deriv,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullRphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullRphideriv(&TransientLogSpiralPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
+double TransientLogSpiralPotentialFullzphideriv(double R,double Z,double phi,
+				  double t,int nargs,double *args){
+  return planarToFullzphideriv(&TransientLogSpiralPotentialRphideriv,R,Z,phi,t,nargs,args);
+}
@@ -5,7 +5,30 @@
 //ZeroForce
 double ZeroPlanarForce(double, double,double,int, double *);
 double ZeroForce(double,double,double,double,int, double *);
+//3D versions of planar potentials
+double planarToFullRforce(double (*)(double,double,double,int,double *),
+			  double,double,double,double,int,double *);
+double planarToFullzforce(double (*)(double,double,double,int,double *),
+			  double,double,double,double,int,double *);
+double planarToFullphiforce(double (*)(double,double,double,int,double *),
+			    double,double,double,double,int,double *);
+double planarToFullR2deriv(double (*)(double,double,double,int,double *),
+			   double (*)(double,double,double,int,double *),
+			   double,double,double,double,int,double *);
+double planarToFullz2deriv(double (*)(double,double,double,int,double *),
+			   double (*)(double,double,double,int,double *),
+			   double,double,double,double,int,double *);
+double planarToFullRzderiv(double (*)(double,double,double,int,double *),
+			   double (*)(double,double,double,int,double *),
+			   double,double,double,double,int,double *);
+double planarToFullphi2deriv(double (*)(double,double,double,int,double *),
+			     double,double,double,double,int,double *);
+double planarToFullRphideriv(double (*)(double,double,double,int,double *),
+			     double,double,double,double,int,double *);
+double planarToFullzphideriv(double (*)(double,double,double,int,double *),
+			     double,double,double,double,int,double *);
 //LogarithmicHaloPotential
+double LogarithmicHaloPotentialEval(double,double,double,double,int,double *);
 double LogarithmicHaloPotentialRforce(double ,double , double, double,
 				      int , double *);
 double LogarithmicHaloPotentialPlanarRforce(double ,double, double,
@@ -14,25 +37,74 @@ double LogarithmicHaloPotentialzforce(double,double,double,double,
 				      int, double *);
 double LogarithmicHaloPotentialPlanarR2deriv(double ,double, double,
 					     int , double *);
+double LogarithmicHaloPotentialR2deriv(double,double,double,double,
+				       int, double *);
+double LogarithmicHaloPotentialz2deriv(double,double,double,double,
+				       int, double *);
+double LogarithmicHaloPotentialRzderiv(double,double,double,double,
+				       int, double *);
 //DehnenBarPotential
 double DehnenBarPotentialRforce(double,double,double,int,double *);
 double DehnenBarPotentialphiforce(double,double,double,int,double *);
 double DehnenBarPotentialR2deriv(double,double,double,int,double *);
 double DehnenBarPotentialphi2deriv(double,double,double,int,double *);
 double DehnenBarPotentialRphideriv(double,double,double,int,double *);
+double DehnenBarPotentialFullRforce(double,double,double,double,int,double *);
+double DehnenBarPotentialFullzforce(double,double,double,double,int,double *);
+double DehnenBarPotentialFullphiforce(double,double,double,double,int,double *);
+double DehnenBarPotentialFullR2deriv(double,double,double,double,int,double *);
+double DehnenBarPotentialFullz2deriv(double,double,double,double,int,double *);
+double DehnenBarPotentialFullRzderiv(double,double,double,double,int,double *);
+double DehnenBarPotentialFullphi2deriv(double,double,double,double,int,double *);
+double DehnenBarPotentialFullRphideriv(double,double,double,double,int,double *);
+double DehnenBarPotentialFullzphideriv(double,double,double,double,int,double *);
 //TransientLogSpiralPotential
 double TransientLogSpiralPotentialRforce(double,double,double,int,double *);
 double TransientLogSpiralPotentialphiforce(double,double,double,int,double *);
+double TransientLogSpiralPotentialR2deriv(double,double,double,int,double *);
+double TransientLogSpiralPotentialphi2deriv(double,double,double,int,double *);
+double TransientLogSpiralPotentialRphideriv(double,double,double,int,double *);
+double TransientLogSpiralPotentialFullRforce(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullzforce(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullphiforce(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullR2deriv(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullz2deriv(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullRzderiv(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullphi2deriv(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullRphideriv(double,double,double,double,int,double *);
+double TransientLogSpiralPotentialFullzphideriv(double,double,double,double,int,double *);
 //SteadyLogSpiralPotential
 double SteadyLogSpiralPotentialRforce(double,double,double,int,double *);
 double SteadyLogSpiralPotentialphiforce(double,double,double,int,double *);
+double SteadyLogSpiralPotentialR2deriv(double,double,double,int,double *);
+double SteadyLogSpiralPotentialphi2deriv(double,double,double,int,double *);
+double SteadyLogSpiralPotentialRphideriv(double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullRforce(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullzforce(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullphiforce(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullR2deriv(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullz2deriv(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullRzderiv(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullphi2deriv(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullRphideriv(double,double,double,double,int,double *);
+double SteadyLogSpiralPotentialFullzphideriv(double,double,double,double,int,double *);
 //EllipticalDiskPotential
 double EllipticalDiskPotentialRforce(double,double,double,int,double *);
 double EllipticalDiskPotentialphiforce(double,double,double,int,double *);
 double EllipticalDiskPotentialR2deriv(double,double,double,int,double *);
 double EllipticalDiskPotentialphi2deriv(double,double,double,int,double *);
 double EllipticalDiskPotentialRphideriv(double,double,double,int,double *);
+double EllipticalDiskPotentialFullRforce(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullzforce(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullphiforce(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullR2deriv(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullz2deriv(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullRzderiv(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullphi2deriv(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullRphideriv(double,double,double,double,int,double *);
+double EllipticalDiskPotentialFullzphideriv(double,double,double,double,int,double *);
 //Miyamoto-Nagai Potential
+double MiyamotoNagaiPotentialEval(double,double,double,double,int,double *);
 double MiyamotoNagaiPotentialRforce(double ,double , double, double,
 				    int , double *);
 double MiyamotoNagaiPotentialPlanarRforce(double ,double, double,
@@ -41,13 +113,29 @@ double MiyamotoNagaiPotentialzforce(double,double,double,double,
 				    int, double *);
 double MiyamotoNagaiPotentialPlanarR2deriv(double ,double, double,
 					   int , double *);
+double MiyamotoNagaiPotentialR2deriv(double,double,double,double,
+				     int, double *);
+double MiyamotoNagaiPotentialz2deriv(double,double,double,double,
+				     int, double *);
+double MiyamotoNagaiPotentialRzderiv(double,double,double,double,
+				     int, double *);
 //LopsidedDiskPotential
 double LopsidedDiskPotentialRforce(double,double,double,int,double *);
 double LopsidedDiskPotentialphiforce(double,double,double,int,double *);
 double LopsidedDiskPotentialR2deriv(double,double,double,int,double *);
 double LopsidedDiskPotentialphi2deriv(double,double,double,int,double *);
 double LopsidedDiskPotentialRphideriv(double,double,double,int,double *);
+double LopsidedDiskPotentialFullRforce(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullzforce(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullphiforce(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullR2deriv(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullz2deriv(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullRzderiv(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullphi2deriv(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullRphideriv(double,double,double,double,int,double *);
+double LopsidedDiskPotentialFullzphideriv(double,double,double,double,int,double *);
 //PowerSphericalPotential
+double PowerSphericalPotentialEval(double,double,double,double,int,double *);
 double PowerSphericalPotentialRforce(double ,double , double, double,
 				     int , double *);
 double PowerSphericalPotentialPlanarRforce(double ,double, double,
@@ -56,7 +144,14 @@ double PowerSphericalPotentialzforce(double,double,double,double,
 				     int, double *);
 double PowerSphericalPotentialPlanarR2deriv(double ,double, double,
 					    int , double *);
+double PowerSphericalPotentialR2deriv(double,double,double,double,
+				      int, double *);
+double PowerSphericalPotentialz2deriv(double,double,double,double,
+				      int, double *);
+double PowerSphericalPotentialRzderiv(double,double,double,double,
+				      int, double *);
 //HernquistPotential
+double HernquistPotentialEval(double,double,double,double,int,double *);
 double HernquistPotentialRforce(double ,double , double, double,
 				     int , double *);
 double HernquistPotentialPlanarRforce(double ,double, double,
@@ -65,7 +160,14 @@ double HernquistPotentialzforce(double,double,double,double,
 				     int, double *);
 double HernquistPotentialPlanarR2deriv(double ,double, double,
 					    int , double *);
+double HernquistPotentialR2deriv(double,double,double,double,
+				 int, double *);
+double HernquistPotentialz2deriv(double,double,double,double,
+				 int, double *);
+double HernquistPotentialRzderiv(double,double,double,double,
+				 int, double *);
 //NFWPotential
+double NFWPotentialEval(double,double,double,double,int,double *);
 double NFWPotentialRforce(double ,double , double, double,
 				     int , double *);
 double NFWPotentialPlanarRforce(double ,double, double,
@@ -74,7 +176,14 @@ double NFWPotentialzforce(double,double,double,double,
 				     int, double *);
 double NFWPotentialPlanarR2deriv(double ,double, double,
 					    int , double *);
+double NFWPotentialR2deriv(double,double,double,double,
+			   int, double *);
+double NFWPotentialz2deriv(double,double,double,double,
+			   int, double *);
+double NFWPotentialRzderiv(double,double,double,double,
+			   int, double *);
 //JaffePotential
+double JaffePotentialEval(double,double,double,double,int,double *);
 double JaffePotentialRforce(double ,double , double, double,
 				     int , double *);
 double JaffePotentialPlanarRforce(double ,double, double,
@@ -83,3 +192,128 @@ double JaffePotentialzforce(double,double,double,double,
 				     int, double *);
 double JaffePotentialPlanarR2deriv(double ,double, double,
 					    int , double *);
+double JaffePotentialR2deriv(double,double,double,double,
+			     int, double *);
+double JaffePotentialz2deriv(double,double,double,double,
+			     int, double *);
+double JaffePotentialRzderiv(double,double,double,double,
+			     int, double *);
+//MultipoleExpansionPotential
+double MultipoleExpansionPotentialRforce(double ,double , double, double,
+					 int , double *);
+double MultipoleExpansionPotentialzforce(double,double,double,double,
+					 int, double *);
+double MultipoleExpansionPotentialphiforce(double,double,double,double,
+					   int, double *);
+double MultipoleExpansionPotentialPlanarRforce(double ,double, double,
+					       int , double *);
+double MultipoleExpansionPotentialPlanarphiforce(double ,double, double,
+						 int , double *);
+double MultipoleExpansionPotentialPlanarR2deriv(double ,double, double,
+						int , double *);
+double MultipoleExpansionPotentialPlanarphi2deriv(double ,double, double,
+						  int , double *);
+double MultipoleExpansionPotentialPlanarRphideriv(double ,double, double,
+						  int , double *);
+double MultipoleExpansionPotentialR2deriv(double,double,double,double,
+					  int, double *);
+double MultipoleExpansionPotentialz2deriv(double,double,double,double,
+					  int, double *);
+double MultipoleExpansionPotentialRzderiv(double,double,double,double,
+					  int, double *);
+double MultipoleExpansionPotentialphi2deriv(double,double,double,double,
+					    int, double *);
+double MultipoleExpansionPotentialRphideriv(double,double,double,double,
+					    int, double *);
+double MultipoleExpansionPotentialzphideriv(double,double,double,double,
+					    int, double *);
+//Plummer-softened objects
+void PlummerCylHessian(double,double,double,double,double,double,double,
+		       double *);
+//MovingObjectPotential
+double MovingObjectPotentialRforce(double ,double , double, double,
+				   int , double *);
+double MovingObjectPotentialzforce(double,double,double,double,
+				   int, double *);
+double MovingObjectPotentialphiforce(double,double,double,double,
+				     int, double *);
+double MovingObjectPotentialR2deriv(double,double,double,double,
+				    int, double *);
+double MovingObjectPotentialz2deriv(double,double,double,double,
+				    int, double *);
+double MovingObjectPotentialRzderiv(double,double,double,double,
+				    int, double *);
+double MovingObjectPotentialphi2deriv(double,double,double,double,
+				      int, double *);
+double MovingObjectPotentialRphideriv(double,double,double,double,
+				      int, double *);
+double MovingObjectPotentialzphideriv(double,double,double,double,
+				      int, double *);
+double MovingObjectPotentialPlanarRforce(double ,double, double,
+					 int , double *);
+double MovingObjectPotentialPlanarphiforce(double ,double, double,
+					   int , double *);
+double MovingObjectPotentialPlanarR2deriv(double ,double, double,
+					  int , double *);
+double MovingObjectPotentialPlanarphi2deriv(double ,double, double,
+					    int , double *);
+double MovingObjectPotentialPlanarRphideriv(double ,double, double,
+					    int , double *);
+//MovingObjectsPotential
+double MovingObjectsPotentialRforce(double ,double , double, double,
+				    int , double *);
+double MovingObjectsPotentialzforce(double,double,double,double,
+				    int, double *);
+double MovingObjectsPotentialphiforce(double,double,double,double,
+				      int, double *);
+double MovingObjectsPotentialR2deriv(double,double,double,double,
+				     int, double *);
+double MovingObjectsPotentialz2deriv(double,double,double,double,
+				     int, double *);
+double MovingObjectsPotentialRzderiv(double,double,double,double,
+				     int, double *);
+double MovingObjectsPotentialphi2deriv(double,double,double,double,
+				       int, double *);
+double MovingObjectsPotentialRphideriv(double,double,double,double,
+				       int, double *);
+double MovingObjectsPotentialzphideriv(double,double,double,double,
+				       int, double *);
+double MovingObjectsPotentialPlanarRforce(double ,double, double,
+					  int , double *);
+double MovingObjectsPotentialPlanarphiforce(double ,double, double,
+					    int , double *);
+double MovingObjectsPotentialPlanarR2deriv(double ,double, double,
+					   int , double *);
+double MovingObjectsPotentialPlanarphi2deriv(double ,double, double,
+					     int , double *);
+double MovingObjectsPotentialPlanarRphideriv(double ,double, double,
+					     int , double *);
+//interpGridPotential
+double interpGridPotentialRforce(double ,double , double, double,
+				 int , double *);
+double interpGridPotentialzforce(double,double,double,double,
+				 int, double *);
+double interpGridPotentialphiforce(double,double,double,double,
+				   int, double *);
+double interpGridPotentialR2deriv(double,double,double,double,
+				  int, double *);
+double interpGridPotentialz2deriv(double,double,double,double,
+				  int, double *);
+double interpGridPotentialRzderiv(double,double,double,double,
+				  int, double *);
+double interpGridPotentialphi2deriv(double,double,double,double,
+				    int, double *);
+double interpGridPotentialRphideriv(double,double,double,double,
+				    int, double *);
+double interpGridPotentialzphideriv(double,double,double,double,
+				    int, double *);
+double interpGridPotentialPlanarRforce(double ,double, double,
+				       int , double *);
+double interpGridPotentialPlanarphiforce(double ,double, double,
+					 int , double *);
+double interpGridPotentialPlanarR2deriv(double ,double, double,
+					int , double *);
+double interpGridPotentialPlanarphi2deriv(double ,double, double,
+					  int , double *);
+double interpGridPotentialPlanarRphideriv(double ,double, double,
+					  int , double *);
@@ -0,0 +1,207 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//interpGridPotential: tricubic Hermite interpolation on a uniform Cartesian
+//grid rotating with a pattern speed, point mass outside of the grid
+//arguments: amp, OmegaP, pa, GMout, nx, ny, nz, xmin, ymin, zmin, hx, hy, hz,
+//[f,fz,fy,fyz,fx,fxz,fxy,fxyz] at each node of the [nx,ny,nz] grid,
+//followed by a cache of the second derivatives
+//[R,z,phi,t,RR,zz,Rz,phiphi,Rphi,zphi] and of the force [R,z,phi,t,FR,Fz,Fphi]
+//(all initialized to NaN)
+static void interpGridPotentialBasis(double t,double h,double B[3][2][2]){
+  //1D cubic Hermite basis B[deriv][node][value/derivative]
+  double t2= t*t;
+  double t3= t2*t;
+  B[0][0][0]= 2.*t3-3.*t2+1.;
+  B[0][0][1]= (t3-2.*t2+t)*h;
+  B[0][1][0]= -2.*t3+3.*t2;
+  B[0][1][1]= (t3-t2)*h;
+  B[1][0][0]= (6.*t2-6.*t)/h;
+  B[1][0][1]= 3.*t2-4.*t+1.;
+  B[1][1][0]= (-6.*t2+6.*t)/h;
+  B[1][1][1]= 3.*t2-2.*t;
+  B[2][0][0]= (12.*t-6.)/h/h;
+  B[2][0][1]= (6.*t-4.)/h;
+  B[2][1][0]= (-12.*t+6.)/h/h;
+  B[2][1][1]= (6.*t-2.)/h;
+}
+static void interpGridPotentialCartesian(double x,double y,double z,
+					 int second,double *args,
+					 double *out){
+  //out= [fx,fy,fz,fxx,fyy,fzz,fxy,fxz,fyz]
+  double GMout= *(args+3);
+  int n[3]= {(int) *(args+4),(int) *(args+5),(int) *(args+6)};
+  double *min= args+7;
+  double *h= args+10;
+  double *coeffs= args+13;
+  double pos[3]= {x,y,z};
+  double B[3][3][2][2];
+  //derivative orders (x,y,z) of each output
+  static const int orders[9][3]= {{1,0,0},{0,1,0},{0,0,1},
+				  {2,0,0},{0,2,0},{0,0,2},
+				  {1,1,0},{1,0,1},{0,1,1}};
+  int nout= second ? 9 : 3;
+  int idx[3];
+  int ii,a,b,c,p,q,r;
+  double s,r2,gm3,w,*C;
+  for (ii=0; ii < 9; ii++) *(out+ii)= 0.;
+  for (ii=0; ii < 3; ii++){
+    s= (pos[ii]-*(min+ii)) / *(h+ii);
+    if ( s < 0. || s > n[ii]-1 ) { //Outside of the grid: point mass
+      r2= x*x+y*y+z*z;
+      gm3= GMout*pow(r2,-1.5);
+      *out= gm3*x;
+      *(out+1)= gm3*y;
+      *(out+2)= gm3*z;
+      if ( second ) {
+	*(out+3)= gm3*(1.-3.*x*x/r2);
+	*(out+4)= gm3*(1.-3.*y*y/r2);
+	*(out+5)= gm3*(1.-3.*z*z/r2);
+	*(out+6)= -3.*gm3*x*y/r2;
+	*(out+7)= -3.*gm3*x*z/r2;
+	*(out+8)= -3.*gm3*y*z/r2;
+      }
+      return;
+    }
+    idx[ii]= (int) floor(s);
+    if ( idx[ii] > n[ii]-2 ) idx[ii]= n[ii]-2;
+    interpGridPotentialBasis(s-idx[ii],*(h+ii),B[ii]);
+  }
+  for (a=0; a < 2; a++)
+    for (b=0; b < 2; b++)
+      for (c=0; c < 2; c++){
+	C= coeffs+8*(((idx[0]+a)*n[1]+idx[1]+b)*n[2]+idx[2]+c);
+	for (p=0; p < 2; p++)
+	  for (q=0; q < 2; q++)
+	    for (r=0; r < 2; r++){
+	      w= *(C+4*p+2*q+r);
+	      for (ii=0; ii < nout; ii++)
+		*(out+ii)+= B[0][orders[ii][0]][a][p]
+		  * B[1][orders[ii][1]][b][q]
+		  * B[2][orders[ii][2]][c][r] * w;
+	    }
+      }
+}
+static double * interpGridPotentialForces(double R,double Z,double phi,
+					  double t,int nargs,double *args){
+  double amp= *args;
+  double *fcache= args+nargs-7;
+  double phig,cp,sp,x,y;
+  double d[9];
+  if ( *fcache == R && *(fcache+1) == Z && *(fcache+2) == phi
+       && *(fcache+3) == t )
+    return fcache+4;
+  phig= phi-*(args+2)-*(args+1)*t;
+  cp= cos(phig);
+  sp= sin(phig);
+  x= R*cp;
+  y= R*sp;
+  interpGridPotentialCartesian(x,y,Z,0,args,d);
+  *fcache= R;
+  *(fcache+1)= Z;
+  *(fcache+2)= phi;
+  *(fcache+3)= t;
+  *(fcache+4)= -amp * ( cp*d[0]+sp*d[1] );
+  *(fcache+5)= -amp * d[2];
+  *(fcache+6)= amp * ( y*d[0]-x*d[1] );
+  return fcache+4;
+}
+double interpGridPotentialRforce(double R,double Z, double phi,
+				 double t,
+				 int nargs, double *args){
+  return *interpGridPotentialForces(R,Z,phi,t,nargs,args);
+}
+double interpGridPotentialzforce(double R,double Z, double phi,
+				 double t,
+				 int nargs, double *args){
+  return *(interpGridPotentialForces(R,Z,phi,t,nargs,args)+1);
+}
+double interpGridPotentialphiforce(double R,double Z, double phi,
+				   double t,
+				   int nargs, double *args){
+  return *(interpGridPotentialForces(R,Z,phi,t,nargs,args)+2);
+}
+static double * interpGridPotentialHessian(double R,double Z,double phi,
+					   double t,int nargs,double *args){
+  double amp= *args;
+  double *hcache= args+nargs-17;
+  double phig,cp,sp;
+  double d[9];
+  if ( *hcache == R && *(hcache+1) == Z && *(hcache+2) == phi
+       && *(hcache+3) == t )
+    return hcache+4;
+  phig= phi-*(args+2)-*(args+1)*t;
+  cp= cos(phig);
+  sp= sin(phig);
+  interpGridPotentialCartesian(R*cp,R*sp,Z,1,args,d);
+  *hcache= R;
+  *(hcache+1)= Z;
+  *(hcache+2)= phi;
+  *(hcache+3)= t;
+  *(hcache+4)= amp * ( cp*cp*d[3]+2.*cp*sp*d[6]+sp*sp*d[4] );
+  *(hcache+5)= amp * d[5];
+  *(hcache+6)= amp * ( cp*d[7]+sp*d[8] );
+  *(hcache+7)= amp * ( R*R*(sp*sp*d[3]-2.*cp*sp*d[6]+cp*cp*d[4])
+		       -R*(cp*d[0]+sp*d[1]) );
+  *(hcache+8)= amp * ( R*(cp*sp*(d[4]-d[3])+(cp*cp-sp*sp)*d[6])
+		       -sp*d[0]+cp*d[1] );
+  *(hcache+9)= amp * R * ( cp*d[8]-sp*d[7] );
+  return hcache+4;
+}
+double interpGridPotentialR2deriv(double R,double Z, double phi,
+				  double t,
+				  int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+0);
+}
+double interpGridPotentialz2deriv(double R,double Z, double phi,
+				  double t,
+				  int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+1);
+}
+double interpGridPotentialRzderiv(double R,double Z, double phi,
+				  double t,
+				  int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+2);
+}
+double interpGridPotentialphi2deriv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+3);
+}
+double interpGridPotentialRphideriv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+4);
+}
+double interpGridPotentialzphideriv(double R,double Z, double phi,
+				    double t,
+				    int nargs, double *args){
+  return *(interpGridPotentialHessian(R,Z,phi,t,nargs,args)+5);
+}
+/*
+  Planar (z=0) forces and second derivatives
+*/
+double interpGridPotentialPlanarRforce(double R,double phi,
+				       double t,
+				       int nargs, double *args){
+  return interpGridPotentialRforce(R,0.,phi,t,nargs,args);
+}
+double interpGridPotentialPlanarphiforce(double R,double phi,
+					 double t,
+					 int nargs, double *args){
+  return interpGridPotentialphiforce(R,0.,phi,t,nargs,args);
+}
+double interpGridPotentialPlanarR2deriv(double R,double phi,
+					double t,
+					int nargs, double *args){
+  return interpGridPotentialR2deriv(R,0.,phi,t,nargs,args);
+}
+double interpGridPotentialPlanarphi2deriv(double R,double phi,
+					  double t,
+					  int nargs, double *args){
+  return interpGridPotentialphi2deriv(R,0.,phi,t,nargs,args);
+}
+double interpGridPotentialPlanarRphideriv(double R,double phi,
+					  double t,
+					  int nargs, double *args){
+  return interpGridPotentialRphideriv(R,0.,phi,t,nargs,args);
+}
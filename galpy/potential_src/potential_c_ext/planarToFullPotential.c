@@ -0,0 +1,71 @@
+#include <math.h>
+#include <galpy_potentials.h>
+//3D versions of planar potentials: Phi(R,Z,phi,t)= Phi_planar(r,phi,t),
+//with r= sqrt(R^2+Z^2); the planar functions are passed as arguments
+double planarToFullRforce(double (*Rforce)(double,double,double,int,double *),
+			  double R,double Z,double phi,
+			  double t,int nargs,double *args){
+  double r= sqrt(R*R+Z*Z);
+  return Rforce(r,phi,t,nargs,args)*R/r;
+}
+double planarToFullzforce(double (*Rforce)(double,double,double,int,double *),
+			  double R,double Z,double phi,
+			  double t,int nargs,double *args){
+  double r= sqrt(R*R+Z*Z);
+  return Rforce(r,phi,t,nargs,args)*Z/r;
+}
+double planarToFullphiforce(double (*phiforce)(double,double,double,int,
+					       double *),
+			    double R,double Z,double phi,
+			    double t,int nargs,double *args){
+  return phiforce(sqrt(R*R+Z*Z),phi,t,nargs,args);
+}
+double planarToFullR2deriv(double (*Rforce)(double,double,double,int,double *),
+			   double (*R2deriv)(double,double,double,int,
+					     double *),
+			   double R,double Z,double phi,
+			   double t,int nargs,double *args){
+  double r2= R*R+Z*Z;
+  double r= sqrt(r2);
+  return (R2deriv(r,phi,t,nargs,args)*R*R
+	  -Rforce(r,phi,t,nargs,args)*Z*Z/r)/r2;
+}
+double planarToFullz2deriv(double (*Rforce)(double,double,double,int,double *),
+			   double (*R2deriv)(double,double,double,int,
+					     double *),
+			   double R,double Z,double phi,
+			   double t,int nargs,double *args){
+  double r2= R*R+Z*Z;
+  double r= sqrt(r2);
+  return (R2deriv(r,phi,t,nargs,args)*Z*Z
+	  -Rforce(r,phi,t,nargs,args)*R*R/r)/r2;
+}
+double planarToFullRzderiv(double (*Rforce)(double,double,double,int,double *),
+			   double (*R2deriv)(double,double,double,int,
+					     double *),
+			   double R,double Z,double phi,
+			   double t,int nargs,double *args){
+  double r2= R*R+Z*Z;
+  double r= sqrt(r2);
+  return (R2deriv(r,phi,t,nargs,args)+Rforce(r,phi,t,nargs,args)/r)*R*Z/r2;
+}
+double planarToFullphi2deriv(double (*phi2deriv)(double,double,double,int,
+						 double *),
+			     double R,double Z,double phi,
+			     double t,int nargs,double *args){
+  return phi2deriv(sqrt(R*R+Z*Z),phi,t,nargs,args);
+}
+double planarToFullRphideriv(double (*Rphideriv)(double,double,double,int,
+						 double *),
+			     double R,double Z,double phi,
+			     double t,int nargs,double *args){
+  double r= sqrt(R*R+Z*Z);
+  return Rphideriv(r,phi,t,nargs,args)*R/r;
+}
+double planarToFullzphideriv(double (*Rphideriv)(double,double,double,int,
+						 double *),
+			     double R,double Z,double phi,
+			     double t,int nargs,double *args){
+  double r= sqrt(R*R+Z*Z);
+  return Rphideriv(r,phi,t,nargs,args)*Z/r;
+}
@@ -1,5 +1,9 @@
+import collections
+import numpy as nu
 from Potential import PotentialError, Potential
 from linearPotential import linearPotential
+#Maximum number of vertical potentials cached on a single RZPotential
+_VERTICALCACHESIZE= 1000
 class verticalPotential(linearPotential):
     """Class that represents a vertical potential derived from a RZPotential:
     phi(z;R)= phi(R,z)-phi(R,0.)"""
@@ -36,7 +40,7 @@ class verticalPotential(linearPotential):
         HISTORY:
            2010-07-13 - Written - Bovy (NYU)
         """
-        return self._RZPot(self._R,z,t=t)-self._RZPot(self._R,0.,t=t)
+        return self._RZPot(self._R,z,t=t)-self._midplane(t)[0]
             
     def _force(self,z,t=0.):
         """
@@ -52,8 +56,27 @@ class verticalPotential(linearPotential):
         HISTORY:
            2010-07-13 - Written - Bovy (NYU)
         """
-        return self._RZPot.zforce(self._R,z,t=t)\
-            -self._RZPot.zforce(self._R,0.,t=t)
+        return self._RZPot.zforce(self._R,z,t=t)-self._midplane(t)[1]
+
+    def _midplane(self,t=0.):
+        """
+        NAME:
+           _midplane
+        PURPOSE:
+           return the (cached) potential and vertical force at (R,0.,t)
+        INPUT:
+           t
+        OUTPUT:
+          (Pot(R,0.,t),F_z(R,0.,t))
+        HISTORY:
+           2026-10-19 - Written - agent (local)
+        """
+        if hasattr(self,'_cachet') and self._cachet == t:
+            return self._cachemid
+        self._cachet= t
+        self._cachemid= (self._RZPot(self._R,0.,t=t),
+                         self._RZPot.zforce(self._R,0.,t=t))
+        return self._cachemid
 
 def RZToverticalPotential(RZPot,R):
     """
@@ -68,6 +91,7 @@ def RZToverticalPotential(RZPot,R):
        (list of) linearPotential instance(s)
     HISTORY:
        2010-07-21 - Written - Bovy (NYU)
+       2026-10-19 - Added caching on the RZPotential - agent (local)
     """
     if isinstance(RZPot,list):
         out= []
@@ -75,11 +99,67 @@ def RZToverticalPotential(RZPot,R):
             if isinstance(pot,linearPotential):
                 out.append(pot)
             else:
-                out.append(verticalPotential(pot,R))
+                out.append(_verticalPotentialFromRZPotential(pot,R))
         return out
     elif isinstance(RZPot,Potential):
-        return verticalPotential(RZPot,R)
+        return _verticalPotentialFromRZPotential(RZPot,R)
     elif isinstance(RZPot,linearPotential):
         return RZPot
     else:
         raise PotentialError("Input to 'RZToverticalPotential' is neither an RZPotential-instance or a list of such instances")
+
+def tabulateVerticalPotentials(RZPot,Rs):
+    """
+    NAME:
+       tabulateVerticalPotentials
+    PURPOSE:
+       precompute the family of vertical potentials of a RZPotential at a 
+       set of radii, such that subsequent calls to toVertical or 
+       RZToverticalPotential at these radii re-use them
+    INPUT:
+       RZPot - RZPotential instance or list of such instances
+       Rs - array of Galactocentric radii
+    OUTPUT:
+       list of (lists of) linearPotential instance(s), one for each R
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    Rs= nu.atleast_1d(Rs)
+    if isinstance(RZPot,list):
+        pots= RZPot
+    else:
+        pots= [RZPot]
+    for pot in pots:
+        if isinstance(pot,Potential):
+            pot._cacheVerticalSize= max(len(Rs),
+                                        getattr(pot,'_cacheVerticalSize',
+                                                _VERTICALCACHESIZE))
+    out= []
+    for R in Rs:
+        vpot= RZToverticalPotential(RZPot,R)
+        #Pre-compute the mid-plane potential
+        if isinstance(vpot,list):
+            for p in vpot:
+                if isinstance(p,verticalPotential): p._midplane()
+        elif isinstance(vpot,verticalPotential):
+            vpot._midplane()
+        out.append(vpot)
+    return out
+
+def _verticalPotentialFromRZPotential(RZPot,R):
+    """Return the vertical potential of RZPot at R, re-using one cached 
+    on RZPot by a previous call (least-recently-used ones are dropped)"""
+    try:
+        cache= RZPot._cacheVertical
+    except AttributeError:
+        cache= RZPot._cacheVertical= collections.OrderedDict()
+    key= float(R)
+    try:
+        out= cache.pop(key)
+    except KeyError:
+        out= verticalPotential(RZPot,R)
+        if len(cache) >= getattr(RZPot,'_cacheVerticalSize',
+                                 _VERTICALCACHESIZE):
+            cache.popitem(last=False)
+    cache[key]= out
+    return out
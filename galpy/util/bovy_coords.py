@@ -31,6 +31,8 @@
 #            galcencyl_to_vxvyvz
 #            dl_to_rphi_2d
 #            rphi_to_dl_2d
+#            Rz_to_uv
+#            uv_to_Rz
 #
 ##############################################################################
 #############################################################################
@@ -1128,6 +1130,47 @@ def rphi_to_dl_2d(R,phi,degree=False,ro=1.,phio=0.):
     else:
         return (d,l)
 
+def Rz_to_uv(R,z,delta=1.):
+    """
+    NAME:
+       Rz_to_uv
+    PURPOSE:
+       convert R,z to prolate spheroidal coordinates u,v with focal 
+       distance delta
+    INPUT:
+       R - Galactocentric cylindrical radius
+       z - vertical height
+       delta= focal distance
+    OUTPUT:
+       (u,v), such that R= delta sinh u sin v, z= delta cosh u cos v
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    d12= sc.sqrt((z+delta)**2.+R**2.)
+    d22= sc.sqrt((z-delta)**2.+R**2.)
+    coshu= (d12+d22)/2./delta
+    cosv= (d12-d22)/2./delta
+    #Protect against round-off
+    return (sc.arccosh(sc.maximum(coshu,1.)),
+            sc.arccos(sc.minimum(sc.maximum(cosv,-1.),1.)))
+
+def uv_to_Rz(u,v,delta=1.):
+    """
+    NAME:
+       uv_to_Rz
+    PURPOSE:
+       convert prolate spheroidal coordinates u,v with focal distance delta 
+       to R,z
+    INPUT:
+       u, v - prolate spheroidal coordinates
+       delta= focal distance
+    OUTPUT:
+       (R,z)
+    HISTORY:
+       2026-10-19 - Written - agent (local)
+    """
+    return (delta*sc.sinh(u)*sc.sin(v),delta*sc.cosh(u)*sc.cos(v))
+
 def get_epoch_angles(epoch=2000.0):
     """
     NAME:
@@ -47,16 +47,24 @@ struct leapFuncArg{
 			   int nargs, double * args);
   double (*R2deriv)(double R,double Z,double phi, double t,
 			  int nargs, double * args);
+  double (*z2deriv)(double R,double Z,double phi, double t,
+		    int nargs, double * args);
+  double (*Rzderiv)(double R,double Z,double phi, double t,
+		    int nargs, double * args);
   double (*phi2deriv)(double R,double Z,double phi, double t,
 			  int nargs, double * args);
   double (*Rphideriv)(double R,double Z,double phi, double t,
 			    int nargs, double * args);
+  double (*zphideriv)(double R,double Z,double phi, double t,
+		      int nargs, double * args);
   double (*planarR2deriv)(double R,double phi, double t,
 			  int nargs, double * args);
   double (*planarphi2deriv)(double R,double phi, double t,
 			  int nargs, double * args);
   double (*planarRphideriv)(double R,double phi, double t,
 			    int nargs, double * args);
+  double (*potentialEval)(double R,double Z,double phi, double t,
+			  int nargs, double * args);
   int nargs;
   double * args;
 };
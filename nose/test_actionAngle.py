@@ -0,0 +1,272 @@
+#Tests of the action-angle engines, against analytic results for the
+#isochrone, against each other, and against conservation along orbits
+import os
+import shutil
+import tempfile
+import numpy
+
+def _mwpot():
+    from galpy.potential import MiyamotoNagaiPotential, NFWPotential, \
+        HernquistPotential
+    return [MiyamotoNagaiPotential(a=0.5,b=0.0375,normalize=0.6),
+            NFWPotential(a=4.5,normalize=0.35),
+            HernquistPotential(a=0.6/8.,normalize=0.05)]
+
+def _xvs(N,seed=1):
+    numpy.random.seed(seed)
+    return [0.8+0.4*numpy.random.uniform(size=N),
+            0.1*numpy.random.normal(size=N),
+            1.+0.1*numpy.random.normal(size=N),
+            0.05*numpy.random.normal(size=N),
+            0.05*numpy.random.normal(size=N),
+            2.*numpy.pi*numpy.random.uniform(size=N)]
+
+# Adiabatic approximation: arrays vs. one at a time
+def test_actionAngleAdiabatic_vector():
+    from galpy.actionAngle import actionAngleAdiabatic
+    aA= actionAngleAdiabatic(pot=_mwpot())
+    xvs= _xvs(5)[:5]
+    jr,lz,jz= aA(*xvs)
+    for ii in range(2):
+        jri,lzi,jzi= aA(*[x[ii] for x in xvs])
+        assert numpy.fabs(jri[0]/jr[ii]-1.) < 10.**-4.
+        assert numpy.fabs(jzi[0]/jz[ii]-1.) < 10.**-4.
+        assert numpy.fabs(aA.Jz(*[x[ii] for x in xvs])[0]/jz[ii]-1.) \
+            < 10.**-4.
+    assert numpy.all(numpy.fabs(aA.JR(*xvs)-jr) < 10.**-10.)
+    assert numpy.all(numpy.fabs(aA.Jz(*xvs)-jz) < 10.**-10.)
+    return None
+
+def test_actionAngleAdiabatic_numcores():
+    from galpy.actionAngle import actionAngleAdiabatic
+    xvs= _xvs(25)[:5]
+    aA= actionAngleAdiabatic(pot=_mwpot())
+    serial= aA(*xvs)
+    parallel= aA(*xvs,numcores=3)
+    for s,p in zip(serial,parallel):
+        assert numpy.all(s == p), \
+            "Actions for numcores > 1 differ from those for numcores=1"
+    return None
+
+def test_actionAngleAdiabatic_JR():
+    from galpy.actionAngle import actionAngleAdiabatic
+    #JR includes gamma Jz in the effective potential, as __call__ does
+    aA= actionAngleAdiabatic(pot=_mwpot())
+    xvs= _xvs(3)[:5]
+    jr= aA(*xvs)[0]
+    for ii in range(3):
+        assert numpy.fabs(aA.JR(*[x[ii] for x in xvs])[0]/jr[ii]-1.) \
+            < 10.**-4.
+    return None
+
+def test_actionAngleAdiabatic_c():
+    from galpy.actionAngle import actionAngleAdiabatic
+    pot= _mwpot()
+    xvs= _xvs(11)[:5]
+    aAc= actionAngleAdiabatic(pot=pot,c=True)
+    aAp= actionAngleAdiabatic(pot=pot,c=False)
+    jrc,lzc,jzc= aAc(*xvs)
+    jrp,lzp,jzp= aAp(*xvs)
+    assert numpy.all(numpy.fabs(jrc/jrp-1.) < 10.**-6.)
+    assert numpy.all(numpy.fabs(jzc/jzp-1.) < 10.**-6.)
+    assert numpy.all(numpy.fabs(lzc-lzp) < 10.**-10.)
+    for ii in range(3):
+        jr,lz,jz= aAc(*[x[ii] for x in xvs])
+        assert numpy.fabs(jr[0]-jrc[ii]) < 10.**-10.
+        assert numpy.fabs(jz[0]-jzc[ii]) < 10.**-10.
+    #Parallel C
+    parallel= aAc(*_xvs(25)[:5],numcores=3)
+    for s,p in zip(aAc(*_xvs(25)[:5]),parallel):
+        assert numpy.all(s == p)
+    return None
+
+# Adiabatic grid restored from a savefile
+def test_actionAngleAdiabaticGrid_savefile():
+    from galpy.actionAngle_src.actionAngleAdiabaticGrid import \
+        actionAngleAdiabaticGrid
+    savedir= tempfile.mkdtemp()
+    try:
+        aAG= actionAngleAdiabaticGrid(pot=_mwpot(),savefilename=savedir)
+        assert len(os.listdir(savedir)) == 1
+        #Restored grids are the same grids
+        aAG2= actionAngleAdiabaticGrid(pot=_mwpot(),savefilename=savedir)
+        assert numpy.all(aAG2._jz == aAG._jz)
+        assert numpy.all(aAG2._jr == aAG._jr)
+        assert numpy.all(aAG2._jzEzzmax == aAG._jzEzzmax)
+        assert numpy.all(aAG2._jrERRa == aAG._jrERRa)
+        #Grids for a different potential are not restored
+        aAG3= actionAngleAdiabaticGrid(pot=_mwpot()[:2],savefilename=savedir)
+        assert len(os.listdir(savedir)) == 2
+    finally:
+        shutil.rmtree(savedir)
+    return None
+
+def test_actionAngleAdiabaticGrid_numcores():
+    from galpy.actionAngle_src.actionAngleAdiabaticGrid import \
+        actionAngleAdiabaticGrid
+    kw= {'pot':_mwpot(),'nR':6,'nEz':6,'nEr':6,'nLz':6,'c':False}
+    aAG= actionAngleAdiabaticGrid(numcores=1,**kw)
+    aAG2= actionAngleAdiabaticGrid(numcores=2,**kw)
+    assert numpy.all(aAG._jz == aAG2._jz)
+    assert numpy.all(aAG._jr == aAG2._jr)
+    return None
+
+# Adiabatic grid vs. direct calculation, on and off the grid
+def test_actionAngleAdiabaticGrid():
+    from galpy.actionAngle import actionAngleAdiabatic
+    from galpy.actionAngle_src.actionAngleAdiabaticGrid import \
+        actionAngleAdiabaticGrid
+    pot= _mwpot()
+    aA= actionAngleAdiabatic(pot=pot)
+    aAG= actionAngleAdiabaticGrid(pot=pot)
+    xvs= _xvs(51)[:5]
+    jr,lz,jz= aA(*xvs)
+    jrg,lzg,jzg= aAG(*xvs)
+    assert numpy.median(numpy.fabs(jrg/jr-1.)) < 10.**-2.
+    assert numpy.median(numpy.fabs(jzg/jz-1.)) < 10.**-2.
+    #Stars outside of the grid fall back onto the direct calculation
+    out= [numpy.array([6.,5.]),numpy.array([0.1,0.]),numpy.array([0.5,0.4]),
+          numpy.array([0.1,0.5]),numpy.array([0.1,0.3])]
+    jrg,lzg,jzg= aAG(*out)
+    jr,lz,jz= aA(*out)
+    assert numpy.all(numpy.fabs(jrg/jr-1.) < 10.**-5.)
+    assert numpy.all(numpy.fabs(jzg/jz-1.) < 10.**-5.)
+    return None
+
+def test_actionAngleAdiabaticGrid_scalar():
+    from galpy.actionAngle_src.actionAngleAdiabaticGrid import \
+        actionAngleAdiabaticGrid
+    aAG= actionAngleAdiabaticGrid(pot=_mwpot())
+    #On and off the grid, and unbound: scalars are treated as arrays
+    xvs= [numpy.array([1.,6.,1.]),numpy.array([0.1,0.1,0.]),
+          numpy.array([1.1,0.5,4.]),numpy.array([0.1,0.1,0.]),
+          numpy.array([0.2,0.3,0.])]
+    jrg,lzg,jzg= aAG(*xvs)
+    assert numpy.isnan(jrg[2]) and not numpy.any(numpy.isnan(jrg[:2]))
+    for ii in range(3):
+        jr,lz,jz= aAG(*[x[ii] for x in xvs])
+        assert numpy.isnan(jr) == numpy.isnan(jrg[ii])
+        if not numpy.isnan(jr): assert jr == jrg[ii]
+        assert lz == lzg[ii] and jz == jzg[ii]
+        assert aAG.Jz(*[x[ii] for x in xvs]) == jzg[ii]
+    return None
+
+# Staeckel fudge: conserved along orbits
+def _orbitxvs(vxvv,pot,ts):
+    from galpy.orbit import Orbit
+    o= Orbit(vxvv)
+    o.integrate(ts,pot,method='dopr54_c')
+    return [o.R(ts),o.vR(ts),o.vT(ts),o.z(ts),o.vz(ts),o.phi(ts)]
+
+def test_actionAngleStaeckel_conserved():
+    from galpy.actionAngle import actionAngleStaeckel, \
+        actionAngleStaeckelGrid
+    pot= _mwpot()
+    ts= numpy.linspace(0.,100.,1001)
+    xvs= _orbitxvs([1.,0.1,1.1,0.,0.25,0.],pot,ts)
+    jr,lz,jz= actionAngleStaeckel(pot=pot,delta=0.45)(*xvs[:5])
+    assert numpy.std(jr)/numpy.mean(jr) < 2.*10.**-2.
+    assert numpy.std(jz)/numpy.mean(jz) < 10.**-2.
+    #The grid reproduces the direct calculation
+    aAG= actionAngleStaeckelGrid(pot=pot,delta=0.45)
+    jrg,lzg,jzg= aAG(*xvs[:5])
+    assert numpy.median(numpy.fabs(jrg/jr-1.)) < 10.**-2.
+    assert numpy.median(numpy.fabs(jzg/jz-1.)) < 10.**-2.
+    assert numpy.amax(numpy.fabs(jrg/jr-1.)) < 5.*10.**-2.
+    assert numpy.amax(numpy.fabs(jzg/jz-1.)) < 5.*10.**-2.
+    return None
+
+# Isochrone: analytic actions conserved, angles linear in time, and equal
+# to the Staeckel actions for a spherical potential
+def _isochrone():
+    from galpy.potential import IsochronePotential
+    return IsochronePotential(normalize=1.,b=1.2)
+
+def test_actionAngleStaeckel_isochrone():
+    from galpy.actionAngle import actionAngleStaeckel, actionAngleIsochrone
+    ip= _isochrone()
+    xvs= _xvs(7)[:5]
+    jr,lz,jz= actionAngleStaeckel(pot=ip,delta=10.**-3.)(*xvs)
+    jri,lzi,jzi= actionAngleIsochrone(ip=ip)(*xvs)
+    assert numpy.all(numpy.fabs(jr-jri) < 10.**-5.)
+    assert numpy.all(numpy.fabs(jz-jzi) < 10.**-5.)
+    return None
+
+def test_actionAngleIsochrone_orbit():
+    from galpy.actionAngle import actionAngleIsochrone
+    ip= _isochrone()
+    aAI= actionAngleIsochrone(ip=ip)
+    ts= numpy.linspace(0.,30.,301)
+    xvs= _orbitxvs([1.,0.2,0.9,0.3,0.2,0.5],ip,ts)
+    out= aAI.actionsFreqsAngles(*xvs)
+    for ii in range(3):
+        assert numpy.std(out[ii]) < 10.**-6.
+        pred= out[6+ii][0]+out[3+ii][0]*ts
+        diff= (out[6+ii]-pred+numpy.pi) % (2.*numpy.pi)-numpy.pi
+        assert numpy.all(numpy.fabs(diff) < 10.**-5.)
+    return None
+
+def test_actionAngleSpherical_batch():
+    from galpy.actionAngle import actionAngleIsochrone
+    from galpy.actionAngle_src.actionAngleSpherical import \
+        actionAngleSpherical
+    ip= _isochrone()
+    xvs= _xvs(9)
+    aAI= actionAngleIsochrone(ip=ip)
+    aAS= actionAngleSpherical(pot=ip)
+    a= aAI.actionsFreqsAngles(*xvs)
+    s= aAS.actionsFreqsAngles(*xvs)
+    for ii in range(9):
+        d= s[ii]-a[ii]
+        if ii >= 6: d= (d+numpy.pi) % (2.*numpy.pi)-numpy.pi
+        assert numpy.all(numpy.fabs(d) < 10.**-6.), \
+            "Batch spherical output %i disagrees with the isochrone" % ii
+    #Single points
+    jr,lz,jz= aAS(*[x[0] for x in xvs[:5]])
+    assert numpy.fabs(jr-a[0][0]) < 10.**-6.
+    assert numpy.fabs(jz-a[2][0]) < 10.**-6.
+    return None
+
+# NAFF vs. the analytic isochrone actions and frequencies
+def test_actionAngleNAFF():
+    from galpy.actionAngle import actionAngleIsochrone, actionAngleNAFF
+    ip= _isochrone()
+    xvs= [numpy.array([1.,0.5,2.]),numpy.array([0.1,-0.3,0.2]),
+          numpy.array([1.1,0.8,0.5]),numpy.zeros(3),numpy.zeros(3)]
+    n= actionAngleNAFF(pot=ip).actionsFreqs(*xvs)
+    a= actionAngleIsochrone(ip=ip).actionsFreqs(*xvs)
+    for ii,tol in zip([0,1,3,4],[10.**-2.,10.**-3.,10.**-4.,10.**-4.]):
+        assert numpy.all(numpy.fabs(n[ii]/a[ii]-1.) < tol), \
+            "NAFF output %i disagrees with the isochrone" % ii
+    return None
+
+# Actions of Orbit instances, cached across calls and potentials, vs. those
+# of a fresh Orbit instance
+def test_orbit_actions():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    pot= _mwpot()
+    lp= LogarithmicHaloPotential(normalize=1.)
+    vxvv= [1.,0.1,1.1,0.05,0.1,0.]
+    o= Orbit(vxvv)
+    jr, jz= o.jr(pot=pot)[0], o.jz(pot=pot)[0]
+    jrlp= o.jr(pot=lp)[0]
+    assert numpy.fabs(jr-jrlp) > 10.**-4.
+    assert o.jr(pot=pot)[0] == jr
+    assert numpy.fabs(Orbit(vxvv).jr(pot=lp)[0]-jrlp) < 10.**-10.
+    assert numpy.fabs(Orbit(vxvv).jz(pot=pot)[0]-jz) < 10.**-10.
+    #Along the orbit
+    ts= numpy.linspace(0.,20.,21)
+    o.integrate(ts,pot,method='dopr54_c')
+    jrs= o.jr(t=ts)
+    jzs= o.jz(t=ts)
+    for ii in [0,7,20]:
+        ot= o(ts[ii])
+        assert numpy.fabs(jrs[ii,0]-ot.jr(pot=pot)[0]) < 10.**-8.
+        assert numpy.fabs(jzs[ii,0]-ot.jz(pot=pot)[0]) < 10.**-8.
+    assert o.jr(t=ts[7])[0] == jrs[7,0]
+    #Re-integrating resets the cache along the orbit
+    o.integrate(ts,lp,method='dopr54_c')
+    assert numpy.fabs(o.jr(t=ts[7])[0]-o(ts[7]).jr(pot=lp)[0]) < 10.**-8.
+    assert numpy.fabs(o.jr()[0]-jrlp) < 10.**-10.
+    return None
@@ -0,0 +1,241 @@
+#Tests of orbit integration in the moving-object, grid, and rotating-frame
+#potentials, against direct evaluation or the Python integrator
+import os
+import tempfile
+import numpy
+
+def _perturberOrbit():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    o= Orbit([1.,0.1,1.1,0.1,0.,0.])
+    o.integrate(numpy.linspace(0.,5.,501),
+                LogarithmicHaloPotential(normalize=1.))
+    return o
+
+def _bar():
+    from galpy.potential import DehnenBarPotential
+    return DehnenBarPotential(omegab=1.5,rb=0.8,Af=0.01,
+                              tform=-100.,tsteady=1.)
+
+def _compareIntegrators(o,ts,pot,methods,tol):
+    out= []
+    for method in methods:
+        oo= o()
+        oo.integrate(ts,pot,method=method)
+        out.append(oo.getOrbit()[-1])
+    for ii in range(1,len(out)):
+        #Compare positions in the plane, to not be sensitive to phi wraps
+        xy0= numpy.array([out[0][0]*numpy.cos(out[0][-1]),
+                          out[0][0]*numpy.sin(out[0][-1])])
+        xy= numpy.array([out[ii][0]*numpy.cos(out[ii][-1]),
+                         out[ii][0]*numpy.sin(out[ii][-1])])
+        assert numpy.all(numpy.fabs(xy-xy0) < tol), \
+            "Integration with %s disagrees with %s" % (methods[ii],methods[0])
+    return None
+
+# Moving objects: C vs. Python integration
+def test_MovingObjectPotential_integrate():
+    from galpy.potential import LogarithmicHaloPotential, \
+        MovingObjectPotential
+    from galpy.orbit import Orbit
+    po= _perturberOrbit()
+    pot= [LogarithmicHaloPotential(normalize=1.),
+          MovingObjectPotential(po,GM=0.06,softening_length=0.1)]
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.05,0.,0.3]),ts,pot,
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-4.)
+    return None
+
+def test_MovingObjectPotential_integrate_planar():
+    from galpy.potential import LogarithmicHaloPotential, \
+        MovingObjectPotential
+    from galpy.orbit import Orbit
+    po= _perturberOrbit()
+    pot= [LogarithmicHaloPotential(normalize=1.),
+          MovingObjectPotential(po,GM=0.06,softening_length=0.1)]
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.3]),ts,pot,
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-4.)
+    return None
+
+# One object in the collection is the single moving object
+def test_MovingObjectsPotential_single():
+    from galpy.potential import MovingObjectPotential, MovingObjectsPotential
+    po= _perturberOrbit()
+    mp= MovingObjectPotential(po,GM=0.06,softening_length=0.1)
+    mps= MovingObjectsPotential([po],GM=0.06,softening_length=0.1)
+    for R,z,phi,t in [(1.,0.1,0.2,0.5),(0.8,-0.2,1.,2.),(1.5,0.,3.,4.)]:
+        assert numpy.fabs(mp(R,z,phi=phi,t=t)-mps(R,z,phi=phi,t=t)) < 10.**-10.
+        assert numpy.fabs(mp.Rforce(R,z,phi=phi,t=t)
+                          -mps.Rforce(R,z,phi=phi,t=t)) < 10.**-10.
+    return None
+
+def _movingObjects():
+    from galpy.potential import LogarithmicHaloPotential, \
+        MovingObjectsPotential
+    from galpy.orbit import Orbit
+    po= _perturberOrbit()
+    po2= Orbit([1.2,-0.1,0.9,-0.1,0.,2.])
+    po2.integrate(numpy.linspace(0.,5.,501),
+                  LogarithmicHaloPotential(normalize=1.))
+    return [LogarithmicHaloPotential(normalize=1.),
+            MovingObjectsPotential([po,po2],GM=[0.06,0.03],
+                                   softening_length=0.1)]
+
+def test_MovingObjectsPotential_integrate():
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.05,0.,0.3]),ts,_movingObjects(),
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-4.)
+    return None
+
+def test_MovingObjectsPotential_integrate_planar():
+    from galpy.orbit import Orbit
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.3]),ts,_movingObjects(),
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-4.)
+    return None
+
+def test_MovingObjectPotential_density():
+    from galpy.potential import MovingObjectPotential, MovingObjectsPotential
+    #The density is that of a Plummer sphere with mass GM
+    po= _perturberOrbit()
+    GM, eps= 0.06, 0.1
+    mp= MovingObjectPotential(po,GM=GM,softening_length=eps)
+    mps= MovingObjectsPotential([po],GM=GM,softening_length=eps)
+    t= 1.3
+    R,z,phi= 1.,0.05,0.4
+    x= R*numpy.cos(phi)-po.x(t)
+    y= R*numpy.sin(phi)-po.y(t)
+    d2= x**2.+y**2.+(z-po.z(t))**2.
+    assert numpy.fabs(mp.dens(R,z,phi=phi,t=t)
+                      -3.*GM*eps**2./4./numpy.pi/(d2+eps**2.)**2.5) < 10.**-8.
+    assert numpy.fabs(mp.dens(R,z,phi=phi,t=t)
+                      -mps.dens(R,z,phi=phi,t=t)) < 10.**-10.
+    return None
+
+# Non-axisymmetric planar potentials in 3D orbits
+def test_planarTofullPotential_integrate():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    lp= LogarithmicHaloPotential(normalize=1.)
+    ts= numpy.linspace(0.,10.,1001)
+    #In the mid-plane, the 3D orbit is the planar orbit
+    o= Orbit([1.,0.1,1.1,0.,0.,0.3])
+    o.integrate(ts,[lp,_bar()],method='dopr54_c')
+    op= Orbit([1.,0.1,1.1,0.3])
+    op.integrate(ts,[lp,_bar()],method='dopr54_c')
+    assert numpy.all(numpy.fabs(o.x(ts)-op.x(ts)) < 10.**-6.)
+    assert numpy.all(numpy.fabs(o.y(ts)-op.y(ts)) < 10.**-6.)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.05,0.1,0.3]),ts,[lp,_bar()],
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-4.)
+    return None
+
+# Grid potential vs. the tabulated potential
+def _gridPotential(savefilename=None):
+    from galpy.potential import MiyamotoNagaiPotential, interpGridPotential
+    from galpy.potential_src.planarPotential import planarTofullPotential
+    mp= MiyamotoNagaiPotential(normalize=0.5,a=0.5,b=0.1)
+    bar= planarTofullPotential(_bar())
+    g= interpGridPotential([mp,bar],xgrid=(-2.,2.,61),ygrid=(-2.,2.,61),
+                           zgrid=(-0.5,0.5,21),OmegaP=1.5,numcores=1,
+                           savefilename=savefilename)
+    return (g,mp,bar)
+
+def test_interpGridPotential():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    g,mp,bar= _gridPotential()
+    #The bar rotates with the grid
+    for R,z,phi,t in [(1.,0.1,0.3,0.),(0.7,-0.2,2.,1.),(1.3,0.,4.,3.)]:
+        direct= mp(R,z)+bar(R,z,phi=phi,t=t)
+        assert numpy.fabs(g(R,z,phi=phi,t=t)/direct-1.) < 10.**-3.
+    lp= LogarithmicHaloPotential(normalize=0.5)
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.05,0.,0.]),ts,[lp,g],
+                        ['odeint','dopr54_c'],10.**-3.)
+    return None
+
+def test_interpGridPotential_savefile():
+    from galpy.potential import interpGridPotential
+    savefilename= os.path.join(tempfile.mkdtemp(),'grid.sav')
+    try:
+        g= _gridPotential(savefilename=savefilename)[0]
+        g2= interpGridPotential(savefilename=savefilename)
+        assert g2(1.,0.1,phi=0.3) == g(1.,0.1,phi=0.3)
+    finally:
+        if os.path.exists(savefilename): os.remove(savefilename)
+    return None
+
+def test_interpGridPotential_planar():
+    from galpy.potential import LogarithmicHaloPotential
+    from galpy.orbit import Orbit
+    g= _gridPotential()[0]
+    for R,phi,t in [(1.,0.3,0.),(0.7,2.,1.),(1.3,4.,3.)]:
+        assert numpy.fabs(g.toPlanar()(R,phi=phi,t=t)
+                          -g(R,0.,phi=phi,t=t)) < 10.**-10.
+    lp= LogarithmicHaloPotential(normalize=0.5)
+    ts= numpy.linspace(0.,5.,501)
+    _compareIntegrators(Orbit([1.,0.1,1.1,0.]),ts,[lp,g],
+                        ['odeint','dopr54_c','leapfrog_c'],10.**-3.)
+    return None
+
+def test_interpGridPotential_savefile_OmegaP():
+    from galpy.potential import interpGridPotential
+    savefilename= os.path.join(tempfile.mkdtemp(),'grid.sav')
+    try:
+        g= _gridPotential(savefilename=savefilename)[0]
+        g2= interpGridPotential(savefilename=savefilename)
+        assert g2.OmegaP() == 1.5
+        assert g2(1.,0.1,phi=0.3,t=1.) == g(1.,0.1,phi=0.3,t=1.)
+        try:
+            interpGridPotential(savefilename=savefilename,OmegaP=1.)
+        except IOError:
+            pass
+        else:
+            raise AssertionError("Restoring a grid with a different OmegaP did not raise an IOError")
+    finally:
+        if os.path.exists(savefilename): os.remove(savefilename)
+    return None
+
+# Rotating-frame integration vs. integration in the inertial frame
+def _rotatingFrameOrbits(vxvv,method,explicitOmegaP=False):
+    from galpy.potential import MiyamotoNagaiPotential, \
+        LogarithmicHaloPotential, DehnenBarPotential
+    from galpy.orbit import Orbit
+    pots= [MiyamotoNagaiPotential(a=0.5,b=0.0375,normalize=0.6),
+           LogarithmicHaloPotential(normalize=0.4),
+           DehnenBarPotential()]
+    ts= numpy.linspace(0.,20.,2001)
+    oi= Orbit(vxvv)
+    oi.integrate(ts,pots,method='odeint')
+    orf= Orbit(vxvv)
+    if explicitOmegaP:
+        orf.integrate(ts,pots,method=method,rotatingFrame=True,
+                      OmegaP=pots[2].OmegaP())
+    else:
+        orf.integrate(ts,pots,method=method,rotatingFrame=True)
+    return (ts,oi,orf)
+
+def test_rotatingFrame():
+    for vxvv in [[1.,0.1,1.1,0.05,0.02,0.3],[1.,0.1,1.1,0.3]]:
+        for method in ['odeint','dopr54_c']:
+            ts,oi,orf= _rotatingFrameOrbits(vxvv,method,
+                                              explicitOmegaP=True)
+            assert numpy.all(numpy.fabs(orf.x(ts)-oi.x(ts)) < 10.**-4.)
+            assert numpy.all(numpy.fabs(orf.y(ts)-oi.y(ts)) < 10.**-4.)
+            assert numpy.all(numpy.fabs(orf.vR(ts)-oi.vR(ts)) < 10.**-4.)
+    return None
+
+def test_rotatingFrame_phi():
+    #The pattern speed is found inside of the 3D wrapper of the bar
+    for vxvv in [[1.,0.1,1.1,0.05,0.02,0.3],[1.,0.1,1.1,0.3]]:
+        #The Python integrator keeps the azimuth continuous
+        ts,oi,orf= _rotatingFrameOrbits(vxvv,'odeint')
+        assert numpy.all(numpy.fabs(orf.getOrbit()[:,-1]
+                                    -oi.getOrbit()[:,-1]) < 10.**-4.)
+        #The C integrators return the azimuth in [0,2pi)
+        ts,oi,orf= _rotatingFrameOrbits(vxvv,'dopr54_c')
+        assert numpy.all((orf.getOrbit()[:,-1] >= 0.)
+                         *(orf.getOrbit()[:,-1] < 2.*numpy.pi))
+    return None
@@ -0,0 +1,337 @@
+#Tests of the potential tables, expansions, caches, and derivatives, against
+#direct evaluation or analytic results
+import numpy
+
+def _mwpot():
+    from galpy.potential import MiyamotoNagaiPotential, NFWPotential, \
+        HernquistPotential
+    return [MiyamotoNagaiPotential(a=0.5,b=0.0375,normalize=0.6),
+            NFWPotential(a=4.5,normalize=0.35),
+            HernquistPotential(a=0.6/8.,normalize=0.05)]
+
+# Fingerprints: equal for equal parameters, different otherwise
+def test_fingerprint():
+    from galpy.potential import LogarithmicHaloPotential, potentialFingerprint
+    lp1= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    lp2= LogarithmicHaloPotential(normalize=1.,q=0.9)
+    lp3= LogarithmicHaloPotential(normalize=1.,q=0.8)
+    assert lp1 == lp2, "Equal potentials do not compare equal"
+    assert hash(lp1) == hash(lp2), "Equal potentials have different hashes"
+    assert lp1 != lp3, "Different potentials compare equal"
+    assert potentialFingerprint([lp1,lp3]) \
+        == potentialFingerprint([lp2,lp3])
+    #The potential of a list does not depend on its order
+    assert potentialFingerprint([lp1,lp3]) \
+        == potentialFingerprint([lp3,lp1])
+    assert potentialFingerprint([lp1,lp3]) \
+        != potentialFingerprint([lp1,lp1])
+    return None
+
+def test_fingerprint_cache():
+    from galpy.potential import MiyamotoNagaiPotential, \
+        potentialFingerprint, verticalPotentialTable
+    mp1= MiyamotoNagaiPotential(normalize=1.)
+    mp2= MiyamotoNagaiPotential(normalize=1.)
+    fp= mp1.fingerprint()
+    assert mp1._cacheFingerprint == fp
+    assert potentialFingerprint(mp1) == fp
+    #Normalizing changes the parameters and resets the cached fingerprint
+    pp= mp1.toPlanar()
+    pfp= pp.fingerprint()
+    mp1.normalize(0.5)
+    assert mp1.fingerprint() != fp
+    assert pp.fingerprint() != pfp
+    assert mp1 != mp2, "Potentials compare equal after normalize"
+    mp2.normalize(0.5)
+    assert mp1 == mp2 and hash(mp1) == hash(mp2)
+    #Tables of vertical potentials can be fingerprinted, also in lists
+    vp= verticalPotentialTable(mp1,nR=11,nz=11)
+    assert vp.fingerprint() == verticalPotentialTable(mp2,nR=11,nz=11)\
+        .fingerprint()
+    assert potentialFingerprint([mp1,vp]) == potentialFingerprint([vp,mp1])
+    return None
+
+def test_fingerprint_movingobject():
+    from galpy.potential import LogarithmicHaloPotential, \
+        MovingObjectPotential
+    from galpy.orbit import Orbit
+    o= Orbit([1.,0.1,1.1,0.1,0.,0.])
+    ts= numpy.linspace(0.,1.,11)
+    o.integrate(ts,LogarithmicHaloPotential(normalize=1.))
+    mp1= MovingObjectPotential(o,GM=0.06)
+    mp2= MovingObjectPotential(o,GM=0.06)
+    mp3= MovingObjectPotential(o,GM=0.1)
+    assert mp1 == mp2, "Equal MovingObjectPotentials do not compare equal"
+    assert mp1 != mp3, "MovingObjectPotentials with different GM compare equal"
+    return None
+
+# Rotation-curve table vs. direct evaluation
+def test_rotcurveTable():
+    from galpy.potential import rotcurveTable, vcirc, omegac, epifreq, \
+        verticalfreq
+    pot= _mwpot()
+    rc= rotcurveTable(pot)
+    Rs= numpy.linspace(0.1,10.,23)
+    vc= numpy.array([vcirc(pot,R) for R in Rs])
+    assert numpy.all(numpy.fabs(rc.vcirc(Rs)/vc-1.) < 10.**-5.)
+    om= numpy.array([omegac(pot,R) for R in Rs])
+    assert numpy.all(numpy.fabs(rc.omegac(Rs)/om-1.) < 10.**-5.)
+    ek= numpy.array([epifreq(pot,R) for R in Rs])
+    assert numpy.all(numpy.fabs(rc.epifreq(Rs)/ek-1.) < 10.**-4.)
+    vf= numpy.array([verticalfreq(pot,R) for R in Rs])
+    assert numpy.all(numpy.fabs(rc.verticalfreq(Rs)/vf-1.) < 10.**-4.)
+    return None
+
+def test_rotcurveTable_splineDerivs():
+    from galpy.potential import rotcurveTable
+    #Second derivatives of the splines in ln R vs. finite differences
+    rc= rotcurveTable(_mwpot())
+    lnR,d= numpy.log(numpy.array([0.5,1.,3.])),10.**-5.
+    for spl in [rc._vcSpline,rc._kappaSpline,rc._nuSpline]:
+        fd= (spl(lnR+d,deriv=1)-spl(lnR-d,deriv=1))/2./d
+        assert numpy.all(numpy.fabs(spl(lnR,deriv=2)/fd-1.) < 10.**-4.)
+    return None
+
+# rl for arrays, inside and outside of the tabulated range, vs. the scalar
+def test_rl_array():
+    from galpy.potential import LogarithmicHaloPotential, rl
+    pot= LogarithmicHaloPotential(normalize=1.)
+    lzs= numpy.array([10.**-4.,0.01,0.5,1.,2.,50.,1000.,10.**4.])
+    rls= rl(pot,lzs)
+    for lz, r in zip(lzs,rls):
+        assert numpy.fabs(r-rl(pot,lz)) < 10.**-6.*r, \
+            "Array rl disagrees with scalar rl for Lz = %g" % lz
+        #For a flat rotation curve, rl = Lz
+        assert numpy.fabs(r-lz) < 10.**-6.*lz
+    return None
+
+# Resonances vs. direct root finding
+def test_resonanceRadii():
+    from galpy.potential import LogarithmicHaloPotential, resonanceRadii
+    pot= LogarithmicHaloPotential(normalize=1.)
+    OmegaPs= numpy.array([0.5,1.,1.5])
+    res= resonanceRadii(pot,OmegaPs,m=2)
+    for ii,OmegaP in enumerate(OmegaPs):
+        #Flat rotation curve: Omega= 1/R, kappa= sqrt(2)/R
+        assert numpy.fabs(res['corotation'][ii]-1./OmegaP) < 10.**-5.
+        assert numpy.fabs(res['ILR'][ii]-(1.-numpy.sqrt(2.)/2.)/OmegaP) < 10.**-5.
+        assert numpy.fabs(res['OLR'][ii]-(1.+numpy.sqrt(2.)/2.)/OmegaP) < 10.**-5.
+        assert numpy.fabs(res['ILR'][ii]
+                          -pot.lindbladR(OmegaP,m=2)) < 10.**-5.
+        assert numpy.fabs(res['OLR'][ii]
+                          -pot.lindbladR(OmegaP,m=-2)) < 10.**-5.
+    return None
+
+def test_resonanceRadii_outsideTable():
+    from galpy.potential import LogarithmicHaloPotential, rotcurveTable
+    pot= LogarithmicHaloPotential(normalize=1.)
+    rc= rotcurveTable(pot,Rrange=(0.1,10.))
+    #Resonances outside of the table are found directly, also for arrays
+    OmegaPs= numpy.array([0.05,1.,20.])
+    for m in [2,-2,'corotation']:
+        res= rc.lindbladR(OmegaPs,m=m)
+        for ii,OmegaP in enumerate(OmegaPs):
+            assert numpy.fabs(res[ii]-rc.lindbladR(OmegaP,m=m)) \
+                < 10.**-5.*res[ii]
+    assert numpy.fabs(rc.resonances(OmegaPs)['OLR'][-1]
+                      -(1.+numpy.sqrt(2.)/2.)/20.) < 10.**-5.
+    return None
+
+# Multipole expansion of a Miyamoto-Nagai density vs. the potential itself
+def test_MultipoleExpansionPotential():
+    from galpy.potential import MiyamotoNagaiPotential, \
+        MultipoleExpansionPotential
+    mp= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.3)
+    mep= MultipoleExpansionPotential(mp,lmax=10,ntheta=256)
+    for R,z in [(0.5,0.),(1.,0.2),(2.,-0.5),(5.,1.)]:
+        assert numpy.fabs(mep(R,z)/mp(R,z)-1.) < 10.**-2.
+        assert numpy.fabs(mep.Rforce(R,z)/mp.Rforce(R,z)-1.) < 10.**-2.
+    return None
+
+def test_MultipoleExpansionPotential_ntheta():
+    from galpy.potential import MiyamotoNagaiPotential, \
+        MultipoleExpansionPotential
+    #The default ntheta resolves a flattened disk
+    mp= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.3)
+    mep= MultipoleExpansionPotential(mp,lmax=10)
+    for R,z in [(2.,-0.5),(5.,1.)]:
+        assert numpy.fabs(mep(R,z)/mp(R,z)-1.) < 10.**-2.
+    return None
+
+def test_MultipoleExpansionPotential_nonaxi_planar():
+    from galpy.potential import MultipoleExpansionPotential
+    #A non-axisymmetric expansion keeps its azimuthal dependence in 2D
+    def dens(R,z,phi):
+        return numpy.exp(-R-z**2.)*(1.+0.3*numpy.cos(2.*phi))
+    mep= MultipoleExpansionPotential(dens,lmax=4,mmax=2,nr=101)
+    pp= mep.toPlanar()
+    for phi in [0.,0.4,1.]:
+        assert numpy.fabs(pp(1.,phi=phi)-mep(1.,0.,phi=phi)) < 10.**-10.
+        assert numpy.fabs(pp.phiforce(1.,phi=phi)
+                          -mep.phiforce(1.,0.,phi=phi)) < 10.**-10.
+    assert numpy.fabs(pp.phiforce(1.,phi=0.4)) > 10.**-4.
+    return None
+
+# Second derivatives vs. finite differences of the forces
+def _checkHessian(p,R,z,phi,d=10.**-5.,tol=10.**-5.):
+    fR= lambda R,z,phi: p.Rforce(R,z,phi=phi)
+    fz= lambda R,z,phi: p.zforce(R,z,phi=phi)
+    fphi= lambda R,z,phi: p.phiforce(R,z,phi=phi)
+    checks= [(p.R2deriv(R,z,phi=phi),
+              -(fR(R+d,z,phi)-fR(R-d,z,phi))/2./d),
+             (p.z2deriv(R,z,phi=phi),
+              -(fz(R,z+d,phi)-fz(R,z-d,phi))/2./d),
+             (p.Rzderiv(R,z,phi=phi),
+              -(fR(R,z+d,phi)-fR(R,z-d,phi))/2./d),
+             (p.phi2deriv(R,z,phi=phi),
+              -(fphi(R,z,phi+d)-fphi(R,z,phi-d))/2./d),
+             (p.Rphideriv(R,z,phi=phi),
+              -(fR(R,z,phi+d)-fR(R,z,phi-d))/2./d)]
+    for ii,(a,fd) in enumerate(checks):
+        assert numpy.fabs(a-fd) < tol*(1.+numpy.fabs(fd)), \
+            "Second derivative %i of %s disagrees with finite differences" % (ii,p.__class__.__name__)
+    return None
+
+def test_Hessians():
+    from galpy.potential import LogarithmicHaloPotential, \
+        DehnenBarPotential, evaluateR2derivs
+    pots= _mwpot()+[LogarithmicHaloPotential(normalize=1.,q=0.9)]
+    R,z,phi,d= 0.9,0.2,0.3,10.**-5.
+    for p in pots:
+        _checkHessian(p,R,z,phi)
+    #Planar, non-axisymmetric
+    dp= DehnenBarPotential()
+    fR= lambda R,phi: dp.Rforce(R,phi=phi)
+    fphi= lambda R,phi: dp.phiforce(R,phi=phi)
+    assert numpy.fabs(dp.R2deriv(R,phi=phi)
+                      +(fR(R+d,phi)-fR(R-d,phi))/2./d) < 10.**-5.
+    assert numpy.fabs(dp.phi2deriv(R,phi=phi)
+                      +(fphi(R,phi+d)-fphi(R,phi-d))/2./d) < 10.**-5.
+    assert numpy.fabs(dp.Rphideriv(R,phi=phi)
+                      +(fR(R,phi+d)-fR(R,phi-d))/2./d) < 10.**-5.
+    #Functions for lists
+    assert numpy.fabs(evaluateR2derivs(R,z,pots[:3])
+                      -numpy.sum([p.R2deriv(R,z) for p in pots[:3]])) < 10.**-10.
+    return None
+
+def test_planarTofullPotential_Hessians_array():
+    from galpy.potential import DehnenBarPotential
+    from galpy.potential_src.planarPotential import planarTofullPotential
+    fp= planarTofullPotential(DehnenBarPotential())
+    R,z,phi= numpy.array([0.5,1.2]),numpy.array([0.1,-0.2]),0.3
+    for func in [fp.R2deriv,fp.z2deriv,fp.Rzderiv,fp.phi2deriv,
+                 fp.Rphideriv,fp.zphideriv]:
+        out= func(R,z,phi=phi)
+        assert out.shape == R.shape
+        assert numpy.all(out == numpy.array([func(r,zz,phi=phi)
+                                             for r,zz in zip(R,z)]))
+    return None
+
+def test_planarTofullPotential_vertical():
+    from galpy.potential import DehnenBarPotential, SteadyLogSpiralPotential
+    from galpy.potential_src.planarPotential import planarTofullPotential
+    R,z,phi,d= 0.9,0.2,0.3,10.**-5.
+    for pp in [DehnenBarPotential(),SteadyLogSpiralPotential()]:
+        fp= planarTofullPotential(pp)
+        #Mid-plane equals the planar potential
+        assert fp(R,0.,phi=phi) == pp(R,phi=phi)
+        assert fp.Rforce(R,0.,phi=phi) == pp.Rforce(R,phi=phi)
+        assert fp.zforce(R,0.,phi=phi) == 0.
+        #Off the plane, the potential depends on r= sqrt(R^2+z^2)
+        assert numpy.fabs(fp(R,z,phi=phi)
+                          -pp(numpy.sqrt(R**2.+z**2.),phi=phi)) < 10.**-14.
+        fd= -(fp(R,z+d,phi=phi)-fp(R,z-d,phi=phi))/2./d
+        assert numpy.fabs(fp.zforce(R,z,phi=phi)-fd) < 10.**-8.
+        assert numpy.fabs(fp.zforce(R,z,phi=phi)) > 10.**-4.
+        _checkHessian(fp,R,z,phi)
+        fd= -(fp.zforce(R,z,phi=phi+d)-fp.zforce(R,z,phi=phi-d))/2./d
+        assert numpy.fabs(fp.zphideriv(R,z,phi=phi)-fd) < 10.**-5.
+    return None
+
+def test_DoubleExponentialDiskPotential_Hessians():
+    from galpy.potential import DoubleExponentialDiskPotential
+    dp= DoubleExponentialDiskPotential(normalize=1.)
+    #Poisson equation, to about the requested accuracy (tol=10^-3)
+    R,z= 0.9,0.2
+    z2= dp.z2deriv(R,z)
+    assert numpy.fabs(z2+dp.R2deriv(R,z)-dp.Rforce(R,z)/R
+                      -4.*numpy.pi*dp.dens(R,z)) < 10.**-2.*numpy.fabs(z2)
+    d= 10.**-3.
+    fd= -(dp.Rforce(R,z+d)-dp.Rforce(R,z-d))/2./d
+    assert numpy.fabs(dp.Rzderiv(R,z)/fd-1.) < 10.**-2.
+    #Array input is evaluated element by element
+    Rs,zs= numpy.array([0.9,1.2]),numpy.array([0.2,0.5])
+    assert numpy.all(dp.z2deriv(Rs,zs)
+                     == numpy.array([dp.z2deriv(R,z) for R,z in zip(Rs,zs)]))
+    assert numpy.all(dp.Rzderiv(Rs,0.2)
+                     == numpy.array([dp.Rzderiv(R,0.2) for R in Rs]))
+    assert dp.R2deriv(Rs,zs).shape == Rs.shape
+    return None
+
+def test_interpRZPotential_Hessians():
+    from galpy.potential import MiyamotoNagaiPotential, interpRZPotential
+    mp= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.05)
+    ip= interpRZPotential(mp,rgrid=(0.5,1.5,41),zgrid=(-0.2,0.2,41))
+    #The second derivatives are those of the interpolated forces
+    _checkHessian(ip,0.9,0.1,0.)
+    for R,z in [(0.9,0.1),(1.13,-0.07)]:
+        assert numpy.fabs(ip.R2deriv(R,z)/mp.R2deriv(R,z)-1.) < 10.**-3.
+        assert numpy.fabs(ip.z2deriv(R,z)/mp.z2deriv(R,z)-1.) < 10.**-3.
+        assert numpy.fabs(ip.Rzderiv(R,z)/mp.Rzderiv(R,z)-1.) < 10.**-3.
+    return None
+
+# Memoizing cache vs. the underlying potential
+def test_cachedPotential():
+    from galpy.potential import MiyamotoNagaiPotential, cachedPotential
+    mp= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.05)
+    cp= cachedPotential(mp,maxsize=4)
+    for R,z in [(1.,0.1),(0.5,0.3),(1.,0.1),(2.,-0.2),(1.,0.1)]:
+        assert cp(R,z) == mp(R,z)
+        assert cp.Rforce(R,z) == mp.Rforce(R,z)
+        assert cp.zforce(R,z) == mp.zforce(R,z)
+    return None
+
+def test_cachedProjections():
+    from galpy.potential import MiyamotoNagaiPotential
+    mp= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.05)
+    assert mp.toPlanar() is mp.toPlanar()
+    assert mp.toVertical(1.2) is mp.toVertical(1.2)
+    assert mp.toVertical(1.2) is not mp.toVertical(1.3)
+    return None
+
+# Vertical-potential table vs. direct evaluation
+def test_verticalPotentialTable():
+    from galpy.potential import MiyamotoNagaiPotential, \
+        verticalPotentialTable
+    pot= MiyamotoNagaiPotential(normalize=1.,a=0.5,b=0.05)
+    vt= verticalPotentialTable(pot)
+    for R in [0.5,1.,2.]:
+        zs= numpy.linspace(0.,1.,11)
+        direct= pot(R,zs)-pot(R,0.)
+        assert numpy.all(numpy.fabs(vt(R,zs)-direct) < 10.**-5.)
+        assert numpy.all(numpy.fabs(vt.zforce(R,zs)-pot.zforce(R,zs)) < 10.**-4.)
+    return None
+
+# Escape-velocity table vs. direct evaluation
+def test_escapecurveTable():
+    from galpy.potential import escapecurveTable, vesc
+    pot= _mwpot()
+    ec= escapecurveTable(pot)
+    Rs= numpy.linspace(0.1,10.,11)
+    ve= numpy.array([vesc(pot,R) for R in Rs])
+    assert numpy.all(numpy.fabs(ec.vesc(Rs)/ve-1.) < 10.**-5.)
+    assert numpy.all(ec.unbound(Rs,1.01*ve))
+    assert not numpy.any(ec.unbound(Rs,0.99*ve))
+    return None
+
+# Isochrone potential vs. its analytic form
+def test_IsochronePotential():
+    from galpy.potential import IsochronePotential
+    b= 0.7
+    ip= IsochronePotential(amp=1.,b=b)
+    for R,z in [(0.5,0.),(1.,0.5),(3.,-1.)]:
+        r= numpy.sqrt(R**2.+z**2.)
+        assert numpy.fabs(ip(R,z)+1./(b+numpy.sqrt(b**2.+r**2.))) < 10.**-10.
+    assert numpy.fabs(ip.Phiinf()) < 10.**-10.
+    _checkHessian(IsochronePotential(normalize=1.,b=0.8),0.9,0.2,0.3)
+    return None